@@ -7,6 +7,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from datetime import datetime
 from importlib import import_module
 from logging import config as logging_config_module
 from types import MappingProxyType
@@ -51,6 +52,7 @@ class FakeEntityState:
     entity_id: str
     state: str
     attributes: Mapping[str, Any]
+    last_updated: datetime | None = None
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary representation compatible with EntityState."""
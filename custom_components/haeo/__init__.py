@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 import logging
 from pathlib import Path
 from types import MappingProxyType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.frontend import add_extra_js_url
 from homeassistant.components.http import StaticPathConfig
@@ -27,13 +27,21 @@ from custom_components.haeo.const import (
     STATIC_CARD_STATIC_PATH,
 )
 from custom_components.haeo.coordinator import HaeoDataUpdateCoordinator
+from custom_components.haeo.coordinator.policy_cache import async_remove_policy_cache
 from custom_components.haeo.core.const import CONF_ADVANCED_MODE, CONF_ELEMENT_TYPE, CONF_NAME
+from custom_components.haeo.core.data.loader.sensor_loader import SensorPayloadCache
 from custom_components.haeo.core.schema.elements.policy import PolicyRuleConfig
 from custom_components.haeo.elements import ELEMENT_DEVICE_NAMES_BY_TYPE
 from custom_components.haeo.flows import HUB_SECTION_ADVANCED
 from custom_components.haeo.flows.surfaced_policy import find_policy_subentry, get_policy_rules
 from custom_components.haeo.horizon import HorizonManager
-from custom_components.haeo.input_stores import InputStoreMap, build_input_stores
+from custom_components.haeo.input_stores import (
+    InputStoreMap,
+    InputStoreReloader,
+    build_input_stores,
+    input_structure,
+    sync_input_stores,
+)
 from custom_components.haeo.services import async_setup_services
 
 from . import migrations as _migrations
@@ -109,19 +117,27 @@ class HaeoRuntimeData:
     Attributes:
         horizon_manager: Manager providing forecast time windows.
         input_stores: Dict of input stores keyed by (element_name, field_path).
+        input_structure: Entry snapshot the stores were built from, with numeric constants masked.
+        payload_cache: Extracted sensor payloads shared by every input store.
+        input_reloader: Batch reloader for driven forecast stores on horizon changes.
         auto_optimize_switch: Switch controlling automatic optimization.
         coordinator: Coordinator for network-level optimization (set after input platforms).
         value_update_in_progress: Flag to skip reload when updating entity values.
-        reload_pending: Flag to coalesce deferred reloads during an element config flow.
+        reload_pending: Flag to coalesce deferred structural changes during an element config flow.
+        structure_lock: Serializes applying structural subentry changes to the running hub.
 
     """
 
     horizon_manager: HorizonManager
     input_stores: InputStoreMap = field(default_factory=_create_input_stores)
+    input_structure: dict[str, Any] | None = field(default=None)
+    payload_cache: SensorPayloadCache = field(default_factory=SensorPayloadCache)
+    input_reloader: InputStoreReloader | None = field(default=None)
     auto_optimize_switch: AutoOptimizeSwitch | None = field(default=None)
     coordinator: HaeoDataUpdateCoordinator | None = field(default=None)
     value_update_in_progress: bool = field(default=False)
     reload_pending: bool = field(default=False)
+    structure_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
 type HaeoConfigEntry = ConfigEntry[HaeoRuntimeData | None]
@@ -201,9 +217,10 @@ async def async_update_listener(hass: HomeAssistant, entry: HaeoConfigEntry) ->
     additions, updates, and removals. Value-only updates (from input entities)
     set value_update_in_progress to skip reload and signal the coordinator.
 
-    Uses async_schedule_reload instead of async_reload to avoid suspending
-    in the listener task. Required subentries are ensured during setup, so
-    no need to check here.
+    Structural subentry changes are applied to the running hub in a separate
+    task, falling back to async_schedule_reload (rather than async_reload, to
+    avoid suspending in the listener task) when they cannot be. Required
+    subentries are ensured during setup, so no need to check here.
     """
     # Check if this is a value-only update from an input entity
     runtime_data = entry.runtime_data
@@ -216,6 +233,17 @@ async def async_update_listener(hass: HomeAssistant, entry: HaeoConfigEntry) ->
             coordinator.signal_optimization_stale()
         return
 
+    # A change that only edits numeric constants of existing inputs (e.g. a
+    # reconfigure flow changing a fixed price) leaves the structure the hub was
+    # built from intact, so the live stores adopt the new values and the
+    # network, entities and solver state are kept.
+    if runtime_data and runtime_data.input_structure == input_structure(entry):
+        changed = sync_input_stores(runtime_data.input_stores)
+        if runtime_data.coordinator:
+            runtime_data.coordinator.refresh_participant_configs()
+        _LOGGER.debug("Constant-only configuration change adopted by %d input stores", changed)
+        return
+
     # Clean up policy rules that reference deleted elements. An element's
     # subentry is committed only after its config flow finishes, but the flow
     # writes the element's surfaced policy rules before that. Skip cleanup while
@@ -225,37 +253,53 @@ async def async_update_listener(hass: HomeAssistant, entry: HaeoConfigEntry) ->
     if not flow_in_progress:
         _cleanup_policy_rules(hass, entry)
 
-    _LOGGER.info("HAEO configuration changed, reloading integration")
+    if runtime_data is None:
+        _LOGGER.info("HAEO configuration changed, reloading integration")
+        if flow_in_progress:
+            hass.loop.call_soon(hass.config_entries.async_schedule_reload, entry.entry_id)
+        else:
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
 
     if not flow_in_progress:
-        hass.config_entries.async_schedule_reload(entry.entry_id)
+        hass.async_create_task(_async_apply_structure_change(hass, entry))
         return
 
     # A subentry flow may still be committing further subentries in the same
     # synchronous step: the battery flow writes its surfaced policy rules before
-    # creating its own subentry. Home Assistant fires update listeners and runs
-    # reloads eagerly, so scheduling the reload now runs the unload phase
+    # creating its own subentry. Applying the change now would see the rules
+    # without the element, and a fallback reload would run the unload phase
     # synchronously from within this change callback, which removes this update
-    # listener before the later subentry commit fires it; that commit then never
-    # schedules a reload and the new element is left without a device or
-    # entities. Defer to the next event loop iteration so every commit in this
-    # step lands first, and coalesce the deferred reloads so the flow rebuilds
-    # the entry exactly once with all subentries present.
-    if runtime_data is None:
-        hass.loop.call_soon(hass.config_entries.async_schedule_reload, entry.entry_id)
-        return
-
+    # listener before the later subentry commit fires it; the new element would
+    # then be left without a device or entities. Defer to the next event loop
+    # iteration so every commit in this step lands first, and coalesce the
+    # deferred changes so the flow applies them exactly once with all
+    # subentries present.
     if runtime_data.reload_pending:
         return
     runtime_data.reload_pending = True
 
-    def _deferred_reload() -> None:
+    def _deferred_change() -> None:
         # Clear the coalescing flag before scheduling so it cannot stick across
-        # synchronous steps; the reload recreates runtime_data regardless.
+        # synchronous steps; a reload recreates runtime_data regardless.
         runtime_data.reload_pending = False
-        hass.config_entries.async_schedule_reload(entry.entry_id)
+        hass.async_create_task(_async_apply_structure_change(hass, entry))
 
-    hass.loop.call_soon(_deferred_reload)
+    hass.loop.call_soon(_deferred_change)
+
+
+async def _async_apply_structure_change(hass: HomeAssistant, entry: HaeoConfigEntry) -> None:
+    """Apply a structural subentry change to the running hub, reloading it when that is not possible."""
+    # Import here to avoid circular imports at module level
+    from custom_components.haeo.subentry_changes import async_apply_subentry_changes  # noqa: PLC0415
+
+    try:
+        if await async_apply_subentry_changes(hass, entry):
+            return
+    except Exception:
+        _LOGGER.exception("Failed to apply the configuration change to the running hub")
+    _LOGGER.info("HAEO configuration changed, reloading integration")
+    hass.config_entries.async_schedule_reload(entry.entry_id)
 
 
 def _element_flow_in_progress(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -373,7 +417,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> bool
     # Build input stores from configuration before any entities exist. The
     # stores are the system's source of truth; entities wrap them for display
     # and the coordinator reads their resolved values.
-    runtime_data.input_stores = build_input_stores(hass, entry, horizon_manager)
+    runtime_data.input_stores = build_input_stores(hass, entry, horizon_manager, runtime_data.payload_cache)
+    runtime_data.input_structure = input_structure(entry)
+
+    # Driven forecast stores are reloaded together on each horizon change, so
+    # the coordinator sees one signal per tick instead of one per store.
+    input_reloader = InputStoreReloader(hass, entry, horizon_manager, runtime_data.input_stores)
+    runtime_data.input_reloader = input_reloader
+    entry.async_on_unload(horizon_manager.subscribe(input_reloader.handle_horizon_change))
 
     # Create the coordinator from the same subentry snapshot used to build the
     # input stores, before setting up platforms. Platform setup and store
@@ -478,6 +529,11 @@ async def async_unload_entry(_hass: HomeAssistant, entry: HaeoConfigEntry) -> bo
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> None:
+    """Remove the persisted state of a deleted hub."""
+    await async_remove_policy_cache(hass, entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
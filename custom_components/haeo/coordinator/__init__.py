@@ -13,20 +13,38 @@ from .coordinator import (
     _localize_currency,  # pyright: ignore[reportPrivateUsage] (exported for testing)
     detect_currency_symbol,
 )
-from .network import ElementUpdater, create_network, evaluate_network_connectivity
+from .network import (
+    CoarsePlan,
+    ElementUpdater,
+    ReducedNetwork,
+    create_network,
+    evaluate_network_connectivity,
+    optimize_aggregated,
+    optimize_coarsened,
+    solve_coarse_plan,
+    solve_near_term,
+    update_network,
+)
 
 __all__ = [
     "STATUS_OPTIONS",
+    "CoarsePlan",
     "CoordinatorData",
     "CoordinatorOutput",
     "ElementUpdater",
     "ForecastPoint",
     "HaeoDataUpdateCoordinator",
     "OptimizationContext",
+    "ReducedNetwork",
     "_build_coordinator_output",
     "_build_optimization_context",
     "_localize_currency",
     "create_network",
     "detect_currency_symbol",
     "evaluate_network_connectivity",
+    "optimize_aggregated",
+    "optimize_coarsened",
+    "solve_coarse_plan",
+    "solve_near_term",
+    "update_network",
 ]
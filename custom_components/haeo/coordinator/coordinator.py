@@ -1,6 +1,8 @@
 """Data update coordinator for the Home Assistant Energy Optimizer integration."""
 
-from collections.abc import Callable, Mapping
+import asyncio
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 import logging
@@ -8,7 +10,7 @@ import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 from homeassistant.const import STATE_ON, EntityCategory, UnitOfTime
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import EventStateChangedData, async_call_later, async_track_state_change_event
@@ -29,11 +31,20 @@ from custom_components.haeo.const import (
     OUTPUT_NAME_OPTIMIZATION_STATUS,
     NetworkOutputName,
 )
-from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES
-from custom_components.haeo.core.const import CONF_DEBOUNCE_SECONDS, CONF_ELEMENT_TYPE, DEFAULT_DEBOUNCE_SECONDS
+from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES, expand_model_elements
+from custom_components.haeo.core.const import (
+    CONF_AGGREGATE_PERIODS,
+    CONF_DEBOUNCE_SECONDS,
+    CONF_ELEMENT_TYPE,
+    CONF_TWO_STAGE_SOLVE,
+    DEFAULT_DEBOUNCE_SECONDS,
+)
 from custom_components.haeo.core.context import OptimizationContext
 from custom_components.haeo.core.data.loader.config_loader import load_element_config_from_values
 from custom_components.haeo.core.model import ModelOutputName, Network, OutputData, OutputType
+from custom_components.haeo.core.model.aggregation import PeriodAggregation
+from custom_components.haeo.core.model.elements import ModelElementConfig
+from custom_components.haeo.core.model.network import ObjectiveSpread, RowCompaction
 from custom_components.haeo.core.model.topology import serialize_topology
 from custom_components.haeo.core.schema.elements import ElementConfigData, ElementConfigSchema
 from custom_components.haeo.core.schema.util import extract_unit_parts
@@ -50,6 +61,8 @@ from custom_components.haeo.horizon import HorizonManager
 from custom_components.haeo.repairs import dismiss_optimization_failure_issue
 
 from . import network as network_module
+from .policy_cache import async_get_policy_cache, async_save_policy_cache
+from .store_index import InputStoreIndex
 
 if TYPE_CHECKING:
     from custom_components.haeo import HaeoConfigEntry, HaeoRuntimeData
@@ -273,6 +286,15 @@ class CoordinatorData:
     completed_at: datetime
     """When the optimization completed."""
 
+    aggregation: PeriodAggregation | None = None
+    """Period merging applied to the solve, None when period aggregation is disabled."""
+
+    objective_spread: ObjectiveSpread | None = None
+    """Coefficient spread of the solved objectives."""
+
+    row_compaction: RowCompaction | None = None
+    """Free row count and compaction history of the network's LP."""
+
 
 class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
     """Data update coordinator for HAEO integration.
@@ -305,30 +327,44 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         # of each, including list fields like policy rules) taken from the same
         # subentry view that built the input stores. Field *values* are read live
         # from the stores at optimization time, so value edits still apply; only
-        # the structure is fixed. Structural changes always trigger a reload,
-        # which rebuilds both the stores and this snapshot together. Reading the
-        # structure live instead would let a subentry committed during setup's
-        # awaits (which schedules its own reload) leak in without matching
-        # stores, breaking config assembly.
+        # the structure is fixed. Structural changes rebuild the affected stores
+        # first and then retake this snapshot in async_apply_structure_change().
+        # Reading the structure live instead would let a subentry committed
+        # during setup's awaits (which schedules its own reload) leak in without
+        # matching stores, breaking config assembly.
         self._participant_subentry_ids: dict[str, str] = {}  # element_name -> subentry_id
-
-        for participant in collect_element_subentries(config_entry):
-            self._participant_subentry_ids[participant.name] = participant.subentry.subentry_id
-
-        self._participant_configs: dict[str, ElementConfigSchema] = get_element_configs(
-            config_entry,
-            self._participant_subentry_ids,
-        )
+        self._participant_configs: dict[str, ElementConfigSchema] = {}
+        self._snapshot_participants(config_entry)
 
         # Custom debouncing state
         advanced_data = config_entry.data.get(HUB_SECTION_ADVANCED, {})
         self._debounce_seconds = float(advanced_data.get(CONF_DEBOUNCE_SECONDS, DEFAULT_DEBOUNCE_SECONDS))
+        self._aggregate_periods = bool(advanced_data.get(CONF_AGGREGATE_PERIODS, False))
+        self._two_stage_solve = bool(advanced_data.get(CONF_TWO_STAGE_SOLVE, False))
+        # Reduced copies of the network kept across optimizations, keyed by how they merge periods
+        self._reduced_networks: dict[str, network_module.ReducedNetwork] = {}
         self._last_optimization_time: float | None = None
         self._debounce_timer: CALLBACK_TYPE | None = None
         self._pending_refresh: bool = False
         self._optimization_in_progress: bool = False  # Prevent concurrent optimizations
         self._pending_element_updates: dict[str, ElementConfigData] = {}
 
+        # Last loaded config per element, refreshed as each element's stores change
+        # so an optimization only loads elements that were never loaded. Loaded
+        # configs depend on the horizon only through its period count (defaults
+        # are broadcast to it), so the cache is keyed on that count.
+        self._loaded_configs: dict[str, ElementConfigData] = {}
+        self._loaded_configs_count: int | None = None
+
+        # Per-element store index, tracking store changes once subscribed in
+        # _subscribe_to_input_stores(); until then each lookup builds a fresh view
+        self._store_index: InputStoreIndex | None = None
+
+        # Elements whose stores changed inside batched_element_updates(), loaded
+        # and signaled once when the outermost batch exits
+        self._batch_depth = 0
+        self._batched_elements: set[str] = set()
+
         # No update_interval - we're event-driven from input entities
         # No request_refresh_debouncer - we handle debouncing ourselves
         super().__init__(
@@ -341,16 +377,43 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
         # State change subscriptions - set up in async_initialize()
         self._state_change_unsubs: list[Callable[[], None]] = []
+        # Input store subscriptions, renewed when the stores change with the structure
+        self._store_unsubs: list[Callable[[], None]] = []
+
+        # Held while the network is solved or restructured, so neither sees the other's changes half done
+        self._network_lock = asyncio.Lock()
+
+    def _snapshot_participants(
+        self,
+        config_entry: ConfigEntry,
+        subentries: Iterable[ConfigSubentry] | None = None,
+    ) -> None:
+        """Take the participant structure snapshot from *subentries*, the entry's current ones by default."""
+        participants = collect_element_subentries(config_entry, subentries)
+        self._participant_subentry_ids = {
+            participant.name: participant.subentry.subentry_id for participant in participants
+        }
+        self._participant_configs = {participant.name: participant.config for participant in participants}
 
     def _get_participant_configs(self) -> dict[str, ElementConfigSchema]:
         """Return the participant structure snapshot taken at construction.
 
         The snapshot is consistent with the input stores: both derive from the
         same subentry view. Field values are read live from the stores, so this
-        only fixes structure, which changes solely via a reload.
+        only fixes structure, which changes via async_apply_structure_change()
+        or a reload.
         """
         return self._participant_configs
 
+    def refresh_participant_configs(self) -> None:
+        """Re-read the participant snapshot after an edit that kept the structure.
+
+        Only valid when the participant set and every field's value kind are
+        unchanged, e.g. after constant-only subentry edits absorbed by the
+        stores, so the snapshot stays consistent with them.
+        """
+        self._participant_configs = get_element_configs(self.config_entry, self._participant_subentry_ids)
+
     async def async_initialize(self) -> None:
         """Initialize the network and set up subscriptions.
 
@@ -368,24 +431,73 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
         _LOGGER.debug("Initializing network with %d participants", len(loaded_configs))
 
+        # Expand adapters once for network creation and connectivity validation
+        model_elements = expand_model_elements(loaded_configs)
+        policy_cache = await async_get_policy_cache(self.hass, self.config_entry.entry_id)
         self.network, self._element_updaters = await network_module.create_network(
             self.config_entry,
             periods_seconds=periods_seconds,
             participants=loaded_configs,
+            model_elements=model_elements,
+            policy_cache=policy_cache,
         )
+        await async_save_policy_cache(self.hass, self.config_entry.entry_id, policy_cache)
+
+        await self._async_update_topology(loaded_configs, model_elements)
 
-        # Build topology for frontend card
+        # Subscribe to input store changes
+        self._subscribe_to_input_stores()
+
+    async def async_apply_structure_change(self, subentries: Iterable[ConfigSubentry]) -> None:
+        """Apply added, removed or restructured participants to the live network.
+
+        Called once the input stores of the changed subentries were rebuilt
+        from *subentries* and are ready. The participant snapshot is retaken
+        from the same subentries, store subscriptions are renewed, and the
+        network is diffed against the new participants so only the changed
+        elements are rebuilt, keeping the rest of the LP and its basis for the
+        next warm start.
+        """
+        async with self._network_lock:
+            previous = self._participant_configs
+            self._snapshot_participants(self.config_entry, subentries)
+            for name in previous.keys() | self._participant_configs.keys():
+                if previous.get(name) != self._participant_configs.get(name):
+                    self._loaded_configs.pop(name, None)
+
+            self._unsubscribe_from_store_changes()
+            self._subscribe_to_store_changes()
+
+            loaded_configs = self._load_from_input_stores()
+            model_elements = expand_model_elements(loaded_configs)
+            policy_cache = await async_get_policy_cache(self.hass, self.config_entry.entry_id)
+            self._element_updaters = network_module.update_network(
+                self.network,
+                participants=loaded_configs,
+                updaters=self._element_updaters,
+                model_elements=model_elements,
+                policy_cache=policy_cache,
+            )
+            # The new participant configs hold every queued update
+            self._pending_element_updates.clear()
+            await async_save_policy_cache(self.hass, self.config_entry.entry_id, policy_cache)
+            await self._async_update_topology(loaded_configs, model_elements)
+
+    async def _async_update_topology(
+        self,
+        loaded_configs: Mapping[str, ElementConfigData],
+        model_elements: Mapping[str, Sequence[ModelElementConfig]],
+    ) -> None:
+        """Serialize the network topology for the frontend card and check its connectivity."""
         element_types = {name: str(config[CONF_ELEMENT_TYPE]) for name, config in loaded_configs.items()}
         self.topology = serialize_topology(self.network, element_types=element_types)
         await network_module.evaluate_network_connectivity(
             self.hass,
             self.config_entry,
             participants=loaded_configs,
+            model_elements=model_elements,
         )
 
-        # Subscribe to input store changes
-        self._subscribe_to_input_stores()
-
     def _get_config_entry(self) -> "HaeoConfigEntry":
         """Get the typed config entry."""
         return self.config_entry  # type: ignore[return-value]
@@ -430,9 +542,28 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
             # Apply initial state from the switch (it may have been restored)
             self._apply_auto_optimize_state(is_enabled=runtime_data.auto_optimize_switch.is_on or False)
 
+        self._subscribe_to_store_changes()
+
+    def _subscribe_to_store_changes(self) -> None:
+        """Track the current input stores and update each store's element when its value changes."""
+        runtime_data = self._get_runtime_data()
+        if runtime_data is None:
+            return
+
+        # Track store state in the index first so element listeners see it current
+        self._store_index = InputStoreIndex(runtime_data.input_stores)
+        self._store_unsubs.extend(self._store_index.track())
+
         # Subscribe each store to update only its element when its value changes
         for (element_name, _field_path), store in runtime_data.input_stores.items():
-            self._state_change_unsubs.append(store.add_listener(self._create_store_listener(element_name)))
+            self._store_unsubs.append(store.add_listener(self._create_store_listener(element_name)))
+
+    def _unsubscribe_from_store_changes(self) -> None:
+        """Drop the input store subscriptions made by _subscribe_to_store_changes()."""
+        for unsub in self._store_unsubs:
+            unsub()
+        self._store_unsubs.clear()
+        self._store_index = None
 
     def _create_store_listener(self, element_name: str) -> Callable[[], None]:
         """Create a listener that updates a specific element when its inputs change."""
@@ -450,18 +581,47 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         The network is guaranteed to exist because it's created in async_initialize()
         before this handler is registered.
         """
-        # Load the updated config for just this element
+        if self._batch_depth:
+            self._batched_elements.add(element_name)
+            return
+
+        # Defer network update until optimization time
+        if self._queue_element_update(element_name):
+            # Trigger optimization (with debouncing)
+            self.signal_optimization_stale()
+
+    def _queue_element_update(self, element_name: str) -> bool:
+        """Load an element's config from its stores and queue it for the next optimization."""
         try:
             element_config = self._load_element_config(element_name)
         except ValueError:
             _LOGGER.exception("Failed to load config for element %s due to invalid input entities", element_name)
-            return
+            # Drop the stale cached config so the next optimization reloads it
+            self._loaded_configs.pop(element_name, None)
+            return False
 
-        # Defer network update until optimization time
         self._pending_element_updates[element_name] = element_config
+        self._loaded_configs[element_name] = element_config
+        return True
 
-        # Trigger optimization (with debouncing)
-        self.signal_optimization_stale()
+    @contextmanager
+    def batched_element_updates(self) -> Generator[None]:
+        """Coalesce input store changes made inside the block into one optimization signal.
+
+        Each changed element is reloaded once when the outermost block exits,
+        so a batch reload of many stores does not signal per store.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batched_elements:
+                element_names = sorted(self._batched_elements)
+                self._batched_elements.clear()
+                queued = [name for name in element_names if self._queue_element_update(name)]
+                if queued:
+                    self.signal_optimization_stale()
 
     @callback
     def _handle_horizon_change(self, network: Network, horizon_manager: HorizonManager) -> None:
@@ -601,29 +761,21 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
             return False
         expected_start = expected_horizon[0]
 
-        # Check forecast input stores have values and matching horizon
-        for store in runtime_data.input_stores.values():
-            if not store.time_series:
-                continue
-            store_horizon = store.horizon_start
-            if store_horizon is None:
-                return False
-            # Allow small floating point tolerance
-            if abs(store_horizon - expected_start) > 1.0:
-                return False
+        # Check forecast input stores have values and matching horizon (within a small tolerance)
+        return self._get_store_index(runtime_data).is_aligned(expected_start)
 
-        return True
+    def _get_store_index(self, runtime_data: "HaeoRuntimeData") -> InputStoreIndex:
+        """Return the tracked store index, or a fresh view before stores are subscribed."""
+        if self._store_index is not None:
+            return self._store_index
+        return InputStoreIndex(runtime_data.input_stores)
 
     def _field_values_for_element(self, element_name: str) -> dict["InputFieldPath", Any]:
         """Collect resolved field values from the element's input stores."""
         runtime_data = self._get_runtime_data()
         if runtime_data is None:
             return {}
-        return {
-            field_path: store.value
-            for (name, field_path), store in runtime_data.input_stores.items()
-            if name == element_name
-        }
+        return self._get_store_index(runtime_data).field_values(element_name)
 
     def _load_element_config(self, element_name: str) -> ElementConfigData:
         """Assemble a single element's config from its input stores.
@@ -661,6 +813,8 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
         Substitutes each input field with its store's pre-resolved value to
         produce fully loaded ElementConfigData. No state machine is consulted.
+        Elements already loaded by a store change are served from the cache, so
+        only elements that were never loaded (or whose load failed) are built.
         """
         runtime_data = self._get_runtime_data()
         if runtime_data is None:
@@ -668,27 +822,36 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
             raise UpdateFailed(msg)
 
         forecast_times = runtime_data.horizon_manager.get_forecast_timestamps()
-        return {
-            name: load_element_config_from_values(
-                name,
-                config,
-                self._field_values_for_element(name),
-                forecast_times,
-            )
-            for name, config in self._get_participant_configs().items()
-        }
+        if len(forecast_times) != self._loaded_configs_count:
+            self._loaded_configs.clear()
+            self._loaded_configs_count = len(forecast_times)
+
+        store_index = self._get_store_index(runtime_data)
+        for name, config in self._get_participant_configs().items():
+            if name not in self._loaded_configs:
+                self._loaded_configs[name] = load_element_config_from_values(
+                    name,
+                    config,
+                    store_index.field_values(name),
+                    forecast_times,
+                )
+        # Copy so store changes during the solve don't alter this run's outputs
+        return dict(self._loaded_configs)
 
     def cleanup(self) -> None:
         """Clean up coordinator resources when unloading."""
         for unsub in self._state_change_unsubs:
             unsub()
         self._state_change_unsubs.clear()
+        self._unsubscribe_from_store_changes()
 
         if self._debounce_timer is not None:
             self._debounce_timer()
             self._debounce_timer = None
 
         self._pending_element_updates.clear()
+        self._loaded_configs.clear()
+        self._batched_elements.clear()
 
     def _apply_pending_element_updates(self) -> None:
         """Apply all pending element updates to the network.
@@ -704,6 +867,115 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 updater(element_config)
         self._pending_element_updates.clear()
 
+    async def _build_coordinator_data(
+        self,
+        context: OptimizationContext,
+        loaded_configs: Mapping[str, ElementConfigData],
+        forecast_timestamps: tuple[float, ...],
+        cost: float,
+        model_outputs: Mapping[str, Mapping[ModelOutputName, OutputData]],
+        aggregation: PeriodAggregation | None,
+        *,
+        started_at: datetime,
+    ) -> CoordinatorData:
+        """Convert solved model outputs into coordinator data for the entities."""
+        end_time = time.time()
+        optimization_duration = end_time - started_at.timestamp()
+        network = self.network
+
+        network_output_data: dict[NetworkOutputName, OutputData] = {
+            OUTPUT_NAME_OPTIMIZATION_COST: OutputData(type=OutputType.COST, unit="$", values=(cost,)),
+            OUTPUT_NAME_OPTIMIZATION_STATUS: OutputData(
+                type=OutputType.STATUS, unit=None, values=(OPTIMIZATION_STATUS_SUCCESS,)
+            ),
+            OUTPUT_NAME_OPTIMIZATION_DURATION: OutputData(
+                type=OutputType.DURATION, unit=UnitOfTime.SECONDS, values=(optimization_duration,)
+            ),
+        }
+
+        # Load the network subentry name from translations
+        translations = await async_get_translations(
+            self.hass, self.hass.config.language, "common", integrations=[DOMAIN]
+        )
+        network_subentry_name = translations[f"component.{DOMAIN}.common.network_subentry_name"]
+
+        currency_sym = detect_currency_symbol(
+            context.source_states,
+            fallback_currency=self.hass.config.currency,
+        )
+
+        outputs: dict[str, SubentryDevices] = {
+            # HAEO outputs use network subentry name as key, network element type as device
+            network_subentry_name: {
+                ELEMENT_TYPE_NETWORK: {
+                    name: _build_coordinator_output(name, output, forecast_times=None, currency_sym=currency_sym)
+                    for name, output in network_output_data.items()
+                }
+            }
+        }
+
+        # Process each config element using its outputs function to transform model outputs into device outputs
+        for element_name, element_config in context.participants.items():
+            element_type = element_config[CONF_ELEMENT_TYPE]
+            outputs_fn = ELEMENT_TYPES[element_type].outputs
+
+            # outputs function returns {device_name: {output_name: OutputData}}
+            # May return multiple devices per config element (e.g., battery regions)
+            try:
+                adapter_outputs: Mapping[ElementDeviceName, Mapping[ElementOutputName, OutputData]] = outputs_fn(
+                    name=element_name,
+                    model_outputs=model_outputs,
+                    config=loaded_configs[element_name],
+                    periods=network.periods,
+                )
+            except KeyError:
+                _LOGGER.exception(
+                    "Failed to get outputs for config element %r (type=%r): missing model element. "
+                    "Available model elements: %s",
+                    element_name,
+                    element_type,
+                    list(model_outputs.keys()),
+                )
+                raise
+
+            # Process each device's outputs, grouping under the subentry (element_name)
+            subentry_devices: SubentryDevices = {}
+            for device_name, device_outputs in adapter_outputs.items():
+                processed_outputs: dict[ElementOutputName, CoordinatorOutput] = {
+                    output_name: _build_coordinator_output(
+                        output_name,
+                        output_data,
+                        forecast_times=forecast_timestamps,
+                        currency_sym=currency_sym,
+                    )
+                    for output_name, output_data in device_outputs.items()
+                }
+
+                if processed_outputs:
+                    subentry_devices[device_name] = processed_outputs
+
+            if subentry_devices:
+                outputs[element_name] = subentry_devices
+
+        completed_at = dt_util.utc_from_timestamp(end_time).astimezone()
+
+        return CoordinatorData(
+            context=context,
+            outputs=outputs,
+            started_at=started_at,
+            completed_at=completed_at,
+            aggregation=aggregation,
+            objective_spread=network.objective_spread,
+            row_compaction=network.row_compaction,
+        )
+
+    def _reduced_network(self, key: str) -> network_module.ReducedNetwork:
+        """Return the reduced copy of the network kept under *key*, starting over for a new network."""
+        reduced = self._reduced_networks.get(key)
+        if reduced is None or reduced.source is not self.network:
+            reduced = self._reduced_networks[key] = network_module.ReducedNetwork(self.network)
+        return reduced
+
     async def _async_update_data(self) -> CoordinatorData:
         """Update data from input entities and run optimization."""
         # Check if optimization is already in progress
@@ -727,146 +999,101 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         self._optimization_in_progress = True
 
         try:
-            # Mark optimization start time immediately to prevent concurrent triggers
-            # This ensures debouncing works even if optimization takes a long time
-            self._last_optimization_time = start_time
-
-            # Get forecast timestamps from horizon manager
-            runtime_data = self._get_runtime_data()
-            if runtime_data is None:
-                msg = "Runtime data not available"
-                raise UpdateFailed(msg)
-
-            forecast_timestamps = runtime_data.horizon_manager.get_forecast_timestamps()
-
-            # Build optimization context capturing all inputs for reproducibility
-            context = _build_optimization_context(
-                hub_config=self.config_entry.data,
-                participant_configs=self._get_participant_configs(),
-                input_stores=runtime_data.input_stores,
-                horizon_manager=runtime_data.horizon_manager,
-            )
-
-            # Verify all store-backed inputs are available before proceeding.
-            # When any input is unavailable the optimization is skipped, matching
-            # the behaviour during initial setup where the integration stays in
-            # the "not ready" state until every store can supply data.
-            for (name, _field_path), store in runtime_data.input_stores.items():
-                if not store.available:
-                    msg = f"Element '{name}' has unavailable inputs"
+            async with self._network_lock:
+                # Mark optimization start time immediately to prevent concurrent triggers
+                # This ensures debouncing works even if optimization takes a long time
+                self._last_optimization_time = start_time
+
+                # Get forecast timestamps from horizon manager
+                runtime_data = self._get_runtime_data()
+                if runtime_data is None:
+                    msg = "Runtime data not available"
                     raise UpdateFailed(msg)
 
-            # Load element configurations from input stores
-            # All input stores are guaranteed to be fully loaded by the time we get here
-            loaded_configs = self._load_from_input_stores()
-
-            _LOGGER.debug("Running optimization with %d participants", len(loaded_configs))
-
-            # Network should have been created in async_initialize() or set manually in tests.
-            network = self.network
+                forecast_timestamps = runtime_data.horizon_manager.get_forecast_timestamps()
 
-            # Apply any pending element updates before optimization
-            self._apply_pending_element_updates()
-
-            # Perform the optimization
-            cost = await self.hass.async_add_executor_job(network.optimize)
-
-            end_time = time.time()
-            optimization_duration = end_time - start_time
+                # Build optimization context capturing all inputs for reproducibility
+                context = _build_optimization_context(
+                    hub_config=self.config_entry.data,
+                    participant_configs=self._get_participant_configs(),
+                    input_stores=runtime_data.input_stores,
+                    horizon_manager=runtime_data.horizon_manager,
+                )
 
-            # Record optimization time for debouncing
-            self._last_optimization_time = end_time
+                # Verify all store-backed inputs are available before proceeding.
+                # When any input is unavailable the optimization is skipped, matching
+                # the behaviour during initial setup where the integration stays in
+                # the "not ready" state until every store can supply data.
+                unavailable_element = self._get_store_index(runtime_data).first_unavailable_element()
+                if unavailable_element is not None:
+                    msg = f"Element '{unavailable_element}' has unavailable inputs"
+                    raise UpdateFailed(msg)
 
-            _LOGGER.debug("Optimization completed successfully with cost: %s", cost)
-            dismiss_optimization_failure_issue(self.hass, self.config_entry.entry_id)
+                # Load element configurations from input stores
+                # All input stores are guaranteed to be fully loaded by the time we get here
+                loaded_configs = self._load_from_input_stores()
 
-            network_output_data: dict[NetworkOutputName, OutputData] = {
-                OUTPUT_NAME_OPTIMIZATION_COST: OutputData(type=OutputType.COST, unit="$", values=(cost,)),
-                OUTPUT_NAME_OPTIMIZATION_STATUS: OutputData(
-                    type=OutputType.STATUS, unit=None, values=(OPTIMIZATION_STATUS_SUCCESS,)
-                ),
-                OUTPUT_NAME_OPTIMIZATION_DURATION: OutputData(
-                    type=OutputType.DURATION, unit=UnitOfTime.SECONDS, values=(optimization_duration,)
-                ),
-            }
+                _LOGGER.debug("Running optimization with %d participants", len(loaded_configs))
 
-            # Load the network subentry name from translations
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "common", integrations=[DOMAIN]
-            )
-            network_subentry_name = translations[f"component.{DOMAIN}.common.network_subentry_name"]
+                # Network should have been created in async_initialize() or set manually in tests.
+                network = self.network
 
-            currency_sym = detect_currency_symbol(
-                context.source_states,
-                fallback_currency=self.hass.config.currency,
-            )
+                # Apply any pending element updates before optimization
+                self._apply_pending_element_updates()
 
-            outputs: dict[str, SubentryDevices] = {
-                # HAEO outputs use network subentry name as key, network element type as device
-                network_subentry_name: {
-                    ELEMENT_TYPE_NETWORK: {
-                        name: _build_coordinator_output(name, output, forecast_times=None, currency_sym=currency_sym)
-                        for name, output in network_output_data.items()
-                    }
-                }
-            }
-
-            # Build nested outputs structure from all network model elements
-            model_outputs: dict[str, Mapping[ModelOutputName, OutputData]] = {
-                element_name: element.outputs() for element_name, element in network.elements.items()
-            }
-
-            # Process each config element using its outputs function to transform model outputs into device outputs
-            for element_name, element_config in context.participants.items():
-                element_type = element_config[CONF_ELEMENT_TYPE]
-                outputs_fn = ELEMENT_TYPES[element_type].outputs
-
-                # outputs function returns {device_name: {output_name: OutputData}}
-                # May return multiple devices per config element (e.g., battery regions)
-                try:
-                    adapter_outputs: Mapping[ElementDeviceName, Mapping[ElementOutputName, OutputData]] = outputs_fn(
-                        name=element_name,
-                        model_outputs=model_outputs,
-                        config=loaded_configs[element_name],
-                        periods=network.periods,
+                # Perform the optimization on the network itself, with identical
+                # consecutive periods merged, with the tail coarsened to meet the
+                # solve time budget, or in two stages: a coarse plan of the whole
+                # horizon is published first, then refined near term
+                solution: network_module.ModelSolution | None = None
+                solve_block_seconds = runtime_data.horizon_manager.solve_block_seconds
+                if self._two_stage_solve:
+                    plan = await self.hass.async_add_executor_job(
+                        network_module.solve_coarse_plan, self._reduced_network("coarse_plan")
                     )
-                except KeyError:
-                    _LOGGER.exception(
-                        "Failed to get outputs for config element %r (type=%r): missing model element. "
-                        "Available model elements: %s",
-                        element_name,
-                        element_type,
-                        list(model_outputs.keys()),
-                    )
-                    raise
-
-                # Process each device's outputs, grouping under the subentry (element_name)
-                subentry_devices: SubentryDevices = {}
-                for device_name, device_outputs in adapter_outputs.items():
-                    processed_outputs: dict[ElementOutputName, CoordinatorOutput] = {
-                        output_name: _build_coordinator_output(
-                            output_name,
-                            output_data,
-                            forecast_times=forecast_timestamps,
-                            currency_sym=currency_sym,
+                    if plan is not None:
+                        coarse_data = await self._build_coordinator_data(
+                            context, loaded_configs, forecast_timestamps, *plan.solution, started_at=started_at
                         )
-                        for output_name, output_data in device_outputs.items()
-                    }
-
-                    if processed_outputs:
-                        subentry_devices[device_name] = processed_outputs
-
-                if subentry_devices:
-                    outputs[element_name] = subentry_devices
-
-            completed_at = dt_util.utc_from_timestamp(end_time).astimezone()
+                        self.async_set_updated_data(coarse_data)
+                        solution = await self.hass.async_add_executor_job(
+                            network_module.solve_near_term, self._reduced_network("near_term"), plan
+                        )
+                elif solve_block_seconds is not None:
+                    solution = await self.hass.async_add_executor_job(
+                        network_module.optimize_coarsened,
+                        self._reduced_network("coarsened"),
+                        solve_block_seconds / 3600,
+                    )
+                elif self._aggregate_periods:
+                    solution = await self.hass.async_add_executor_job(
+                        network_module.optimize_aggregated, self._reduced_network("aggregated")
+                    )
 
-            return CoordinatorData(
-                context=context,
-                outputs=outputs,
-                started_at=started_at,
-                completed_at=completed_at,
-            )
+                aggregation: PeriodAggregation | None = None
+                if solution is None:
+                    cost = await self.hass.async_add_executor_job(network.optimize)
+                    model_outputs = network.outputs()
+                else:
+                    cost, model_outputs, aggregation = solution
+
+                # Record optimization time for debouncing and the solve time budget
+                self._last_optimization_time = time.time()
+                if not self._two_stage_solve:
+                    runtime_data.horizon_manager.record_solve_time(self._last_optimization_time - start_time)
+
+                _LOGGER.debug("Optimization completed successfully with cost: %s", cost)
+                dismiss_optimization_failure_issue(self.hass, self.config_entry.entry_id)
+
+                return await self._build_coordinator_data(
+                    context,
+                    loaded_configs,
+                    forecast_timestamps,
+                    cost,
+                    model_outputs,
+                    aggregation,
+                    started_at=started_at,
+                )
         finally:
             # Always clear the in-progress flag
             self._optimization_in_progress = False
@@ -6,26 +6,47 @@ optimization cycle the coordinator calls these updaters with fresh
 ``ElementConfigData``; they re-derive model values through the adapter
 then write directly to the captured ``TrackedParam`` descriptors without
 any runtime path resolution.
+
+Updaters also carry a per-field plan built at network creation: input
+fields the adapter forwards untouched into tracked params are written
+straight to those params when they change, and unchanged fields are
+skipped, so only changes to derived fields re-run the adapter.
 """
 
 from collections.abc import Callable, Mapping, Sequence
+from copy import copy
+from dataclasses import dataclass
 import logging
-from typing import Any
+from typing import Any, Final, NoReturn
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 import numpy as np
+from numpy.typing import NDArray
 
 from custom_components.haeo.core.adapters.elements.policy import extract_policy_rules
-from custom_components.haeo.core.adapters.policy_compilation import CompiledPolicyRule, compile_policies
-from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES, collect_model_elements
-from custom_components.haeo.core.const import CONF_ELEMENT_TYPE
-from custom_components.haeo.core.model import Network
+from custom_components.haeo.core.adapters.policy_compilation import (
+    CompiledPolicyRule,
+    PolicyCompilationCache,
+    compile_policies,
+)
+from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES, collect_model_elements, expand_model_elements
+from custom_components.haeo.core.const import (
+    CONF_BOUNDED_BATTERIES,
+    CONF_ELEMENT_TYPE,
+    CONF_NORMALIZED_TIME_PREFERENCE,
+    HUB_SECTION_ADVANCED,
+)
+from custom_components.haeo.core.model import Battery, ModelOutputName, Network, OutputData
+from custom_components.haeo.core.model.aggregation import PeriodAggregation, find_period_runs
+from custom_components.haeo.core.model.contraction import contract_passthrough_nodes
 from custom_components.haeo.core.model.elements import ModelElementConfig
+from custom_components.haeo.core.model.elements.battery import BATTERY_ENERGY_STORED
 from custom_components.haeo.core.model.elements.policy_pricing import PolicyPricing
+from custom_components.haeo.core.model.network import CalibratedOptions
 from custom_components.haeo.core.model.reactive import TrackedParam
 from custom_components.haeo.core.model.util import broadcast_to_sequence
-from custom_components.haeo.core.schema.elements import ElementConfigData, ElementType
+from custom_components.haeo.core.schema.elements import ELEMENT_FIELD_HINTS, ElementConfigData, ElementType
 from custom_components.haeo.repairs import create_disconnected_network_issue, dismiss_disconnected_network_issue
 from custom_components.haeo.validation import format_component_summary, validate_network_topology
 
@@ -34,9 +55,23 @@ _LOGGER = logging.getLogger(__name__)
 type ElementUpdater = Callable[[ElementConfigData], None]
 """Closure that applies fresh config values to pre-resolved TrackedParams."""
 
+type ModelOutputs = dict[str, Mapping[ModelOutputName, OutputData]]
+"""Model element outputs keyed by model element name."""
+
+type ModelSolution = tuple[float, ModelOutputs, PeriodAggregation]
+"""Optimal cost, model outputs on the network's periods, and the period aggregation solved."""
+
+# Two-stage solving: the first NEAR_TERM_HOURS are refined at full resolution,
+# the rest of the horizon is solved in blocks of about COARSE_BLOCK_HOURS
+NEAR_TERM_HOURS: Final = 24.0
+COARSE_BLOCK_HOURS: Final = 2.0
+
 # Sentinel for missing dict paths during value extraction.
 _MISSING: object = object()
 
+type _Setter = Callable[[object], None]
+type _FieldPath = tuple[str, str]
+
 
 def _collect_policy_rules(
     participants: Mapping[str, ElementConfigData],
@@ -60,17 +95,17 @@ def _collect_policy_rules(
 _SKIP_KEYS: frozenset[str] = frozenset({"element_type", "name", "segment_type"})
 
 
-def _discover_setters(
+def _discover_params(
     element: Any,
     config: Mapping[str, Any],
-) -> list[tuple[tuple[str, ...], Callable[[object], None]]]:
+) -> list[tuple[tuple[str, ...], Any, str]]:
     """Walk *config* in parallel with *element* to find TrackedParam targets.
 
-    Returns ``(path, setter)`` pairs where *path* is the key sequence in
-    the ``ModelElementConfig`` dict and *setter* writes directly to the
-    descriptor on the live element.
+    Returns ``(path, target, attr)`` triples where *path* is the key
+    sequence in the ``ModelElementConfig`` dict and *attr* names the
+    TrackedParam descriptor on *target*, the element or one of its segments.
     """
-    result: list[tuple[tuple[str, ...], Callable[[object], None]]] = []
+    result: list[tuple[tuple[str, ...], Any, str]] = []
 
     def _navigate(obj: Any, key: str) -> Any:
         if isinstance(obj, Mapping):
@@ -89,14 +124,25 @@ def _discover_setters(
             elif not isinstance(obj, Mapping):
                 descriptor = getattr(type(obj), key, None)
                 if isinstance(descriptor, TrackedParam):
-                    target = obj
-                    attr = key
-                    result.append((path, lambda v, t=target, a=attr: setattr(t, a, v)))
+                    result.append((path, obj, key))
 
     _walk(element, config, ())
     return result
 
 
+def _discover_setters(
+    element: Any,
+    config: Mapping[str, Any],
+) -> list[tuple[tuple[str, ...], Callable[[object], None]]]:
+    """Return ``(path, setter)`` pairs for the TrackedParams found by ``_discover_params``.
+
+    Each *setter* writes directly to the descriptor on the live element.
+    """
+    return [
+        (path, lambda v, t=target, a=attr: setattr(t, a, v)) for path, target, attr in _discover_params(element, config)
+    ]
+
+
 def _extract_at_path(config: Mapping[str, Any], path: tuple[str, ...]) -> Any:
     """Extract a value from a nested dict, returning ``_MISSING`` on failure."""
     current: Any = config
@@ -108,26 +154,124 @@ def _extract_at_path(config: Mapping[str, Any], path: tuple[str, ...]) -> Any:
     return current
 
 
+def _replace_at_path(config: Mapping[str, Any], path: tuple[str, ...], value: Any) -> dict[str, Any]:
+    """Return a copy of *config* with *value* at *path*, copying only the dicts along it."""
+    head, *rest = path
+    return {**config, head: _replace_at_path(config[head], tuple(rest), value) if rest else value}
+
+
 # ---------------------------------------------------------------------------
 # Updater builders
 # ---------------------------------------------------------------------------
 
 
+class _ProbeUsedError(TypeError):
+    """Raised when an adapter operates on a probe value instead of forwarding it."""
+
+
+class _ProbeValue:
+    """Opaque stand-in for an input field value.
+
+    Every operation other than passing the object along raises
+    ``_ProbeUsedError``, so an adapter probed with it either forwards it
+    untouched into its model config or fails.
+    """
+
+    __slots__ = ()
+    __array_ufunc__ = None
+
+    def _refuse(self, *_args: object) -> NoReturn:
+        msg = "Input field value used by the adapter while probing field dependencies"
+        raise _ProbeUsedError(msg)
+
+    __getattr__ = __array__ = __bool__ = __float__ = __int__ = __index__ = __round__ = _refuse
+    __hash__ = __len__ = __iter__ = __getitem__ = __contains__ = _refuse
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _refuse
+    __neg__ = __pos__ = __abs__ = _refuse
+    __add__ = __radd__ = __sub__ = __rsub__ = __mul__ = __rmul__ = _refuse
+    __truediv__ = __rtruediv__ = __floordiv__ = __rfloordiv__ = __mod__ = __rmod__ = __pow__ = __rpow__ = _refuse
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Return True when two config values are equal, comparing arrays elementwise."""
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return bool(np.array_equal(a, b))
+    if isinstance(a, Mapping) and isinstance(b, Mapping):
+        return a.keys() == b.keys() and all(_same_value(a[key], b[key]) for key in a)
+    return bool(a == b)
+
+
+def _element_field_paths(element_type: ElementType) -> list[_FieldPath]:
+    """Return the ``(section, field)`` paths of an element type's input fields."""
+    return [(section, field) for section, fields in ELEMENT_FIELD_HINTS[element_type].items() for field in fields]
+
+
+def _probe_direct_setters(
+    element_type: ElementType,
+    config: ElementConfigData,
+    field_path: _FieldPath,
+    initial_by_name: Mapping[str, ModelElementConfig],
+    element_bindings: list[tuple[str, list[tuple[tuple[str, ...], _Setter]]]],
+) -> list[_Setter] | None:
+    """Return the setters a field is forwarded to untouched, or None when it is derived.
+
+    The adapter is run with the field replaced by a probe value. The field is
+    direct when that succeeds, the probe lands only at tracked param paths, and
+    every other tracked param keeps its initial value.
+    """
+    section, field = field_path
+    probe = _ProbeValue()
+    probe_config: Any = {**config, section: {**config[section], field: probe}}  # type: ignore[literal-required]
+    try:
+        probed_by_name = {cfg["name"]: cfg for cfg in ELEMENT_TYPES[element_type].model_elements(probe_config)}
+        setters: list[_Setter] = []
+        for name, bindings in element_bindings:
+            probed = probed_by_name.get(name)
+            if probed is None:
+                _LOGGER.debug(
+                    "Field %s.%s of %s is derived: model element %s disappears", section, field, element_type, name
+                )
+                return None
+            for path, setter in bindings:
+                value = _extract_at_path(probed, path)
+                if value is probe:
+                    setters.append(setter)
+                elif not _same_value(value, _extract_at_path(initial_by_name[name], path)):
+                    _LOGGER.debug(
+                        "Field %s.%s of %s is derived: it changes %s at %s", section, field, element_type, name, path
+                    )
+                    return None
+    except _ProbeUsedError:
+        _LOGGER.debug("Field %s.%s of %s is derived: the adapter computes with it", section, field, element_type)
+        return None
+    return setters
+
+
 def _build_element_updater(
     network: Network,
     element_type: ElementType,
     initial_model_configs: list[ModelElementConfig],
+    initial_config: ElementConfigData | None = None,
 ) -> ElementUpdater:
     """Build an updater for a non-policy element.
 
     Discovers TrackedParam paths on the initial model configs and captures
     direct setters.  On each call the adapter re-derives values from fresh
     config, then the captured setters write them without path resolution.
+
+    When *initial_config* (the config the model configs were built from) is
+    given, each input field is also probed once to find fields the adapter
+    forwards untouched into tracked params. Updates then compare field values
+    with the last applied config: unchanged fields are skipped and changed
+    direct fields are written straight to their params, so the adapter only
+    re-runs when a field it computes with has changed.
     """
     adapter = ELEMENT_TYPES[element_type]
 
     # Pre-resolve bindings: (model_element_name, [(dict_path, setter), ...])
-    element_bindings: list[tuple[str, list[tuple[tuple[str, ...], Callable[[object], None]]]]] = []
+    element_bindings: list[tuple[str, list[tuple[tuple[str, ...], _Setter]]]] = []
     for model_config in initial_model_configs:
         element_name = model_config["name"]
         element = network.elements.get(element_name)
@@ -137,7 +281,21 @@ def _build_element_updater(
         if setters:
             element_bindings.append((element_name, setters))
 
-    def update(config: ElementConfigData) -> None:
+    field_paths = _element_field_paths(element_type)
+    direct_setters: dict[_FieldPath, list[_Setter]] = {}
+    if initial_config is not None:
+        initial_by_name = {cfg["name"]: cfg for cfg in initial_model_configs}
+        for field_path in field_paths:
+            value = _extract_at_path(initial_config, field_path)
+            if value is _MISSING or value is None:
+                continue
+            setters = _probe_direct_setters(element_type, initial_config, field_path, initial_by_name, element_bindings)
+            if setters is not None:
+                direct_setters[field_path] = setters
+
+    applied = initial_config
+
+    def update_all(config: ElementConfigData) -> None:
         fresh_model_configs = adapter.model_elements(config)
         by_name: dict[str, ModelElementConfig] = {cfg["name"]: cfg for cfg in fresh_model_configs}
         for name, setters in element_bindings:
@@ -149,6 +307,30 @@ def _build_element_updater(
                 if value is not _MISSING:
                     setter(value)
 
+    def update(config: ElementConfigData) -> None:
+        nonlocal applied
+        # Only record the config once every write succeeded, so a failed update is retried in full
+        if applied is None:
+            update_all(config)
+            applied = config
+            return
+
+        changed = {
+            field_path: value
+            for field_path in field_paths
+            if not _same_value(value := _extract_at_path(config, field_path), _extract_at_path(applied, field_path))
+        }
+        if not all(
+            path in direct_setters and value is not _MISSING and value is not None for path, value in changed.items()
+        ):
+            update_all(config)
+            applied = config
+            return
+        for path, value in changed.items():
+            for setter in direct_setters[path]:
+                setter(value)
+        applied = config
+
     return update
 
 
@@ -199,28 +381,53 @@ async def create_network(
     *,
     periods_seconds: Sequence[int],
     participants: Mapping[str, ElementConfigData],
+    model_elements: Mapping[str, Sequence[ModelElementConfig]] | None = None,
+    policy_cache: PolicyCompilationCache | None = None,
 ) -> tuple[Network, dict[str, ElementUpdater]]:
     """Create a new Network from configuration.
 
     Returns the network and a dict mapping each HA element name to an
     ``ElementUpdater`` closure that writes fresh config values to the
     pre-resolved TrackedParams on the network elements.
+
+    *model_elements* is an ``expand_model_elements`` result for the
+    participants; when omitted the adapters are expanded here, once, and the
+    expansion is shared by policy compilation and updater discovery.
+
+    *policy_cache* supplies and collects compiled policy structures, so a
+    topology and rule set compiled before is only retagged and repriced.
     """
     # Convert seconds to hours for model layer
     periods_hours = np.asarray(periods_seconds, dtype=float) / 3600
-    net = Network(name=f"haeo_network_{entry.entry_id}", periods=periods_hours)
+    advanced = entry.data.get(HUB_SECTION_ADVANCED, {})
+    bounded_batteries = bool(advanced.get(CONF_BOUNDED_BATTERIES, False))
+    normalized_time_preference = bool(advanced.get(CONF_NORMALIZED_TIME_PREFERENCE, False))
+    net = Network(
+        name=f"haeo_network_{entry.entry_id}",
+        periods=periods_hours,
+        options=CalibratedOptions(secondary_objective="normalized") if normalized_time_preference else None,
+        battery_formulation="bounded" if bounded_batteries else "cumulative",
+    )
 
     if not participants:
         _LOGGER.info("No participants configured for hub - returning empty network")
         return net, {}
 
-    sorted_model_elements: list[ModelElementConfig] = list(collect_model_elements(participants))
+    if model_elements is None:
+        model_elements = expand_model_elements(participants)
+
+    # Policy compilation tags configs in place, so it gets shallow copies and the
+    # shared expansion stays as the adapters produced it for updater discovery
+    sorted_model_elements: list[ModelElementConfig] = [
+        copy(model_config) for model_config in collect_model_elements(participants, model_elements)
+    ]
 
     # Compile policy rules into tagged power flow constraints
     policy_rules = _collect_policy_rules(participants)
-    result = compile_policies(sorted_model_elements, policy_rules)
+    result = compile_policies(sorted_model_elements, policy_rules, policy_cache)
+    model_configs, net.contractions = contract_passthrough_nodes(result["elements"])
 
-    for model_element_config in result["elements"]:
+    for model_element_config in model_configs:
         element_name = model_element_config.get("name")
         try:
             net.add(model_element_config)
@@ -235,9 +442,7 @@ async def create_network(
         element_type = config[CONF_ELEMENT_TYPE]
         if element_type == ElementType.POLICY:
             continue
-        adapter = ELEMENT_TYPES[element_type]
-        initial_model_configs = adapter.model_elements(config)
-        updaters[name] = _build_element_updater(net, element_type, initial_model_configs)
+        updaters[name] = _build_element_updater(net, element_type, list(model_elements[name]), config)
 
     # Build the policy updater.  The config flow enforces a single policy
     # element, so the pricing_rule_map covers that one element's rules and
@@ -251,14 +456,352 @@ async def create_network(
     return net, updaters
 
 
+def _same_structure(element: Any, config: Mapping[str, Any], fresh: Mapping[str, Any]) -> bool:
+    """Return True when *fresh* only differs from *element*'s *config* in its TrackedParam values."""
+    paths = [path for path, _target, _attr in _discover_params(element, config)]
+    masked: list[Mapping[str, Any]] = []
+    for model_config in (config, fresh):
+        structure: Mapping[str, Any] = model_config
+        for path in paths:
+            if _extract_at_path(structure, path) is not _MISSING:
+                structure = _replace_at_path(structure, path, _MISSING)
+        masked.append(structure)
+    return _same_value(*masked)
+
+
+def _restructure_network(network: Network, configs: Sequence[ModelElementConfig]) -> set[str]:
+    """Bring *network* to the elements of *configs* in place, returning the names added or removed.
+
+    Elements whose config only differs in TrackedParam values are kept, with
+    the new values written to their params. Any other change removes the
+    element and adds it afresh, along with the connections ending at it and
+    the policy pricing of those connections, since they hold references to
+    its variables. Everything else keeps its rows, columns and basis.
+    """
+    fresh_by_name = {config["name"]: config for config in configs}
+    changed = {
+        name
+        for name, config in network.element_configs.items()
+        if name not in fresh_by_name or not _same_structure(network.elements[name], config, fresh_by_name[name])
+    }
+    for name, config in network.element_configs.items():
+        if config["element_type"] == "connection" and {config["source"], config["target"]} & changed:
+            changed.add(name)
+    for name, config in network.element_configs.items():
+        if config["element_type"] == "policy_pricing" and {term["connection"] for term in config["terms"]} & changed:
+            changed.add(name)
+
+    # Pricing goes before the connections it prices, and connections before their endpoints
+    removal_order = {"policy_pricing": 0, "connection": 1}
+    for name in sorted(changed, key=lambda name: removal_order.get(network.element_configs[name]["element_type"], 2)):
+        network.remove(name)
+
+    for config in configs:
+        name = config["name"]
+        if name not in network.elements:
+            try:
+                network.add(config)
+            except Exception as e:
+                msg = f"Failed to add model element '{name}' (type={config.get('element_type')})"
+                _LOGGER.exception(msg)
+                raise ValueError(msg) from e
+            changed.add(name)
+            continue
+        for path, setter in _discover_setters(network.elements[name], config):
+            setter(_extract_at_path(config, path))
+        network.element_configs[name] = config
+
+    # Keep the order a fresh network would have
+    network.elements = {config["name"]: network.elements[config["name"]] for config in configs}
+    network.element_configs = {config["name"]: network.element_configs[config["name"]] for config in configs}
+    return changed
+
+
+def update_network(
+    network: Network,
+    *,
+    participants: Mapping[str, ElementConfigData],
+    updaters: Mapping[str, ElementUpdater],
+    model_elements: Mapping[str, Sequence[ModelElementConfig]] | None = None,
+    policy_cache: PolicyCompilationCache | None = None,
+) -> dict[str, ElementUpdater]:
+    """Apply added, removed or restructured participants to a network built by ``create_network``.
+
+    Policies are recompiled through *policy_cache* and the network is diffed
+    against the result, so only the elements whose structure changed are
+    removed and added again; the rest keep their LP rows, columns and basis.
+
+    Returns the element updaters for *participants*. Updaters in *updaters*
+    whose model elements were all kept are reused, after applying the
+    participant's config so they match the values written to the network.
+    """
+    if model_elements is None:
+        model_elements = expand_model_elements(participants)
+
+    sorted_model_elements: list[ModelElementConfig] = [
+        copy(model_config) for model_config in collect_model_elements(participants, model_elements)
+    ]
+    result = compile_policies(sorted_model_elements, _collect_policy_rules(participants), policy_cache)
+    model_configs, contractions = contract_passthrough_nodes(result["elements"])
+    changed = _restructure_network(network, model_configs)
+    network.contractions = contractions
+    _LOGGER.debug("Restructured network %s: %d elements added or removed", network.name, len(changed))
+
+    new_updaters: dict[str, ElementUpdater] = {}
+    for name, config in participants.items():
+        element_type = config[CONF_ELEMENT_TYPE]
+        if element_type == ElementType.POLICY:
+            continue
+        updater = updaters.get(name)
+        if updater is not None and not {model_config["name"] for model_config in model_elements[name]} & changed:
+            updater(config)
+            new_updaters[name] = updater
+        else:
+            new_updaters[name] = _build_element_updater(network, element_type, list(model_elements[name]), config)
+
+    if result["pricing_rule_map"]:
+        policy_updater = _build_policy_updater(network, result["pricing_rule_map"])
+        for name, config in participants.items():
+            if config[CONF_ELEMENT_TYPE] == ElementType.POLICY:
+                new_updaters[name] = policy_updater
+
+    return new_updaters
+
+
+# ---------------------------------------------------------------------------
+# Solving on merged periods
+# ---------------------------------------------------------------------------
+
+
+class ReducedNetwork:
+    """A copy of a network solved on merged periods, kept across optimization cycles.
+
+    The copy is built from the configs the source network's elements were
+    added from, reduced onto the merged periods. Each load reads the source's
+    TrackedParams, which the element updaters keep current, and writes their
+    reduced values to the copy's own, so the copy keeps its LP and basis
+    between cycles. It is rebuilt only when the merged period count changes;
+    when the source's elements change, the copy is restructured the same way.
+    """
+
+    def __init__(self, source: Network) -> None:
+        """Mirror *source*; the copy itself is built on the first load."""
+        self.source = source
+        self._source_elements: tuple[Any, ...] = ()
+        self._restructure = False
+        self._source_params: dict[str, list[tuple[tuple[str, ...], Any, str]]] = {}
+        self._network: Network | None = None
+        self._setters: dict[str, list[tuple[tuple[str, ...], _Setter]]] = {}
+        self._aggregation: PeriodAggregation | None = None
+
+    def live_configs(self) -> list[ModelElementConfig]:
+        """Return the source's element configs holding its current parameter values."""
+        elements = tuple(self.source.elements.values())
+        if len(elements) != len(self._source_elements) or any(
+            element is not known for element, known in zip(elements, self._source_elements, strict=True)
+        ):
+            self._source_elements = elements
+            self._source_params = {
+                name: _discover_params(self.source.elements[name], config)
+                for name, config in self.source.element_configs.items()
+            }
+            self._restructure = self._network is not None
+
+        configs: list[ModelElementConfig] = []
+        for name, config in self.source.element_configs.items():
+            live: Mapping[str, Any] = config
+            for path, target, attr in self._source_params[name]:
+                live = _replace_at_path(live, path, getattr(target, attr))
+            configs.append(live)  # type: ignore[arg-type]
+        return configs
+
+    def load(self, aggregation: PeriodAggregation, configs: Sequence[ModelElementConfig] | None = None) -> Network:
+        """Write the source's current values, reduced by *aggregation*, to the copy and return it.
+
+        *configs* are the source's ``live_configs`` when the caller already read them.
+        """
+        if configs is None:
+            configs = self.live_configs()
+        periods = self.source.periods
+        reduced_periods = aggregation.aggregate_periods(periods)
+        reduced_configs = [aggregation.aggregate_config(config, periods) for config in configs]
+
+        network = self._network
+        if network is None or network.n_periods != aggregation.n_aggregated:
+            network = self._build(reduced_periods, reduced_configs)
+        elif self._restructure:
+            network.update_periods(reduced_periods)
+            _restructure_network(network, reduced_configs)
+            network.contractions = self.source.contractions
+            self._discover_setters(network)
+        else:
+            network.update_periods(reduced_periods)
+            for config in reduced_configs:
+                for path, setter in self._setters[config["name"]]:
+                    setter(_extract_at_path(config, path))
+        self._restructure = False
+        self._aggregation = aggregation
+        return network
+
+    def _build(self, periods: NDArray[np.float64], configs: Sequence[ModelElementConfig]) -> Network:
+        """Build the copy on *periods* from reduced *configs*."""
+        source = self.source
+        network = Network(
+            name=source.name, periods=periods, options=source.options, battery_formulation=source.battery_formulation
+        )
+        network.contractions = source.contractions
+        for config in configs:
+            network.add(config)
+        self._discover_setters(network)
+        self._network = network
+        _LOGGER.debug("Built %d-period copy of network %s", network.n_periods, source.name)
+        return network
+
+    def _discover_setters(self, network: Network) -> None:
+        """Capture the setters of the copy's TrackedParams for later loads."""
+        self._setters = {
+            name: _discover_setters(network.elements[name], config) for name, config in network.element_configs.items()
+        }
+
+    def solve(self) -> ModelSolution:
+        """Optimize the loaded copy and expand its outputs onto the source's periods."""
+        network, aggregation = self._network, self._aggregation
+        if network is None or aggregation is None:
+            msg = "ReducedNetwork.solve() called before load()"
+            raise RuntimeError(msg)
+        periods = self.source.periods
+        cost = network.optimize()
+        self.source.objective_spread = network.objective_spread
+
+        _LOGGER.debug("Solved %d periods as %d aggregated periods", aggregation.n_periods, aggregation.n_aggregated)
+        outputs: ModelOutputs = {
+            name: {
+                output_name: aggregation.expand_output(output, periods)
+                for output_name, output in element_outputs.items()
+            }
+            for name, element_outputs in network.outputs().items()
+        }
+        return cost, outputs, aggregation
+
+
+def optimize_aggregated(reduced: ReducedNetwork) -> ModelSolution:
+    """Optimize with runs of identical consecutive periods merged.
+
+    The source network's current inputs are scanned for runs of periods with
+    identical values. When any run is found, *reduced* is loaded with one
+    period per run and solved, and its outputs are expanded back onto the
+    source's periods; otherwise the source network itself is optimized.
+
+    Returns the optimal cost, the model outputs keyed by element name and the
+    aggregation that was applied.
+    """
+    network = reduced.source
+    configs = reduced.live_configs()
+    aggregation = find_period_runs(network.periods, configs)
+    if aggregation.is_identity or not network.elements:
+        cost = network.optimize()
+        return cost, network.outputs(), aggregation
+    reduced.load(aggregation, configs)
+    return reduced.solve()
+
+
+def optimize_coarsened(reduced: ReducedNetwork, block_hours: float) -> ModelSolution | None:
+    """Optimize with the horizon beyond ``NEAR_TERM_HOURS`` solved in blocks of about *block_hours*.
+
+    This trades resolution in the tail of the horizon for solve time. Returns
+    None when the horizon does not extend past the near-term window.
+    """
+    network = reduced.source
+    window = _near_term_window(network.periods)
+    if window >= network.n_periods or not network.elements:
+        return None
+    reduced.load(PeriodAggregation.coarsen(network.periods, block_hours, keep=window))
+    return reduced.solve()
+
+
+def _near_term_window(periods: NDArray[np.floating[Any]]) -> int:
+    """Return the number of leading periods that end within ``NEAR_TERM_HOURS``, at least one."""
+    return max(int(np.searchsorted(np.cumsum(periods), NEAR_TERM_HOURS, side="right")), 1)
+
+
+@dataclass(frozen=True, slots=True)
+class CoarsePlan:
+    """First stage of a two-stage solve: the whole horizon at coarse resolution."""
+
+    solution: ModelSolution
+    """Cost, model outputs expanded onto the network's periods, and the coarsening used."""
+
+    window: int
+    """Number of leading periods the near-term stage solves at full resolution."""
+
+    window_charge: dict[str, float]
+    """Planned stored energy of each battery at the end of the window."""
+
+
+def solve_coarse_plan(reduced: ReducedNetwork) -> CoarsePlan | None:
+    """Solve the whole horizon in blocks of about ``COARSE_BLOCK_HOURS``.
+
+    The blocks never span the end of the first ``NEAR_TERM_HOURS`` of the
+    horizon, so the plan's stored energy there is exact for the coarse model.
+    Returns None when the horizon does not extend past the near-term window.
+    """
+    network = reduced.source
+    periods = network.periods
+    window = _near_term_window(periods)
+    if window >= len(periods) or not network.elements:
+        return None
+
+    reduced.load(PeriodAggregation.coarsen(periods, COARSE_BLOCK_HOURS, breaks=(window,)))
+    solution = reduced.solve()
+    _cost, outputs, _aggregation = solution
+    window_charge = {
+        name: float(outputs[name][BATTERY_ENERGY_STORED].values[window])
+        for name, element in network.elements.items()
+        if isinstance(element, Battery)
+    }
+    return CoarsePlan(solution=solution, window=window, window_charge=window_charge)
+
+
+def solve_near_term(reduced: ReducedNetwork, plan: CoarsePlan) -> ModelSolution:
+    """Refine *plan*: the near-term window at full resolution, the tail still coarse.
+
+    *reduced* must be kept apart from the one that solved *plan*, as the two
+    merge different periods. Each battery must end the window holding at
+    least the energy the coarse plan gave it there, so the refined plan
+    cannot spend energy the coarse plan kept for later. Averaged coarse
+    inputs can make that floor unreachable, in which case the window is
+    re-solved without it. Any other failure is raised.
+    """
+    network = reduced.load(PeriodAggregation.coarsen(reduced.source.periods, COARSE_BLOCK_HOURS, keep=plan.window))
+    batteries = [
+        (element, plan.window_charge[name])
+        for name, element in network.elements.items()
+        if isinstance(element, Battery) and name in plan.window_charge
+    ]
+    for battery, charge in batteries:
+        minimum_charge = np.zeros(network.n_periods + 1)
+        minimum_charge[plan.window] = np.clip(charge, 0.0, battery.capacity[plan.window])
+        battery.minimum_charge = minimum_charge
+    try:
+        return reduced.solve()
+    except ValueError:
+        if not network.infeasible:
+            raise
+        _LOGGER.warning("Near-term solve cannot reach the coarse plan's battery charge; solving without it")
+    for battery, _charge in batteries:
+        battery.minimum_charge = np.zeros(network.n_periods + 1)
+    return reduced.solve()
+
+
 async def evaluate_network_connectivity(
     hass: HomeAssistant,
     entry: ConfigEntry,
     *,
     participants: Mapping[str, ElementConfigData],
+    model_elements: Mapping[str, Sequence[ModelElementConfig]] | None = None,
 ) -> None:
     """Validate the network connectivity for an entry and manage repair issues."""
-    result = validate_network_topology(participants)
+    result = validate_network_topology(participants, model_elements)
 
     if result.is_connected:
         dismiss_disconnected_network_issue(hass, entry.entry_id)
@@ -276,7 +819,18 @@ async def evaluate_network_connectivity(
 
 
 __all__ = [
+    "COARSE_BLOCK_HOURS",
+    "NEAR_TERM_HOURS",
+    "CoarsePlan",
     "ElementUpdater",
+    "ModelOutputs",
+    "ModelSolution",
+    "ReducedNetwork",
     "create_network",
     "evaluate_network_connectivity",
+    "optimize_aggregated",
+    "optimize_coarsened",
+    "solve_coarse_plan",
+    "solve_near_term",
+    "update_network",
 ]
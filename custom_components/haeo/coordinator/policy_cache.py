@@ -0,0 +1,51 @@
+"""Per-hub policy compilation cache kept in memory and in Home Assistant storage.
+
+Policy compilation only depends on the network topology and the rule
+groupings, which rarely change between reloads and restarts. Each hub keeps a
+:class:`PolicyCompilationCache` in ``hass.data`` so reloads reuse it directly,
+and mirrors it to a storage file so the first setup after a restart does too.
+"""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util.hass_dict import HassKey
+
+from custom_components.haeo.const import DOMAIN
+from custom_components.haeo.core.adapters.policy_compilation import PolicyCompilationCache
+
+STORAGE_VERSION = 1
+
+_POLICY_CACHES: HassKey[dict[str, PolicyCompilationCache]] = HassKey(f"{DOMAIN}_policy_caches")
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the storage file backing a hub's cache."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.policy_compilation.{entry_id}")
+
+
+async def async_get_policy_cache(hass: HomeAssistant, entry_id: str) -> PolicyCompilationCache:
+    """Return the hub's cache, restoring it from storage on first use."""
+    caches = hass.data.setdefault(_POLICY_CACHES, {})
+    cache = caches.get(entry_id)
+    if cache is None:
+        cache = caches[entry_id] = PolicyCompilationCache.from_dict(await _store(hass, entry_id).async_load())
+    return cache
+
+
+async def async_save_policy_cache(hass: HomeAssistant, entry_id: str, cache: PolicyCompilationCache) -> None:
+    """Persist the cache when a compilation added to it since the last save."""
+    if not cache.modified:
+        return
+    cache.modified = False
+    await _store(hass, entry_id).async_save(cache.as_dict())
+
+
+async def async_remove_policy_cache(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop a removed hub's cache from memory and storage."""
+    hass.data.get(_POLICY_CACHES, {}).pop(entry_id, None)
+    await _store(hass, entry_id).async_remove()
+
+
+__all__ = ["async_get_policy_cache", "async_remove_policy_cache", "async_save_policy_cache"]
@@ -0,0 +1,112 @@
+"""Per-element index over a hub's input stores.
+
+The coordinator looks stores up by element and gates optimization on every
+store being available and every forecast store being aligned to the current
+horizon. Scanning the flat ``(element, field path)`` store map for each of
+those costs O(stores) per element and per signal; this index groups the stores
+once and keeps the availability and alignment state up to date from store
+notifications instead.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from custom_components.haeo.core.data.input_store import InputStore
+    from custom_components.haeo.elements import InputFieldPath
+
+# Forecast stores within this many seconds of the expected horizon start are aligned
+HORIZON_START_TOLERANCE = 1.0
+
+
+class InputStoreIndex:
+    """Input stores grouped by element with incrementally tracked readiness.
+
+    State is computed once on construction. :meth:`track` subscribes to the
+    stores so later changes are folded in per store; an untracked index is a
+    point-in-time view.
+    """
+
+    def __init__(self, input_stores: Mapping[tuple[str, "InputFieldPath"], "InputStore"]) -> None:
+        """Group the stores by element and record their current state."""
+        self._by_element: dict[str, dict[InputFieldPath, InputStore]] = {}
+        self._element_names: dict[InputStore, str] = {}
+        for (element_name, field_path), store in input_stores.items():
+            self._by_element.setdefault(element_name, {})[field_path] = store
+            self._element_names[store] = element_name
+
+        # Horizon start of every forecast store, and how many stores share each start
+        self._horizon_starts: dict[InputStore, float | None] = {}
+        self._horizon_start_counts: Counter[float | None] = Counter()
+        # Unavailable stores mapped to their element name, in insertion order
+        self._unavailable: dict[InputStore, str] = {}
+
+        for store in self._element_names:
+            self._refresh(store)
+
+    def track(self) -> list[Callable[[], None]]:
+        """Subscribe to every store so the index follows their changes.
+
+        Returns the unsubscribe callables.
+        """
+        unsubs: list[Callable[[], None]] = []
+        for store in self._element_names:
+            listener = self._create_listener(store)
+            unsubs.append(store.add_listener(listener))
+            unsubs.append(store.add_availability_listener(listener))
+        return unsubs
+
+    def _create_listener(self, store: "InputStore") -> Callable[[], None]:
+        """Create a listener refreshing a single store's entry."""
+
+        def listener() -> None:
+            self._refresh(store)
+
+        return listener
+
+    def _refresh(self, store: "InputStore") -> None:
+        """Fold a store's current availability and horizon start into the index."""
+        if store.available:
+            self._unavailable.pop(store, None)
+        elif store not in self._unavailable:
+            self._unavailable[store] = self._element_names[store]
+
+        if not store.time_series:
+            return
+        horizon_start = store.horizon_start
+        if store in self._horizon_starts:
+            previous = self._horizon_starts[store]
+            if previous == horizon_start:
+                return
+            self._horizon_start_counts[previous] -= 1
+            if not self._horizon_start_counts[previous]:
+                del self._horizon_start_counts[previous]
+        self._horizon_starts[store] = horizon_start
+        self._horizon_start_counts[horizon_start] += 1
+
+    def element_stores(self, element_name: str) -> Mapping["InputFieldPath", "InputStore"]:
+        """Return an element's stores keyed by field path."""
+        return self._by_element.get(element_name, {})
+
+    def field_values(self, element_name: str) -> dict["InputFieldPath", Any]:
+        """Collect resolved field values from an element's input stores."""
+        return {field_path: store.value for field_path, store in self.element_stores(element_name).items()}
+
+    def first_unavailable_element(self) -> str | None:
+        """Return the element of the first unavailable store, or None when all are available."""
+        return next(iter(self._unavailable.values()), None)
+
+    def is_aligned(self, expected_start: float) -> bool:
+        """Return True when every forecast store is loaded for the horizon starting at *expected_start*.
+
+        Only the distinct horizon starts are checked, which is a single one once
+        all forecast stores have reloaded for the current horizon.
+        """
+        return all(
+            start is not None and abs(start - expected_start) <= HORIZON_START_TOLERANCE
+            for start in self._horizon_start_counts
+        )
+
+
+__all__ = ["HORIZON_START_TOLERANCE", "InputStoreIndex"]
@@ -5,7 +5,7 @@ from datetime import UTC, datetime, timedelta
 import time
 from types import MappingProxyType
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, call, patch
 
 from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 from homeassistant.const import STATE_OFF, STATE_ON, EntityCategory, UnitOfEnergy
@@ -29,14 +29,20 @@ from custom_components.haeo.const import (
 )
 from custom_components.haeo.coordinator import (
     STATUS_OPTIONS,
+    CoarsePlan,
     CoordinatorData,
     ForecastPoint,
     HaeoDataUpdateCoordinator,
     OptimizationContext,
+    ReducedNetwork,
     _build_coordinator_output,
     _build_optimization_context,
     _localize_currency,
     detect_currency_symbol,
+    optimize_aggregated,
+    optimize_coarsened,
+    solve_coarse_plan,
+    solve_near_term,
 )
 from custom_components.haeo.core.adapters.elements.battery import BATTERY_DEVICE_BATTERY, BATTERY_POWER_CHARGE
 from custom_components.haeo.core.adapters.elements.connection import CONNECTION_DEVICE_CONNECTION, CONNECTION_POWER
@@ -44,6 +50,7 @@ from custom_components.haeo.core.adapters.elements.grid import GRID_COST_NET, GR
 from custom_components.haeo.core.adapters.elements.solar import SOLAR_POWER
 from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES
 from custom_components.haeo.core.const import (
+    CONF_AGGREGATE_PERIODS,
     CONF_DEBOUNCE_SECONDS,
     CONF_ELEMENT_TYPE,
     CONF_NAME,
@@ -55,12 +62,14 @@ from custom_components.haeo.core.const import (
     CONF_TIER_3_DURATION,
     CONF_TIER_4_COUNT,
     CONF_TIER_4_DURATION,
+    CONF_TWO_STAGE_SOLVE,
     DEFAULT_DEBOUNCE_SECONDS,
     DEFAULT_TIER_2_DURATION,
     DEFAULT_TIER_3_DURATION,
     DEFAULT_TIER_4_DURATION,
 )
 from custom_components.haeo.core.model import Network, OutputData, OutputType
+from custom_components.haeo.core.model.aggregation import PeriodAggregation
 from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_NODE
 from custom_components.haeo.core.schema import as_connection_target, as_constant_value, as_entity_value
 from custom_components.haeo.core.schema.elements import ElementType
@@ -254,6 +263,7 @@ def mock_runtime_data(hass: HomeAssistant, mock_hub_entry: MockConfigEntry) -> H
     mock_horizon: Any = MagicMock(spec=HorizonManager)
     mock_horizon.get_forecast_timestamps.return_value = (1000.0, 2000.0, 3000.0)
     mock_horizon.subscribe.return_value = MagicMock()  # Unsubscribe function
+    mock_horizon.solve_block_seconds = None  # Full resolution
 
     # Create mock auto-optimize switch (default to on)
     mock_auto_optimize_switch: Any = MagicMock(spec=AutoOptimizeSwitch)
@@ -582,6 +592,148 @@ async def test_async_update_data_raises_on_missing_model_element(
         await coordinator._async_update_data()
 
 
+async def test_async_update_data_solves_aggregated_network_when_enabled(
+    hass: HomeAssistant,
+    mock_hub_entry: MockConfigEntry,
+    mock_battery_subentry: ConfigSubentry,
+    mock_runtime_data: HaeoRuntimeData,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With period aggregation enabled the coordinator solves through optimize_aggregated.
+
+    The reduced network it solves is kept for the next optimization.
+    """
+    hass.config_entries.async_update_entry(
+        mock_hub_entry,
+        data={
+            **mock_hub_entry.data,
+            HUB_SECTION_ADVANCED: {**mock_hub_entry.data[HUB_SECTION_ADVANCED], CONF_AGGREGATE_PERIODS: True},
+        },
+    )
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_hub_entry)
+    coordinator.network = Network(name="net", periods=np.array([0.5, 0.5]))
+    loaded_configs = {"Test Battery": mock_battery_subentry.data}
+    aggregation = PeriodAggregation(run_lengths=(2,))
+
+    monkeypatch.setattr(
+        "custom_components.haeo.coordinator.coordinator.ELEMENT_TYPES",
+        {**ELEMENT_TYPES, "battery": MagicMock(outputs=MagicMock(return_value={}))},
+    )
+
+    with (
+        patch.object(coordinator, "_load_from_input_stores", return_value=loaded_configs),
+        patch.object(
+            hass, "async_add_executor_job", new_callable=AsyncMock, return_value=(1.5, {}, aggregation)
+        ) as mock_executor,
+        patch(
+            "custom_components.haeo.coordinator.coordinator.async_get_translations",
+            AsyncMock(return_value={"component.haeo.common.network_subentry_name": "System"}),
+        ),
+    ):
+        result = await coordinator._async_update_data()
+        await coordinator._async_update_data()
+
+    first, second = mock_executor.await_args_list
+    assert first.args[0] is optimize_aggregated
+    reduced = first.args[1]
+    assert isinstance(reduced, ReducedNetwork)
+    assert reduced.source is coordinator.network
+    assert second == call(optimize_aggregated, reduced)
+    assert result.aggregation is aggregation
+    assert result.outputs["System"][ELEMENT_TYPE_NETWORK][OUTPUT_NAME_OPTIMIZATION_COST].state == 1.5
+
+
+async def test_async_update_data_coarsens_tail_for_solve_time_budget(
+    hass: HomeAssistant,
+    mock_hub_entry: MockConfigEntry,
+    mock_battery_subentry: ConfigSubentry,
+    mock_runtime_data: HaeoRuntimeData,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Solve blocks from the horizon manager coarsen the solve, whose time is then recorded."""
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_hub_entry)
+    coordinator.network = Network(name="net", periods=np.array([0.5, 0.5]))
+    loaded_configs = {"Test Battery": mock_battery_subentry.data}
+    aggregation = PeriodAggregation(run_lengths=(1, 1))
+    mock_horizon = _get_mock_horizon(mock_runtime_data)
+    mock_horizon.solve_block_seconds = 7200
+
+    monkeypatch.setattr(
+        "custom_components.haeo.coordinator.coordinator.ELEMENT_TYPES",
+        {**ELEMENT_TYPES, "battery": MagicMock(outputs=MagicMock(return_value={}))},
+    )
+
+    with (
+        patch.object(coordinator, "_load_from_input_stores", return_value=loaded_configs),
+        patch.object(
+            hass, "async_add_executor_job", new_callable=AsyncMock, return_value=(1.5, {}, aggregation)
+        ) as mock_executor,
+        patch(
+            "custom_components.haeo.coordinator.coordinator.async_get_translations",
+            AsyncMock(return_value={"component.haeo.common.network_subentry_name": "System"}),
+        ),
+    ):
+        result = await coordinator._async_update_data()
+
+    mock_executor.assert_awaited_once_with(optimize_coarsened, ANY, 2.0)
+    (coarsened,) = mock_executor.await_args_list
+    assert coarsened.args[1].source is coordinator.network
+    mock_horizon.record_solve_time.assert_called_once()
+    assert result.aggregation is aggregation
+
+
+async def test_async_update_data_publishes_coarse_plan_before_refining(
+    hass: HomeAssistant,
+    mock_hub_entry: MockConfigEntry,
+    mock_battery_subentry: ConfigSubentry,
+    mock_runtime_data: HaeoRuntimeData,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With two-stage solving enabled the coarse plan is published, then replaced by the refined one."""
+    hass.config_entries.async_update_entry(
+        mock_hub_entry,
+        data={
+            **mock_hub_entry.data,
+            HUB_SECTION_ADVANCED: {**mock_hub_entry.data[HUB_SECTION_ADVANCED], CONF_TWO_STAGE_SOLVE: True},
+        },
+    )
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_hub_entry)
+    coordinator.network = Network(name="net", periods=np.array([0.5, 0.5]))
+    loaded_configs = {"Test Battery": mock_battery_subentry.data}
+    coarse = PeriodAggregation(run_lengths=(2,))
+    refined = PeriodAggregation.identity(2)
+    plan = CoarsePlan(solution=(2.0, {}, coarse), window=1, window_charge={})
+
+    monkeypatch.setattr(
+        "custom_components.haeo.coordinator.coordinator.ELEMENT_TYPES",
+        {**ELEMENT_TYPES, "battery": MagicMock(outputs=MagicMock(return_value={}))},
+    )
+
+    with (
+        patch.object(coordinator, "_load_from_input_stores", return_value=loaded_configs),
+        patch.object(
+            hass, "async_add_executor_job", new_callable=AsyncMock, side_effect=[plan, (1.5, {}, refined)]
+        ) as mock_executor,
+        patch.object(coordinator, "async_set_updated_data") as mock_set_updated,
+        patch(
+            "custom_components.haeo.coordinator.coordinator.async_get_translations",
+            AsyncMock(return_value={"component.haeo.common.network_subentry_name": "System"}),
+        ),
+    ):
+        result = await coordinator._async_update_data()
+
+    assert mock_executor.await_args_list == [call(solve_coarse_plan, ANY), call(solve_near_term, ANY, plan)]
+    coarse_network = mock_executor.await_args_list[0].args[1]
+    near_term_network = mock_executor.await_args_list[1].args[1]
+    assert coarse_network.source is near_term_network.source is coordinator.network
+    assert coarse_network is not near_term_network
+    published = mock_set_updated.call_args.args[0]
+    assert published.aggregation is coarse
+    assert published.outputs["System"][ELEMENT_TYPE_NETWORK][OUTPUT_NAME_OPTIMIZATION_COST].state == 2.0
+    assert result.aggregation is refined
+    assert result.outputs["System"][ELEMENT_TYPE_NETWORK][OUTPUT_NAME_OPTIMIZATION_COST].state == 1.5
+
+
 def test_build_coordinator_output_emits_forecast_entries() -> None:
     """Forecast data is mapped onto ISO timestamps when lengths match."""
 
@@ -799,10 +951,11 @@ def test_coordinator_cleanup_invokes_listener(
     patch_state_change_listener.return_value = unsubscribe
 
     # Add a mock input store so a store listener subscription gets created.
-    # Its add_listener returns the same unsubscribe mock as the switch listener
-    # so the total unsub count and call count line up.
+    # Its add_listener and add_availability_listener return the same unsubscribe
+    # mock as the switch listener so the total unsub count and call count line up.
     mock_store = MagicMock()
     mock_store.add_listener.return_value = unsubscribe
+    mock_store.add_availability_listener.return_value = unsubscribe
     mock_runtime_data.input_stores[("Test Battery", (SECTION_POWER_LIMITS, CONF_MAX_POWER_TARGET_SOURCE))] = mock_store
 
     coordinator = HaeoDataUpdateCoordinator(hass, mock_hub_entry)
@@ -810,7 +963,7 @@ def test_coordinator_cleanup_invokes_listener(
     # Subscription now happens after first refresh, so simulate that
     coordinator._subscribe_to_input_stores()
     # Should have subscriptions for: store listener + auto-optimize switch
-    num_subs = len(coordinator._state_change_unsubs)
+    num_subs = len(coordinator._state_change_unsubs) + len(coordinator._store_unsubs)
     assert num_subs >= 2  # At least store listener + auto-optimize switch
 
     coordinator.cleanup()
@@ -818,6 +971,7 @@ def test_coordinator_cleanup_invokes_listener(
     # All unsubscribers should be called
     assert unsubscribe.call_count == num_subs
     assert len(coordinator._state_change_unsubs) == 0
+    assert len(coordinator._store_unsubs) == 0
 
 
 @pytest.mark.usefixtures("mock_battery_subentry", "mock_grid_subentry")
@@ -846,6 +1000,33 @@ def test_element_state_change_defers_update_and_triggers_optimization(
     assert coordinator._pending_element_updates == {"Test Battery": element_config}
 
 
+@pytest.mark.usefixtures("mock_battery_subentry", "mock_grid_subentry")
+def test_batched_element_updates_signal_once(
+    hass: HomeAssistant,
+    mock_hub_entry: MockConfigEntry,
+    mock_runtime_data: HaeoRuntimeData,
+) -> None:
+    """Store changes inside a batch load each element once and signal optimization once."""
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_hub_entry)
+    coordinator.network = MagicMock()
+
+    with (
+        patch.object(coordinator, "_load_element_config", side_effect=lambda name: {"name": name}) as load_mock,
+        patch.object(coordinator, "signal_optimization_stale") as trigger_mock,
+        coordinator.batched_element_updates(),
+    ):
+        coordinator._handle_element_update("Test Battery")
+        coordinator._handle_element_update("Test Grid")
+        coordinator._handle_element_update("Test Battery")
+        with coordinator.batched_element_updates():
+            coordinator._handle_element_update("Test Grid")
+        trigger_mock.assert_not_called()
+
+    assert load_mock.call_count == 2
+    trigger_mock.assert_called_once()
+    assert set(coordinator._pending_element_updates) == {"Test Battery", "Test Grid"}
+
+
 @pytest.mark.usefixtures("mock_battery_subentry", "mock_grid_subentry")
 def test_horizon_change_triggers_optimization(
     hass: HomeAssistant,
@@ -1311,6 +1492,37 @@ def test_load_from_input_stores_delegates_to_config_loader(
     assert result == {"Test Battery": loaded_config}
 
 
+@pytest.mark.usefixtures("mock_battery_subentry", "mock_grid_subentry")
+def test_load_from_input_stores_reloads_only_dirty_elements(
+    hass: HomeAssistant,
+    mock_hub_entry: MockConfigEntry,
+    mock_runtime_data: HaeoRuntimeData,
+) -> None:
+    """Cached element configs are reused until the element's stores change."""
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_hub_entry)
+    coordinator.network = MagicMock()
+
+    with (
+        patch(
+            "custom_components.haeo.coordinator.coordinator.load_element_config_from_values",
+            side_effect=lambda name, *_args: {"name": name},
+        ) as mock_load,
+        patch.object(coordinator, "signal_optimization_stale"),
+    ):
+        first = coordinator._load_from_input_stores()
+        assert mock_load.call_count == 2
+
+        coordinator._handle_element_update("Test Grid")
+        assert mock_load.call_count == 3
+
+        second = coordinator._load_from_input_stores()
+
+    # Only the changed element was rebuilt, by its store listener
+    assert mock_load.call_count == 3
+    assert [call.args[0] for call in mock_load.call_args_list] == ["Test Battery", "Test Grid", "Test Grid"]
+    assert second == first
+
+
 @pytest.mark.usefixtures("mock_battery_subentry")
 async def test_async_update_data_raises_when_runtime_data_none_in_body(
     hass: HomeAssistant,
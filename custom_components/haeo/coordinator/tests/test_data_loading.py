@@ -1,20 +1,47 @@
 """Tests for network building."""
 
+from typing import Any
+from unittest.mock import patch
+
 from homeassistant.core import HomeAssistant
 import numpy as np
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.haeo.const import DOMAIN
-from custom_components.haeo.coordinator import create_network
+from custom_components.haeo.coordinator import (
+    CoarsePlan,
+    ReducedNetwork,
+    create_network,
+    optimize_aggregated,
+    optimize_coarsened,
+    solve_coarse_plan,
+    solve_near_term,
+    update_network,
+)
+from custom_components.haeo.core.adapters.registry import expand_model_elements
+from custom_components.haeo.core.const import (
+    CONF_BOUNDED_BATTERIES,
+    CONF_MAX_SOLVE_BLOCK_DURATION,
+    CONF_NORMALIZED_TIME_PREFERENCE,
+    CONF_TARGET_SOLVE_TIME,
+    HUB_SECTION_ADVANCED,
+    HUB_SECTION_TIERS,
+)
+from custom_components.haeo.core.model import Network
+from custom_components.haeo.core.model.aggregation import PeriodAggregation
+from custom_components.haeo.core.model.elements.battery import Battery, BoundedBattery
 from custom_components.haeo.core.model.elements.connection import Connection
 from custom_components.haeo.core.model.elements.policy_pricing import PolicyPricing
 from custom_components.haeo.core.schema import as_connection_target
 from custom_components.haeo.core.schema.elements import ElementConfigData, ElementType
+from custom_components.haeo.core.schema.elements.battery import BatteryConfigData
 from custom_components.haeo.core.schema.elements.connection import ConnectionConfigData
+from custom_components.haeo.core.schema.elements.grid import GridConfigData
 from custom_components.haeo.core.schema.elements.load import LoadConfigData
 from custom_components.haeo.core.schema.elements.node import CONF_IS_SINK, CONF_IS_SOURCE, NodeConfigData
 from custom_components.haeo.core.schema.elements.policy import PolicyConfigData, PolicyRuleData
+from custom_components.haeo.horizon import SOLVE_TIME_WINDOW, HorizonManager
 
 
 async def test_create_network_successful_loads_load_participant(hass: HomeAssistant) -> None:
@@ -50,6 +77,41 @@ async def test_create_network_successful_loads_load_participant(hass: HomeAssist
     assert "Baseload" in result.elements
 
 
+async def test_create_network_reuses_model_element_expansion(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A supplied model element expansion is shared instead of expanding again."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="shared_expansion")
+    entry.add_to_hass(hass)
+
+    main_bus: NodeConfigData = {
+        "element_type": ElementType.NODE,
+        "name": "main_bus",
+        "role": {CONF_IS_SOURCE: True, CONF_IS_SINK: True},
+    }
+    loaded_configs: dict[str, ElementConfigData] = {"main_bus": main_bus}
+    model_elements = expand_model_elements(loaded_configs)
+
+    def _expand(*_: object) -> None:
+        msg = "adapters expanded again"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("custom_components.haeo.coordinator.network.expand_model_elements", _expand)
+
+    network, updaters = await create_network(
+        entry,
+        periods_seconds=[1800],
+        participants=loaded_configs,
+        model_elements=model_elements,
+    )
+
+    assert list(network.elements) == ["main_bus"]
+    assert "main_bus" in updaters
+    # Policy compilation tags its own copies, leaving the shared expansion untouched
+    assert "outbound_tags" not in model_elements["main_bus"][0]
+
+
 async def test_create_network_without_participants_returns_empty_network(hass: HomeAssistant) -> None:
     """create_network should return an empty network when no participants are provided."""
 
@@ -329,3 +391,363 @@ async def test_create_network_add_failure_is_wrapped(hass: HomeAssistant, monkey
             periods_seconds=[900],
             participants=participants,
         )
+
+
+async def test_optimize_aggregated_matches_full_network(hass: HomeAssistant) -> None:
+    """Merging identical periods keeps the cost and expands outputs to every period."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="aggregated")
+    entry.add_to_hass(hass)
+
+    main_bus: NodeConfigData = {
+        "element_type": ElementType.NODE,
+        "name": "main_bus",
+        "role": {CONF_IS_SOURCE: False, CONF_IS_SINK: False},
+    }
+    grid: GridConfigData = {
+        "element_type": ElementType.GRID,
+        "name": "grid",
+        "connection": as_connection_target("main_bus"),
+        "pricing": {
+            "price_source_target": np.array([0.3, 0.3, 0.3, 0.1]),
+            "price_target_source": np.array([0.05, 0.05, 0.05, 0.05]),
+        },
+        "power_limits": {},
+    }
+    baseload: LoadConfigData = {
+        "element_type": ElementType.LOAD,
+        "name": "Baseload",
+        "connection": as_connection_target("main_bus"),
+        "forecast": {"forecast": np.asarray([2.0, 2.0, 2.0, 2.0], dtype=float)},
+        "curtailment": {},
+    }
+    participants: dict[str, ElementConfigData] = {"main_bus": main_bus, "grid": grid, "Baseload": baseload}
+    network, _ = await create_network(entry, periods_seconds=[1800, 1800, 3600, 3600], participants=participants)
+
+    cost, outputs, aggregation = optimize_aggregated(ReducedNetwork(network))
+
+    assert aggregation.run_lengths == (3, 1)
+    assert cost == pytest.approx(network.optimize())
+    assert set(outputs) == set(network.elements)
+    balance = network.elements["main_bus"].outputs()["element_power_balance"]
+    assert len(outputs["main_bus"]["element_power_balance"].values) == len(balance.values)
+
+
+def _two_stage_participants(n_hours: int) -> dict[str, ElementConfigData]:
+    """Build a grid, battery and load whose import price doubles after the first day."""
+    main_bus: NodeConfigData = {
+        "element_type": ElementType.NODE,
+        "name": "main_bus",
+        "role": {CONF_IS_SOURCE: False, CONF_IS_SINK: False},
+    }
+    grid: GridConfigData = {
+        "element_type": ElementType.GRID,
+        "name": "grid",
+        "connection": as_connection_target("main_bus"),
+        "pricing": {
+            "price_source_target": np.where(np.arange(n_hours) < 24, 0.1, 0.3),
+            "price_target_source": np.full(n_hours, 0.05),
+        },
+        "power_limits": {},
+    }
+    battery: BatteryConfigData = {
+        "element_type": ElementType.BATTERY,
+        "name": "battery",
+        "connection": as_connection_target("main_bus"),
+        "storage": {"capacity": np.full(n_hours + 1, 10.0), "initial_charge_percentage": 0.5},
+        "limits": {},
+        "power_limits": {
+            "max_power_source_target": np.full(n_hours, 5.0),
+            "max_power_target_source": np.full(n_hours, 5.0),
+        },
+        "pricing": {},
+        "efficiency": {},
+        "partitioning": {},
+    }
+    baseload: LoadConfigData = {
+        "element_type": ElementType.LOAD,
+        "name": "Baseload",
+        "connection": as_connection_target("main_bus"),
+        "forecast": {"forecast": np.full(n_hours, 1.0)},
+        "curtailment": {},
+    }
+    return {"main_bus": main_bus, "grid": grid, "battery": battery, "Baseload": baseload}
+
+
+async def test_solve_coarse_plan_skips_short_horizons(hass: HomeAssistant) -> None:
+    """Horizons that end within the near-term window are solved in one stage."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="short_horizon")
+    entry.add_to_hass(hass)
+    participants = _two_stage_participants(12)
+    network, _ = await create_network(entry, periods_seconds=[3600] * 12, participants=participants)
+
+    assert solve_coarse_plan(ReducedNetwork(network)) is None
+
+
+async def test_two_stage_solve_refines_near_term_window(hass: HomeAssistant) -> None:
+    """The coarse plan covers the horizon and the refinement keeps its charge at the window end."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="two_stage")
+    entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    network, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+
+    plan = solve_coarse_plan(ReducedNetwork(network))
+
+    assert plan is not None
+    assert plan.window == 24
+    assert plan.solution[2].run_lengths == (2,) * 15
+    assert plan.window_charge["battery"] == pytest.approx(6.0)
+
+    cost, outputs, aggregation = solve_near_term(ReducedNetwork(network), plan)
+
+    assert aggregation.run_lengths == (1,) * 24 + (2,) * 3
+    assert cost == pytest.approx(network.optimize())
+    stored = outputs["battery"]["battery_energy_stored"].values
+    assert len(stored) == 31
+    assert stored[24] >= plan.window_charge["battery"] - 1e-6
+
+
+async def test_near_term_solve_drops_an_unreachable_charge_floor(hass: HomeAssistant) -> None:
+    """A coarse plan charge the battery cannot reach is dropped and the window re-solved without it."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="unreachable_floor")
+    entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    battery = participants["battery"]
+    assert battery["element_type"] == ElementType.BATTERY
+    battery["power_limits"] = {
+        "max_power_source_target": np.full(30, 0.1),
+        "max_power_target_source": np.full(30, 0.1),
+    }
+    network, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+    plan = CoarsePlan(solution=(0.0, {}, PeriodAggregation.identity(30)), window=24, window_charge={"battery": 10.0})
+
+    reduced = ReducedNetwork(network)
+    cost, outputs, aggregation = solve_near_term(reduced, plan)
+
+    refined_battery = reduced.load(aggregation).elements["battery"]
+    assert isinstance(refined_battery, Battery)
+    np.testing.assert_array_equal(refined_battery.minimum_charge, 0.0)
+    assert cost == pytest.approx(network.optimize())
+    assert outputs["battery"]["battery_energy_stored"].values[24] < 10.0
+
+
+async def test_near_term_solve_raises_other_failures(hass: HomeAssistant) -> None:
+    """Failures other than an unreachable charge floor are not retried."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="near_term_failure")
+    entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    network, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+    plan = CoarsePlan(solution=(0.0, {}, PeriodAggregation.identity(30)), window=24, window_charge={"battery": 6.0})
+
+    with (
+        patch.object(Network, "optimize", side_effect=ValueError("boom")) as optimize,
+        pytest.raises(ValueError, match="boom"),
+    ):
+        solve_near_term(ReducedNetwork(network), plan)
+    optimize.assert_called_once()
+
+
+async def test_optimize_coarsened_merges_the_tail_into_blocks(hass: HomeAssistant) -> None:
+    """The horizon beyond the near-term window is solved in blocks and expanded back."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="coarsened")
+    entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    network, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+
+    solution = optimize_coarsened(ReducedNetwork(network), 3.0)
+
+    assert solution is not None
+    cost, outputs, aggregation = solution
+    assert aggregation.run_lengths == (1,) * 24 + (3, 3)
+    assert cost == pytest.approx(network.optimize())
+    assert len(outputs["battery"]["battery_energy_stored"].values) == 31
+    assert optimize_coarsened(ReducedNetwork(Network("empty", periods=network.periods)), 3.0) is None
+
+
+async def test_reduced_network_follows_updates_without_rebuilding(hass: HomeAssistant) -> None:
+    """Element updates reach the kept reduced network, which solves as if rebuilt from the new inputs."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="reduced_updates")
+    entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    network, updaters = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+    reduced = ReducedNetwork(network)
+
+    assert optimize_coarsened(reduced, 3.0) is not None
+    copy = reduced.load(PeriodAggregation.coarsen(network.periods, 3.0, keep=24))
+
+    updated = _two_stage_participants(30)
+    grid = updated["grid"]
+    assert grid["element_type"] == ElementType.GRID
+    grid["pricing"]["price_source_target"] = np.linspace(0.1, 0.4, 30)
+    updaters["grid"](grid)
+    solution = optimize_coarsened(reduced, 3.0)
+
+    rebuilt, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=updated)
+    expected = optimize_coarsened(ReducedNetwork(rebuilt), 3.0)
+    assert solution is not None
+    assert expected is not None
+    assert reduced.load(PeriodAggregation.coarsen(network.periods, 3.0, keep=24)) is copy
+    assert solution[0] == pytest.approx(expected[0])
+    np.testing.assert_allclose(
+        solution[1]["battery"]["battery_energy_stored"].values,
+        expected[1]["battery"]["battery_energy_stored"].values,
+        atol=1e-6,
+    )
+
+
+async def test_update_network_adds_and_removes_participants_in_place(hass: HomeAssistant) -> None:
+    """Removing and re-adding a participant matches fresh builds and keeps the unaffected elements."""
+
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="update_network")
+    entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    network, updaters = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+    reduced = ReducedNetwork(network)
+    full_cost = network.optimize()
+    coarsened = optimize_coarsened(reduced, 3.0)
+    assert coarsened is not None
+    copy = reduced.load(PeriodAggregation.coarsen(network.periods, 3.0, keep=24))
+    baseload = network.elements["Baseload"]
+
+    without_battery = {name: config for name, config in participants.items() if name != "battery"}
+    updaters = update_network(network, participants=without_battery, updaters=updaters)
+
+    assert "battery" not in updaters
+    assert not any(name.startswith("battery") for name in network.elements)
+    assert network.elements["Baseload"] is baseload
+    fresh, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=without_battery)
+    assert network.optimize() == pytest.approx(fresh.optimize())
+    solution = optimize_coarsened(reduced, 3.0)
+    expected = optimize_coarsened(ReducedNetwork(fresh), 3.0)
+    assert solution is not None
+    assert expected is not None
+    assert solution[0] == pytest.approx(expected[0])
+    assert reduced.load(PeriodAggregation.coarsen(network.periods, 3.0, keep=24)) is copy
+
+    update_network(network, participants=participants, updaters=updaters)
+
+    assert network.optimize() == pytest.approx(full_cost)
+    solution = optimize_coarsened(reduced, 3.0)
+    assert solution is not None
+    assert solution[0] == pytest.approx(coarsened[0])
+
+
+async def test_bounded_batteries_option_selects_battery_formulation(hass: HomeAssistant) -> None:
+    """The hub option builds bounded batteries, which aggregated solves inherit at the same cost."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN, entry_id="bounded", data={HUB_SECTION_ADVANCED: {CONF_BOUNDED_BATTERIES: True}}
+    )
+    entry.add_to_hass(hass)
+    cumulative_entry = MockConfigEntry(domain=DOMAIN, entry_id="cumulative")
+    cumulative_entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    network, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+    cumulative, _ = await create_network(cumulative_entry, periods_seconds=[3600] * 30, participants=participants)
+
+    assert network.battery_formulation == "bounded"
+    assert cumulative.battery_formulation == "cumulative"
+    batteries = [element for element in network.elements.values() if isinstance(element, Battery)]
+    assert batteries
+    assert all(isinstance(element, BoundedBattery) for element in batteries)
+    assert network.optimize() == pytest.approx(cumulative.optimize())
+
+    solution = optimize_coarsened(ReducedNetwork(network), 3.0)
+    expected = optimize_coarsened(ReducedNetwork(cumulative), 3.0)
+
+    assert solution is not None
+    assert expected is not None
+    assert solution[0] == pytest.approx(expected[0])
+
+
+async def test_normalized_time_preference_option_selects_secondary_objective(hass: HomeAssistant) -> None:
+    """The hub option normalizes the secondary objective, which reduced solves inherit at the same cost."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN, entry_id="normalized", data={HUB_SECTION_ADVANCED: {CONF_NORMALIZED_TIME_PREFERENCE: True}}
+    )
+    entry.add_to_hass(hass)
+    indexed_entry = MockConfigEntry(domain=DOMAIN, entry_id="indexed")
+    indexed_entry.add_to_hass(hass)
+    participants = _two_stage_participants(30)
+    network, _ = await create_network(entry, periods_seconds=[3600] * 30, participants=participants)
+    indexed, _ = await create_network(indexed_entry, periods_seconds=[3600] * 30, participants=participants)
+
+    assert network.options.secondary_objective == "normalized"
+    assert indexed.options.secondary_objective == "indexed"
+    assert network.optimize() == pytest.approx(indexed.optimize())
+
+    solution = optimize_coarsened(ReducedNetwork(network), 3.0)
+    expected = optimize_coarsened(ReducedNetwork(indexed), 3.0)
+
+    assert solution is not None
+    assert expected is not None
+    assert solution[0] == pytest.approx(expected[0])
+    assert network.objective_spread is not None
+    assert indexed.objective_spread is not None
+    assert network.objective_spread.secondary < indexed.objective_spread.secondary
+
+
+async def test_solve_time_budget_settles_with_kept_reduced_networks(hass: HomeAssistant) -> None:
+    """Solve blocks settle at the first level within the target although each new level builds its network.
+
+    Solve times are modelled per solved period, with a build costing five
+    solves whenever a reduced network is built.
+    """
+    solve_seconds = 0.01
+    build_seconds = 0.05
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="solve_budget",
+        data={
+            HUB_SECTION_TIERS: {
+                "tier_1_count": 0,
+                "tier_1_duration": 1,
+                "tier_2_count": 0,
+                "tier_2_duration": 5,
+                "tier_3_count": 48,
+                "tier_3_duration": 30,
+                "tier_4_count": 24,
+                "tier_4_duration": 60,
+            },
+            HUB_SECTION_ADVANCED: {CONF_TARGET_SOLVE_TIME: 0.65, CONF_MAX_SOLVE_BLOCK_DURATION: 480},
+        },
+    )
+    entry.add_to_hass(hass)
+    manager = HorizonManager(hass, entry)
+    periods_seconds = manager.periods_seconds
+    network, _ = await create_network(
+        entry, periods_seconds=periods_seconds, participants=_two_stage_participants(len(periods_seconds))
+    )
+    reduced = ReducedNetwork(network)
+    build = ReducedNetwork._build
+    builds = 0
+
+    def counting_build(self: ReducedNetwork, *args: Any) -> Network:
+        nonlocal builds
+        builds += 1
+        return build(self, *args)
+
+    blocks: list[int | None] = []
+    with patch.object(ReducedNetwork, "_build", counting_build):
+        for _ in range(3 * (SOLVE_TIME_WINDOW + 1)):
+            block = manager.solve_block_seconds
+            blocks.append(block)
+            built = builds
+            solution = None if block is None else optimize_coarsened(reduced, block / 3600)
+            if solution is None:
+                network.optimize()
+                n_solved = network.n_periods
+            else:
+                n_solved = solution[2].n_aggregated
+            manager.record_solve_time(n_solved * (solve_seconds + build_seconds * (builds - built)))
+
+    assert set(blocks) == {None, 7200}
+    assert blocks[-1] == 7200
+    assert builds == 1
@@ -1,18 +1,22 @@
 """Tests for coordinator network utilities."""
 
 from typing import Any
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
 from custom_components.haeo.coordinator.network import (
     _MISSING,
+    ElementUpdater,
     _build_element_updater,
     _build_policy_updater,
     _collect_policy_rules,
     _discover_setters,
     _extract_at_path,
 )
+from custom_components.haeo.core.adapters.elements.grid import adapter as grid_adapter
+from custom_components.haeo.core.adapters.policy_compilation import compile_policies
 from custom_components.haeo.core.const import CONF_ELEMENT_TYPE, CONF_NAME
 from custom_components.haeo.core.model import Network
 from custom_components.haeo.core.model.elements import (
@@ -37,6 +41,7 @@ from custom_components.haeo.core.schema.elements.connection import (
     CONF_PRICE_SOURCE_TARGET,
     ConnectionConfigData,
 )
+from custom_components.haeo.core.schema.elements.grid import CONF_PRICE_TARGET_SOURCE, GridConfigData, GridPricingData
 from custom_components.haeo.core.schema.sections.efficiency import EfficiencyData
 from custom_components.haeo.core.schema.sections.power_limits import PowerLimitsData
 from custom_components.haeo.core.schema.sections.pricing import PricingData
@@ -240,6 +245,109 @@ def test_element_updater_handles_none_efficiency() -> None:
     network.optimize()
 
 
+def _grid_updater_setup() -> tuple[Network, GridConfigData, ElementUpdater]:
+    """Build a grid element network and its planned updater."""
+    config = GridConfigData(
+        element_type=ElementType.GRID,
+        name="grid",
+        connection=as_connection_target("house"),
+        pricing=GridPricingData(
+            price_source_target=np.array([0.30, 0.30]),
+            price_target_source=np.array([0.05, 0.05]),
+        ),
+        power_limits=PowerLimitsData(
+            max_power_source_target=np.array([10.0, 10.0]),
+            max_power_target_source=np.array([10.0, 10.0]),
+        ),
+    )
+    network = Network(name="test", periods=np.array([1.0, 1.0]))
+    initial_model_configs = grid_adapter.model_elements(config)
+    house: ModelElementConfig = {
+        "element_type": MODEL_ELEMENT_TYPE_NODE,
+        "name": "house",
+        "is_source": True,
+        "is_sink": True,
+    }
+    for model_config in compile_policies([house, *initial_model_configs], [])["elements"]:
+        network.add(model_config)
+    return network, config, _build_element_updater(network, ElementType.GRID, initial_model_configs, config)
+
+
+def _segment_price(network: Network, connection_name: str) -> Any:
+    connection = network.elements[connection_name]
+    assert isinstance(connection, Connection)
+    return connection.segments["pricing"].price  # type: ignore[attr-defined]
+
+
+def test_element_updater_skips_adapter_for_unchanged_fields() -> None:
+    """An update with unchanged field values does not re-run the adapter."""
+    _network, config, updater = _grid_updater_setup()
+    fresh_config: Any = {**config, "pricing": dict(config["pricing"])}
+
+    with patch.object(grid_adapter, "model_elements", wraps=grid_adapter.model_elements) as model_elements:
+        updater(fresh_config)
+
+    model_elements.assert_not_called()
+
+
+def test_element_updater_writes_direct_fields_without_adapter() -> None:
+    """A changed field forwarded untouched into a tracked param is written directly."""
+    network, config, updater = _grid_updater_setup()
+    import_price = np.array([0.40, 0.20])
+    fresh_config: Any = {**config, "pricing": {**config["pricing"], CONF_PRICE_SOURCE_TARGET: import_price}}
+
+    with patch.object(grid_adapter, "model_elements", wraps=grid_adapter.model_elements) as model_elements:
+        updater(fresh_config)
+
+    model_elements.assert_not_called()
+    assert _segment_price(network, "grid:import") is import_price
+
+
+def test_element_updater_rederives_computed_fields() -> None:
+    """A changed field the adapter computes with re-runs the adapter."""
+    network, config, updater = _grid_updater_setup()
+    fresh_config: Any = {
+        **config,
+        "pricing": {**config["pricing"], CONF_PRICE_TARGET_SOURCE: np.array([0.08, 0.02])},
+    }
+
+    with patch.object(grid_adapter, "model_elements", wraps=grid_adapter.model_elements) as model_elements:
+        updater(fresh_config)
+
+    model_elements.assert_called_once()
+    np.testing.assert_array_equal(_segment_price(network, "grid:export"), [-0.08, -0.02])
+
+
+def test_element_updater_retries_failed_updates() -> None:
+    """A failed update is not recorded as applied, so the next call writes the change."""
+    network, config, updater = _grid_updater_setup()
+    fresh_config: Any = {
+        **config,
+        "pricing": {**config["pricing"], CONF_PRICE_TARGET_SOURCE: np.array([0.08, 0.02])},
+    }
+
+    with (
+        patch.object(grid_adapter, "model_elements", side_effect=RuntimeError("adapter failed")),
+        pytest.raises(RuntimeError, match="adapter failed"),
+    ):
+        updater(fresh_config)
+    updater(fresh_config)
+
+    np.testing.assert_array_equal(_segment_price(network, "grid:export"), [-0.08, -0.02])
+
+
+def test_element_updater_planning_surfaces_adapter_errors() -> None:
+    """An adapter failure unrelated to the probe value is not mistaken for a derived field."""
+    network, config, _updater = _grid_updater_setup()
+    initial_model_configs = grid_adapter.model_elements(config)
+
+    with (
+        patch.object(grid_adapter, "model_elements", side_effect=KeyError("broken adapter")),
+        pytest.raises(KeyError, match="broken adapter"),
+    ):
+        _build_element_updater(network, ElementType.GRID, initial_model_configs, config)
+
+
 # ---------------------------------------------------------------------------
 # _build_policy_updater
 # ---------------------------------------------------------------------------
@@ -0,0 +1,42 @@
+"""Tests for the per-hub policy compilation cache persistence."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.haeo.coordinator.policy_cache import (
+    _POLICY_CACHES,
+    async_get_policy_cache,
+    async_remove_policy_cache,
+    async_save_policy_cache,
+)
+from custom_components.haeo.core.adapters.policy_compilation import PolicyStructure
+
+
+def _structure() -> PolicyStructure:
+    return PolicyStructure(connection_tags={"c": [1]}, outbound_tags={"grid": 1}, inbound_tags={}, placements=[])
+
+
+async def test_policy_cache_survives_memory_loss(hass: HomeAssistant) -> None:
+    """A saved cache is shared in memory and restored from storage after a restart."""
+    cache = await async_get_policy_cache(hass, "entry")
+    assert await async_get_policy_cache(hass, "entry") is cache
+
+    cache.put("key", _structure())
+    await async_save_policy_cache(hass, "entry", cache)
+    assert not cache.modified
+
+    # Simulate a restart by dropping the in-memory caches
+    hass.data.pop(_POLICY_CACHES)
+    restored = await async_get_policy_cache(hass, "entry")
+    assert restored is not cache
+    assert restored.get("key") == _structure()
+
+
+async def test_removed_policy_cache_is_not_restored(hass: HomeAssistant) -> None:
+    """Removing a hub's cache deletes it from memory and storage."""
+    cache = await async_get_policy_cache(hass, "entry")
+    cache.put("key", _structure())
+    await async_save_policy_cache(hass, "entry", cache)
+
+    await async_remove_policy_cache(hass, "entry")
+
+    assert len(await async_get_policy_cache(hass, "entry")) == 0
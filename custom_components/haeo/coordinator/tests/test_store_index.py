@@ -0,0 +1,84 @@
+"""Tests for the per-element input store index."""
+
+from typing import Any
+
+from conftest import FakeEntityState, FakeStateMachine
+from custom_components.haeo.coordinator.store_index import InputStoreIndex
+from custom_components.haeo.core.data.input_store import InputStore, create_input_store
+from custom_components.haeo.core.model.const import OutputType
+from custom_components.haeo.core.schema import as_entity_value
+from custom_components.haeo.core.schema.field_hints import FieldHint
+
+
+class _Storage:
+    """In-memory storage double implementing the Storage protocol."""
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def read(self) -> Any:
+        return self.value
+
+    async def write(self, value: Any) -> None:
+        self.value = value
+
+
+def _store(value: Any, horizon: list[tuple[float, ...]], *, time_series: bool = True) -> InputStore:
+    """Build a store resolving against the mutable ``horizon``."""
+    return create_input_store(
+        storage=_Storage(value),
+        hint=FieldHint(output_type=OutputType.POWER, time_series=time_series),
+        get_forecast_timestamps=lambda: horizon[0],
+    )
+
+
+def test_index_groups_stores_by_element() -> None:
+    """Field values are collected per element from the element's own stores only."""
+    horizon = [(0.0, 300.0, 600.0)]
+    index = InputStoreIndex(
+        {
+            ("Battery", ("power", "max")): _store(5.0, horizon, time_series=False),
+            ("Battery", ("power", "min")): _store(1.0, horizon, time_series=False),
+            ("Grid", ("price",)): _store(0.3, horizon, time_series=False),
+        }
+    )
+
+    assert index.field_values("Battery") == {("power", "max"): 5.0, ("power", "min"): 1.0}
+    assert index.field_values("Grid") == {("price",): 0.3}
+    assert index.field_values("Missing") == {}
+
+
+def test_tracked_index_follows_horizon_alignment() -> None:
+    """Alignment follows stores as they reload for a new horizon."""
+    horizon = [(0.0, 300.0, 600.0)]
+    first = _store(1.0, horizon)
+    second = _store(2.0, horizon)
+    scalar = _store(3.0, horizon, time_series=False)
+    index = InputStoreIndex({("A", ("a",)): first, ("B", ("b",)): second, ("B", ("c",)): scalar})
+    index.track()
+
+    assert index.is_aligned(0.0)
+
+    horizon[0] = (300.0, 600.0, 900.0)
+    first.refresh()
+    assert not index.is_aligned(300.0)
+
+    second.refresh()
+    assert index.is_aligned(300.0)
+    assert not index.is_aligned(0.0)
+
+
+async def test_tracked_index_follows_availability() -> None:
+    """Failed loads mark the element unavailable until a later load succeeds."""
+    horizon = [(0.0, 300.0, 600.0)]
+    driven = _store(as_entity_value(["sensor.x"]), horizon, time_series=False)
+    index = InputStoreIndex({("Load", ("power",)): driven, ("Grid", ("price",)): _store(0.3, horizon)})
+    index.track()
+
+    assert index.first_unavailable_element() == "Load"
+
+    assert await driven.async_load(FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "2.0", {})})) is True
+    assert index.first_unavailable_element() is None
+
+    assert await driven.async_load(FakeStateMachine({})) is False
+    assert index.first_unavailable_element() == "Load"
@@ -16,6 +16,11 @@ Implements the full compilation pipeline:
 8. Pricing injection — per-VLAN sink-side minimum s-t cut placement as
    PolicyPricing model elements with reactive TrackedParam prices
 
+Steps 1-8 depend only on the topology and the rule groupings, never on
+prices. Their outcome is a JSON-serializable PolicyStructure that a
+PolicyCompilationCache keeps by a canonical hash of those inputs, so a
+network rebuilt with the same structure only reapplies tags and prices.
+
 Every source-capable node receives a VLAN through signature merging.
 Policied sources get VLANs from their rule signatures; unpolicied sources
 share a single VLAN (the empty-signature group) with no pricing elements.
@@ -29,9 +34,11 @@ See docs/developer-guide/vlan-optimization.md for optimization proofs.
 """
 
 from collections import defaultdict, deque
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from collections.abc import Set as AbstractSet
-from typing import Any, NotRequired, TypedDict
+import hashlib
+import json
+from typing import Any, NotRequired, TypedDict, TypeGuard
 
 import numpy as np
 from numpy.typing import NDArray
@@ -67,6 +74,102 @@ class CompilationResult(TypedDict):
     pricing_rule_map: dict[int, list[str]]
 
 
+class PolicyPlacement(TypedDict):
+    """Pricing placement of one rule for one source VLAN, without its price."""
+
+    rule: int
+    name: str
+    label: str
+    terms: list[PolicyPricingTerm]
+
+
+class PolicyStructure(TypedDict):
+    """Price-independent outcome of policy compilation.
+
+    Only JSON types are used so structures can be persisted as-is.
+    """
+
+    connection_tags: dict[str, list[int]]
+    outbound_tags: dict[str, int]
+    inbound_tags: dict[str, list[int]]
+    placements: list[PolicyPlacement]
+
+
+# Bump whenever compilation output changes for the same inputs so cached and
+# persisted structures from older versions are no longer looked up
+POLICY_STRUCTURE_VERSION = 1
+
+# Structures kept per cache; hubs rarely alternate between more topologies
+POLICY_CACHE_SIZE = 8
+
+
+def _is_policy_structure(value: object) -> TypeGuard[PolicyStructure]:
+    """Return True when *value* has every PolicyStructure key with its container type."""
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("connection_tags"), dict)
+        and isinstance(value.get("outbound_tags"), dict)
+        and isinstance(value.get("inbound_tags"), dict)
+        and isinstance(value.get("placements"), list)
+    )
+
+
+class PolicyCompilationCache:
+    """Least-recently-used compiled structures keyed by policy_structure_key().
+
+    Integrations persist :meth:`as_dict` and restore it with :meth:`from_dict`;
+    :attr:`modified` tells them whether anything changed since the last save.
+    """
+
+    def __init__(self, max_entries: int = POLICY_CACHE_SIZE) -> None:
+        """Initialize an empty cache holding at most *max_entries* structures."""
+        self._max_entries = max_entries
+        self._structures: dict[str, PolicyStructure] = {}
+        self.modified = False
+
+    def __len__(self) -> int:
+        """Return the number of cached structures."""
+        return len(self._structures)
+
+    def get(self, key: str) -> PolicyStructure | None:
+        """Return the structure for *key* and mark it most recently used."""
+        structure = self._structures.pop(key, None)
+        if structure is not None:
+            self._structures[key] = structure
+        return structure
+
+    def put(self, key: str, structure: PolicyStructure) -> None:
+        """Store *structure*, evicting the least recently used beyond the limit."""
+        self._structures.pop(key, None)
+        self._structures[key] = structure
+        while len(self._structures) > self._max_entries:
+            del self._structures[next(iter(self._structures))]
+        self.modified = True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache contents in their persisted form."""
+        return {"version": POLICY_STRUCTURE_VERSION, "structures": dict(self._structures)}
+
+    @classmethod
+    def from_dict(cls, data: object, max_entries: int = POLICY_CACHE_SIZE) -> "PolicyCompilationCache":
+        """Restore a cache from :meth:`as_dict` output.
+
+        Data from another structure version, or not shaped like a cache, yields
+        an empty cache rather than an error; it is simply recompiled.
+        """
+        cache = cls(max_entries)
+        if not isinstance(data, Mapping) or data.get("version") != POLICY_STRUCTURE_VERSION:
+            return cache
+        structures = data.get("structures")
+        if isinstance(structures, Mapping):
+            for key, structure in structures.items():
+                if isinstance(key, str) and _is_policy_structure(structure):
+                    cache._structures[key] = structure
+        while len(cache._structures) > max_entries:
+            del cache._structures[next(iter(cache._structures))]
+        return cache
+
+
 def _as_name_list(value: object) -> list[str]:
     """Normalize a wildcard/list endpoint field to list[str]."""
     if isinstance(value, list):
@@ -77,6 +180,7 @@ def _as_name_list(value: object) -> list[str]:
 def compile_policies(
     elements: list[ModelElementConfig],
     policy_configs: Sequence[CompiledPolicyRule],
+    cache: PolicyCompilationCache | None = None,
 ) -> CompilationResult:
     """Compile policy rules into tagged power flow constraints on model elements.
 
@@ -84,19 +188,73 @@ def compile_policies(
     inbound_tags fields. Generates PolicyPricing model elements for each
     pricing placement.
 
+    The price-independent part of the compilation is looked up in *cache* by
+    its :func:`policy_structure_key` and only compiled on a miss, so rebuilding
+    a network whose topology and rule groupings are unchanged skips steps 1-8.
+
     Args:
         elements: All model element configs (nodes and connections).
         policy_configs: List of policy rule configs, each with:
             - sources: list of node names, or ["*"] for any
             - destinations: list of node names, or ["*"] for any
             - price: $/kWh (omitted for tagging-only rules)
+        cache: Optional cache of compiled structures to read and fill.
 
     Returns:
         CompilationResult with the element configs and a mapping from
         policy rule index to pricing element names.
 
     """
-    # Partition by element type — connections have source/target fields
+    if cache is None:
+        structure = compile_policy_structure(elements, policy_configs)
+    else:
+        key = policy_structure_key(elements, policy_configs)
+        cached = cache.get(key)
+        if cached is None:
+            structure = compile_policy_structure(elements, policy_configs)
+            cache.put(key, structure)
+        else:
+            structure = cached
+    return apply_policy_structure(elements, policy_configs, structure)
+
+
+def policy_structure_key(
+    elements: Sequence[ModelElementConfig],
+    policy_configs: Sequence[CompiledPolicyRule],
+) -> str:
+    """Return a canonical hash of everything the compiled structure depends on.
+
+    That is the taggable node names and roles, the connections in order and
+    each rule's source and destination lists. Prices and enabled flags are
+    applied after compilation, so editing them never changes the key.
+    """
+    nodes: list[tuple[str, bool, bool]] = []
+    connections: list[tuple[str, str, str]] = []
+    for elem in elements:
+        if elem["element_type"] == MODEL_ELEMENT_TYPE_CONNECTION:
+            connections.append((elem["name"], elem["source"], elem["target"]))
+        elif elem["element_type"] != MODEL_ELEMENT_TYPE_POLICY_PRICING:
+            nodes.append((elem["name"], bool(elem.get("is_source", True)), bool(elem.get("is_sink", True))))
+    rules = [(_as_name_list(policy["sources"]), _as_name_list(policy["destinations"])) for policy in policy_configs]
+    payload = {
+        "version": POLICY_STRUCTURE_VERSION,
+        "nodes": sorted(nodes),
+        "connections": connections,
+        "rules": rules,
+    }
+    return hashlib.sha256(json.dumps(payload, separators=(",", ":")).encode()).hexdigest()
+
+
+def apply_policy_structure(
+    elements: list[ModelElementConfig],
+    policy_configs: Sequence[CompiledPolicyRule],
+    structure: PolicyStructure,
+) -> CompilationResult:
+    """Apply a compiled structure and the current rule prices to element configs.
+
+    *structure* must come from :func:`compile_policy_structure` for elements
+    and rules with the same :func:`policy_structure_key`.
+    """
     connections: list[ConnectionElementConfig] = []
     non_connections: list[ModelElementConfig] = []
     by_name: dict[str, _TaggableConfig] = {}
@@ -112,6 +270,67 @@ def compile_policies(
     if not connections:
         return CompilationResult(elements=elements, pricing_rule_map={})
 
+    tagged_connections: list[ConnectionElementConfig] = []
+    for conn in connections:
+        tags = structure["connection_tags"].get(conn["name"])
+        if not tags:
+            continue
+        conn["tags"] = set(tags)
+        tagged_connections.append(conn)
+
+    for name, vlan_id in structure["outbound_tags"].items():
+        by_name[name]["outbound_tags"] = {vlan_id}
+    for name, vlan_ids in structure["inbound_tags"].items():
+        by_name[name]["inbound_tags"] = set(vlan_ids)
+
+    # Disabled rules compile into the network structure (VLANs, tags)
+    # but start with zero price so they have no cost influence.
+    # Toggling enabled/disabled updates the TrackedParam reactively.
+    pricing_elements: list[PolicyPricingElementConfig] = []
+    pricing_rule_map: dict[int, list[str]] = {}
+    for placement in structure["placements"]:
+        policy = policy_configs[placement["rule"]]
+        price = policy["price"] if policy.get("enabled", True) else 0.0
+        pricing_elements.append(
+            PolicyPricingElementConfig(
+                element_type=MODEL_ELEMENT_TYPE_POLICY_PRICING,
+                name=placement["name"],
+                label=placement["label"],
+                price=price,
+                terms=[
+                    PolicyPricingTerm(connection=term["connection"], tag=term["tag"]) for term in placement["terms"]
+                ],
+            )
+        )
+        pricing_rule_map.setdefault(placement["rule"], []).append(placement["name"])
+
+    return CompilationResult(
+        elements=[*non_connections, *tagged_connections, *pricing_elements],
+        pricing_rule_map=pricing_rule_map,
+    )
+
+
+def compile_policy_structure(
+    elements: Sequence[ModelElementConfig],
+    policy_configs: Sequence[CompiledPolicyRule],
+) -> PolicyStructure:
+    """Run the compilation pipeline without touching the element configs.
+
+    Returns the price-independent outcome (tags and pricing placements) for
+    :func:`apply_policy_structure`.
+    """
+    # Partition by element type — connections have source/target fields
+    connections: list[ConnectionElementConfig] = []
+    by_name: dict[str, _TaggableConfig] = {}
+    for elem in elements:
+        if elem["element_type"] == MODEL_ELEMENT_TYPE_CONNECTION:
+            connections.append(elem)
+        elif elem["element_type"] != MODEL_ELEMENT_TYPE_POLICY_PRICING:
+            by_name[elem["name"]] = elem
+
+    if not connections:
+        return PolicyStructure(connection_tags={}, outbound_tags={}, inbound_tags={}, placements=[])
+
     names: set[str] = set(by_name.keys())
 
     # Capability sets for wildcard expansion: nodes that can only produce
@@ -120,10 +339,9 @@ def compile_policies(
     source_names = {name for name, elem in by_name.items() if elem.get("is_source", True)}
     sink_names = {name for name, elem in by_name.items() if elem.get("is_sink", True)}
 
-    # Directed graph: edges follow connection direction (source → target)
-    directed_graph: dict[str, set[tuple[str, str]]] = defaultdict(set)
-    for conn in connections:
-        directed_graph[conn["source"]].add((conn["target"], conn["name"]))
+    # Directed graph: edges follow connection direction (source → target).
+    # Edge ids are connection positions, so graph results map straight back.
+    graph = _PolicyGraph((conn["source"], conn["target"], conn["name"]) for conn in connections)
 
     # --- Step 1: Flow enumeration ---
     # Each rule is identified by its source/destination grouping. Rules with
@@ -182,7 +400,10 @@ def compile_policies(
     # zero-wear arbitrage loops against tag-scoped prices. Pricing is
     # still only placed on the cut separating source from policy-specific
     # destinations (step 8); non-destination sinks remain policy-free.
-    tag_connections: dict[int, set[str]] = {}
+    tag_connections: dict[int, set[int]] = {}
+    sink_nodes = graph.indices(sink_names)
+    # Backward reachability from the sinks is the same for every source
+    sink_reachable, _ = graph.reach(sink_nodes, forward=False)
 
     for vlan_id in active_vlans:
         source_nodes = {n for n, v in tag_map.items() if v == vlan_id}
@@ -192,9 +413,9 @@ def compile_policies(
         # ANY source, which breaks when multiple sources share a VLAN
         # (e.g. Grid:export and Battery:charge become unreachable even
         # though they're valid paths for other sources in the VLAN).
-        reachable: set[str] = set()
-        for src in source_nodes:
-            reachable |= _find_reachable_connections({src}, sink_names, directed_graph, absorb_at=sink_names)
+        reachable: set[int] = set()
+        for src in graph.indices(source_nodes):
+            reachable |= graph.reachable_edges({src}, sink_reachable, absorb_at=sink_nodes)
         tag_connections[vlan_id] = reachable
 
     # --- Step 5: Connection tagging ---
@@ -204,27 +425,22 @@ def compile_policies(
     # flow when not all elements exist yet. Once all sources and sinks are
     # configured, every connection on a source-to-sink path receives at
     # least one tag.
-    tagged_connections: list[ConnectionElementConfig] = []
-    for conn in connections:
-        tags = {tag_id for tag_id, reachable in tag_connections.items() if conn["name"] in reachable}
-        if not tags:
-            continue
-        conn["tags"] = tags
-        tagged_connections.append(conn)
+    connection_tags: dict[str, list[int]] = {}
+    for edge_id, conn in enumerate(connections):
+        tags = sorted(tag_id for tag_id, reachable in tag_connections.items() if edge_id in reachable)
+        if tags:
+            connection_tags[conn["name"]] = tags
 
     # --- Step 6: Node outbound tags ---
     # Every source in the tag map gets outbound_tags forcing its production
     # onto its assigned VLAN. Unpolicied and policied sources are treated
     # uniformly — the difference is only whether pricing elements exist.
-    for name, vlan_id in tag_map.items():
-        by_name[name]["outbound_tags"] = {vlan_id}
+    outbound_tags = dict(tag_map)
 
     # --- Step 7: Node inbound tags ---
     # All sinks accept every active VLAN so both policied and unpolicied
     # power can reach any sink.
-    for name in sink_names:
-        if name in by_name:
-            by_name[name]["inbound_tags"] = set(active_vlans)
+    inbound_tags = {name: list(active_vlans) for name in sorted(sink_names) if name in by_name}
 
     # --- Step 8: Pricing injection ---
     # For each VLAN participating in a rule, place the price on a minimum
@@ -237,7 +453,8 @@ def compile_policies(
     # sum-over-cut constraint rather than one per destination).
     #
     # Each placement becomes a PolicyPricing model element with a TrackedParam
-    # price, enabling reactive updates when policy values change.
+    # price when the structure is applied, enabling reactive updates when
+    # policy values change.
     #
     # Degenerate shapes of the same algorithm:
     #   - specific target: cut collapses to the target's inbound edges,
@@ -247,8 +464,11 @@ def compile_policies(
     #     gate);
     #   - shared bottleneck between multiple sources and targets (e.g. an
     #     inverter between DC and AC): cut is the bottleneck edge.
-    pricing_elements: list[PolicyPricingElementConfig] = []
-    pricing_rule_map: dict[int, list[str]] = {}
+    placements: list[PolicyPlacement] = []
+    # VLAN subgraphs are the tagged edges of each VLAN, in connection order.
+    # Rules sharing a grouping share their cuts.
+    vlan_edges = {vlan_id: sorted(reachable) for vlan_id, reachable in tag_connections.items()}
+    cuts: dict[tuple[int, frozenset[str], frozenset[str]], set[int]] = {}
 
     for rule_idx, policy in enumerate(policy_configs):
         sources = _resolve_wildcard(_as_name_list(policy["sources"]), names, wildcard_set=source_names)
@@ -259,12 +479,6 @@ def compile_policies(
         src_label = ", ".join(raw_src) if raw_src != ["*"] else "*"
         dst_label = ", ".join(raw_dst) if raw_dst != ["*"] else "*"
         rule_label = f"{src_label} → {dst_label}"
-        # Disabled rules compile into the network structure (VLANs, tags)
-        # but start with zero price so they have no cost influence.
-        # Toggling enabled/disabled updates the TrackedParam reactively.
-        price = policy["price"]
-        if not policy.get("enabled", True):
-            price = 0.0
 
         sources_by_vlan: dict[int, set[str]] = defaultdict(set)
         for src in sources:
@@ -272,38 +486,32 @@ def compile_policies(
                 continue
             sources_by_vlan[tag_map[src]].add(src)
 
-        rule_pricing_names: list[str] = []
         for source_vlan, vlan_sources in sorted(sources_by_vlan.items()):
-            vlan_edges = [
-                (conn["source"], conn["target"], conn["name"])
-                for conn in tagged_connections
-                if source_vlan in conn.get("tags", set())
-            ]
-            cut = _min_cut_edges(vlan_sources, set(destinations), vlan_edges)
+            cut_key = (source_vlan, frozenset(vlan_sources), frozenset(destinations))
+            if cut_key not in cuts:
+                cuts[cut_key] = graph.min_cut(
+                    vlan_edges[source_vlan],
+                    graph.indices(vlan_sources),
+                    graph.indices(set(destinations) - vlan_sources),
+                )
+            cut = {graph.edge_names[edge_id] for edge_id in cuts[cut_key]}
             if not cut:
                 continue
 
-            terms: list[PolicyPricingTerm] = [
-                PolicyPricingTerm(connection=conn_name, tag=source_vlan) for conn_name in sorted(cut)
-            ]
-            element_name = f"policy_pricing_r{rule_idx}_v{source_vlan}"
-            pricing_elements.append(
-                PolicyPricingElementConfig(
-                    element_type=MODEL_ELEMENT_TYPE_POLICY_PRICING,
-                    name=element_name,
+            placements.append(
+                PolicyPlacement(
+                    rule=rule_idx,
+                    name=f"policy_pricing_r{rule_idx}_v{source_vlan}",
                     label=rule_label,
-                    price=price,
-                    terms=terms,
+                    terms=[PolicyPricingTerm(connection=conn_name, tag=source_vlan) for conn_name in sorted(cut)],
                 )
             )
-            rule_pricing_names.append(element_name)
-
-        if rule_pricing_names:
-            pricing_rule_map[rule_idx] = rule_pricing_names
 
-    return CompilationResult(
-        elements=[*non_connections, *tagged_connections, *pricing_elements],
-        pricing_rule_map=pricing_rule_map,
+    return PolicyStructure(
+        connection_tags=connection_tags,
+        outbound_tags=outbound_tags,
+        inbound_tags=inbound_tags,
+        placements=placements,
     )
 
 
@@ -324,7 +532,189 @@ def _resolve_wildcard(
     return [n for n in names if n in all_names]
 
 
-def _find_reachable_connections(
+class _PolicyGraph:
+    """Integer-indexed directed connection graph built once per compilation.
+
+    Nodes map to dense indices and every connection is an edge id in
+    insertion order, so reachability and max-flow run on flat lists rather
+    than string-keyed dicts. Multiple connections may join the same pair.
+    """
+
+    def __init__(self, edges: Iterable[tuple[str, str, str]]) -> None:
+        """Index the ``(source, target, connection name)`` edges."""
+        self.node_index: dict[str, int] = {}
+        self.edge_names: list[str] = []
+        self.edge_ends: list[tuple[int, int]] = []
+        self._outgoing: list[list[int]] = []
+        self._incoming: list[list[int]] = []
+        for source, target, name in edges:
+            u = self._add_node(source)
+            v = self._add_node(target)
+            self._outgoing[u].append(len(self.edge_names))
+            self._incoming[v].append(len(self.edge_names))
+            self.edge_names.append(name)
+            self.edge_ends.append((u, v))
+
+    def _add_node(self, name: str) -> int:
+        index = self.node_index.get(name)
+        if index is None:
+            index = self.node_index[name] = len(self.node_index)
+            self._outgoing.append([])
+            self._incoming.append([])
+        return index
+
+    def indices(self, names: Iterable[str]) -> set[int]:
+        """Return the indices of *names*, skipping nodes without connections."""
+        return {self.node_index[name] for name in names if name in self.node_index}
+
+    def reach(
+        self,
+        start: AbstractSet[int],
+        *,
+        forward: bool,
+        stop_at: AbstractSet[int] = frozenset(),
+    ) -> tuple[set[int], set[int]]:
+        """Return (reachable, expanded) nodes; expanded excludes stop_at nodes."""
+        adjacency = self._outgoing if forward else self._incoming
+        end = 1 if forward else 0
+        reachable = set(start)
+        expanded: set[int] = set()
+        queue: deque[int] = deque(start)
+        while queue:
+            current = queue.popleft()
+            if current in stop_at:
+                continue
+            expanded.add(current)
+            for edge_id in adjacency[current]:
+                neighbor = self.edge_ends[edge_id][end]
+                if neighbor not in reachable:
+                    reachable.add(neighbor)
+                    queue.append(neighbor)
+        return reachable, expanded
+
+    def reachable_edges(
+        self,
+        source_nodes: AbstractSet[int],
+        backward_reachable: AbstractSet[int],
+        *,
+        absorb_at: AbstractSet[int] = frozenset(),
+    ) -> set[int]:
+        """Return edge ids on directed paths from *source_nodes* into *backward_reachable*.
+
+        *backward_reachable* is the backward reachability of the destinations
+        (see :func:`find_reachable_connections` for the semantics).
+        """
+        forward_reachable, forward_expanded = self.reach(source_nodes, forward=True, stop_at=absorb_at - source_nodes)
+        relevant_nodes = forward_reachable & backward_reachable
+        return {
+            edge_id
+            for current in relevant_nodes & forward_expanded
+            for edge_id in self._outgoing[current]
+            if (neighbor := self.edge_ends[edge_id][1]) in relevant_nodes and neighbor not in source_nodes
+        }
+
+    def min_cut(self, edge_ids: Sequence[int], sources: AbstractSet[int], destinations: AbstractSet[int]) -> set[int]:
+        """Return the edge ids on the sink-side minimum cut of the *edge_ids* subgraph.
+
+        Unit capacity per edge, solved with Dinic's algorithm on flat arc
+        arrays: arc ``a`` and its residual twin ``a ^ 1`` are stored in pairs.
+        Parallel edges between the same pair share one arc whose capacity is
+        their count. See :func:`min_cut_edges` for the cut's properties.
+        """
+        if not sources or not destinations:
+            return set()
+
+        pair_edges: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for edge_id in edge_ids:
+            pair_edges[self.edge_ends[edge_id]].append(edge_id)
+
+        super_src = len(self.node_index)
+        super_dst = super_src + 1
+        # Exceeds the total internal capacity, so super arcs never saturate
+        unbounded = len(edge_ids) + 1
+        arc_to: list[int] = []
+        arc_cap: list[int] = []
+        arcs_out: list[list[int]] = [[] for _ in range(super_dst + 1)]
+
+        def add_arc(u: int, v: int, capacity: int) -> None:
+            arcs_out[u].append(len(arc_to))
+            arc_to.append(v)
+            arc_cap.append(capacity)
+            arcs_out[v].append(len(arc_to))
+            arc_to.append(u)
+            arc_cap.append(0)
+
+        for src in sorted(sources):
+            add_arc(super_src, src, unbounded)
+        for dst in sorted(destinations):
+            add_arc(dst, super_dst, unbounded)
+        for (u, v), parallel in pair_edges.items():
+            add_arc(u, v, len(parallel))
+
+        while True:
+            # Level graph by BFS over arcs with residual capacity
+            level = [-1] * (super_dst + 1)
+            level[super_src] = 0
+            queue: deque[int] = deque([super_src])
+            while queue:
+                u = queue.popleft()
+                for arc in arcs_out[u]:
+                    if arc_cap[arc] > 0 and level[arc_to[arc]] < 0:
+                        level[arc_to[arc]] = level[u] + 1
+                        queue.append(arc_to[arc])
+            if level[super_dst] < 0:
+                break
+
+            # Blocking flow by iterative DFS with per-node arc pointers
+            next_arc = [0] * (super_dst + 1)
+            path: list[int] = []
+            u = super_src
+            while True:
+                if u == super_dst:
+                    pushed = min(arc_cap[arc] for arc in path)
+                    for arc in path:
+                        arc_cap[arc] -= pushed
+                        arc_cap[arc ^ 1] += pushed
+                    path.clear()
+                    u = super_src
+                    continue
+                arcs = arcs_out[u]
+                while next_arc[u] < len(arcs):
+                    arc = arcs[next_arc[u]]
+                    if arc_cap[arc] > 0 and level[arc_to[arc]] == level[u] + 1:
+                        break
+                    next_arc[u] += 1
+                if next_arc[u] < len(arcs):
+                    arc = arcs[next_arc[u]]
+                    path.append(arc)
+                    u = arc_to[arc]
+                    continue
+                # Dead end: retreat and skip the arc that led here
+                if not path:
+                    break
+                u = arc_to[path.pop() ^ 1]
+                next_arc[u] += 1
+
+        # Sink-side canonical cut: T = {nodes from which super_dst is
+        # reachable via residual arcs}, found by walking residual arcs
+        # backwards from super_dst.
+        t_side = [False] * (super_dst + 1)
+        t_side[super_dst] = True
+        stack = [super_dst]
+        while stack:
+            v = stack.pop()
+            for arc in arcs_out[v]:
+                u = arc_to[arc]
+                if not t_side[u] and arc_cap[arc ^ 1] > 0:
+                    t_side[u] = True
+                    stack.append(u)
+
+        return {
+            edge_id for (u, v), parallel in pair_edges.items() if not t_side[u] and t_side[v] for edge_id in parallel
+        }
+
+
+def find_reachable_connections(
     source_nodes: set[str],
     dest_nodes: set[str],
     directed_graph: Mapping[str, set[tuple[str, str]]],
@@ -356,61 +746,26 @@ def _find_reachable_connections(
     own reachability calls.
 
     Stays linear in graph size and is stable on cyclic topologies.
+    Compilation calls ``_PolicyGraph.reachable_edges`` on its shared graph
+    directly, reusing the backward pass across sources; this builds a
+    graph for one standalone query.
     """
     if not source_nodes or not dest_nodes:
         return set()
 
-    absorbing = (absorb_at or set()) - source_nodes
-
-    # Build reverse directed graph
-    reverse_graph: dict[str, set[tuple[str, str]]] = defaultdict(set)
-    for current, neighbors in directed_graph.items():
-        for neighbor, conn_name in neighbors:
-            reverse_graph[neighbor].add((current, conn_name))
-
-    def collect_reachable(
-        start_nodes: set[str],
-        adjacency: Mapping[str, set[tuple[str, str]]],
-        *,
-        stop_at: AbstractSet[str] = frozenset(),
-    ) -> tuple[set[str], set[str]]:
-        """Return (reachable, expanded) where expanded excludes stop_at nodes."""
-        reachable: set[str] = set()
-        expanded: set[str] = set()
-        queue: deque[str] = deque(start_nodes)
-        while queue:
-            current = queue.popleft()
-            if current in reachable:
-                continue
-            reachable.add(current)
-            if current in stop_at:
-                continue
-            expanded.add(current)
-            for neighbor, _conn_name in adjacency.get(current, set()):
-                if neighbor not in reachable:
-                    queue.append(neighbor)
-        return reachable, expanded
-
-    forward_reachable, forward_expanded = collect_reachable(source_nodes, directed_graph, stop_at=absorbing)
-    backward_reachable, _ = collect_reachable(dest_nodes, reverse_graph)
-
-    relevant_nodes = forward_reachable & backward_reachable
-    if not relevant_nodes:
-        return set()
-
-    # Only emit edges out of nodes we actually expanded forward; edges out
-    # of absorbing nodes are excluded so tags stop at the sink.  Edges
-    # whose target is the VLAN's own source are also excluded, so tagged
-    # flow cannot re-enter its origin and create phantom storage loops.
-    return {
-        conn_name
-        for current in relevant_nodes & forward_expanded
-        for neighbor, conn_name in directed_graph.get(current, set())
-        if neighbor in relevant_nodes and neighbor not in source_nodes
-    }
+    graph = _PolicyGraph(
+        (current, neighbor, conn_name)
+        for current, neighbors in directed_graph.items()
+        for neighbor, conn_name in neighbors
+    )
+    backward_reachable, _ = graph.reach(graph.indices(dest_nodes), forward=False)
+    edge_ids = graph.reachable_edges(
+        graph.indices(source_nodes), backward_reachable, absorb_at=graph.indices(absorb_at or set())
+    )
+    return {graph.edge_names[edge_id] for edge_id in edge_ids}
 
 
-def _min_cut_edges(
+def min_cut_edges(
     sources: set[str],
     destinations: set[str],
     directed_edges: Sequence[tuple[str, str, str]],
@@ -418,10 +773,10 @@ def _min_cut_edges(
     """Return connection names on a sink-side minimum s-t cut.
 
     Solves max s-t flow with unit capacity on each internal directed edge
-    (Edmonds-Karp BFS) and returns the cut closest to the destination side:
-    the S-side is every node from which ``SUPER_DST`` is NOT reachable in
-    the final residual graph, so the cut lands where source-tagged flow
-    converges onto the destination boundary.
+    (Dinic's algorithm, see ``_PolicyGraph.min_cut``) and returns the cut
+    closest to the destination side: the S-side is every node from which
+    ``SUPER_DST`` is NOT reachable in the final residual graph, so the cut
+    lands where source-tagged flow converges onto the destination boundary.
 
     The returned cut has two properties we rely on for policy placement:
 
@@ -443,6 +798,9 @@ def _min_cut_edges(
     Parallel edges between the same ``(u, v)`` pair share one aggregated
     flow variable with capacity equal to the number of parallels; if the
     aggregate lies on the cut, every parallel connection name is returned.
+
+    Compilation runs ``_PolicyGraph.min_cut`` on its shared graph directly;
+    this builds a graph for one standalone query.
     """
     if not sources or not destinations:
         return set()
@@ -453,72 +811,6 @@ def _min_cut_edges(
     effective_destinations = destinations - sources
     if not effective_destinations:
         return set()
-    effective_sources = sources
-
-    super_src = "\x00__min_cut_src__"
-    super_dst = "\x00__min_cut_dst__"
-    inf = float("inf")
-
-    residual: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
-    conns_by_pair: dict[tuple[str, str], list[str]] = defaultdict(list)
-
-    for src in sorted(effective_sources):
-        residual[super_src][src] = inf
-    for dst in sorted(effective_destinations):
-        residual[dst][super_dst] = inf
-    for u, v, conn_name in directed_edges:
-        residual[u][v] += 1
-        conns_by_pair[(u, v)].append(conn_name)
-
-    def _bfs_augmenting_path() -> dict[str, str] | None:
-        parent: dict[str, str] = {}
-        visited = {super_src}
-        queue: deque[str] = deque([super_src])
-        while queue:
-            u = queue.popleft()
-            for v, cap in residual[u].items():
-                if v not in visited and cap > 0:
-                    visited.add(v)
-                    parent[v] = u
-                    if v == super_dst:
-                        return parent
-                    queue.append(v)
-        return None
-
-    while (parent := _bfs_augmenting_path()) is not None:
-        path_flow = inf
-        v = super_dst
-        while v in parent:
-            u = parent[v]
-            path_flow = min(path_flow, residual[u][v])
-            v = u
-        v = super_dst
-        while v in parent:
-            u = parent[v]
-            residual[u][v] -= path_flow
-            residual[v][u] += path_flow
-            v = u
-
-    # Sink-side canonical cut: T = {nodes from which super_dst is reachable
-    # via forward residual edges}. Equivalently, a forward BFS in the
-    # reverse residual from super_dst.
-    reverse_adj: dict[str, list[str]] = defaultdict(list)
-    for u, outbound in residual.items():
-        for v, cap in outbound.items():
-            if cap > 0:
-                reverse_adj[v].append(u)
-
-    t_side = {super_dst}
-    queue = deque([super_dst])
-    while queue:
-        v = queue.popleft()
-        for u in reverse_adj[v]:
-            if u not in t_side:
-                t_side.add(u)
-                queue.append(u)
-
-    cut_conn_names: set[str] = set()
-    for (u, v), conn_names in conns_by_pair.items():
-        if u not in t_side and v in t_side:
-            cut_conn_names.update(conn_names)
-    return cut_conn_names
+    graph = _PolicyGraph(directed_edges)
+    edge_ids = graph.min_cut(range(len(directed_edges)), graph.indices(sources), graph.indices(effective_destinations))
+    return {graph.edge_names[edge_id] for edge_id in edge_ids}
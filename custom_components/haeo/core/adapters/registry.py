@@ -1,6 +1,6 @@
 """Element adapter registry and model element collection."""
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any, Protocol, TypeGuard, runtime_checkable
 
 from custom_components.haeo.core.adapters.elements.battery import adapter as battery_adapter
@@ -74,15 +74,34 @@ def is_element_type(value: Any) -> TypeGuard[ElementType]:
     return value in ELEMENT_TYPES
 
 
+def expand_model_elements(
+    participants: Mapping[str, ElementConfigData],
+) -> dict[str, list[ModelElementConfig]]:
+    """Run each participant's adapter once, keyed by participant name.
+
+    The expansion can be shared by everything that needs model element configs
+    while building a network, so each adapter runs once per build.
+    """
+    return {
+        name: ELEMENT_TYPES[loaded_params[CONF_ELEMENT_TYPE]].model_elements(loaded_params)
+        for name, loaded_params in participants.items()
+    }
+
+
 def collect_model_elements(
     participants: Mapping[str, ElementConfigData],
+    model_elements: Mapping[str, Sequence[ModelElementConfig]] | None = None,
 ) -> list[ModelElementConfig]:
-    """Collect and sort model elements from all participants."""
-    all_model_elements: list[ModelElementConfig] = []
-    for loaded_params in participants.values():
-        element_type = loaded_params[CONF_ELEMENT_TYPE]
-        model_elements = ELEMENT_TYPES[element_type].model_elements(loaded_params)
-        all_model_elements.extend(model_elements)
+    """Collect and sort model elements from all participants.
+
+    Pass *model_elements* from ``expand_model_elements`` to reuse an existing
+    expansion instead of running the adapters again.
+    """
+    if model_elements is None:
+        model_elements = expand_model_elements(participants)
+    all_model_elements: list[ModelElementConfig] = [
+        model_config for name in participants for model_config in model_elements[name]
+    ]
 
     return sorted(
         all_model_elements,
@@ -94,5 +113,6 @@ __all__ = [
     "ELEMENT_TYPES",
     "ElementAdapter",
     "collect_model_elements",
+    "expand_model_elements",
     "is_element_type",
 ]
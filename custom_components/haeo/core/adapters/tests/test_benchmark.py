@@ -0,0 +1,79 @@
+"""Policy compilation benchmarks on synthetic topologies of growing size.
+
+Run with:
+    uv run pytest custom_components/haeo/core/adapters/tests/test_benchmark.py -m benchmark
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.haeo.core.adapters.policy_compilation import (
+    CompiledPolicyRule,
+    PolicyStructure,
+    compile_policy_structure,
+)
+from custom_components.haeo.core.model import ModelElementConfig
+from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_CONNECTION, MODEL_ELEMENT_TYPE_NODE
+from custom_components.haeo.core.model.elements.connection import ConnectionElementConfig
+from custom_components.haeo.core.model.elements.node import NodeElementConfig
+
+pytestmark = pytest.mark.benchmark
+
+# Sources and sinks hang off shared buses joined through a central switchboard
+_BUS_COUNT = 4
+
+
+def _synthetic_network(size: int) -> tuple[list[ModelElementConfig], list[CompiledPolicyRule]]:
+    """Build *size* sources and sinks with per-source rules to a rotating subset of sinks."""
+    elements: list[ModelElementConfig] = [
+        NodeElementConfig(element_type=MODEL_ELEMENT_TYPE_NODE, name="switchboard", is_source=False, is_sink=False)
+    ]
+
+    def connect(source: str, target: str) -> None:
+        elements.append(
+            ConnectionElementConfig(
+                element_type=MODEL_ELEMENT_TYPE_CONNECTION, name=f"{source}->{target}", source=source, target=target
+            )
+        )
+
+    for bus in range(_BUS_COUNT):
+        name = f"bus_{bus}"
+        elements.append(
+            NodeElementConfig(element_type=MODEL_ELEMENT_TYPE_NODE, name=name, is_source=False, is_sink=False)
+        )
+        connect(name, "switchboard")
+        connect("switchboard", name)
+    for index in range(size):
+        bus = f"bus_{index % _BUS_COUNT}"
+        source = f"source_{index}"
+        sink = f"sink_{index}"
+        elements.append(
+            NodeElementConfig(element_type=MODEL_ELEMENT_TYPE_NODE, name=source, is_source=True, is_sink=False)
+        )
+        elements.append(
+            NodeElementConfig(element_type=MODEL_ELEMENT_TYPE_NODE, name=sink, is_source=False, is_sink=True)
+        )
+        connect(source, bus)
+        connect(bus, sink)
+
+    rules = [
+        CompiledPolicyRule(
+            sources=[f"source_{index}"],
+            destinations=[f"sink_{(index + offset) % size}" for offset in range(1, 4)],
+            price=0.01 * index,
+        )
+        for index in range(size)
+    ]
+    rules.append(CompiledPolicyRule(sources=["*"], destinations=["sink_0"], price=0.1))
+    return elements, rules
+
+
+@pytest.mark.parametrize("size", [10, 40, 160])
+def test_compile_policy_structure_scaling(size: int, benchmark: BenchmarkFixture) -> None:
+    """Benchmark the full compilation pipeline as sources, sinks and rules grow together."""
+    elements, rules = _synthetic_network(size)
+
+    structure: PolicyStructure = benchmark(compile_policy_structure, elements, rules)
+
+    assert len(structure["outbound_tags"]) == size
+    assert {placement["rule"] for placement in structure["placements"]} == set(range(size + 1))
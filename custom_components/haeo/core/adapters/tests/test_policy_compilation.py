@@ -10,17 +10,24 @@ Tests cover:
 - End-to-end network optimization with policies
 """
 
+from copy import deepcopy
+import json
 from typing import Any, Literal, overload
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
 from custom_components.haeo.core.adapters.policy_compilation import (
+    POLICY_STRUCTURE_VERSION,
     CompilationResult,
     CompiledPolicyRule,
-    _find_reachable_connections,
-    _min_cut_edges,
+    PolicyCompilationCache,
     compile_policies,
+    compile_policy_structure,
+    find_reachable_connections,
+    min_cut_edges,
+    policy_structure_key,
 )
 from custom_components.haeo.core.model import ModelElementConfig
 from custom_components.haeo.core.model.element import NetworkElement
@@ -957,8 +964,8 @@ def test_identical_numpy_prices_separate_rules_get_separate_vlans() -> None:
 def test_find_reachable_connections_returns_empty_for_missing_endpoints() -> None:
     """Empty source or destination sets short-circuit reachability."""
     graph = {"a": {("b", "ab")}, "b": {("a", "ab")}}
-    assert _find_reachable_connections(set(), {"b"}, graph) == set()
-    assert _find_reachable_connections({"a"}, set(), graph) == set()
+    assert find_reachable_connections(set(), {"b"}, graph) == set()
+    assert find_reachable_connections({"a"}, set(), graph) == set()
 
 
 def test_find_reachable_connections_returns_empty_for_disjoint_reachability() -> None:
@@ -969,7 +976,7 @@ def test_find_reachable_connections_returns_empty_for_disjoint_reachability() ->
         "x": {("y", "xy")},
         "y": {("x", "xy")},
     }
-    assert _find_reachable_connections({"a"}, {"y"}, graph) == set()
+    assert find_reachable_connections({"a"}, {"y"}, graph) == set()
 
 
 def test_find_reachable_connections_absorbs_tags_at_sinks() -> None:
@@ -989,7 +996,7 @@ def test_find_reachable_connections_absorbs_tags_at_sinks() -> None:
         "battery": {("inv", "battery_discharge")},
     }
     sinks = {"battery", "load"}
-    connections = _find_reachable_connections({"solar"}, sinks, graph, absorb_at=sinks)
+    connections = find_reachable_connections({"solar"}, sinks, graph, absorb_at=sinks)
     assert "battery_discharge" not in connections
     # Still reaches load directly and the battery charge edge
     assert "solar_inv" in connections
@@ -1009,7 +1016,7 @@ def test_find_reachable_connections_does_not_absorb_at_origin() -> None:
         "inv": {("load", "inv_load")},
     }
     sinks = {"battery", "load"}
-    connections = _find_reachable_connections({"battery"}, sinks, graph, absorb_at=sinks)
+    connections = find_reachable_connections({"battery"}, sinks, graph, absorb_at=sinks)
     assert connections == {"battery_discharge", "inv_load"}
 
 
@@ -1029,7 +1036,7 @@ def test_find_reachable_connections_excludes_edges_into_source() -> None:
         "inv": {("battery", "battery_charge"), ("load", "inv_load")},
     }
     sinks = {"battery", "load"}
-    connections = _find_reachable_connections({"battery"}, sinks, graph, absorb_at=sinks)
+    connections = find_reachable_connections({"battery"}, sinks, graph, absorb_at=sinks)
     assert "battery_charge" not in connections, (
         "Battery VLAN must not re-enter the battery via its charge edge; "
         "otherwise solver exploits a zero-cost self-loop."
@@ -1102,7 +1109,7 @@ def test_min_cut_specific_target_lands_on_target_inbound() -> None:
     """Single source, single target: cut is the target's inbound edge (the discriminator)."""
     # grid → sw → load ; cut separating {grid} from {load} sits on sw_load
     edges = [("grid", "sw", "grid_sw"), ("sw", "load", "sw_load")]
-    assert _min_cut_edges({"grid"}, {"load"}, edges) == {"sw_load"}
+    assert min_cut_edges({"grid"}, {"load"}, edges) == {"sw_load"}
 
 
 def test_min_cut_wildcard_target_lands_on_source_outbound() -> None:
@@ -1113,7 +1120,7 @@ def test_min_cut_wildcard_target_lands_on_source_outbound() -> None:
         ("sw", "load", "sw_load"),
         ("sw", "grid", "sw_grid"),
     ]
-    assert _min_cut_edges({"battery"}, {"load", "grid", "inv"}, edges) == {"bat_inv"}
+    assert min_cut_edges({"battery"}, {"load", "grid", "inv"}, edges) == {"bat_inv"}
 
 
 def test_min_cut_finds_shared_bottleneck_between_multi_source_multi_target() -> None:
@@ -1131,7 +1138,7 @@ def test_min_cut_finds_shared_bottleneck_between_multi_source_multi_target() ->
         ("sw", "load", "sw_load"),
         ("sw", "grid", "sw_grid"),
     ]
-    assert _min_cut_edges({"battery", "solar"}, {"load", "grid"}, edges) == {"inv_sw"}
+    assert min_cut_edges({"battery", "solar"}, {"load", "grid"}, edges) == {"inv_sw"}
 
 
 def test_min_cut_is_antichain_every_path_crosses_exactly_once() -> None:
@@ -1148,7 +1155,7 @@ def test_min_cut_is_antichain_every_path_crosses_exactly_once() -> None:
         ("c", "d", "cd"),
     ]
     # Sink-side canonical cut is target-inbound: {bd, cd}
-    cut = _min_cut_edges({"a"}, {"d"}, edges)
+    cut = min_cut_edges({"a"}, {"d"}, edges)
     assert cut == {"bd", "cd"}
     # Each s-t path contains exactly one cut edge
     paths = [["ab", "bd"], ["ac", "cd"]]
@@ -1158,8 +1165,8 @@ def test_min_cut_is_antichain_every_path_crosses_exactly_once() -> None:
 
 def test_min_cut_empty_when_source_or_dest_empty() -> None:
     """Empty source or destination set yields no cut edges."""
-    assert _min_cut_edges(set(), {"a"}, [("a", "b", "x")]) == set()
-    assert _min_cut_edges({"a"}, set(), [("a", "b", "x")]) == set()
+    assert min_cut_edges(set(), {"a"}, [("a", "b", "x")]) == set()
+    assert min_cut_edges({"a"}, set(), [("a", "b", "x")]) == set()
 
 
 def test_min_cut_ignores_self_loops_in_destinations() -> None:
@@ -1171,13 +1178,13 @@ def test_min_cut_ignores_self_loops_in_destinations() -> None:
     edge.
     """
     edges = [("battery", "inv", "bat_inv"), ("inv", "load", "inv_load")]
-    assert _min_cut_edges({"battery"}, {"battery", "load"}, edges) == {"inv_load"}
+    assert min_cut_edges({"battery"}, {"battery", "load"}, edges) == {"inv_load"}
 
 
 def test_min_cut_returns_empty_for_unreachable_destinations() -> None:
     """No s-t path in the subgraph means max flow is zero and cut is empty."""
     edges = [("a", "b", "ab"), ("c", "d", "cd")]
-    assert _min_cut_edges({"a"}, {"d"}, edges) == set()
+    assert min_cut_edges({"a"}, {"d"}, edges) == set()
 
 
 def test_min_cut_handles_parallel_edges() -> None:
@@ -1190,7 +1197,7 @@ def test_min_cut_handles_parallel_edges() -> None:
         ("grid", "load", "conn_a"),
         ("grid", "load", "conn_b"),
     ]
-    assert _min_cut_edges({"grid"}, {"load"}, edges) == {"conn_a", "conn_b"}
+    assert min_cut_edges({"grid"}, {"load"}, edges) == {"conn_a", "conn_b"}
 
 
 def test_min_cut_scales_with_cardinality_not_capacity() -> None:
@@ -1208,10 +1215,41 @@ def test_min_cut_scales_with_cardinality_not_capacity() -> None:
         ("s", "b", "sb"),
         ("b", "t", "bt"),
     ]
-    cut = _min_cut_edges({"s"}, {"t"}, edges)
+    cut = min_cut_edges({"s"}, {"t"}, edges)
     assert len(cut) == 2
 
 
+def _brute_force_sink_side_cut(
+    sources: set[str], destinations: set[str], edges: list[tuple[str, str, str]]
+) -> set[str]:
+    """Minimum cut with the largest source side, by enumerating every node partition."""
+    free_nodes = sorted({node for u, v, _ in edges for node in (u, v)} - sources - destinations)
+    best: tuple[int, int, set[str]] | None = None
+    for mask in range(1 << len(free_nodes)):
+        s_side = sources | {node for bit, node in enumerate(free_nodes) if mask >> bit & 1}
+        cut = {name for u, v, name in edges if u in s_side and v not in s_side}
+        if best is None or (len(cut), -len(s_side)) < (best[0], best[1]):
+            best = (len(cut), -len(s_side), cut)
+    assert best is not None
+    return best[2]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_min_cut_matches_brute_force_sink_side_cut(seed: int) -> None:
+    """The max-flow cut equals the sink-side minimum cut on random multigraphs."""
+    rng = np.random.default_rng(seed)
+    nodes = ["s1", "s2", "a", "b", "c", "d", "e", "t1", "t2"]
+    edges = [
+        (str(nodes[u]), str(nodes[v]), f"e{index}")
+        for index, (u, v) in enumerate(rng.integers(0, len(nodes), size=(18, 2)))
+        if u != v
+    ]
+
+    assert min_cut_edges({"s1", "s2"}, {"t1", "t2"}, edges) == _brute_force_sink_side_cut(
+        {"s1", "s2"}, {"t1", "t2"}, edges
+    )
+
+
 def test_no_policy_no_extra_cost() -> None:
     """Without policies, optimization behaves normally."""
     network = Network(name="test", periods=np.array([1.0]))
@@ -1424,3 +1462,77 @@ def test_adding_unrelated_policy_preserves_existing_tags() -> None:
     assert solar_tag_after == battery_tag_after
     # Grid gets its own VLAN
     assert grid_tag != solar_tag_after
+
+
+# --- Structure caching ---
+
+
+def _cache_topology() -> list[ModelElementConfig]:
+    return [
+        _node("grid", is_source=True, is_sink=True),
+        _node("solar", is_source=True),
+        _junction("sw"),
+        _node("load", is_sink=True),
+        _conn("grid_sw", "grid", "sw"),
+        _conn("sw_grid", "sw", "grid"),
+        _conn("solar_sw", "solar", "sw"),
+        _conn("sw_load", "sw", "load"),
+    ]
+
+
+def test_cached_compilation_matches_uncached() -> None:
+    """A cache hit reapplies the stored structure with the current prices."""
+    cache = PolicyCompilationCache()
+    compile_policies(_cache_topology(), [_policy(["solar"], ["grid"], 0.02)], cache)
+
+    policies = [_policy(["solar"], ["grid"], 0.07)]
+    with patch(
+        "custom_components.haeo.core.adapters.policy_compilation.compile_policy_structure",
+        side_effect=AssertionError("structure should come from the cache"),
+    ):
+        cached = compile_policies(_cache_topology(), policies, cache)
+
+    assert cached == compile_policies(_cache_topology(), policies)
+    assert [pricing["price"] for pricing in _pricing_configs(cached)] == [0.07]
+
+
+def test_policy_structure_key_ignores_prices_and_enabled() -> None:
+    """Only topology and rule groupings change the structure key."""
+    elements = _cache_topology()
+    key = policy_structure_key(elements, [_policy(["solar"], ["grid"], 0.02)])
+
+    assert policy_structure_key(elements, [_policy(["solar"], ["grid"], 0.5, enabled=False)]) == key
+    assert policy_structure_key(elements, [_policy(["solar"], ["load"], 0.02)]) != key
+    assert policy_structure_key([*elements, _conn("grid_load", "grid", "load")], [_policy(["solar"], ["grid"])]) != key
+
+
+def test_policy_cache_round_trips_through_json() -> None:
+    """Persisted caches restore to the same structures; other versions are dropped."""
+    elements = _cache_topology()
+    policies = [_policy(["solar"], ["grid"], 0.02)]
+    key = policy_structure_key(elements, policies)
+    structure = compile_policy_structure(elements, policies)
+    cache = PolicyCompilationCache()
+    cache.put(key, structure)
+
+    restored = PolicyCompilationCache.from_dict(json.loads(json.dumps(cache.as_dict())))
+    assert restored.get(key) == structure
+    assert not restored.modified
+
+    stale = {**cache.as_dict(), "version": POLICY_STRUCTURE_VERSION + 1}
+    assert len(PolicyCompilationCache.from_dict(stale)) == 0
+    assert len(PolicyCompilationCache.from_dict(None)) == 0
+
+
+def test_policy_cache_evicts_least_recently_used() -> None:
+    """The cache keeps its most recently used structures up to its limit."""
+    structure = compile_policy_structure(_cache_topology(), [])
+    cache = PolicyCompilationCache(max_entries=2)
+    cache.put("a", structure)
+    cache.put("b", deepcopy(structure))
+    assert cache.get("a") is not None
+    cache.put("c", deepcopy(structure))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
@@ -10,6 +10,12 @@ CONF_NAME: Final = "name"
 CONF_DEBOUNCE_SECONDS: Final = "debounce_seconds"
 CONF_HORIZON_PRESET: Final = "horizon_preset"
 CONF_ADVANCED_MODE: Final = "advanced_mode"
+CONF_AGGREGATE_PERIODS: Final = "aggregate_periods"
+CONF_TWO_STAGE_SOLVE: Final = "two_stage_solve"
+CONF_TARGET_SOLVE_TIME: Final = "target_solve_time"
+CONF_MAX_SOLVE_BLOCK_DURATION: Final = "max_solve_block_duration"
+CONF_BOUNDED_BATTERIES: Final = "bounded_batteries"
+CONF_NORMALIZED_TIME_PREFERENCE: Final = "normalized_time_preference"
 
 # Interval tier configuration (4 tiers with count and duration each)
 # Each tier specifies: count = number of intervals, duration = minutes per interval
@@ -39,6 +45,11 @@ DEFAULT_TIER_4_DURATION: Final = 60
 
 DEFAULT_DEBOUNCE_SECONDS: Final = 2  # 2 seconds debounce window
 
+# Solve time budget: 0 seconds disables adaptive resolution, which may then
+# coarsen the tail of the horizon into blocks of up to 4 hours
+DEFAULT_TARGET_SOLVE_TIME: Final = 0
+DEFAULT_MAX_SOLVE_BLOCK_DURATION: Final = 240
+
 # Hub section keys
 HUB_SECTION_COMMON: Final = "common"
 HUB_SECTION_ADVANCED: Final = "advanced"
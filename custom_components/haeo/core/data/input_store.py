@@ -8,7 +8,8 @@ An ``InputStore`` is the single source of truth for one field's value:
 
 - It is built from configuration (via :func:`create_input_store`) and bound to
   a ``Storage`` that backs it to persistent config.
-- DRIVEN stores resolve from source entities through ``async_load``.
+- DRIVEN stores resolve from source entities through ``async_load``, which
+  captures source states on the event loop and resolves them in the executor.
 - EDITABLE stores hold a constant that is persisted through the storage on
   ``set_value``.
 - Consumers (the coordinator) read the resolved ``value`` and subscribe to
@@ -17,17 +18,25 @@ An ``InputStore`` is the single source of truth for one field's value:
 
 import asyncio
 from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 import logging
 from typing import Any
 
 import numpy as np
 
-from custom_components.haeo.core.data.loader.config_loader import is_percent_field, resolve_constant, resolve_field
+from custom_components.haeo.core.data.loader.config_loader import (
+    is_percent_field,
+    resolve_constant,
+    resolve_field,
+    resolve_shifted_forecast,
+)
+from custom_components.haeo.core.data.loader.sensor_loader import SensorPayloadCache
 from custom_components.haeo.core.data.storage import Storage
 from custom_components.haeo.core.schema import as_entity_value
 from custom_components.haeo.core.schema.field_hints import FieldHint
-from custom_components.haeo.core.state import EntityState, StateMachine
+from custom_components.haeo.core.state import EntityState, StateMachine, StateSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +48,41 @@ class InputMode(Enum):
     DRIVEN = "driven"
 
 
+@dataclass(frozen=True, slots=True)
+class StoreLoad:
+    """Result of resolving a driven store's source entities.
+
+    Produced by :meth:`InputStore.resolve_load` (which may run off the event
+    loop) and applied by :meth:`InputStore.apply_load`.
+    """
+
+    captured_source_states: dict[str, EntityState]
+    """Source states the load was resolved from."""
+    forecast_timestamps: tuple[float, ...]
+    """Horizon the load was resolved against."""
+    value: bool | float | np.ndarray | None
+    """Resolved value in optimization units, or None when the load failed."""
+    generation: int = 0
+    """Load generation from :meth:`InputStore.start_load`, used to drop superseded loads."""
+
+
+@dataclass(frozen=True, slots=True)
+class StoreValue:
+    """A store's current value and what it was resolved from.
+
+    Captured on the event loop with :meth:`InputStore.current_value` so that
+    :meth:`InputStore.resolve_load` never reads store attributes that
+    :meth:`InputStore.apply_load` may reassign concurrently.
+    """
+
+    value: bool | float | np.ndarray | None
+    """Current value in optimization units."""
+    source_states: dict[str, EntityState]
+    """Source states the value was resolved from."""
+    loaded_timestamps: tuple[float, ...]
+    """Horizon the value was resolved against (empty unless a time series)."""
+
+
 class InputStore:
     """Holds the resolved value for a single input field.
 
@@ -55,6 +99,7 @@ class InputStore:
         storage: Persistence binding backing this store.
         initial_value: Initial constant value (display units) for editable mode.
         negate: When True, values resolved from source entities are negated.
+        payload_cache: Extraction cache shared with the other stores of the hub.
 
     """
 
@@ -68,6 +113,7 @@ class InputStore:
         storage: Storage,
         initial_value: float | bool | None = None,
         negate: bool = False,
+        payload_cache: SensorPayloadCache | None = None,
     ) -> None:
         """Initialize the input store."""
         self._mode = mode
@@ -75,6 +121,7 @@ class InputStore:
         self._hint = hint
         self._get_forecast_timestamps = get_forecast_timestamps
         self._storage = storage
+        self._payload_cache = payload_cache
 
         # When True, values resolved from source entities are negated so the
         # optimization sees the running cost's negative. Constant (editable)
@@ -87,8 +134,16 @@ class InputStore:
         self._available = False
         self._loaded_timestamps: tuple[float, ...] = ()
         self._captured_source_states: dict[str, EntityState] = {}
+        # Source states the current value was resolved from, used to detect
+        # horizon changes that only shift the time axis (see ``resolve_load``).
+        self._value_source_states: dict[str, EntityState] = {}
+        # Loads may finish out of order once resolved off the event loop; each
+        # carries the generation it was started with and older ones are dropped.
+        self._load_generation = 0
+        self._applied_generation = 0
         self._data_ready = asyncio.Event()
         self._listeners: list[Callable[[], None]] = []
+        self._availability_listeners: list[Callable[[], None]] = []
 
         if mode == InputMode.EDITABLE and initial_value is not None:
             self._resolve_from_constant(mark_ready=False)
@@ -212,19 +267,30 @@ class InputStore:
 
         Returns an unsubscribe callable.
         """
-        self._listeners.append(listener)
+        return _add_listener(self._listeners, listener)
 
-        def _unsub() -> None:
-            if listener in self._listeners:
-                self._listeners.remove(listener)
+    def add_availability_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback fired whenever ``available`` changes.
 
-        return _unsub
+        Unlike change listeners this also fires for failed loads, which mark the
+        store unavailable without changing its value. Returns an unsubscribe
+        callable.
+        """
+        return _add_listener(self._availability_listeners, listener)
 
     def _notify(self) -> None:
         """Fire all registered change listeners."""
         for listener in list(self._listeners):
             listener()
 
+    def _set_available(self, *, available: bool) -> None:
+        """Update availability, firing availability listeners when it changes."""
+        if available == self._available:
+            return
+        self._available = available
+        for listener in list(self._availability_listeners):
+            listener()
+
     # --- Mutation ---
 
     def set_value(self, value: float | bool) -> None:  # noqa: FBT001 (bool is a valid input value)
@@ -245,82 +311,210 @@ class InputStore:
         if self._mode == InputMode.EDITABLE:
             self._resolve_from_constant(mark_ready=True)
 
+    def sync_from_storage(self) -> bool:
+        """Adopt a numeric constant edited directly in storage, e.g. by a reconfigure flow.
+
+        Returns True when the constant changed, after re-resolving and notifying
+        listeners. Driven stores and non-numeric values are left untouched.
+        """
+        if self._mode != InputMode.EDITABLE:
+            return False
+        match self._storage.read():
+            case {"type": "constant", "value": bool()} | bool():
+                return False
+            case {"type": "constant", "value": int() | float() as constant} | (int() | float() as constant):
+                pass
+            case _:
+                return False
+        if float(constant) == self._constant:
+            return False
+        self.set_value(float(constant))
+        return True
+
     async def async_load(self, sm: StateMachine) -> bool:
         """Resolve data from source entities via the provided state machine.
 
         Returns True if data was successfully loaded, False otherwise. Does not
         modify state on failure (keeps previous values).
         """
-        self._captured_source_states = {
-            eid: state for eid in self._source_entity_ids if (state := sm.get(eid)) is not None
-        }
+        return self.apply_load(await self.async_resolve(sm))
 
-        if not self._source_entity_ids:
-            self._available = False
-            return False
+    async def async_resolve(self, sm: StateMachine) -> StoreLoad:
+        """Resolve source entities in the executor without modifying the store.
 
+        Source states and the horizon are captured on the event loop so the
+        executor job never touches the live state machine. Apply the result with
+        :meth:`apply_load`; a load started later always wins.
+        """
+        generation = self.start_load()
+        snapshot = StateSnapshot.capture(sm, self._source_entity_ids)
         forecast_timestamps = self._get_forecast_timestamps()
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(self.resolve_load, snapshot, self.current_value(), forecast_timestamps, generation=generation),
+        )
+
+    def current_value(self) -> StoreValue:
+        """Capture the current value for a load to shift from.
+
+        Call on the event loop alongside :meth:`start_load`.
+        """
+        return StoreValue(self._value, self._value_source_states, self._loaded_timestamps)
+
+    def start_load(self) -> int:
+        """Start a load and return its generation.
+
+        Call on the event loop when capturing the states a load resolves from.
+        """
+        self._load_generation += 1
+        return self._load_generation
+
+    def resolve_load(
+        self,
+        sm: StateMachine,
+        current: StoreValue,
+        forecast_timestamps: tuple[float, ...],
+        *,
+        generation: int,
+    ) -> StoreLoad:
+        """Resolve source entities into a load result without modifying the store.
+
+        Safe to run off the event loop against a state snapshot: it reads only
+        the store's configuration and the ``current`` value captured with
+        :meth:`current_value`. The result is applied with :meth:`apply_load`.
+        """
+        captured = {eid: state for eid in self._source_entity_ids if (state := sm.get(eid)) is not None}
+
+        if not self._source_entity_ids:
+            return StoreLoad(captured, forecast_timestamps, None, generation)
+
         try:
-            resolved = resolve_field(
-                as_entity_value(self._source_entity_ids),
-                self._hint,
-                sm,
-                list(forecast_timestamps),
-            )
+            previous = self._shiftable_value(current, captured, forecast_timestamps)
+            if previous is not None:
+                resolved = resolve_shifted_forecast(
+                    self._source_entity_ids,
+                    self._hint,
+                    sm,
+                    current.loaded_timestamps,
+                    -previous if self._negate else previous,
+                    list(forecast_timestamps),
+                    cache=self._payload_cache,
+                )
+            else:
+                resolved = resolve_field(
+                    as_entity_value(self._source_entity_ids),
+                    self._hint,
+                    sm,
+                    list(forecast_timestamps),
+                    cache=self._payload_cache,
+                )
         except Exception:
             _LOGGER.debug(
                 "Load failed from sources %s; keeping previous value",
                 self._source_entity_ids,
                 exc_info=True,
             )
-            self._available = False
-            return False
+            return StoreLoad(captured, forecast_timestamps, None, generation)
 
         if resolved is None or not isinstance(resolved, (bool, float, int, np.ndarray)):
             _LOGGER.debug(
                 "Load returned no value from sources %s; keeping previous value",
                 self._source_entity_ids,
             )
-            self._available = False
-            return False
+            return StoreLoad(captured, forecast_timestamps, None, generation)
 
         if isinstance(resolved, np.ndarray) and resolved.size == 0:
-            self._available = False
-            return False
+            return StoreLoad(captured, forecast_timestamps, None, generation)
 
         if self._negate and not isinstance(resolved, bool):
             resolved = -resolved
 
-        self._value = resolved
-        self._available = True
-        self._loaded_timestamps = forecast_timestamps if self._hint.time_series else ()
+        return StoreLoad(captured, forecast_timestamps, resolved, generation)
+
+    def apply_load(self, load: StoreLoad) -> bool:
+        """Apply a resolved load, marking ready and notifying listeners on success.
+
+        Returns True if the load carried a value. A failed load marks the store
+        unavailable but keeps its previous value. A load started before the last
+        applied one is superseded and discarded.
+        """
+        if load.generation < self._applied_generation:
+            _LOGGER.debug("Discarding superseded load from sources %s", self._source_entity_ids)
+            return False
+        self._applied_generation = load.generation
+
+        self._captured_source_states = load.captured_source_states
+        if load.value is None:
+            self._set_available(available=False)
+            return False
+
+        self._value = load.value
+        self._value_source_states = load.captured_source_states
+        self._loaded_timestamps = load.forecast_timestamps if self._hint.time_series else ()
+        self._set_available(available=True)
         self._data_ready.set()
         self._notify()
         return True
 
+    def _shiftable_value(
+        self,
+        current: StoreValue,
+        captured: dict[str, EntityState],
+        forecast_timestamps: tuple[float, ...],
+    ) -> np.ndarray | None:
+        """Return the current value when a load would only shift its time axis.
+
+        That is the case for a time series resolved from the very same source
+        states against a different horizon, as on a horizon boundary tick.
+        """
+        value = current.value
+        previous = current.source_states
+        if (
+            not self._hint.time_series
+            or not isinstance(value, np.ndarray)
+            or not current.loaded_timestamps
+            or current.loaded_timestamps == forecast_timestamps
+            or captured.keys() != previous.keys()
+            or any(captured[entity_id] is not state for entity_id, state in previous.items())
+        ):
+            return None
+        return value
+
     def _resolve_from_constant(self, *, mark_ready: bool) -> None:
         """Resolve the stored constant into the optimization value."""
         if self._constant is None:
             self._value = None
-            self._available = False
             self._loaded_timestamps = ()
+            self._set_available(available=False)
         else:
             forecast_timestamps = self._get_forecast_timestamps()
             self._value = resolve_constant(self._constant, self._hint, list(forecast_timestamps))
-            self._available = True
             self._loaded_timestamps = forecast_timestamps if self._hint.time_series else ()
+            self._set_available(available=True)
 
         if mark_ready:
             self._data_ready.set()
             self._notify()
 
 
+def _add_listener(listeners: list[Callable[[], None]], listener: Callable[[], None]) -> Callable[[], None]:
+    """Append *listener* to *listeners* and return a callable removing it again."""
+    listeners.append(listener)
+
+    def _unsub() -> None:
+        if listener in listeners:
+            listeners.remove(listener)
+
+    return _unsub
+
+
 def create_input_store(
     *,
     storage: Storage,
     hint: FieldHint,
     get_forecast_timestamps: Callable[[], tuple[float, ...]],
     negate: bool = False,
+    payload_cache: SensorPayloadCache | None = None,
 ) -> InputStore:
     """Create an InputStore from its storage binding and field hint.
 
@@ -332,7 +526,8 @@ def create_input_store(
 
     When ``negate`` is True, values resolved from source entities are negated.
     Constant values are already stored negated, so the flag only changes the
-    driven path.
+    driven path. ``payload_cache`` is shared by all stores of a hub so each
+    source state change is extracted once.
     """
     config_value = storage.read()
     match config_value:
@@ -344,6 +539,7 @@ def create_input_store(
                 get_forecast_timestamps=get_forecast_timestamps,
                 storage=storage,
                 negate=negate,
+                payload_cache=payload_cache,
             )
         case {"type": "constant", "value": constant}:
             return InputStore(
@@ -389,4 +585,4 @@ def create_input_store(
             raise RuntimeError(msg)
 
 
-__all__ = ["InputMode", "InputStore", "create_input_store"]
+__all__ = ["InputMode", "InputStore", "StoreLoad", "StoreValue", "create_input_store"]
@@ -14,22 +14,22 @@ import numpy as np
 from custom_components.haeo.core.adapters.registry import is_element_type
 from custom_components.haeo.core.const import CONF_ELEMENT_TYPE, CONF_NAME
 from custom_components.haeo.core.data.util.forecast_combiner import combine_sensor_payloads
-from custom_components.haeo.core.data.util.forecast_fuser import fuse_to_boundaries, fuse_to_intervals
+from custom_components.haeo.core.data.util.forecast_fuser import fuse_shifted, fuse_to_boundaries, fuse_to_intervals
 from custom_components.haeo.core.model.const import OutputType
 from custom_components.haeo.core.schema import SchemaValue
 from custom_components.haeo.core.schema.constant_value import is_constant_value
-from custom_components.haeo.core.schema.elements import ELEMENT_CONFIG_SCHEMAS, ElementConfigData, ElementConfigSchema
-from custom_components.haeo.core.schema.entity_value import is_entity_value
-from custom_components.haeo.core.schema.field_hints import (
-    FieldHint,
-    ListFieldHints,
-    extract_field_hints,
-    extract_list_field_hints,
+from custom_components.haeo.core.schema.elements import (
+    ELEMENT_FIELD_HINTS,
+    ELEMENT_LIST_FIELD_HINTS,
+    ElementConfigData,
+    ElementConfigSchema,
 )
+from custom_components.haeo.core.schema.entity_value import is_entity_value
+from custom_components.haeo.core.schema.field_hints import FieldHint, ListFieldHints
 from custom_components.haeo.core.schema.none_value import is_none_value
 from custom_components.haeo.core.state import StateMachine
 
-from .sensor_loader import load_sensors
+from .sensor_loader import SensorPayloadCache, load_sensors
 
 _PERCENT_OUTPUT_TYPES = frozenset({OutputType.STATE_OF_CHARGE, OutputType.EFFICIENCY})
 
@@ -66,7 +66,7 @@ def load_element_config(
         msg = f"Unknown element type: {element_type}"
         raise ValueError(msg)
 
-    field_hints = extract_field_hints(ELEMENT_CONFIG_SCHEMAS[element_type])
+    field_hints = ELEMENT_FIELD_HINTS[element_type]
 
     loaded: dict[str, Any] = {
         key: dict(value) if isinstance(value, Mapping) else value for key, value in element_config.items()
@@ -99,7 +99,7 @@ def load_element_config(
                 loaded.setdefault(section_name, {})[field_name] = resolved
 
     # Resolve list-based input fields (e.g. policy rules with entity prices)
-    list_hints = extract_list_field_hints(ELEMENT_CONFIG_SCHEMAS[element_type])
+    list_hints = ELEMENT_LIST_FIELD_HINTS[element_type]
     for list_key, hints in list_hints.items():
         items = element_config.get(list_key)
         if not isinstance(items, (list, tuple)):
@@ -162,7 +162,7 @@ def load_element_config_from_values(
         msg = f"Unknown element type: {element_type}"
         raise ValueError(msg)
 
-    field_hints = extract_field_hints(ELEMENT_CONFIG_SCHEMAS[element_type])
+    field_hints = ELEMENT_FIELD_HINTS[element_type]
 
     loaded: dict[str, Any] = {
         key: dict(value) if isinstance(value, Mapping) else value for key, value in element_config.items()
@@ -190,7 +190,7 @@ def load_element_config_from_values(
                 if isinstance(loaded_section, dict):
                     loaded_section.pop(field_name, None)
 
-    list_hints = extract_list_field_hints(ELEMENT_CONFIG_SCHEMAS[element_type])
+    list_hints = ELEMENT_LIST_FIELD_HINTS[element_type]
     for list_key, hints in list_hints.items():
         items = element_config.get(list_key)
         if not isinstance(items, (list, tuple)):
@@ -232,11 +232,15 @@ def resolve_field(
     hint: FieldHint,
     sm: StateMachine,
     forecast_times: Sequence[float],
+    *,
+    cache: SensorPayloadCache | None = None,
 ) -> _Sentinel | bool | float | np.ndarray | None:
     """Resolve a single field value based on its schema type and hint metadata.
 
     Shared by the config loader (whole-element resolution) and ``InputStore``
-    (single-field resolution) so both paths produce identical values.
+    (single-field resolution) so both paths produce identical values. Stores
+    pass their hub's shared ``cache`` so sensors referenced by several fields
+    are only extracted once per state change.
     """
     if is_none_value(value):
         return _REMOVE
@@ -262,7 +266,7 @@ def resolve_field(
     if not unwrapped:
         return None
 
-    return _resolve_entities(unwrapped, hint, sm, forecast_times, is_percent=is_percent)
+    return _resolve_entities(unwrapped, hint, sm, forecast_times, is_percent=is_percent, cache=cache)
 
 
 def is_percent_field(hint: FieldHint) -> bool:
@@ -310,9 +314,10 @@ def _resolve_entities(
     forecast_times: Sequence[float],
     *,
     is_percent: bool,
+    cache: SensorPayloadCache | None = None,
 ) -> float | np.ndarray | None:
     """Load entity data from state machine and fuse to horizon."""
-    payloads = load_sensors(sm, entity_ids)
+    payloads = load_sensors(sm, entity_ids, cache=cache)
     if not payloads:
         return None
 
@@ -335,6 +340,33 @@ def _resolve_entities(
     return np.array(values)
 
 
+def resolve_shifted_forecast(
+    entity_ids: Sequence[str],
+    hint: FieldHint,
+    sm: StateMachine,
+    previous_times: Sequence[float],
+    previous_values: np.ndarray,
+    forecast_times: Sequence[float],
+    *,
+    cache: SensorPayloadCache | None = None,
+) -> np.ndarray | None:
+    """Re-resolve a time series entity field onto a horizon that moved in time.
+
+    ``previous_values`` must be this field's values resolved over
+    ``previous_times`` from the same source states. Periods both horizons share
+    are carried over and only the rest are fused, giving the same values
+    ``resolve_field`` would produce for ``forecast_times``.
+    """
+    payloads = load_sensors(sm, entity_ids, cache=cache)
+    if not payloads:
+        return None
+
+    present_value, forecast_series = combine_sensor_payloads(payloads)
+    shift = fuse_shifted(present_value, forecast_series, previous_times, forecast_times, boundaries=hint.boundaries)
+    fresh_values = shift.fresh_values / 100.0 if is_percent_field(hint) else shift.fresh_values
+    return shift.merge(previous_values, fresh_values)
+
+
 def _resolve_list_items(
     items: Sequence[Any],
     hints: ListFieldHints,
@@ -374,4 +406,5 @@ __all__ = [
     "load_element_configs",
     "resolve_constant",
     "resolve_field",
+    "resolve_shifted_forecast",
 ]
@@ -4,8 +4,10 @@ from collections.abc import Sequence
 from enum import StrEnum
 from typing import NamedTuple
 
+import numpy as np
+
 from custom_components.haeo.core.state import EntityState
-from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement, convert_to_base_unit
+from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement, base_unit_conversion, convert_to_base_unit
 
 from . import (
     aemo_nem,
@@ -19,7 +21,7 @@ from . import (
     solcast_solar,
     volcast,
 )
-from .utils import EntityMetadata, separate_duplicate_timestamps
+from .utils import EntityMetadata, separate_duplicate_timestamp_arrays
 
 # Union of all domain literal types from the extractor modules
 ExtractorFormat = (
@@ -114,19 +116,17 @@ def extract(state: EntityState) -> ExtractedData:
 
     # Convert values to base units
     if isinstance(data, Sequence):
-        converted_data: list[tuple[int, float]] = []
-        base_unit: UnitOfMeasurement | str | None = unit_str
-        for ts, point_value in data:
-            converted_value, base_unit, _ = convert_to_base_unit(
-                point_value,
-                unit_str,
-                device_class,
-            )
-            converted_data.append((ts, converted_value))
+        # Resolve the conversion once and scale the whole series with a single multiply
+        factor, base_unit, _ = base_unit_conversion(unit_str, device_class)
+        if not data:
+            return ExtractedData([], base_unit)
+
+        series = np.asarray(data, dtype=np.float64)
+        values = series[:, 1] * factor if factor != 1.0 else series[:, 1]
 
         # Separate duplicate timestamps to prevent interpolation (also converts int timestamps to float)
-        separated_data = separate_duplicate_timestamps(converted_data)
-        return ExtractedData(separated_data, base_unit)
+        timestamps, values = separate_duplicate_timestamp_arrays(series[:, 0], values)
+        return ExtractedData(list(zip(timestamps.tolist(), values.tolist(), strict=True)), base_unit)
 
     # Convert single value
     converted_value, base_unit, _ = convert_to_base_unit(data, unit_str, device_class)
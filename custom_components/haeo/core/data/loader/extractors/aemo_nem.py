@@ -8,7 +8,7 @@ from typing import Literal, Protocol, TypedDict, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,15 +58,16 @@ class Parser:
             and "start_time" in item
             and "price" in item
             and isinstance(item["price"], (int, float))
-            and is_parsable_to_datetime(item["start_time"])
             for item in forecast
-        )
+        ) and are_parsable_to_datetimes([item["start_time"] for item in forecast])
 
     @staticmethod
     def extract(state: AemoNemState) -> tuple[Sequence[tuple[int, float]], UnitOfMeasurement, DeviceClass]:
         """Extract forecast data from AEMO energy market format."""
+        forecast = state.attributes["forecast"]
+        timestamps = parse_datetimes_to_timestamps([item["start_time"] for item in forecast])
         parsed: list[tuple[int, float]] = [
-            (parse_datetime_to_timestamp(item["start_time"]), item["price"]) for item in state.attributes["forecast"]
+            (timestamp, item["price"]) for timestamp, item in zip(timestamps, forecast, strict=True)
         ]
         parsed.sort(key=lambda x: x[0])
         return parsed, Parser.UNIT, Parser.DEVICE_CLASS
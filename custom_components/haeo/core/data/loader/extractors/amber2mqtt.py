@@ -14,7 +14,7 @@ from typing import Literal, Protocol, TypedDict, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,15 +70,12 @@ class Parser:
             and "end_time" in item
             and "advanced_price_predicted" in item
             and isinstance(item["advanced_price_predicted"], (int, float))
-            and is_parsable_to_datetime(item["start_time"])
-            and is_parsable_to_datetime(item["end_time"])
             for item in forecasts
-        )
+        ) and are_parsable_to_datetimes([item[key] for item in forecasts for key in ("start_time", "end_time")])
 
     @staticmethod
-    def _round_to_minute(timestamp: str | datetime) -> int:
+    def _round_to_minute(raw: int) -> int:
         """Round timestamp to nearest minute (Amber provides times 1 second into each period)."""
-        raw = parse_datetime_to_timestamp(timestamp)
         return int(round(raw / 60.0) * 60.0)
 
     @staticmethod
@@ -99,9 +96,12 @@ class Parser:
 
         is_feedin = state.attributes.get("channel_type") == "feedin"
 
-        for item in forecasts:
-            start = Parser._round_to_minute(item["start_time"])
-            end = Parser._round_to_minute(item["end_time"])
+        starts = parse_datetimes_to_timestamps([item["start_time"] for item in forecasts])
+        ends = parse_datetimes_to_timestamps([item["end_time"] for item in forecasts])
+
+        for item, raw_start, raw_end in zip(forecasts, starts, ends, strict=True):
+            start = Parser._round_to_minute(raw_start)
+            end = Parser._round_to_minute(raw_end)
             price = -item["advanced_price_predicted"] if is_feedin else item["advanced_price_predicted"]
 
             # Emit start of window and end of window with same price
@@ -13,7 +13,7 @@ from typing import Literal, Protocol, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 Format = Literal["emhass"]
 DOMAIN: Format = "emhass"
@@ -96,9 +96,8 @@ class Parser:
             and "date" in item
             and entity_name in item
             and _is_numeric_or_numeric_string(item[entity_name])
-            and is_parsable_to_datetime(item["date"])
             for item in forecast
-        )
+        ) and are_parsable_to_datetimes([item["date"] for item in forecast if isinstance(item, Mapping)])
 
     @staticmethod
     def _get_forecast(state: EmhassState) -> Sequence[ForecastEntry]:
@@ -122,12 +121,9 @@ class Parser:
         forecast = Parser._get_forecast(state)
 
         # detect() validated all items have date and entity_name keys
+        timestamps = parse_datetimes_to_timestamps([item["date"] for item in forecast])
         parsed: list[tuple[int, float]] = [
-            (
-                parse_datetime_to_timestamp(item["date"]),
-                _parse_numeric(item[entity_name]),
-            )
-            for item in forecast
+            (timestamp, _parse_numeric(item[entity_name])) for timestamp, item in zip(timestamps, forecast, strict=True)
         ]
         parsed.sort(key=lambda x: x[0])
 
@@ -12,7 +12,7 @@ from typing import Literal, Protocol, TypedDict, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,9 +58,8 @@ class Parser:
             return False
 
         return all(
-            isinstance(key, str) and isinstance(value, (int, float)) and is_parsable_to_datetime(key)
-            for key, value in forecast_dict.items()
-        )
+            isinstance(key, str) and isinstance(value, (int, float)) for key, value in forecast_dict.items()
+        ) and are_parsable_to_datetimes(list(forecast_dict))
 
     @staticmethod
     def extract(state: FlowPowerState) -> tuple[Sequence[tuple[int, float]], UnitOfMeasurement, DeviceClass]:
@@ -78,8 +77,9 @@ class Parser:
         forecast_dict = state.attributes["forecast_dict"]
 
         # Convert forecast_dict to sorted list of (timestamp, price) tuples
+        timestamps = parse_datetimes_to_timestamps(list(forecast_dict))
         entries: list[tuple[int, float]] = [
-            (parse_datetime_to_timestamp(ts_str), float(price)) for ts_str, price in forecast_dict.items()
+            (timestamp, float(price)) for timestamp, price in zip(timestamps, forecast_dict.values(), strict=True)
         ]
         entries.sort(key=lambda x: x[0])
 
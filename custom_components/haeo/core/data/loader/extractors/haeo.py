@@ -13,7 +13,7 @@ from typing import Literal, NotRequired, Protocol, TypedDict, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,13 +70,9 @@ class Parser:
 
         # Validate all entries are dicts with time and value fields
         if not all(
-            isinstance(item, Mapping)
-            and "time" in item
-            and "value" in item
-            and is_parsable_to_datetime(item["time"])
-            and isinstance(item["value"], (int, float))
+            isinstance(item, Mapping) and "time" in item and "value" in item and isinstance(item["value"], (int, float))
             for item in forecast
-        ):
+        ) or not are_parsable_to_datetimes([item["time"] for item in forecast]):
             return False
 
         # Check for required unit_of_measurement
@@ -104,7 +100,8 @@ class Parser:
         forecast = state.attributes["forecast"]
 
         # Parse list of {"time": ..., "value": ...} dicts
-        parsed = [(parse_datetime_to_timestamp(item["time"]), float(item["value"])) for item in forecast]
+        timestamps = parse_datetimes_to_timestamps([item["time"] for item in forecast])
+        parsed = [(timestamp, float(item["value"])) for timestamp, item in zip(timestamps, forecast, strict=True)]
         parsed.sort(key=lambda x: x[0])
 
         # Apply interpolation mode if specified
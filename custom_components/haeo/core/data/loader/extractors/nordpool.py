@@ -15,7 +15,7 @@ from typing import Literal, Protocol, TypedDict, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,10 +67,8 @@ class Parser:
             and "end" in item
             and "value" in item
             and isinstance(item["value"], (int, float))
-            and is_parsable_to_datetime(item["start"])
-            and is_parsable_to_datetime(item["end"])
             for item in entries
-        )
+        ) and are_parsable_to_datetimes([item[key] for item in entries for key in ("start", "end")])
 
     @staticmethod
     def detect(state: EntityState) -> TypeGuard[NordpoolState]:
@@ -103,10 +101,11 @@ class Parser:
         Each entry produces two points (start, value) and (end, value) to create
         a step function without linear interpolation between periods.
         """
+        starts = parse_datetimes_to_timestamps([item["start"] for item in entries])
+        ends = parse_datetimes_to_timestamps([item["end"] for item in entries])
+
         parsed: list[tuple[int, float]] = []
-        for item in entries:
-            start = parse_datetime_to_timestamp(item["start"])
-            end = parse_datetime_to_timestamp(item["end"])
+        for item, start, end in zip(entries, starts, ends, strict=True):
             value = item["value"]
             parsed.append((start, value))
             parsed.append((end, value))
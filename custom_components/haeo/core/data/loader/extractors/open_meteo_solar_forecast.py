@@ -8,7 +8,7 @@ from typing import Literal, Protocol, TypedDict, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,13 +46,13 @@ class Parser:
         if not isinstance(watts, Mapping) or not watts:
             return False
 
-        return all(is_parsable_to_datetime(k) and isinstance(v, (int, float)) for k, v in watts.items())
+        return all(isinstance(v, (int, float)) for v in watts.values()) and are_parsable_to_datetimes(list(watts))
 
     @staticmethod
     def extract(state: OpenMeteoSolarState) -> tuple[Sequence[tuple[int, float]], UnitOfMeasurement, DeviceClass]:
         """Extract forecast data from Open-Meteo solar forecast format."""
-        parsed: list[tuple[int, float]] = [
-            (parse_datetime_to_timestamp(time), value) for time, value in state.attributes["watts"].items()
-        ]
+        watts = state.attributes["watts"]
+        timestamps = parse_datetimes_to_timestamps(list(watts))
+        parsed: list[tuple[int, float]] = list(zip(timestamps, watts.values(), strict=True))
         parsed.sort(key=lambda x: x[0])
         return parsed, Parser.UNIT, Parser.DEVICE_CLASS
@@ -8,7 +8,7 @@ from typing import Literal, Protocol, TypedDict, TypeGuard
 from custom_components.haeo.core.state import EntityState
 from custom_components.haeo.core.units import DeviceClass, UnitOfMeasurement
 
-from .utils import is_parsable_to_datetime, parse_datetime_to_timestamp
+from .utils import are_parsable_to_datetimes, parse_datetimes_to_timestamps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,9 +61,8 @@ class Parser:
             and "period_start" in item
             and "pv_estimate" in item
             and isinstance(item["pv_estimate"], (int, float))
-            and is_parsable_to_datetime(item["period_start"])
             for item in detailed_forecast
-        )
+        ) and are_parsable_to_datetimes([item["period_start"] for item in detailed_forecast])
 
     @staticmethod
     def extract(state: SolcastSolarState) -> tuple[Sequence[tuple[int, float]], UnitOfMeasurement, DeviceClass]:
@@ -71,9 +70,10 @@ class Parser:
 
         State has been validated by detect(), so all entries are guaranteed to be valid.
         """
+        detailed_forecast = state.attributes["detailedForecast"]
+        timestamps = parse_datetimes_to_timestamps([item["period_start"] for item in detailed_forecast])
         parsed: list[tuple[int, float]] = [
-            (parse_datetime_to_timestamp(item["period_start"]), item["pv_estimate"])
-            for item in state.attributes["detailedForecast"]
+            (timestamp, item["pv_estimate"]) for timestamp, item in zip(timestamps, detailed_forecast, strict=True)
         ]
         parsed.sort(key=lambda x: x[0])
         return parsed, Parser.UNIT, Parser.DEVICE_CLASS
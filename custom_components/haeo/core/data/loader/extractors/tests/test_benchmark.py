@@ -0,0 +1,33 @@
+"""Extractor benchmarks using the recorded sensor payloads.
+
+Run with:
+    uv run pytest custom_components/haeo/core/data/loader/extractors/tests/test_benchmark.py -m benchmark
+"""
+
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from conftest import FakeEntityState
+from custom_components.haeo.core.data.loader import extractors
+from custom_components.haeo.core.data.loader.extractors.tests.test_data.sensors import VALID_SENSORS_BY_PARSER
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize(
+    "sensors",
+    list(VALID_SENSORS_BY_PARSER.values()),
+    ids=list(VALID_SENSORS_BY_PARSER),
+)
+def test_extract_recorded_sensors(sensors: list[dict[str, Any]], benchmark: BenchmarkFixture) -> None:
+    """Benchmark detection, datetime parsing and unit conversion for each provider's recorded payloads."""
+    states = [FakeEntityState(s["entity_id"], s["state"], s["attributes"]) for s in sensors]
+
+    def run() -> list[extractors.ExtractedData]:
+        return [extractors.extract(state) for state in states]
+
+    results = benchmark(run)
+
+    assert len(results) == len(sensors)
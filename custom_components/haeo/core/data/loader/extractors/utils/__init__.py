@@ -1,12 +1,20 @@
 """Extractor utility functions for data extraction and parsing."""
 
 from .entity_metadata import EntityMetadata
-from .parse_datetime import is_parsable_to_datetime, parse_datetime_to_timestamp
-from .separate_timestamps import separate_duplicate_timestamps
+from .parse_datetime import (
+    are_parsable_to_datetimes,
+    is_parsable_to_datetime,
+    parse_datetime_to_timestamp,
+    parse_datetimes_to_timestamps,
+)
+from .separate_timestamps import separate_duplicate_timestamp_arrays, separate_duplicate_timestamps
 
 __all__ = [
     "EntityMetadata",
+    "are_parsable_to_datetimes",
     "is_parsable_to_datetime",
     "parse_datetime_to_timestamp",
+    "parse_datetimes_to_timestamps",
+    "separate_duplicate_timestamp_arrays",
     "separate_duplicate_timestamps",
 ]
@@ -1,8 +1,17 @@
 """Utility functions for datetime parsing in forecast extractors."""
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
+from functools import lru_cache
+import re
 from typing import Any
 
+import numpy as np
+
+# Second-resolution ISO 8601 with an optional "Z" or "+HH:MM" suffix, the shape every supported provider emits
+_ISO_SECONDS = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?", re.ASCII)
+_ISO_LOCAL_LENGTH = 19
+
 
 def parse_datetime_to_timestamp(value: Any) -> int:
     """Parse a datetime string or datetime object to UTC timestamp.
@@ -32,6 +41,59 @@ def parse_datetime_to_timestamp(value: Any) -> int:
     raise ValueError(msg)
 
 
+@lru_cache(maxsize=64)
+def _offset_seconds(suffix: str) -> int:
+    """Return the UTC offset in seconds for an ISO 8601 suffix ("", "Z" or "+HH:MM")."""
+    if suffix in ("", "Z"):
+        return 0
+    sign = -1 if suffix[0] == "-" else 1
+    return sign * (int(suffix[1:3]) * 3600 + int(suffix[4:6]) * 60)
+
+
+def _parse_iso_seconds(values: Sequence[Any]) -> list[int] | None:
+    """Parse uniformly shaped ISO 8601 strings in one NumPy pass, or return None if any value differs."""
+    if not all(isinstance(value, str) and _ISO_SECONDS.fullmatch(value) for value in values):
+        return None
+
+    try:
+        local = np.array([value[:_ISO_LOCAL_LENGTH] for value in values], dtype="datetime64[s]")
+    except ValueError:
+        return None
+
+    offsets = np.fromiter(
+        (_offset_seconds(value[_ISO_LOCAL_LENGTH:]) for value in values),
+        dtype=np.int64,
+        count=len(values),
+    )
+    return (local.astype(np.int64) - offsets).tolist()
+
+
+def parse_datetimes_to_timestamps(values: Sequence[Any]) -> list[int]:
+    """Parse a series of datetime strings or datetime objects to UTC timestamps.
+
+    Series in the common second-resolution ISO 8601 shape are parsed in bulk;
+    anything else falls back to parse_datetime_to_timestamp per item.
+
+    Args:
+        values: Datetime objects or ISO format datetime strings
+
+    Returns:
+        Unix timestamps in seconds as integers, in input order
+
+    Raises:
+        ValueError: If any value is not a valid datetime string or datetime object
+
+    """
+    if not values:
+        return []
+
+    fast = _parse_iso_seconds(values)
+    if fast is not None:
+        return fast
+
+    return [parse_datetime_to_timestamp(value) for value in values]
+
+
 def is_parsable_to_datetime(value: Any) -> bool:
     """Check if a value can be parsed to a UTC timestamp."""
     try:
@@ -39,3 +101,12 @@ def is_parsable_to_datetime(value: Any) -> bool:
         return True
     except (ValueError, TypeError):
         return False
+
+
+def are_parsable_to_datetimes(values: Sequence[Any]) -> bool:
+    """Check if every value in a series can be parsed to a UTC timestamp."""
+    try:
+        parse_datetimes_to_timestamps(values)
+        return True
+    except (ValueError, TypeError):
+        return False
@@ -3,31 +3,28 @@
 from collections.abc import Sequence
 
 import numpy as np
+from numpy.typing import NDArray
 
 
-def separate_duplicate_timestamps(data: Sequence[tuple[int, float]]) -> list[tuple[float, float]]:
-    """Separate duplicate timestamps to prevent interpolation.
+def separate_duplicate_timestamp_arrays(
+    timestamps: NDArray[np.float64],
+    values: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Separate duplicate timestamps in parallel timestamp and value arrays.
 
-    When two adjacent timestamps are the same, this function adjusts the first
-    occurrence to be slightly earlier using np.nextafter. This creates step
-    functions without interpolation when forecasts are combined.
-
-    When three or more consecutive timestamps are duplicates, middle entries are removed
-    as they would cause issues when combining forecasts.
+    Array form of separate_duplicate_timestamps for callers that already hold
+    the series as NumPy arrays, avoiding a round trip through Python tuples.
 
     Args:
-        data: Sequence of (timestamp_seconds, value) tuples where timestamps are in seconds as integers
+        timestamps: Timestamps in seconds
+        values: Values aligned with timestamps
 
     Returns:
-        List of (timestamp, value) tuples with duplicate timestamps separated and converted to floats
+        Tuple of (timestamps, values) arrays with duplicate timestamps separated
 
     """
-    if not data:
-        return []
-
-    # Convert to numpy arrays for vectorized operations
-    timestamps = np.array([t for t, _ in data], dtype=np.float64)
-    values = np.array([v for _, v in data], dtype=np.float64)
+    if timestamps.size == 0:
+        return timestamps, values
 
     # Find where timestamps are duplicated with the next entry (compute once)
     is_duplicate_next = timestamps[:-1] == timestamps[1:]
@@ -48,5 +45,34 @@ def separate_duplicate_timestamps(data: Sequence[tuple[int, float]]) -> list[tup
     # Apply nextafter to timestamps that are duplicated with the next entry
     adjusted_timestamps = np.where(is_duplicate, np.nextafter(timestamps, -np.inf), timestamps)
 
+    return adjusted_timestamps, values
+
+
+def separate_duplicate_timestamps(data: Sequence[tuple[int, float]]) -> list[tuple[float, float]]:
+    """Separate duplicate timestamps to prevent interpolation.
+
+    When two adjacent timestamps are the same, this function adjusts the first
+    occurrence to be slightly earlier using np.nextafter. This creates step
+    functions without interpolation when forecasts are combined.
+
+    When three or more consecutive timestamps are duplicates, middle entries are removed
+    as they would cause issues when combining forecasts.
+
+    Args:
+        data: Sequence of (timestamp_seconds, value) tuples where timestamps are in seconds as integers
+
+    Returns:
+        List of (timestamp, value) tuples with duplicate timestamps separated and converted to floats
+
+    """
+    if not data:
+        return []
+
+    # Convert to numpy arrays for vectorized operations
+    timestamps = np.array([t for t, _ in data], dtype=np.float64)
+    values = np.array([v for _, v in data], dtype=np.float64)
+
+    adjusted_timestamps, values = separate_duplicate_timestamp_arrays(timestamps, values)
+
     # Convert to list of tuples
     return list(zip(adjusted_timestamps.tolist(), values.tolist(), strict=True))
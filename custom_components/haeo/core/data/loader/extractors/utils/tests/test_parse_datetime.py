@@ -4,7 +4,11 @@ from datetime import UTC, datetime
 
 import pytest
 
-from custom_components.haeo.core.data.loader.extractors.utils.parse_datetime import parse_datetime_to_timestamp
+from custom_components.haeo.core.data.loader.extractors.utils.parse_datetime import (
+    are_parsable_to_datetimes,
+    parse_datetime_to_timestamp,
+    parse_datetimes_to_timestamps,
+)
 
 
 def test_parse_datetime_string() -> None:
@@ -54,3 +58,33 @@ def test_parse_non_datetime_type_raises_error() -> None:
 
     with pytest.raises(ValueError, match="Expected datetime or string, got dict"):
         parse_datetime_to_timestamp({})
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param(["2025-10-06T00:00:00+11:00", "2025-10-06T00:30:00+11:00"], id="positive_offset"),
+        pytest.param(["2025-10-06T00:00:00-05:30", "2025-10-06T00:00:00+00:00"], id="mixed_offsets"),
+        pytest.param(["2025-10-06T00:00:00Z", "2025-10-06 01:00:00"], id="zulu_and_naive"),
+        pytest.param(["2025-10-06T00:00:00.750+10:00", "2025-10-06T00:00:00+10:00"], id="fractional_fallback"),
+        pytest.param([datetime(2025, 10, 6, tzinfo=UTC), "2025-10-06T00:00:00+10:00"], id="datetime_fallback"),
+        pytest.param([], id="empty"),
+    ],
+)
+def test_parse_datetimes_matches_per_item(values: list[object]) -> None:
+    """Test that bulk parsing matches per-item parsing for every input shape."""
+    result = parse_datetimes_to_timestamps(values)
+    assert result == [parse_datetime_to_timestamp(value) for value in values]
+    assert all(isinstance(timestamp, int) for timestamp in result)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2025-13-06T00:00:00+10:00", "2025-10-06T00:00:00+24:00", "not a timestamp", None],
+)
+def test_parse_datetimes_invalid_raises_error(value: object) -> None:
+    """Test that a single invalid entry fails the whole series like per-item parsing."""
+    values = ["2025-10-06T00:00:00+10:00", value]
+    with pytest.raises(ValueError):  # noqa: PT011
+        parse_datetimes_to_timestamps(values)
+    assert not are_parsable_to_datetimes(values)
@@ -3,7 +3,10 @@
 import numpy as np
 import pytest
 
-from custom_components.haeo.core.data.loader.extractors.utils import separate_duplicate_timestamps
+from custom_components.haeo.core.data.loader.extractors.utils import (
+    separate_duplicate_timestamp_arrays,
+    separate_duplicate_timestamps,
+)
 
 
 def _prev(v: float) -> float:
@@ -84,3 +87,22 @@ def test_separate_duplicate_timestamps_preserves_value_order() -> None:
     # Values should be in same order
     values = [v for _, v in result]
     assert values == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_separate_duplicate_timestamp_arrays_matches_tuple_form() -> None:
+    """Test that the array form produces the same series as the tuple form."""
+    data = [(100, 1.0), (100, 2.0), (100, 3.0), (200, 4.0), (300, 5.0), (300, 6.0)]
+    timestamps, values = separate_duplicate_timestamp_arrays(
+        np.array([t for t, _ in data], dtype=np.float64),
+        np.array([v for _, v in data], dtype=np.float64),
+    )
+
+    assert list(zip(timestamps.tolist(), values.tolist(), strict=True)) == separate_duplicate_timestamps(data)
+
+
+def test_separate_duplicate_timestamp_arrays_empty() -> None:
+    """Test that empty arrays pass through unchanged."""
+    timestamps, values = separate_duplicate_timestamp_arrays(np.array([]), np.array([]))
+
+    assert timestamps.size == 0
+    assert values.size == 0
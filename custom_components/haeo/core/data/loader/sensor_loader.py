@@ -3,7 +3,7 @@
 from collections.abc import Sequence
 from typing import Any, TypeGuard
 
-from custom_components.haeo.core.state import StateMachine
+from custom_components.haeo.core.state import EntityState, StateMachine
 
 from .extractors import extract
 
@@ -38,7 +38,64 @@ def normalize_entity_ids(value: Any) -> list[str]:
     raise TypeError(msg)
 
 
-def load_sensor(sm: StateMachine, entity_id: str) -> SensorPayload | None:
+def _extract_payload(state: EntityState) -> SensorPayload | None:
+    """Extract the base-unit payload from a state, or None when it cannot be parsed."""
+    try:
+        return extract(state).data
+    except ValueError:
+        return None
+
+
+class SensorPayloadCache:
+    """Cache of extracted sensor payloads shared across input stores.
+
+    The same source sensor is often referenced by several fields and elements.
+    Entries are keyed by ``(entity_id, last_updated)`` so each state change is
+    extracted and unit-converted once no matter how many fields consume it.
+    Only the latest revision of each entity is kept, which bounds the cache to
+    one entry per referenced entity.
+
+    States whose ``last_updated`` is None (test doubles, diagnostics replays)
+    cannot be told apart and are extracted on every lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[str, tuple[object, SensorPayload | None]] = {}
+
+    def get(self, state: EntityState) -> SensorPayload | None:
+        """Return the extracted payload for *state*, extracting on a cache miss."""
+        revision = state.last_updated
+        if revision is None:
+            return _extract_payload(state)
+
+        entry = self._entries.get(state.entity_id)
+        if entry is not None and entry[0] == revision:
+            return entry[1]
+
+        payload = _extract_payload(state)
+        self._entries[state.entity_id] = (revision, payload)
+        return payload
+
+    def invalidate(self, entity_id: str) -> None:
+        """Drop any cached payload for *entity_id*."""
+        self._entries.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entities."""
+        return len(self._entries)
+
+
+def load_sensor(
+    sm: StateMachine,
+    entity_id: str,
+    *,
+    cache: SensorPayloadCache | None = None,
+) -> SensorPayload | None:
     """Load sensor data for a single entity ID.
 
     Checks if the sensor is a forecast sensor and loads it using forecast extraction,
@@ -47,6 +104,7 @@ def load_sensor(sm: StateMachine, entity_id: str) -> SensorPayload | None:
     Args:
         sm: State machine implementation
         entity_id: The entity ID to load
+        cache: Optional shared payload cache to reuse extractions from
 
     Returns:
         Either a float (for simple values) or a list of (timestamp, value) tuples
@@ -57,18 +115,23 @@ def load_sensor(sm: StateMachine, entity_id: str) -> SensorPayload | None:
     if state is None:
         return None
 
-    try:
-        return extract(state).data
-    except ValueError:
-        return None
+    if cache is not None:
+        return cache.get(state)
+    return _extract_payload(state)
 
 
-def load_sensors(sm: StateMachine, entity_ids: Sequence[str]) -> dict[str, SensorPayload]:
+def load_sensors(
+    sm: StateMachine,
+    entity_ids: Sequence[str],
+    *,
+    cache: SensorPayloadCache | None = None,
+) -> dict[str, SensorPayload]:
     """Load sensor data for multiple entity IDs.
 
     Args:
         sm: State machine implementation
         entity_ids: List of entity IDs to load
+        cache: Optional shared payload cache to reuse extractions from
 
     Returns:
         Dictionary mapping entity IDs to their sensor payloads.
@@ -78,7 +141,7 @@ def load_sensors(sm: StateMachine, entity_ids: Sequence[str]) -> dict[str, Senso
     payloads: dict[str, SensorPayload] = {}
 
     for entity_id in entity_ids:
-        payload = load_sensor(sm, entity_id)
+        payload = load_sensor(sm, entity_id, cache=cache)
         if payload is not None:
             payloads[entity_id] = payload
 
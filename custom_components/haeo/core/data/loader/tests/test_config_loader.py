@@ -15,10 +15,20 @@ from custom_components.haeo.core.data.loader.config_loader import (
     load_element_configs,
 )
 from custom_components.haeo.core.model.const import OutputType
-from custom_components.haeo.core.schema import as_connection_target
+from custom_components.haeo.core.schema import as_connection_target, field_hints
+from custom_components.haeo.core.schema.elements import (
+    ELEMENT_CONFIG_SCHEMAS,
+    ELEMENT_FIELD_HINTS,
+    ELEMENT_LIST_FIELD_HINTS,
+)
 from custom_components.haeo.core.schema.elements.battery import CONF_CAPACITY, SECTION_STORAGE
 from custom_components.haeo.core.schema.elements.policy import CONF_PRICE, CONF_RULES
-from custom_components.haeo.core.schema.field_hints import FieldHint, ListFieldHints
+from custom_components.haeo.core.schema.field_hints import (
+    FieldHint,
+    ListFieldHints,
+    extract_field_hints,
+    extract_list_field_hints,
+)
 from custom_components.haeo.core.schema.sections import CONF_EFFICIENCY_SOURCE_TARGET, SECTION_EFFICIENCY
 
 FORECAST_TIMES = (0.0, 3600.0, 7200.0, 10800.0)
@@ -212,7 +222,7 @@ def test_efficiency_defaults_to_unity(
 def test_unavailable_efficiency_entity_defaults_to_unity(monkeypatch: pytest.MonkeyPatch) -> None:
     """Unavailable efficiency entity data falls back to 100% defaults."""
 
-    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str]) -> dict[str, float]:
+    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str], **_kwargs: Any) -> dict[str, float]:
         return {}
 
     monkeypatch.setattr(cl, "load_sensors", fake_load_sensors)
@@ -254,7 +264,7 @@ def test_entity_value_resolves_to_time_series(
 ) -> None:
     """Entity values resolve to time series arrays regardless of sensor data shape."""
 
-    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str]) -> dict[str, object]:
+    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str], **_kwargs: Any) -> dict[str, object]:
         return sensor_data
 
     monkeypatch.setattr(cl, "load_sensors", fake_load_sensors)
@@ -281,7 +291,7 @@ def test_price_field_resolves_to_none(
 ) -> None:
     """Price field resolves to None for unavailable, empty, or unrecognized values."""
 
-    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str]) -> dict[str, float]:
+    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str], **_kwargs: Any) -> dict[str, float]:
         return {}
 
     monkeypatch.setattr(cl, "load_sensors", fake_load_sensors)
@@ -309,7 +319,7 @@ def test_unknown_element_type_raises() -> None:
 def test_entity_percent_scalar_converts(monkeypatch: pytest.MonkeyPatch) -> None:
     """Entity-backed SOC scalar values are divided by 100."""
 
-    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str]) -> dict[str, float]:
+    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str], **_kwargs: Any) -> dict[str, float]:
         return {"sensor.soc": 80.0}
 
     monkeypatch.setattr(cl, "load_sensors", fake_load_sensors)
@@ -323,7 +333,7 @@ def test_entity_percent_scalar_converts(monkeypatch: pytest.MonkeyPatch) -> None
 def test_entity_percent_time_series_converts(monkeypatch: pytest.MonkeyPatch) -> None:
     """Entity-backed SOC boundary values are divided by 100."""
 
-    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str]) -> dict[str, float]:
+    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str], **_kwargs: Any) -> dict[str, float]:
         return {"sensor.cap": 10.0}
 
     monkeypatch.setattr(cl, "load_sensors", fake_load_sensors)
@@ -366,7 +376,7 @@ def test_boolean_values_pass_through(role_input: dict[str, Any]) -> None:
 def test_entity_non_percent_scalar_resolves(monkeypatch: pytest.MonkeyPatch) -> None:
     """Non-percent scalar entity values resolve without division."""
 
-    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str]) -> dict[str, float]:
+    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str], **_kwargs: Any) -> dict[str, float]:
         return {"sensor.salvage": 0.05}
 
     monkeypatch.setattr(cl, "load_sensors", fake_load_sensors)
@@ -476,7 +486,7 @@ def test_resolve_list_items_zero_price_loads(items: list[dict[str, Any]]) -> Non
 def test_resolve_list_items_unavailable_entity_sets_none(monkeypatch: pytest.MonkeyPatch) -> None:
     """When entity resolution returns None, the field is set to None."""
 
-    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str]) -> dict[str, float]:
+    def fake_load_sensors(_sm: Any, entity_ids: Sequence[str], **_kwargs: Any) -> dict[str, float]:
         return {}
 
     monkeypatch.setattr(cl, "load_sensors", fake_load_sensors)
@@ -511,7 +521,7 @@ def test_load_element_config_resolves_list_fields(monkeypatch: pytest.MonkeyPatc
         fields={"price": FieldHint(output_type=OutputType.PRICE, time_series=True)},
     )
 
-    monkeypatch.setattr(cl, "extract_list_field_hints", lambda _cls: {"rules": hints})
+    monkeypatch.setattr(cl, "ELEMENT_LIST_FIELD_HINTS", {"grid": {"rules": hints}})
 
     config: dict[str, Any] = {
         "element_type": "grid",
@@ -568,6 +578,27 @@ def test_load_element_config_from_values_substitutes_store_values() -> None:
     np.testing.assert_array_equal(result["storage"]["capacity"], prices)
 
 
+def test_load_element_config_from_values_uses_precomputed_hints(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Loading reads the import-time hint registry instead of reflecting on schemas."""
+
+    def _reflect(*_args: Any, **_kwargs: Any) -> Any:
+        msg = "schema reflection in the load path"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(field_hints, "get_type_hints", _reflect)
+
+    result = _load_config_from_values("Battery", _battery_config(), {(SECTION_STORAGE, CONF_CAPACITY): 10.0})
+
+    assert result["storage"]["capacity"] == 10.0
+
+
+def test_element_hint_registry_matches_extraction() -> None:
+    """The precomputed registry holds the hints extracted from each schema."""
+    for element_type, schema_cls in ELEMENT_CONFIG_SCHEMAS.items():
+        assert ELEMENT_FIELD_HINTS[element_type] == extract_field_hints(schema_cls)
+        assert ELEMENT_LIST_FIELD_HINTS[element_type] == extract_list_field_hints(schema_cls)
+
+
 def test_load_element_config_from_values_none_uses_default() -> None:
     """A None store value falls back to the field hint default when one exists."""
     config = _inverter_config(efficiency_source_target={"type": "constant", "value": 90.0})
@@ -7,7 +7,13 @@ import pytest
 
 from conftest import FakeEntityState, FakeStateMachine
 from custom_components.haeo.core.data.loader.extractors import ExtractedData
-from custom_components.haeo.core.data.loader.sensor_loader import load_sensor, load_sensors, normalize_entity_ids
+from custom_components.haeo.core.data.loader.sensor_loader import (
+    SensorPayloadCache,
+    load_sensor,
+    load_sensors,
+    normalize_entity_ids,
+)
+from custom_components.haeo.core.state import StateSnapshot
 
 
 def test_normalize_entity_ids_accepts_str_and_sequence() -> None:
@@ -127,3 +133,109 @@ async def test_load_sensors_excludes_unavailable() -> None:
     assert "sensor.unavailable" not in payloads
     assert "sensor.missing" not in payloads
     assert len(payloads) == 1
+
+
+def test_payload_cache_extracts_each_revision_once() -> None:
+    """A cached sensor is extracted once per last_updated revision."""
+
+    updated = datetime(2024, 1, 1, tzinfo=UTC)
+    state = FakeEntityState(
+        entity_id="sensor.a",
+        state="500",
+        attributes={"device_class": "power", "unit_of_measurement": "W"},
+        last_updated=updated,
+    )
+    cache = SensorPayloadCache()
+
+    with patch(
+        "custom_components.haeo.core.data.loader.sensor_loader.extract",
+        return_value=ExtractedData(data=0.5, unit="kW"),
+    ) as mock_extract:
+        first = load_sensors(FakeStateMachine({"sensor.a": state}), ["sensor.a"], cache=cache)
+        second = load_sensors(FakeStateMachine({"sensor.a": state}), ["sensor.a"], cache=cache)
+        assert mock_extract.call_count == 1
+
+        newer = FakeEntityState(
+            entity_id="sensor.a",
+            state="700",
+            attributes=state.attributes,
+            last_updated=updated + timedelta(minutes=1),
+        )
+        load_sensor(FakeStateMachine({"sensor.a": newer}), "sensor.a", cache=cache)
+        assert mock_extract.call_count == 2
+
+    assert first == second == {"sensor.a": 0.5}
+    assert len(cache) == 1
+
+
+def test_payload_cache_hits_through_state_snapshot() -> None:
+    """Snapshotted states keep their last_updated revision and share cache entries."""
+
+    state = FakeEntityState(
+        entity_id="sensor.a",
+        state="500",
+        attributes={"device_class": "power", "unit_of_measurement": "W"},
+        last_updated=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+    sm = FakeStateMachine({"sensor.a": state})
+    cache = SensorPayloadCache()
+
+    with patch(
+        "custom_components.haeo.core.data.loader.sensor_loader.extract",
+        return_value=ExtractedData(data=0.5, unit="kW"),
+    ) as mock_extract:
+        load_sensor(sm, "sensor.a", cache=cache)
+        load_sensor(StateSnapshot.capture(sm, ["sensor.a"]), "sensor.a", cache=cache)
+
+    assert mock_extract.call_count == 1
+
+
+def test_payload_cache_caches_unparsable_states() -> None:
+    """States that fail extraction are cached as None for their revision."""
+
+    state = FakeEntityState(
+        entity_id="sensor.unavailable",
+        state="unavailable",
+        attributes={},
+        last_updated=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+    cache = SensorPayloadCache()
+    sm = FakeStateMachine({"sensor.unavailable": state})
+
+    assert load_sensor(sm, "sensor.unavailable", cache=cache) is None
+    assert len(cache) == 1
+    assert load_sensor(sm, "sensor.unavailable", cache=cache) is None
+
+
+def test_payload_cache_bypassed_without_revision() -> None:
+    """States without last_updated are extracted on every lookup and never stored."""
+
+    state = FakeEntityState(entity_id="sensor.a", state="1", attributes={})
+    cache = SensorPayloadCache()
+
+    with patch(
+        "custom_components.haeo.core.data.loader.sensor_loader.extract",
+        return_value=ExtractedData(data=1.0, unit=None),
+    ) as mock_extract:
+        cache.get(state)
+        cache.get(state)
+
+    assert mock_extract.call_count == 2
+    assert len(cache) == 0
+
+
+def test_payload_cache_invalidate_and_clear() -> None:
+    """Invalidation drops a single entity; clear drops everything."""
+
+    updated = datetime(2024, 1, 1, tzinfo=UTC)
+    cache = SensorPayloadCache()
+    cache.get(FakeEntityState("sensor.a", "1", {}, last_updated=updated))
+    cache.get(FakeEntityState("sensor.b", "2", {}, last_updated=updated))
+    assert len(cache) == 2
+
+    cache.invalidate("sensor.a")
+    cache.invalidate("sensor.missing")
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
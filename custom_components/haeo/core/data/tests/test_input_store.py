@@ -6,6 +6,8 @@ and a tiny in-memory storage double so values resolve identically to the config
 loader (``resolve_field``/``resolve_constant``).
 """
 
+from datetime import UTC, datetime
+import threading
 from typing import Any
 from unittest.mock import patch
 
@@ -14,6 +16,9 @@ import pytest
 
 from conftest import FakeEntityState, FakeStateMachine
 from custom_components.haeo.core.data.input_store import InputMode, create_input_store
+from custom_components.haeo.core.data.loader.config_loader import resolve_field
+from custom_components.haeo.core.data.loader.extractors import extract
+from custom_components.haeo.core.data.loader.sensor_loader import SensorPayloadCache
 from custom_components.haeo.core.model.const import OutputType
 from custom_components.haeo.core.schema import as_constant_value, as_entity_value
 from custom_components.haeo.core.schema.field_hints import FieldHint
@@ -48,11 +53,18 @@ def _make_store(
     time_series: bool = False,
     boundaries: bool = False,
     negate: bool = False,
+    payload_cache: SensorPayloadCache | None = None,
 ) -> Any:
     """Build an InputStore from an in-memory storage value and field hint."""
     storage = _MemStorage(storage_value)
     hint = FieldHint(output_type=output_type, time_series=time_series, boundaries=boundaries)
-    return create_input_store(storage=storage, hint=hint, get_forecast_timestamps=_timestamps, negate=negate)
+    return create_input_store(
+        storage=storage,
+        hint=hint,
+        get_forecast_timestamps=_timestamps,
+        negate=negate,
+        payload_cache=payload_cache,
+    )
 
 
 # --- Editable constant resolution ---
@@ -171,6 +183,40 @@ def test_set_value_percent_divides() -> None:
     assert store.native_value == pytest.approx(80.0)
 
 
+def test_sync_from_storage_adopts_edited_numeric_constant() -> None:
+    """sync_from_storage picks up numeric constants written to storage out of band."""
+    storage = _MemStorage(as_constant_value(5.0))
+    store = create_input_store(
+        storage=storage, hint=FieldHint(output_type=OutputType.ENERGY), get_forecast_timestamps=_timestamps
+    )
+    calls: list[int] = []
+    store.add_listener(lambda: calls.append(1))
+
+    assert store.sync_from_storage() is False
+    assert calls == []
+
+    storage.value = as_constant_value(9.0)
+    assert store.sync_from_storage() is True
+    assert store.value == 9.0
+    assert calls == [1]
+
+    storage.value = as_constant_value(value=True)
+    assert store.sync_from_storage() is False
+    assert store.value == 9.0
+
+
+def test_sync_from_storage_ignores_driven_store() -> None:
+    """Driven stores never adopt storage values through sync_from_storage."""
+    storage = _MemStorage(as_entity_value(["sensor.x"]))
+    store = create_input_store(
+        storage=storage, hint=FieldHint(output_type=OutputType.ENERGY), get_forecast_timestamps=_timestamps
+    )
+
+    storage.value = as_constant_value(3.0)
+
+    assert store.sync_from_storage() is False
+
+
 def test_add_listener_unsub_removes_listener() -> None:
     """The unsubscribe callable removes the listener so it is no longer notified."""
     store = _make_store(output_type=OutputType.ENERGY, time_series=False)
@@ -219,6 +265,31 @@ async def test_driven_async_load_success() -> None:
     assert store.is_ready() is True
 
 
+async def test_driven_stores_share_payload_cache() -> None:
+    """Stores sharing a payload cache extract a common source state only once."""
+    cache = SensorPayloadCache()
+    scalar = _make_store(storage_value=as_entity_value(["sensor.x"]), payload_cache=cache)
+    series = _make_store(
+        storage_value=as_entity_value(["sensor.x"]),
+        output_type=OutputType.POWER,
+        time_series=True,
+        payload_cache=cache,
+    )
+    state = FakeEntityState("sensor.x", "12.0", {}, last_updated=datetime(2024, 1, 1, tzinfo=UTC))
+    sm = FakeStateMachine({"sensor.x": state})
+
+    with patch(
+        "custom_components.haeo.core.data.loader.sensor_loader.extract",
+        wraps=extract,
+    ) as mock_extract:
+        assert await scalar.async_load(sm) is True
+        assert await series.async_load(sm) is True
+
+    assert mock_extract.call_count == 1
+    assert scalar.value == 12.0
+    np.testing.assert_array_equal(series.value, [12.0, 12.0])
+
+
 async def test_driven_async_load_negates_resolved_value() -> None:
     """A negated driven store flips the sign of values resolved from sources."""
     store = _make_store(
@@ -307,6 +378,134 @@ async def test_driven_async_load_rejects_empty_time_series() -> None:
     assert store.available is False
 
 
+async def test_driven_async_load_shifts_unchanged_sources() -> None:
+    """A horizon shift with unchanged sources carries shared periods instead of re-fusing."""
+    forecast = [(float(t), float(t % 3600) / 60.0) for t in range(0, 2 * 86400, 300)]
+    watts = {datetime.fromtimestamp(t, UTC).isoformat(): v for t, v in forecast}
+    sm = FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "40.0", {"watts": watts})})
+    horizon = [tuple(float(t) for t in range(600, 600 + 30 * 300, 300))]
+    hint = FieldHint(output_type=OutputType.STATE_OF_CHARGE, time_series=True)
+
+    def _store() -> Any:
+        return create_input_store(
+            storage=_MemStorage(as_entity_value(["sensor.x"])),
+            hint=hint,
+            get_forecast_timestamps=lambda: horizon[0],
+            negate=True,
+        )
+
+    store = _store()
+    assert await store.async_load(sm) is True
+
+    horizon[0] = tuple(t + 300.0 for t in horizon[0])
+    with patch(
+        "custom_components.haeo.core.data.input_store.resolve_field",
+        side_effect=AssertionError("full resolution on a shift-only load"),
+    ):
+        assert await store.async_load(sm) is True
+
+    reference = _store()
+    assert await reference.async_load(sm) is True
+    assert store.forecast_timestamps == horizon[0]
+    assert store.value.tolist() == reference.value.tolist()
+    assert len(set(store.value.tolist())) > 1
+
+
+async def test_resolve_load_shifts_from_captured_value() -> None:
+    """Resolution shifts the value captured when the load started, not one applied since."""
+    forecast = [(float(t), float(t % 3600) / 60.0) for t in range(0, 2 * 86400, 300)]
+    watts = {datetime.fromtimestamp(t, UTC).isoformat(): v for t, v in forecast}
+    sm = FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "40.0", {"watts": watts})})
+    horizon = [tuple(float(t) for t in range(600, 600 + 30 * 300, 300))]
+    hint = FieldHint(output_type=OutputType.STATE_OF_CHARGE, time_series=True)
+
+    def _store() -> Any:
+        return create_input_store(
+            storage=_MemStorage(as_entity_value(["sensor.x"])),
+            hint=hint,
+            get_forecast_timestamps=lambda: horizon[0],
+        )
+
+    store = _store()
+    assert await store.async_load(sm) is True
+    generation = store.start_load()
+    current = store.current_value()
+
+    # A newer load from other source states is applied while the first one resolves
+    other = FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "10.0", {})})
+    assert await store.async_load(other) is True
+
+    horizon[0] = tuple(t + 300.0 for t in horizon[0])
+    with patch(
+        "custom_components.haeo.core.data.input_store.resolve_field",
+        side_effect=AssertionError("full resolution on a shift-only load"),
+    ):
+        load = store.resolve_load(sm, current, horizon[0], generation=generation)
+
+    reference = _store()
+    assert await reference.async_load(sm) is True
+    assert load.value is not None
+    assert load.value.tolist() == reference.value.tolist()
+
+
+async def test_driven_async_load_changed_source_resolves_fully() -> None:
+    """A changed source state is resolved in full even when the horizon also moved."""
+    horizon = [(0.0, 300.0, 600.0)]
+    store = create_input_store(
+        storage=_MemStorage(as_entity_value(["sensor.x"])),
+        hint=FieldHint(output_type=OutputType.PRICE, time_series=True),
+        get_forecast_timestamps=lambda: horizon[0],
+    )
+    assert await store.async_load(FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "1.0", {})})) is True
+
+    horizon[0] = (300.0, 600.0, 900.0)
+    assert await store.async_load(FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "2.0", {})})) is True
+
+    np.testing.assert_array_equal(store.value, [2.0, 2.0])
+
+
+async def test_driven_async_load_resolves_in_executor() -> None:
+    """Resolution runs off the event loop thread against captured source states."""
+    store = _make_store(storage_value=as_entity_value(["sensor.x"]))
+    sm = FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "12.0", {})})
+    threads: list[int] = []
+
+    def _resolve(*args: Any, **kwargs: Any) -> Any:
+        threads.append(threading.get_ident())
+        return resolve_field(*args, **kwargs)
+
+    with patch("custom_components.haeo.core.data.input_store.resolve_field", side_effect=_resolve):
+        assert await store.async_load(sm) is True
+
+    assert threads
+    assert threads[0] != threading.get_ident()
+    assert store.value == 12.0
+
+
+def test_apply_load_discards_superseded_load() -> None:
+    """A load started before the last applied one is dropped, keeping the newer value."""
+    store = _make_store(storage_value=as_entity_value(["sensor.x"]))
+    older_generation = store.start_load()
+    older = store.resolve_load(
+        FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "1.0", {})}),
+        store.current_value(),
+        _timestamps(),
+        generation=older_generation,
+    )
+    newer = store.resolve_load(
+        FakeStateMachine({"sensor.x": FakeEntityState("sensor.x", "2.0", {})}),
+        store.current_value(),
+        _timestamps(),
+        generation=store.start_load(),
+    )
+
+    assert store.apply_load(newer) is True
+    assert store.apply_load(older) is False
+
+    assert store.value == 2.0
+    assert store.available is True
+
+
 async def test_driven_async_load_without_source_entities() -> None:
     """A driven store with no source entity IDs cannot load."""
     storage = _MemStorage({"type": "entity", "value": []})
@@ -3,6 +3,7 @@
 from collections.abc import Mapping
 
 import numpy as np
+from numpy.typing import NDArray
 
 from . import ForecastSeries, SensorPayload
 
@@ -11,32 +12,27 @@ def combine_sensor_payloads(payloads: Mapping[str, SensorPayload]) -> tuple[floa
     """Sum present values and merge forecast series on shared timestamps."""
 
     present_value: float | None = None
-    forecast_series: list[ForecastSeries] = []
+    forecast_arrays: list[NDArray[np.float64]] = []
 
     for payload in payloads.values():
         if isinstance(payload, float):
             if present_value is None:
                 present_value = 0.0
             present_value += payload
-        elif isinstance(payload, list):
-            forecast_series.append(payload)
+        elif isinstance(payload, list) and payload:
+            forecast_arrays.append(np.asarray(payload, dtype=np.float64))
 
-    if not forecast_series:
+    if not forecast_arrays:
         return (present_value, [])
 
-    unique_timestamps = sorted({timestamp for series in forecast_series for timestamp, _ in series})
-    all_timestamps = np.array(unique_timestamps, dtype=np.float64)
+    # Every series is a (n, 2) array of [timestamp, value] rows
+    all_timestamps = np.unique(np.concatenate([series[:, 0] for series in forecast_arrays]))
     total_values = np.zeros(all_timestamps.size, dtype=np.float64)
 
-    for series in forecast_series:
-        timestamps = np.array([timestamp for timestamp, _ in series], dtype=np.float64)
-        values = np.array([value for _, value in series], dtype=np.float64)
-        interpolated = np.interp(all_timestamps, timestamps, values, left=0.0, right=0.0)
-        total_values += interpolated
+    # Accumulate in payload order so sums stay bit-identical regardless of series count
+    for series in forecast_arrays:
+        total_values += np.interp(all_timestamps, series[:, 0], series[:, 1], left=0.0, right=0.0)
 
-    combined_forecast = [
-        (float(timestamp), float(value))
-        for timestamp, value in zip(all_timestamps.tolist(), total_values.tolist(), strict=False)
-    ]
+    combined_forecast = list(zip(all_timestamps.tolist(), total_values.tolist(), strict=True))
 
     return (present_value, combined_forecast)
@@ -1,6 +1,7 @@
 """Fuse combined forecast data into horizon-aligned values."""
 
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
@@ -34,8 +35,29 @@ def _build_extended_block(
 
     # Repeat block as needed to cover the entire horizon
     repeat_count = max(2, int(np.ceil((horizon_end - horizon_start) / cover_seconds)) + 1)
-    extended = [(timestamp + i * cover_seconds, value) for i in range(repeat_count) for (timestamp, value) in block]
-    return np.array(extended, dtype=[("timestamp", np.float64), ("value", np.float64)])
+    base = np.array(block, dtype=[("timestamp", np.float64), ("value", np.float64)])
+    offsets = np.arange(repeat_count) * cover_seconds
+    extended = np.empty(repeat_count * len(base), dtype=base.dtype)
+    extended["timestamp"] = (base["timestamp"][np.newaxis, :] + offsets[:, np.newaxis]).ravel()
+    extended["value"] = np.tile(base["value"], repeat_count)
+    return extended
+
+
+def _interval_average(block_array: NDArray[Any], interval_start: float, interval_end: float) -> float:
+    """Trapezoidal average of the extended block over one interval."""
+    # Get block points strictly within this interval (excluding boundaries)
+    mask = (block_array["timestamp"] > interval_start) & (block_array["timestamp"] < interval_end)
+    interval_points = block_array[mask]
+
+    # Build integration series: start boundary + internal points + end boundary
+    start_value = np.interp(interval_start, block_array["timestamp"], block_array["value"])
+    end_value = np.interp(interval_end, block_array["timestamp"], block_array["value"])
+    times = np.concatenate([[interval_start], interval_points["timestamp"], [interval_end]])
+    values = np.concatenate([[start_value], interval_points["value"], [end_value]])
+
+    # Trapezoidal integration: area under curve divided by duration
+    area = np.trapezoid(values, times)
+    return float(area / (interval_end - interval_start))
 
 
 def fuse_to_boundaries(
@@ -119,28 +141,115 @@ def fuse_to_intervals(
     block_array = _build_extended_block(forecast_series, horizon_start, horizon_end)
 
     # Trapezoidal integration over each interval
-    result: list[float] = []
-    for i in range(n_intervals):
-        interval_start = horizon_times[i]
-        interval_end = horizon_times[i + 1]
-        interval_duration = interval_end - interval_start
-
-        # Get block points strictly within this interval (excluding boundaries)
-        mask = (block_array["timestamp"] > interval_start) & (block_array["timestamp"] < interval_end)
-        interval_points = block_array[mask]
-
-        # Build integration series: start boundary + internal points + end boundary
-        start_value = np.interp(interval_start, block_array["timestamp"], block_array["value"])
-        end_value = np.interp(interval_end, block_array["timestamp"], block_array["value"])
-        times = np.concatenate([[interval_start], interval_points["timestamp"], [interval_end]])
-        values = np.concatenate([[start_value], interval_points["value"], [end_value]])
-
-        # Trapezoidal integration: area under curve divided by duration
-        area = np.trapezoid(values, times)
-        result.append(float(area / interval_duration))
+    result = [_interval_average(block_array, horizon_times[i], horizon_times[i + 1]) for i in range(n_intervals)]
 
     # Replace first interval with present_value if provided
     if present_value is not None:
         result[0] = present_value
 
     return result
+
+
+@dataclass(frozen=True, slots=True)
+class ShiftedFusion:
+    """Fusion of a horizon that shares periods with a previously fused one.
+
+    Values at ``carried`` positions equal the previous horizon's values at the
+    matching ``carried_from`` positions; the remaining ``fresh`` positions were
+    fused anew into ``fresh_values``.
+    """
+
+    carried: NDArray[np.intp]
+    carried_from: NDArray[np.intp]
+    fresh: NDArray[np.intp]
+    fresh_values: NDArray[np.float64]
+
+    def merge(self, previous_values: NDArray[np.float64], fresh_values: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Assemble the new horizon's values from the previous and fresh values.
+
+        ``fresh_values`` is passed separately so callers can apply the same
+        element-wise conversion the previous values went through.
+        """
+        values = np.empty(len(self.carried) + len(self.fresh), dtype=np.float64)
+        values[self.carried] = previous_values[self.carried_from]
+        values[self.fresh] = fresh_values
+        return values
+
+
+def fuse_shifted(
+    present_value: float | None,
+    forecast_series: ForecastSeries,
+    previous_times: Sequence[float],
+    horizon_times: Sequence[float],
+    *,
+    boundaries: bool,
+) -> ShiftedFusion:
+    """Fuse a forecast onto a horizon, reusing periods of a previous fusion.
+
+    ``previous_times`` is a horizon the same forecast was fused onto before.
+    Periods present in both horizons (same boundary timestamps) whose
+    interpolation neighbourhood is unaffected by the moved cycle anchor are
+    carried over; only newly exposed periods, periods whose width changed, and
+    position 0 are fused. Merging the result reproduces ``fuse_to_boundaries``
+    / ``fuse_to_intervals`` over ``horizon_times`` exactly.
+
+    Args:
+        present_value: Current sensor value (actual current state)
+        forecast_series: Time series forecast data
+        previous_times: Boundary timestamps of the previous fusion
+        horizon_times: Boundary timestamps (n+1 values defining n intervals)
+        boundaries: Fuse point-in-time boundary values instead of interval averages
+
+    """
+    count = len(horizon_times) if boundaries else max(len(horizon_times) - 1, 0)
+    positions = np.arange(count, dtype=np.intp)
+    no_carry = np.empty(0, dtype=np.intp)
+
+    if not forecast_series or len(previous_times) < MIN_BOUNDARIES or count < MIN_BOUNDARIES:
+        fuse = fuse_to_boundaries if boundaries else fuse_to_intervals
+        return ShiftedFusion(
+            no_carry, no_carry, positions, np.array(fuse(present_value, forecast_series, horizon_times))
+        )
+
+    times = np.asarray(horizon_times, dtype=np.float64)
+    old_times = np.asarray(previous_times, dtype=np.float64)
+    block_array = _build_extended_block(forecast_series, times[0], times[-1])
+    old_block = _build_extended_block(forecast_series, old_times[0], old_times[-1])
+
+    # Both blocks are windows onto the same periodic extension of the forecast, so
+    # they hold the same points between the new block's start and the earlier end.
+    lower = block_array["timestamp"][0]
+    upper = min(block_array["timestamp"][-1], old_block["timestamp"][-1])
+    new_window = block_array[(block_array["timestamp"] >= lower) & (block_array["timestamp"] <= upper)]
+    old_window = old_block[(old_block["timestamp"] >= lower) & (old_block["timestamp"] <= upper)]
+
+    carried = no_carry
+    carried_from = no_carry
+    if np.array_equal(new_window, old_window):
+        # Position 0 is the present value (or the clamped start) in both fusions.
+        candidates = positions[1:]
+        source = np.searchsorted(old_times, times[candidates])
+        matched = np.minimum(source, len(old_times) - 1)
+        keep = (source >= 1) & (old_times[matched] == times[candidates]) & (times[candidates] >= lower)
+        if boundaries:
+            keep &= times[candidates] <= upper
+        else:
+            following = np.minimum(source + 1, len(old_times) - 1)
+            keep &= (
+                (source + 1 < len(old_times))
+                & (old_times[following] == times[candidates + 1])
+                & (times[candidates + 1] <= upper)
+            )
+        carried = candidates[keep]
+        carried_from = source[keep]
+
+    fresh = np.setdiff1d(positions, carried, assume_unique=True)
+    if boundaries:
+        fresh_values = np.interp(times[fresh], block_array["timestamp"], block_array["value"])
+    else:
+        fresh_values = np.array(
+            [_interval_average(block_array, horizon_times[i], horizon_times[i + 1]) for i in fresh.tolist()]
+        )
+    if present_value is not None:
+        fresh_values[0] = present_value
+    return ShiftedFusion(carried, carried_from, fresh, fresh_values.astype(np.float64))
@@ -1,8 +1,13 @@
 """Tests for forecast payload combination utilities."""
 
+from itertools import pairwise
+
 import numpy as np
 import pytest
 
+from conftest import FakeEntityState
+from custom_components.haeo.core.data.loader import extractors
+from custom_components.haeo.core.data.loader.extractors.tests.test_data.sensors import ALL_VALID_SENSORS
 from custom_components.haeo.core.data.util.forecast_combiner import combine_sensor_payloads
 
 type Payloads = dict[str, float | list[tuple[float, float]]]
@@ -169,3 +174,31 @@ def test_combine_sensor_payloads(
     for (actual_ts, actual_val), (expected_ts, expected_val) in zip(forecast_series, expected_forecast, strict=True):
         assert actual_ts == expected_ts
         assert actual_val == pytest.approx(expected_val)
+
+
+def _combine_per_point(series_list: list[list[tuple[float, float]]]) -> list[tuple[float, float]]:
+    """Combine series point by point from Python tuples as a reference."""
+    unique_timestamps = sorted({timestamp for series in series_list for timestamp, _ in series})
+    all_timestamps = np.array(unique_timestamps, dtype=np.float64)
+    total_values = np.zeros(all_timestamps.size, dtype=np.float64)
+    for series in series_list:
+        timestamps = np.array([timestamp for timestamp, _ in series], dtype=np.float64)
+        values = np.array([value for _, value in series], dtype=np.float64)
+        total_values += np.interp(all_timestamps, timestamps, values, left=0.0, right=0.0)
+    return list(zip(all_timestamps.tolist(), total_values.tolist(), strict=True))
+
+
+def test_combine_sensor_payloads_bit_identical_on_extractor_fixtures() -> None:
+    """Combining extracted fixture series matches the per-point reference exactly."""
+    series_list = [
+        extractors.extract(FakeEntityState(sensor["entity_id"], sensor["state"], sensor["attributes"])).data
+        for _, sensor in ALL_VALID_SENSORS
+    ]
+    forecasts = [list(series) for series in series_list if isinstance(series, list)]
+
+    for first, second in pairwise(forecasts):
+        _, combined = combine_sensor_payloads({"sensor.a": first, "sensor.b": second})
+        assert combined == _combine_per_point([first, second])
+
+    _, combined = combine_sensor_payloads({f"sensor.{i}": series for i, series in enumerate(forecasts)})
+    assert combined == _combine_per_point(forecasts)
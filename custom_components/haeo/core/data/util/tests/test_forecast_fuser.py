@@ -17,7 +17,10 @@ Tests use simple integer timestamps to avoid datetime complexity.
 import numpy as np
 import pytest
 
-from custom_components.haeo.core.data.util.forecast_fuser import fuse_to_boundaries, fuse_to_intervals
+from conftest import FakeEntityState
+from custom_components.haeo.core.data.loader import extractors
+from custom_components.haeo.core.data.loader.extractors.tests.test_data.sensors import ALL_VALID_SENSORS
+from custom_components.haeo.core.data.util.forecast_fuser import fuse_shifted, fuse_to_boundaries, fuse_to_intervals
 
 
 @pytest.mark.parametrize(
@@ -253,3 +256,91 @@ def test_fuse_to_boundaries_raises_when_no_data() -> None:
     """Test that missing both forecast_series and present_value raises ValueError."""
     with pytest.raises(ValueError, match="Either forecast_series or present_value must be provided"):
         fuse_to_boundaries(None, [], [0, 1000, 2000])
+
+
+# --- Tests for fuse_shifted ---
+
+
+def _tiered_horizon(start: float) -> list[float]:
+    """Build a tiered horizon whose later tiers align to their own period, like the horizon manager."""
+    times = [start]
+    for step, span in ((60, 900), (300, 2 * 3600), (1800, 6 * 3600), (3600, 12 * 3600)):
+        end = start + span
+        while times[-1] < end:
+            times.append((times[-1] // step + 1) * step)
+    return times
+
+
+def _shifted_values(
+    present_value: float | None,
+    forecast_series: list[tuple[float, float]],
+    previous_times: list[float],
+    horizon_times: list[float],
+    *,
+    boundaries: bool,
+) -> tuple[list[float], int]:
+    """Fuse ``horizon_times`` through the shift path, returning values and the carried count."""
+    fuse = fuse_to_boundaries if boundaries else fuse_to_intervals
+    previous = np.array(fuse(present_value, forecast_series, previous_times))
+    shift = fuse_shifted(present_value, forecast_series, previous_times, horizon_times, boundaries=boundaries)
+    return shift.merge(previous, shift.fresh_values).tolist(), len(shift.carried)
+
+
+def _shift_forecasts() -> list[list[tuple[float, float]]]:
+    """Extractor fixture forecasts with distinct time layouts, plus a dense two-day forecast."""
+    series_list = [
+        extractors.extract(FakeEntityState(sensor["entity_id"], sensor["state"], sensor["attributes"])).data
+        for _, sensor in ALL_VALID_SENSORS
+    ]
+    layouts: dict[tuple[float, ...], list[tuple[float, float]]] = {}
+    for series in series_list:
+        if isinstance(series, list) and len(series) > 1:
+            layouts.setdefault(tuple(timestamp - series[0][0] for timestamp, _ in series), list(series))
+    dense = [(1_700_000_000.5 + i * 1800.0, float(np.sin(i / 5.0)) * 3.0) for i in range(96)]
+    return [*layouts.values(), dense]
+
+
+@pytest.mark.parametrize("boundaries", [False, True], ids=["intervals", "boundaries"])
+@pytest.mark.parametrize("present_value", [None, 7.5], ids=["no_present", "present"])
+def test_fuse_shifted_matches_full_fusion(*, boundaries: bool, present_value: float | None) -> None:
+    """Minute-by-minute horizon shifts reproduce a full fusion exactly while carrying most periods."""
+    fuse = fuse_to_boundaries if boundaries else fuse_to_intervals
+    total_carried = total_values = 0
+    for forecast_series in _shift_forecasts():
+        base = forecast_series[0][0] // 60 * 60 + 120
+        previous_times = _tiered_horizon(base)
+        for minute in (1, 31):
+            horizon_times = _tiered_horizon(base + minute * 60)
+            values, carried = _shifted_values(
+                present_value, forecast_series, previous_times, horizon_times, boundaries=boundaries
+            )
+
+            assert values == fuse(present_value, forecast_series, horizon_times)
+            total_carried += carried
+            total_values += len(values)
+            previous_times = horizon_times
+
+    assert total_carried > total_values // 3
+
+
+def test_fuse_shifted_recomputes_only_changed_periods() -> None:
+    """Only position 0 and periods not shared with the previous horizon are fused."""
+    forecast_series = [(float(t), float(t % 7200) / 100.0) for t in range(0, 4 * 86400, 600)]
+    previous_times = [0.0, 600.0, 1200.0, 1800.0, 3600.0]
+    horizon_times = [600.0, 1200.0, 1800.0, 3600.0, 5400.0]
+
+    shift = fuse_shifted(3.0, forecast_series, previous_times, horizon_times, boundaries=False)
+
+    assert shift.carried.tolist() == [1, 2]
+    assert shift.carried_from.tolist() == [2, 3]
+    assert shift.fresh.tolist() == [0, 3]
+    assert shift.fresh_values[1] == fuse_to_intervals(3.0, forecast_series, horizon_times)[3]
+    assert shift.fresh_values[0] == 3.0
+
+
+def test_fuse_shifted_without_forecast_fuses_everything() -> None:
+    """Present-only payloads have nothing to carry and broadcast the present value."""
+    shift = fuse_shifted(5.0, [], [0, 1000, 2000], [1000, 2000, 3000], boundaries=False)
+
+    assert shift.carried.size == 0
+    assert shift.merge(np.array([5.0, 5.0]), shift.fresh_values).tolist() == [5.0, 5.0]
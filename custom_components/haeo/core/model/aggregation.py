@@ -0,0 +1,280 @@
+"""Lossless horizon aggregation of identical consecutive periods.
+
+Long horizons often contain runs of periods where every model input is the
+same (flat tariffs, zero solar overnight, constant load forecasts). Within
+such a run the LP is linear with constant coefficients, so averaging any
+optimal solution over the run is feasible and costs the same: stored energy
+moves linearly between the run's boundaries, staying within the constant
+bounds. Merging each run into one wider period therefore leaves the optimal
+cost unchanged while shrinking the LP.
+
+:func:`find_period_runs` finds the runs for a set of model element configs,
+and the resulting :class:`PeriodAggregation` shrinks the configs and periods
+for the solve and expands the solved outputs back onto the original periods.
+
+Only the primary cost is preserved exactly. The time-preference secondary
+objective weighs periods by index, so ties may break differently.
+
+:meth:`PeriodAggregation.coarsen` builds a lossy aggregation instead, grouping
+periods into fixed-length blocks whatever their inputs. Configs reduced with
+their period durations then take each block's time-weighted mean inputs.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, overload
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .const import OutputType
+from .elements import ModelElementConfig
+from .output_data import ModelOutputValue, OutputData
+
+# Segment types whose costs depend on stored energy at each boundary, which a
+# merged period only samples at its ends
+_BOUNDARY_COST_SEGMENTS: frozenset[str] = frozenset({"soc_pricing"})
+
+# Output types holding one value per period boundary rather than per period
+_BOUNDARY_OUTPUT_TYPES: frozenset[OutputType] = frozenset({OutputType.ENERGY, OutputType.STATE_OF_CHARGE})
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodAggregation:
+    """Consecutive runs of original periods, each solved as one period."""
+
+    run_lengths: tuple[int, ...]
+
+    @classmethod
+    def identity(cls, n_periods: int) -> "PeriodAggregation":
+        """Return an aggregation that keeps every period."""
+        return cls(run_lengths=(1,) * n_periods)
+
+    @classmethod
+    def coarsen(
+        cls,
+        periods: NDArray[np.floating[Any]],
+        block_hours: float,
+        *,
+        keep: int = 0,
+        breaks: Sequence[int] = (),
+    ) -> "PeriodAggregation":
+        """Return an aggregation grouping periods into blocks of at least *block_hours*.
+
+        This is lossy unless the grouped periods happen to be identical. The
+        first *keep* periods stay at full resolution, and no block spans a
+        period index in *breaks*, so those boundaries survive coarsening.
+        Periods already as long as a block stay on their own, and a shorter
+        block can only close a horizon or end before a break.
+        """
+        stops = {keep, *breaks}
+        run_lengths = [1] * keep
+        length = 0
+        elapsed = 0.0
+        for index, hours in enumerate(np.asarray(periods, dtype=float)[keep:], start=keep):
+            if length and index in stops:
+                run_lengths.append(length)
+                length, elapsed = 0, 0.0
+            length += 1
+            elapsed += hours
+            if elapsed >= block_hours:
+                run_lengths.append(length)
+                length, elapsed = 0, 0.0
+        if length:
+            run_lengths.append(length)
+        return cls(run_lengths=tuple(run_lengths))
+
+    @property
+    def n_periods(self) -> int:
+        """Return the original period count."""
+        return sum(self.run_lengths)
+
+    @property
+    def n_aggregated(self) -> int:
+        """Return the aggregated period count."""
+        return len(self.run_lengths)
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Return the fraction of periods removed by merging."""
+        if not self.run_lengths:
+            return 0.0
+        return 1.0 - self.n_aggregated / self.n_periods
+
+    @property
+    def is_identity(self) -> bool:
+        """Return True when no periods are merged."""
+        return self.n_aggregated == self.n_periods
+
+    @property
+    def run_starts(self) -> NDArray[np.intp]:
+        """Return the original index of each run's first period."""
+        return np.concatenate(([0], np.cumsum(self.run_lengths[:-1]))).astype(np.intp)
+
+    def aggregate_periods(self, periods: NDArray[np.floating[Any]]) -> NDArray[np.float64]:
+        """Return the merged period durations."""
+        return np.add.reduceat(np.asarray(periods, dtype=float), self.run_starts)
+
+    def aggregate_config(
+        self, config: ModelElementConfig, periods: NDArray[np.floating[Any]] | None = None
+    ) -> ModelElementConfig:
+        """Return a copy of *config* with every horizon array reduced to one value per run.
+
+        Per-period arrays take each run's first value, or with *periods* given,
+        each run's duration-weighted mean of the values that are set (not NaN).
+        The two agree on runs of identical values. Boundary arrays keep the
+        values at run boundaries.
+        """
+        weights = None if periods is None else np.asarray(periods, dtype=float)
+        return _map_arrays(config, lambda value: self._aggregate_array(value, weights))  # type: ignore[return-value]
+
+    def _aggregate_array(self, value: NDArray[Any], weights: NDArray[np.float64] | None) -> NDArray[Any]:
+        n = self.n_periods
+        starts = self.run_starts
+        if len(value) == n + 1:
+            return value[np.append(starts, n)]
+        if len(value) != n:
+            return value
+        if weights is None or value.dtype.kind != "f":
+            return value[starts]
+        present = ~np.isnan(value)
+        weighted = np.add.reduceat(np.where(present, value * weights, 0.0), starts)
+        total = np.add.reduceat(np.where(present, weights, 0.0), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(total > 0, weighted / total, np.nan)
+
+    @overload
+    def expand_output(self, output: OutputData, periods: NDArray[np.floating[Any]]) -> OutputData: ...
+
+    @overload
+    def expand_output(self, output: ModelOutputValue, periods: NDArray[np.floating[Any]]) -> ModelOutputValue: ...
+
+    def expand_output(self, output: ModelOutputValue, periods: NDArray[np.floating[Any]]) -> ModelOutputValue:
+        """Map a solved output (or nested output mapping) back onto the original *periods*."""
+        if isinstance(output, OutputData):
+            return self._expand_output_data(output, periods)
+        return {key: self.expand_output(value, periods) for key, value in output.items()}  # type: ignore[return-value]
+
+    def _expand_output_data(self, output: OutputData, periods: NDArray[np.floating[Any]]) -> OutputData:
+        """Expand one output's values and ranging.
+
+        Boundary values are interpolated linearly in time inside each run.
+        Per-period values and ranging repeat across the run, including
+        outputs holding several per-period blocks (e.g. one per tag).
+        """
+        if self.is_identity:
+            return output
+        m = self.n_aggregated
+        count = len(output.values)
+        if output.type in _BOUNDARY_OUTPUT_TYPES and count == m + 1:
+            values = self._interpolate_boundaries(
+                np.asarray(output.values, dtype=float), np.asarray(periods, dtype=float)
+            )
+            return _replace_values(output, tuple(values), output.range_up, output.range_dn)
+        if count == 0 or count % m:
+            return output
+
+        lengths = np.asarray(self.run_lengths)
+
+        def expand(series: Sequence[Any] | None) -> tuple[Any, ...] | None:
+            if series is None or len(series) % m:
+                return None if series is None else tuple(series)
+            return tuple(np.repeat(np.asarray(series, dtype=object).reshape(-1, m), lengths, axis=1).flat)
+
+        return _replace_values(output, expand(output.values) or (), expand(output.range_up), expand(output.range_dn))
+
+    def _interpolate_boundaries(self, values: NDArray[np.float64], periods: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Linearly interpolate run-boundary values at every original boundary."""
+        elapsed = np.concatenate(([0.0], np.cumsum(periods)))
+        run_boundaries = elapsed[np.append(self.run_starts, self.n_periods)]
+        return np.interp(elapsed, run_boundaries, values)
+
+
+def find_period_runs(periods: NDArray[np.floating[Any]], configs: Sequence[ModelElementConfig]) -> PeriodAggregation:
+    """Find the runs of consecutive periods whose model inputs are all identical.
+
+    Period ``t`` joins the run of period ``t - 1`` when every per-period
+    array has equal values at ``t - 1`` and ``t``, and every per-boundary
+    array has equal values at ``t - 1``, ``t`` and ``t + 1``, so the removed
+    boundary's constraints are implied by its neighbours. Period durations
+    may differ within a run. Configs with arrays of any other horizon length,
+    or with costs on stored energy, are not aggregated.
+    """
+    n = len(periods)
+    if n == 0:
+        return PeriodAggregation(run_lengths=())
+
+    mergeable = np.ones(n - 1, dtype=bool)
+    for config in configs:
+        if _has_boundary_costs(config):
+            return PeriodAggregation.identity(n)
+        for array in _iter_arrays(config):
+            if len(array) == n:
+                mergeable &= _equal_neighbours(array)
+            elif len(array) == n + 1:
+                mergeable &= _equal_neighbours(array[:-1]) & _equal_neighbours(array[1:])
+            elif len(array) > 1:
+                return PeriodAggregation.identity(n)
+
+    starts = np.flatnonzero(np.concatenate(([True], ~mergeable)))
+    return PeriodAggregation(run_lengths=tuple(int(length) for length in np.diff(np.append(starts, n))))
+
+
+def _equal_neighbours(array: NDArray[Any]) -> NDArray[np.bool_]:
+    """Return whether each value equals the next, treating NaN as equal to NaN."""
+    if array.dtype.kind in "fc":
+        return (array[1:] == array[:-1]) | (np.isnan(array[1:]) & np.isnan(array[:-1]))
+    return array[1:] == array[:-1]
+
+
+def _iter_arrays(value: Any) -> list[NDArray[Any]]:
+    """Return every one-dimensional array nested in a config."""
+    if isinstance(value, np.ndarray):
+        return [value] if value.ndim == 1 else []
+    if isinstance(value, Mapping):
+        return [array for item in value.values() for array in _iter_arrays(item)]
+    return []
+
+
+def _has_boundary_costs(value: Any) -> bool:
+    """Return True when a config contains a segment costing stored energy."""
+    if isinstance(value, Mapping):
+        if value.get("segment_type") in _BOUNDARY_COST_SEGMENTS:
+            return True
+        return any(_has_boundary_costs(item) for item in value.values())
+    return False
+
+
+def _map_arrays(value: Any, fn: Any) -> Any:
+    """Copy nested config mappings, applying *fn* to one-dimensional arrays."""
+    if isinstance(value, np.ndarray) and value.ndim == 1:
+        return fn(value)
+    if isinstance(value, Mapping):
+        return {key: _map_arrays(item, fn) for key, item in value.items()}
+    return value
+
+
+def _replace_values(
+    output: OutputData,
+    values: Sequence[Any],
+    range_up: Sequence[Any] | None,
+    range_dn: Sequence[Any] | None,
+) -> OutputData:
+    """Return a copy of *output* with new values and ranging."""
+    return OutputData(
+        type=output.type,
+        unit=output.unit,
+        values=values,
+        direction=output.direction,
+        advanced=output.advanced,
+        state_last=output.state_last,
+        state=output.state,
+        priority=output.priority,
+        fixed=output.fixed,
+        display_precision=output.display_precision,
+        range_up=range_up,
+        range_dn=range_dn,
+    )
+
+
+__all__ = ["PeriodAggregation", "find_period_runs"]
@@ -0,0 +1,235 @@
+"""Contraction of passthrough junction nodes before the LP is built.
+
+Adapters model some devices as a junction node joined to the rest of the
+network by one connection in and one connection out. When one of those
+connections has no losses, limits or prices, the junction and that
+connection only add a balance row and a flow column per period without
+changing what the LP can do. :func:`contract_passthrough_nodes` removes
+them, redirecting the other connection straight to the far element.
+
+The removed elements still get outputs: the junction's power balance price
+is the far element's, which is a valid dual because the removed connection
+is free, and the removed connection carries exactly the redirected
+connection's flow at the junction end. :meth:`Contraction.outputs` rebuilds
+them from the solved network so sensors see the same element names.
+
+Only the primary cost is preserved exactly. Removing a connection removes
+its time-preference term, so ties in the secondary objective may break
+differently.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from .const import OutputType
+from .element import ELEMENT_POWER_BALANCE, Element
+from .elements import (
+    MODEL_ELEMENT_TYPE_CONNECTION,
+    MODEL_ELEMENT_TYPE_NODE,
+    MODEL_ELEMENT_TYPE_POLICY_PRICING,
+    Connection,
+    ConnectionElementConfig,
+    ModelElementConfig,
+)
+from .elements.connection import CONNECTION_POWER
+from .output_data import OutputData
+from .output_names import ModelOutputName
+
+# Segment types that are the identity when every parameter is unset
+_IDENTITY_SEGMENT_TYPES: frozenset[str] = frozenset({"passthrough", "efficiency", "power_limit", "pricing"})
+
+
+@dataclass(frozen=True, slots=True)
+class Contraction:
+    """A junction node and free connection removed from the network."""
+
+    node: str
+    """Name of the removed junction node."""
+
+    connection: str
+    """Name of the removed free connection between the junction and *far*."""
+
+    kept: str
+    """Name of the connection redirected from the junction to *far*."""
+
+    far: str
+    """Element at the other end of the removed connection."""
+
+    kept_end: Literal["source", "target"]
+    """End of *kept* that was at the junction and is now at *far*."""
+
+    def outputs(
+        self,
+        elements: Mapping[str, Element[Any]],
+        outputs: Mapping[str, Mapping[ModelOutputName, OutputData]],
+    ) -> dict[str, Mapping[ModelOutputName, OutputData]]:
+        """Return outputs for the removed node and connection from the solved *elements*.
+
+        *outputs* must already hold the far element's outputs, so contractions
+        are restored in the reverse of the order they were made.
+        """
+        kept = elements[self.kept]
+        if not isinstance(kept, Connection):
+            msg = f"Contracted connection '{self.kept}' is not a connection"
+            raise TypeError(msg)
+        flow = kept.total_power_out if self.kept_end == "target" else kept.total_power_in
+        restored: dict[str, Mapping[ModelOutputName, OutputData]] = {
+            self.connection: {
+                CONNECTION_POWER: OutputData(
+                    type=OutputType.POWER_FLOW,
+                    unit="kW",
+                    values=kept.extract_values(flow),
+                    direction="+",
+                    priority=kept.priority,
+                )
+            }
+        }
+
+        balance = outputs.get(self.far, {}).get(ELEMENT_POWER_BALANCE)
+        if isinstance(balance, OutputData):
+            # The far element's tag row is its last block, see _contraction_for
+            restored[self.node] = {
+                ELEMENT_POWER_BALANCE: OutputData(
+                    type=OutputType.SHADOW_PRICE,
+                    unit=balance.unit,
+                    values=tuple(balance.values[-kept.n_periods :]),
+                )
+            }
+        else:
+            restored[self.node] = {}
+        return restored
+
+
+def contract_passthrough_nodes(
+    configs: Sequence[ModelElementConfig],
+) -> tuple[list[ModelElementConfig], tuple[Contraction, ...]]:
+    """Remove junction nodes that a free connection ties to a single-tag neighbour.
+
+    A node is contracted when it neither produces nor consumes, has no tag
+    restrictions, and has exactly one inbound and one outbound connection,
+    both carrying the same single tag. One of the two must be free (every
+    segment is the identity) and not priced by a policy. The element at the
+    free connection's far end must carry that tag and only that tag, so its
+    power balance price is also the junction's.
+
+    Returns the reduced configs, with redirected connections copied rather
+    than changed, and the contractions in the order they were made.
+    """
+    reduced = list(configs)
+    priced = {
+        term["connection"]
+        for config in reduced
+        if config["element_type"] == MODEL_ELEMENT_TYPE_POLICY_PRICING
+        for term in config["terms"]
+    }
+    contractions: list[Contraction] = []
+    while (found := _find_contraction(reduced, priced)) is not None:
+        contraction, redirected = found
+        contractions.append(contraction)
+        reduced = [
+            redirected if config["name"] == contraction.kept else config
+            for config in reduced
+            if config["name"] not in (contraction.node, contraction.connection)
+        ]
+    return reduced, tuple(contractions)
+
+
+def _find_contraction(
+    configs: Sequence[ModelElementConfig], priced: set[str]
+) -> tuple[Contraction, ConnectionElementConfig] | None:
+    """Return the first contractible junction and its redirected connection."""
+    by_name = {
+        config["name"]: config
+        for config in configs
+        if config["element_type"] not in (MODEL_ELEMENT_TYPE_CONNECTION, MODEL_ELEMENT_TYPE_POLICY_PRICING)
+    }
+    inbound: dict[str, list[ConnectionElementConfig]] = {name: [] for name in by_name}
+    outbound: dict[str, list[ConnectionElementConfig]] = {name: [] for name in by_name}
+    for config in configs:
+        if config["element_type"] == MODEL_ELEMENT_TYPE_CONNECTION:
+            outbound.setdefault(config["source"], []).append(config)
+            inbound.setdefault(config["target"], []).append(config)
+
+    for name, config in by_name.items():
+        if (
+            config["element_type"] != MODEL_ELEMENT_TYPE_NODE
+            or config.get("is_source", True)
+            or config.get("is_sink", True)
+            or config.get("outbound_tags") is not None
+            or config.get("inbound_tags") is not None
+            or len(inbound[name]) != 1
+            or len(outbound[name]) != 1
+        ):
+            continue
+        found = _contraction_for(name, inbound[name][0], outbound[name][0], by_name, inbound, outbound, priced)
+        if found is not None:
+            return found
+    return None
+
+
+def _contraction_for(
+    node: str,
+    incoming: ConnectionElementConfig,
+    outgoing: ConnectionElementConfig,
+    by_name: Mapping[str, ModelElementConfig],
+    inbound: Mapping[str, list[ConnectionElementConfig]],
+    outbound: Mapping[str, list[ConnectionElementConfig]],
+    priced: set[str],
+) -> tuple[Contraction, ConnectionElementConfig] | None:
+    """Return the contraction of *node* between *incoming* and *outgoing*, if one is exact."""
+    tags = incoming.get("tags")
+    if tags is None or len(tags) != 1 or outgoing.get("tags") != tags:
+        return None
+    (tag,) = tags
+
+    # Prefer removing the outgoing connection, keeping the incoming one
+    for free, kept, kept_end, far in (
+        (outgoing, incoming, "target", outgoing["target"]),
+        (incoming, outgoing, "source", incoming["source"]),
+    ):
+        other = kept["source"] if kept_end == "target" else kept["target"]
+        far_config = by_name.get(far)
+        if (
+            free["name"] in priced
+            or not _is_free(free)
+            or far_config is None
+            or far in (node, other)
+            or not _carries(far_config, tag)
+            or any(conn.get("tags") != tags for conn in (*inbound.get(far, ()), *outbound.get(far, ())))
+        ):
+            continue
+        redirected: ConnectionElementConfig = {**kept, kept_end: far}  # type: ignore[misc]
+        contraction = Contraction(
+            node=node,
+            connection=free["name"],
+            kept=kept["name"],
+            far=far,
+            kept_end=kept_end,  # type: ignore[arg-type]
+        )
+        return contraction, redirected
+    return None
+
+
+def _is_free(config: ConnectionElementConfig) -> bool:
+    """Return True when every segment of a connection is the identity."""
+    return all(
+        spec["segment_type"] in _IDENTITY_SEGMENT_TYPES
+        and all(_is_unset(value) for key, value in spec.items() if key != "segment_type")
+        for spec in config.get("segments", {}).values()
+    )
+
+
+def _is_unset(value: Any) -> bool:
+    """Return True for a segment parameter that leaves the segment inactive."""
+    return value is None or value is False or (isinstance(value, list | tuple | dict) and not value)
+
+
+def _carries(config: ModelElementConfig, tag: int) -> bool:
+    """Return True when a network element config can pass flow on *tag*, see NetworkElement.carries_tag."""
+    outbound_tags = config.get("outbound_tags")
+    inbound_tags = config.get("inbound_tags")
+    return outbound_tags is None or inbound_tags is None or tag in outbound_tags or tag in inbound_tags
+
+
+__all__ = ["Contraction", "contract_passthrough_nodes"]
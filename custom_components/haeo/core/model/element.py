@@ -266,6 +266,27 @@ class NetworkElement[OutputNameT: str](Element[OutputNameT]):
         """
         self._connections.append((connection, end))
 
+    def unregister_connection(self, connection: Any) -> None:
+        """Forget a connection registered with :meth:`register_connection`."""
+        self._connections = [(conn, end) for conn, end in self._connections if conn is not connection]
+
+    def release_tag_decomposition(self) -> list[int]:
+        """Forget the per-tag decomposition variables and return their columns.
+
+        The power balance creates fresh variables for the tags it then sees,
+        so the caller must fix the returned columns at zero.
+        """
+        columns = [
+            var.index
+            for by_tag in (self._consumed_by_tag, self._produced_by_tag)
+            if by_tag is not None
+            for variables in by_tag.values()
+            for var in variables
+        ]
+        self._consumed_by_tag = None
+        self._produced_by_tag = None
+        return columns
+
     # --- Element power protocol ---
 
     def element_power_produced(self) -> HighspyArray | NDArray[Any] | None:
@@ -324,6 +345,20 @@ class NetworkElement[OutputNameT: str](Element[OutputNameT]):
                 total_power = total_power + conn.power_into_target_for_tag(tag)
         return total_power
 
+    def carries_tag(self, tag: int) -> bool:
+        """Return True when connection flow on *tag* may enter or leave this element.
+
+        A tag outside both restricted ``outbound_tags`` and ``inbound_tags``
+        is neither produced, consumed nor passed through here, so every
+        connection flow on it at this element is forced to zero.
+        """
+        return (
+            self.outbound_tags is None
+            or self.inbound_tags is None
+            or tag in self.outbound_tags
+            or tag in self.inbound_tags
+        )
+
     def connection_tags(self) -> set[int]:
         """Return the union of all tags from all connected connections."""
         tags: set[int] = set()
@@ -369,7 +404,11 @@ class NetworkElement[OutputNameT: str](Element[OutputNameT]):
 
         Production is decomposed across ``outbound_tags`` via per-tag variables.
         Consumption is decomposed across ``inbound_tags`` via per-tag variables.
-        Tags outside both sets are blocked (each connection's per-tag flow == 0).
+        A single outbound or inbound tag takes the whole production or
+        consumption directly, without decomposition variables or rows.
+        Tags outside both sets are blocked (each connection's per-tag flow == 0);
+        the network drops such tags from connections where it can, see
+        :meth:`carries_tag`.
 
         Output: shadow price indicating the marginal value of energy at this element.
         Skipped when there are no connections and no external power.
@@ -398,18 +437,22 @@ class NetworkElement[OutputNameT: str](Element[OutputNameT]):
         constraints: list[highs_linear_expression] = []
 
         # Decompose production across outbound tags
-        produced_by_tag: dict[int, HighspyArray] = {}
+        produced_by_tag: Mapping[int, HighspyArray | NDArray[Any]] = {}
         if produced is not None:
-            if outbound:
+            if len(outbound) == 1:
+                produced_by_tag = {next(iter(outbound)): produced}
+            elif outbound:
                 produced_by_tag = self._get_produced_by_tag(outbound)
                 constraints.extend(list((reduce(operator.add, produced_by_tag.values()) - produced) * dt == 0))
             else:
                 constraints.extend(list(produced * dt == 0))
 
         # Decompose consumption across inbound tags
-        consumed_by_tag: dict[int, HighspyArray] = {}
+        consumed_by_tag: Mapping[int, HighspyArray | NDArray[Any]] = {}
         if consumed is not None:
-            if inbound:
+            if len(inbound) == 1:
+                consumed_by_tag = {next(iter(inbound)): consumed}
+            elif inbound:
                 consumed_by_tag = self._get_consumed_by_tag(inbound)
                 constraints.extend(list((reduce(operator.add, consumed_by_tag.values()) - consumed) * dt == 0))
             else:
@@ -6,6 +6,7 @@ This module re-exports all element classes for convenient imports.
 from dataclasses import dataclass
 from typing import Final
 
+from .battery import BATTERY_FORMULATIONS as BATTERY_FORMULATIONS
 from .battery import BATTERY_OUTPUT_NAMES as BATTERY_OUTPUT_NAMES
 from .battery import BATTERY_POWER_CONSTRAINTS as BATTERY_POWER_CONSTRAINTS
 from .battery import ELEMENT_TYPE as MODEL_ELEMENT_TYPE_BATTERY
@@ -13,7 +14,9 @@ from .battery import Battery as Battery
 from .battery import BatteryConstraintName as BatteryConstraintName
 from .battery import BatteryElementConfig as BatteryElementConfig
 from .battery import BatteryElementTypeName as BatteryElementTypeName
+from .battery import BatteryFormulation as BatteryFormulation
 from .battery import BatteryOutputName as BatteryOutputName
+from .battery import BoundedBattery as BoundedBattery
 from .connection import CONNECTION_OUTPUT_NAMES as CONNECTION_OUTPUT_NAMES
 from .connection import CONNECTION_POWER as CONNECTION_POWER
 from .connection import ELEMENT_TYPE as MODEL_ELEMENT_TYPE_CONNECTION
@@ -78,6 +81,7 @@ ELEMENTS: Final[dict[ModelElementType, ElementSpec]] = {
 }
 
 __all__ = [
+    "BATTERY_FORMULATIONS",
     "BATTERY_OUTPUT_NAMES",
     "BATTERY_POWER_CONSTRAINTS",
     "CONNECTION_OUTPUT_NAMES",
@@ -90,7 +94,9 @@ __all__ = [
     "Battery",
     "BatteryConstraintName",
     "BatteryElementConfig",
+    "BatteryFormulation",
     "BatteryOutputName",
+    "BoundedBattery",
     "Connection",
     "ConnectionElementConfig",
     "ConnectionElementTypeName",
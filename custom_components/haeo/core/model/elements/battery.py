@@ -52,6 +52,9 @@ BATTERY_OUTPUT_NAMES: Final[frozenset[BatteryOutputName]] = frozenset(
     )
 )
 
+# Battery LP formulations selectable per network
+type BatteryFormulation = Literal["cumulative", "bounded"]
+
 # Battery power constraints (subset of outputs that relate to power balance)
 BATTERY_POWER_CONSTRAINTS: Final[frozenset[BatteryConstraintName]] = frozenset((BATTERY_POWER_BALANCE,))
 
@@ -63,6 +66,7 @@ class BatteryElementConfig(TypedDict):
     name: str
     capacity: NDArray[np.floating[Any]] | float
     initial_charge: float
+    minimum_charge: NotRequired[NDArray[np.floating[Any]] | float]
     salvage_value: NotRequired[float]
     outbound_tags: NotRequired[set[int] | None]
     inbound_tags: NotRequired[set[int] | None]
@@ -78,6 +82,7 @@ class Battery(NetworkElement[BatteryOutputName]):
     # Parameters
     capacity: TrackedParam[NDArray[np.float64]] = TrackedParam()
     initial_charge: TrackedParam[float] = TrackedParam()
+    minimum_charge: TrackedParam[NDArray[np.float64]] = TrackedParam()
     salvage_value: TrackedParam[float] = TrackedParam()
 
     def __init__(
@@ -88,6 +93,7 @@ class Battery(NetworkElement[BatteryOutputName]):
         solver: Highs,
         capacity: NDArray[np.floating[Any]] | float,
         initial_charge: float,
+        minimum_charge: NDArray[np.floating[Any]] | float = 0.0,
         salvage_value: float = 0.0,
         outbound_tags: set[int] | None = None,
         inbound_tags: set[int] | None = None,
@@ -103,14 +109,23 @@ class Battery(NetworkElement[BatteryOutputName]):
         )
         n_periods = self.n_periods
 
-        # Set tracked parameters (broadcasts capacity to n_periods + 1)
+        # Set tracked parameters (broadcasts capacity and minimum charge to n_periods + 1)
         self.capacity = broadcast_to_sequence(capacity, n_periods + 1)
         self.initial_charge = initial_charge
+        self.minimum_charge = broadcast_to_sequence(minimum_charge, n_periods + 1)
         self.salvage_value = salvage_value
 
-        # Create all energy variables (including initial state at t=0)
-        self.energy_in = solver.addVariables(n_periods + 1, lb=0.0, name_prefix=f"{name}_energy_in_", out_array=True)
-        self.energy_out = solver.addVariables(n_periods + 1, lb=0.0, name_prefix=f"{name}_energy_out_", out_array=True)
+        self._add_energy_variables()
+
+    def _add_energy_variables(self) -> None:
+        """Create the energy variables, including the initial state at t=0."""
+        n_periods = self.n_periods
+        self.energy_in = self._solver.addVariables(
+            n_periods + 1, lb=0.0, name_prefix=f"{self.name}_energy_in_", out_array=True
+        )
+        self.energy_out = self._solver.addVariables(
+            n_periods + 1, lb=0.0, name_prefix=f"{self.name}_energy_out_", out_array=True
+        )
 
         # Stored energy is computed from cumulative values (not period-dependent)
         self.stored_energy = self.energy_in - self.energy_out
@@ -134,14 +149,9 @@ class Battery(NetworkElement[BatteryOutputName]):
         return (self.energy_out[1:] - self.energy_out[:-1]) * (1.0 / self.periods)
 
     @constraint
-    def battery_initial_charge(self) -> highs_linear_expression:
-        """Constraint: energy_in[0] == initial_charge."""
-        return self.energy_in[0] == self.initial_charge
-
-    @constraint
-    def battery_initial_discharge(self) -> highs_linear_expression:
-        """Constraint: energy_out[0] == 0."""
-        return self.energy_out[0] == 0.0
+    def battery_initial_state(self) -> list[highs_linear_expression]:
+        """Constraint: energy_in[0] == initial_charge and energy_out[0] == 0."""
+        return [self.energy_in[0] == self.initial_charge, self.energy_out[0] == 0.0]
 
     @constraint(output=True, unit="$/kWh")
     def battery_energy_in_flow(self) -> list[highs_linear_expression]:
@@ -169,11 +179,11 @@ class Battery(NetworkElement[BatteryOutputName]):
 
     @constraint(output=True, unit="$/kWh")
     def battery_soc_min(self) -> list[highs_linear_expression]:
-        """Constraint: stored energy cannot be negative.
+        """Constraint: stored energy cannot fall below the minimum charge (zero by default).
 
         Output: shadow price indicating the marginal cost of minimum SOC constraint.
         """
-        return list(self.stored_energy[1:] >= 0)
+        return list(self.stored_energy[1:] >= self.minimum_charge[1:])
 
     def element_power_produced(self) -> HighspyArray:
         """Return power produced by discharging the battery."""
@@ -208,3 +218,87 @@ class Battery(NetworkElement[BatteryOutputName]):
     def battery_energy_stored(self) -> OutputData:
         """Output: energy currently stored in the battery."""
         return OutputData(type=OutputType.ENERGY, unit="kWh", values=self.extract_values(self.stored_energy))
+
+
+class BoundedBattery(Battery):
+    """Battery entity using per-period energy columns and a running balance.
+
+    Stores the energy moved in each period and the stored energy at each
+    boundary as columns, linked by one balance row per period.
+    The flow and SOC limits become bounds on those columns, so their shadow
+    prices are recovered from reduced costs and match :class:`Battery`.
+    """
+
+    def _add_energy_variables(self) -> None:
+        """Create the per-period energy and stored energy variables, including the initial state at t=0."""
+        n_periods = self.n_periods
+        self.energy_charged = self._solver.addVariables(
+            n_periods, lb=0.0, name_prefix=f"{self.name}_energy_charged_", out_array=True
+        )
+        self.energy_discharged = self._solver.addVariables(
+            n_periods, lb=0.0, name_prefix=f"{self.name}_energy_discharged_", out_array=True
+        )
+        self.stored_energy = self._solver.addVariables(
+            n_periods + 1, lb=-np.inf, ub=np.inf, name_prefix=f"{self.name}_stored_energy_", out_array=True
+        )
+
+    @property
+    def power_consumption(self) -> HighspyArray:
+        """Power being consumed to charge the battery."""
+        return self.energy_charged * (1.0 / self.periods)
+
+    @property
+    def power_production(self) -> HighspyArray:
+        """Power being produced by discharging the battery."""
+        return self.energy_discharged * (1.0 / self.periods)
+
+    @constraint(column_bounds=True)
+    def battery_initial_state(self) -> list[highs_linear_expression]:
+        """Constraint: stored_energy[0] == initial_charge."""
+        return [self.stored_energy[0] == self.initial_charge]
+
+    @constraint
+    def battery_energy_balance(self) -> list[highs_linear_expression]:
+        """Constraint: stored energy changes by the energy charged less the energy discharged."""
+        return list(
+            self.stored_energy[1:] - self.stored_energy[:-1] - self.energy_charged + self.energy_discharged == 0.0
+        )
+
+    @constraint(output=True, unit="$/kWh", column_bounds=True)
+    def battery_energy_in_flow(self) -> list[highs_linear_expression]:
+        """Constraint: energy charged in each period is non-negative.
+
+        Output: shadow price indicating the marginal value of energy flow constraints.
+        """
+        return list(self.energy_charged >= 0.0)
+
+    @constraint(output=True, unit="$/kWh", column_bounds=True)
+    def battery_energy_out_flow(self) -> list[highs_linear_expression]:
+        """Constraint: energy discharged in each period is non-negative.
+
+        Output: shadow price indicating the marginal value of energy flow constraints.
+        """
+        return list(self.energy_discharged >= 0.0)
+
+    @constraint(output=True, unit="$/kWh", column_bounds=True)
+    def battery_soc_max(self) -> list[highs_linear_expression]:
+        """Constraint: stored energy cannot exceed capacity.
+
+        Output: shadow price indicating the marginal value of additional capacity.
+        """
+        return list(self.stored_energy[1:] <= self.capacity[1:])
+
+    @constraint(output=True, unit="$/kWh", column_bounds=True)
+    def battery_soc_min(self) -> list[highs_linear_expression]:
+        """Constraint: stored energy cannot fall below the minimum charge (zero by default).
+
+        Output: shadow price indicating the marginal cost of minimum SOC constraint.
+        """
+        return list(self.stored_energy[1:] >= self.minimum_charge[1:])
+
+
+# Battery classes for each formulation
+BATTERY_FORMULATIONS: Final[dict[BatteryFormulation, type[Battery]]] = {
+    "cumulative": Battery,
+    "bounded": BoundedBattery,
+}
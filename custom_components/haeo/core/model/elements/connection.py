@@ -90,6 +90,7 @@ class Connection[TOutputName: str](Element[TOutputName]):
         self.is_external = is_external
         self.is_time_sensitive = is_time_sensitive
         self.priority = 0  # assigned by Network from sort_key
+        self.priority_count: int | None = None  # assigned by Network for a normalized secondary objective
 
         self._segment_specs: OrderedDict[str, SegmentSpec] = OrderedDict(segments or {})
         self._segments: OrderedDict[str, Segment] = OrderedDict()
@@ -238,6 +239,9 @@ class Connection[TOutputName: str](Element[TOutputName]):
         # Time-preference objective: prefer earlier energy transfer
         n = self.n_periods
         weights = self.priority * n + np.arange(1, n + 1, dtype=np.float64)
+        if self.priority_count is not None:
+            # Same ordering mapped onto [1, 2), so the spread no longer grows with connections and periods
+            weights = 1.0 + (weights - 1.0) / (self.priority_count * n)
         secondary = Highs.qsum(self.total_power_in * self.periods * weights)
 
         if primary is None:
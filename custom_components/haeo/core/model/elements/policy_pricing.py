@@ -76,6 +76,8 @@ class PolicyPricing(Element[str]):
     @cost
     def pricing_cost(self) -> highs_linear_expression | None:
         """Compute the pricing cost for this policy rule placement."""
+        if not self._power_terms:
+            return None
         price = self.price
         costs = [Highs.qsum(pt * price * self.periods) for pt in self._power_terms]
         return costs[0] if len(costs) == 1 else Highs.qsum(costs)
@@ -59,12 +59,16 @@ class PowerLimitSegment(Segment):
         self._fixed = spec.get("fixed", False)
         self.max_power = broadcast_to_sequence(spec.get("max_power"), self._n_periods)
 
-    @constraint(output=True, unit="$/kWh")
+    @constraint(output=True, unit="$/kWh", column_bounds=True)
     def power_limit(self) -> list[highs_linear_expression] | None:
         """Directional power limit constraint (energy-native).
 
         Formulated as energy: power * dt <= max_power * dt.
         Shadow prices are $/kWh.
+
+        On a single-tag connection each period limits one flow variable, so the
+        limit is applied as column bounds and forecast updates only change
+        bounds. Multi-tag connections limit the tag sum with one row per period.
         """
         if self.max_power is None:
             return None
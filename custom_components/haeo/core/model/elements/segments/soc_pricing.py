@@ -25,12 +25,7 @@ class SocPricingSegmentSpec(TypedDict):
     charge_capacity_price: NotRequired[NDArray[np.floating[Any]] | float | None]
 
 
-def _exposed_slack(
-    threshold: NDArray[np.float64] | None,
-    price: NDArray[np.float64] | None,
-    slack: HighspyArray,
-) -> HighspyArray | None:
-    return slack if threshold is not None and price is not None else None
+type SlackKind = Literal["discharge_energy", "charge_capacity"]
 
 
 class SocPricingSegment(Segment):
@@ -77,18 +72,9 @@ class SocPricingSegment(Segment):
             msg = "charge_capacity_threshold is required when charge_capacity_price is set"
             raise ValueError(msg)
 
-        self._discharge_energy_slack = solver.addVariables(
-            n_periods,
-            lb=0,
-            name_prefix=f"{segment_id}_discharge_energy_",
-            out_array=True,
-        )
-        self._charge_capacity_slack = solver.addVariables(
-            n_periods,
-            lb=0,
-            name_prefix=f"{segment_id}_charge_capacity_",
-            out_array=True,
-        )
+        # Slack columns are added once a threshold and price pair is first set
+        self._slacks: dict[SlackKind, HighspyArray] = {}
+        self._fixed_slacks: set[SlackKind] = set()
 
     def _get_battery(self) -> Any:
         """Find the battery element from the connection endpoints."""
@@ -98,46 +84,86 @@ class SocPricingSegment(Segment):
         msg = "SOC pricing segment requires a battery element endpoint"
         raise TypeError(msg)
 
+    def _pricing(self, kind: SlackKind) -> tuple[NDArray[np.float64], NDArray[np.float64]] | None:
+        """Return the threshold and price for *kind* when both are set."""
+        if kind == "discharge_energy":
+            threshold, price = self.discharge_energy_threshold, self.discharge_energy_price
+        else:
+            threshold, price = self.charge_capacity_threshold, self.charge_capacity_price
+        if threshold is None or price is None:
+            return None
+        return threshold, price
+
+    def _slack(self, kind: SlackKind) -> HighspyArray | None:
+        """Return the slack columns for *kind* while its threshold and price are set.
+
+        Columns are added on first use. HiGHS cannot delete columns without
+        renumbering every later variable, so unsetting the pair fixes them at
+        zero until it is set again.
+        """
+        slack = self._slacks.get(kind)
+        if self._pricing(kind) is None:
+            if slack is not None and kind not in self._fixed_slacks:
+                self._set_slack_bounds(slack, 0.0)
+                self._fixed_slacks.add(kind)
+            return None
+        if slack is None:
+            slack = self._solver.addVariables(
+                self._n_periods, lb=0, name_prefix=f"{self.segment_id}_{kind}_", out_array=True
+            )
+            self._slacks[kind] = slack
+        elif kind in self._fixed_slacks:
+            self._set_slack_bounds(slack, np.inf)
+            self._fixed_slacks.discard(kind)
+        return slack
+
+    def _set_slack_bounds(self, slack: HighspyArray, upper: float) -> None:
+        """Bound every slack column to [0, *upper*]."""
+        columns = np.asarray([var.index for var in slack], dtype=np.int32)
+        self._solver.changeColsBounds(len(columns), columns, np.zeros(len(columns)), np.full(len(columns), upper))
+
     @property
     def discharge_energy_slack(self) -> HighspyArray | None:
         """Slack for energy below discharge threshold."""
-        return _exposed_slack(
-            self.discharge_energy_threshold,
-            self.discharge_energy_price,
-            self._discharge_energy_slack,
-        )
+        return self._slacks.get("discharge_energy") if self._pricing("discharge_energy") is not None else None
 
     @property
     def charge_capacity_slack(self) -> HighspyArray | None:
         """Slack for energy above charge capacity threshold."""
-        return _exposed_slack(
-            self.charge_capacity_threshold,
-            self.charge_capacity_price,
-            self._charge_capacity_slack,
-        )
+        return self._slacks.get("charge_capacity") if self._pricing("charge_capacity") is not None else None
 
     @constraint
-    def soc_slack_bounds(self) -> list[highs_linear_expression] | None:
-        """Bound slack variables to SOC threshold violations when penalties apply."""
-        bounds: list[highs_linear_expression] = []
+    def discharge_energy_slack_bounds(self) -> list[highs_linear_expression] | None:
+        """Bound the discharge slack to the energy below its threshold while it is priced.
+
+        Returns None once the pair is unset, which frees the rows so the
+        penalty cannot linger as a hard minimum SOC.
+        """
+        slack = self._slack("discharge_energy")
+        if slack is None or self.discharge_energy_threshold is None:
+            return None
         stored = np.asarray(self._battery.stored_energy, dtype=object)[1:]
+        return list(slack >= self.discharge_energy_threshold - stored)
 
-        if self.discharge_energy_threshold is not None and self.discharge_energy_price is not None:
-            bounds.extend(list(self._discharge_energy_slack >= self.discharge_energy_threshold - stored))
-
-        if self.charge_capacity_threshold is not None and self.charge_capacity_price is not None:
-            bounds.extend(list(self._charge_capacity_slack >= stored - self.charge_capacity_threshold))
-
-        return bounds or None
+    @constraint
+    def charge_capacity_slack_bounds(self) -> list[highs_linear_expression] | None:
+        """Bound the charge slack to the energy above its threshold while it is priced."""
+        slack = self._slack("charge_capacity")
+        if slack is None or self.charge_capacity_threshold is None:
+            return None
+        stored = np.asarray(self._battery.stored_energy, dtype=object)[1:]
+        return list(slack >= stored - self.charge_capacity_threshold)
 
     @cost
     def soc_pricing_cost(self) -> highs_linear_expression | None:
         """Penalty cost for operating outside SOC thresholds."""
         cost_terms = []
-        if self.discharge_energy_price is not None and self.discharge_energy_threshold is not None:
-            cost_terms.append(Highs.qsum(self._discharge_energy_slack * self.discharge_energy_price * self.periods))
-        if self.charge_capacity_price is not None and self.charge_capacity_threshold is not None:
-            cost_terms.append(Highs.qsum(self._charge_capacity_slack * self.charge_capacity_price * self.periods))
+        discharge = self._slack("discharge_energy")
+        if discharge is not None and self.discharge_energy_price is not None:
+            cost_terms.append(Highs.qsum(discharge * self.discharge_energy_price * self.periods))
+        charge = self._slack("charge_capacity")
+        if charge is not None and self.charge_capacity_price is not None:
+            cost_terms.append(Highs.qsum(charge * self.charge_capacity_price * self.periods))
         if not cost_terms:
             return None
         if len(cost_terms) == 1:
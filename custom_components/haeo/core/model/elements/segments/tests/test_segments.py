@@ -392,6 +392,87 @@ def test_soc_pricing_cost_none_without_prices() -> None:
     assert segment.cost() is None
 
 
+def test_soc_pricing_slack_columns_follow_threshold_and_price() -> None:
+    """Slack columns are added when a pair is first set and fixed at zero while it is unset."""
+    h = create_solver()
+    periods = np.asarray([1.0, 1.0], dtype=np.float64)
+    battery = DummyElement("battery", periods, h)
+    battery.stored_energy = h.addVariables(3, lb=0, name_prefix="battery_e_", out_array=True)  # type: ignore[attr-defined]
+    target = DummyElement("target", periods, h)
+    pv = h.addVariables(len(periods), lb=0, name_prefix="soc_test_", out_array=True)
+    segment = SocPricingSegment(
+        "seg",
+        len(periods),
+        periods,
+        h,
+        spec={"segment_type": "soc_pricing"},
+        source_element=battery,
+        target_element=target,
+        power_in={0: pv},
+    )
+    segment.constraints()
+    segment.cost()
+    assert h.numVariables == 5
+    assert segment.charge_capacity_slack is None
+
+    segment.discharge_energy_threshold = np.array([2.0, 2.0])
+    segment.discharge_energy_price = np.array([0.1, 0.1])
+    segment.constraints()
+    segment.cost()
+    slack = segment.discharge_energy_slack
+    assert slack is not None
+    assert h.numVariables == 7
+    columns = np.asarray([var.index for var in slack], dtype=np.int32)
+
+    segment.discharge_energy_price = None
+    segment.constraints()
+    assert segment.discharge_energy_slack is None
+    _status, _count, _costs, lower, upper, _nnz = h.getCols(len(columns), columns)
+    np.testing.assert_array_equal(upper, [0.0, 0.0])
+
+    segment.discharge_energy_price = np.array([0.2, 0.2])
+    segment.constraints()
+    assert h.numVariables == 7
+    _status, _count, _costs, lower, upper, _nnz = h.getCols(len(columns), columns)
+    np.testing.assert_array_equal(lower, [0.0, 0.0])
+    np.testing.assert_array_equal(np.isinf(upper), [True, True])
+
+
+def test_soc_pricing_unset_pair_frees_its_slack_rows() -> None:
+    """Unsetting one of two priced pairs frees only its rows, so its threshold no longer binds."""
+    h = create_solver()
+    periods = np.asarray([1.0, 1.0], dtype=np.float64)
+    battery = DummyElement("battery", periods, h)
+    battery.stored_energy = h.addVariables(3, lb=0, name_prefix="battery_e_", out_array=True)  # type: ignore[attr-defined]
+    target = DummyElement("target", periods, h)
+    pv = h.addVariables(len(periods), lb=0, name_prefix="soc_test_", out_array=True)
+    segment = SocPricingSegment(
+        "seg",
+        len(periods),
+        periods,
+        h,
+        spec={
+            "segment_type": "soc_pricing",
+            "discharge_energy_threshold": 2.0,
+            "discharge_energy_price": 0.1,
+            "charge_capacity_threshold": 8.0,
+            "charge_capacity_price": 0.1,
+        },
+        source_element=battery,
+        target_element=target,
+        power_in={0: pv},
+    )
+    segment.constraints()
+    assert h.numConstrs == 4
+
+    segment.discharge_energy_price = None
+    segment.constraints()
+    _status, _count, lower, upper, _nnz = h.getRows(4, np.arange(4, dtype=np.int32))
+    # Constraints apply in name order, so the charge rows come first
+    np.testing.assert_array_equal(lower, [-8.0, -8.0, -np.inf, -np.inf])
+    np.testing.assert_array_equal(upper, [np.inf, np.inf, np.inf, np.inf])
+
+
 def test_tag_transfer_cost_none_when_no_tags_match() -> None:
     """Tag transfer cost returns None when tag_prices references tags not in power_in."""
     h = create_solver()
@@ -503,3 +584,36 @@ def test_power_limit_no_max_power() -> None:
     h.run()
     # HiGHS returns 0 for unbounded, but the key point is no constraint error
     assert seg.max_power is None
+
+
+@pytest.mark.parametrize(
+    ("tags", "expected_rows"),
+    [((0,), 0), ((0, 1), 2)],
+    ids=["single-tag-column-bounds", "multi-tag-rows"],
+)
+def test_power_limit_uses_rows_only_for_multi_tag_sums(tags: tuple[int, ...], expected_rows: int) -> None:
+    """A single-tag limit bounds the flow column directly while a tag sum needs one row per period."""
+    h = create_solver()
+    periods = np.array([1.0, 0.5])
+    power_in = {tag: h.addVariables(2, lb=0, name_prefix=f"pwr_{tag}_", out_array=True) for tag in tags}
+    seg = PowerLimitSegment(
+        "limit",
+        2,
+        periods,
+        h,
+        spec={"segment_type": "power_limit", "max_power": np.array([3.0, 4.0])},
+        source_element=DummyElement("src", periods, h),
+        target_element=DummyElement("tgt", periods, h),
+        power_in=power_in,
+    )
+    seg.constraints()
+    assert h.numConstrs == expected_rows
+
+    h.minimize(-1.0 * Highs.qsum(seg.total_power_in * periods))
+    np.testing.assert_allclose(h.vals(seg.total_power_in), [3.0, 4.0], atol=1e-9)
+    np.testing.assert_allclose(seg.outputs()["power_limit"].values, [-1.0, -1.0], atol=1e-9)
+
+    seg.max_power = np.array([1.0, 2.0])
+    seg.constraints()
+    h.run()
+    np.testing.assert_allclose(h.vals(seg.total_power_in), [1.0, 2.0], atol=1e-9)
@@ -1,27 +1,34 @@
 """Network class for electrical system modeling and optimization."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Generator, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 import logging
 from typing import Any, Final, Literal, overload
 
-from highspy import Highs, HighsModelStatus
+from highspy import Highs, HighsBasisStatus, HighsModelStatus
 from highspy.highs import highs_cons, highs_linear_expression
 import numpy as np
 from numpy.typing import NDArray
 
-from .element import Element, NetworkElement
+from .contraction import Contraction
+from .element import ELEMENT_POWER_BALANCE, Element, NetworkElement
 from .elements import ELEMENTS, ModelElementConfig
-from .elements.battery import Battery, BatteryElementConfig
+from .elements.battery import BATTERY_FORMULATIONS, Battery, BatteryElementConfig, BatteryFormulation
 from .elements.connection import Connection, ConnectionElementConfig, ConnectionOutputName
 from .elements.node import Node, NodeElementConfig
 from .elements.policy_pricing import PolicyPricing, PolicyPricingElementConfig
-from .reactive.decorators import clear_ranging_cache
+from .output_data import OutputData
+from .output_names import ModelOutputName
+from .reactive.decorators import clear_ranging_cache, constraint_rows, retire_constraints
+from .reactive.protocols import ReactiveHost
+from .reactive.tracked_param import get_decorator_state
 
 _LOGGER = logging.getLogger(__name__)
 
 
 ObjectiveMode = Literal["lex", "blended", "calibrated"]
+SecondaryObjective = Literal["indexed", "normalized"]
 OnOffChoose = Literal["on", "off", "choose"]
 
 
@@ -37,10 +44,21 @@ _CAL_MARGIN: Final = 1.0  # step back from upper boundary (log10 decades)
 
 @dataclass(frozen=True, kw_only=True)
 class _SolverBase:
-    """Shared HiGHS options applicable to all solver algorithms."""
+    """Shared HiGHS options applicable to all solver algorithms.
+
+    secondary_objective: "indexed" weights each connection's time preference
+    by ``priority * n_periods + period``, so its coefficients span the
+    connection count times the horizon. "normalized" maps the same ordering
+    onto [1, 2), keeping the spread bounded by the period durations.
+
+    compaction_threshold: fraction of LP rows left free by constraints that
+    no longer apply before optimize() deletes them. None never compacts.
+    """
 
     presolve: OnOffChoose = "choose"
     parallel: OnOffChoose = "choose"
+    secondary_objective: SecondaryObjective = "indexed"
+    compaction_threshold: float | None = 0.1
 
     def _apply_common(self, h: Highs) -> None:
         h.setOptionValue("presolve", self.presolve)
@@ -104,6 +122,26 @@ class CalibratedOptions(SimplexTuning):
 SolveOptions = LexOptions | BlendedOptions | CalibratedOptions
 
 
+@dataclass(frozen=True, slots=True)
+class ObjectiveSpread:
+    """Ratio of the largest to the smallest nonzero coefficient magnitude in each objective.
+
+    Ratios of many orders of magnitude make the LP poorly conditioned.
+    """
+
+    primary: float
+    secondary: float
+
+
+@dataclass(frozen=True, slots=True)
+class RowCompaction:
+    """Free rows carried by a long-lived network and how often they were deleted."""
+
+    threshold: float | None
+    dead_rows: int
+    compactions: int
+
+
 class Network:
     """Network class for electrical system modeling.
 
@@ -123,15 +161,32 @@ class Network:
         periods: NDArray[np.floating[Any]],
         *,
         options: SolveOptions | None = None,
+        battery_formulation: BatteryFormulation = "cumulative",
     ) -> None:
-        """Create a network with the given period durations and solver options."""
+        """Create a network with the given period durations, solver options and battery formulation."""
         self.name = name
         self.periods = np.asarray(periods, dtype=float)
         self.elements: dict[str, Element[Any]] = {}
+        # Config each element was added from, so the network can be rebuilt on other periods
+        self.element_configs: dict[str, ModelElementConfig] = {}
         self.options: SolveOptions = options or CalibratedOptions()
+        self.battery_formulation: BatteryFormulation = battery_formulation
         self._solver = Highs()
         self._lex_constraint: highs_cons | None = None
         self._calibrated_weight: float | None = None
+        # Coefficient spread of the last objective solved for this network
+        self.objective_spread: ObjectiveSpread | None = None
+        # Rows freed by constraints that no longer apply, and how many times they were deleted
+        self._dead_rows = 0
+        self._compactions = 0
+        # Connection tags dropped in add() because an endpoint can never carry them
+        self._pruned_tags: dict[str, set[int]] = {}
+        # Columns each element added, fixed at zero once it is removed
+        self._columns: dict[str, list[range]] = {}
+        # Freed rows of removed constraints, kept as relaxed constraint states until compaction deletes them
+        self._retired: list[dict[str, Any]] = []
+        # Junctions removed from the configs before they were added, see contract_passthrough_nodes
+        self.contractions: tuple[Contraction, ...] = ()
 
         # Redirect HiGHS logging to Python logger at debug level
         self._solver.cbLogging += self._log_callback
@@ -155,6 +210,22 @@ class Network:
         """Return the number of optimization periods."""
         return len(self.periods)
 
+    @property
+    def infeasible(self) -> bool:
+        """Return True when the last solve found no feasible solution."""
+        # Presolve can only tell infeasible from unbounded models apart by solving further
+        return self._solver.getModelStatus() in (
+            HighsModelStatus.kInfeasible,
+            HighsModelStatus.kUnboundedOrInfeasible,
+        )
+
+    @property
+    def row_compaction(self) -> RowCompaction:
+        """Return the free row count and compaction history of the LP."""
+        return RowCompaction(
+            threshold=self.options.compaction_threshold, dead_rows=self._dead_rows, compactions=self._compactions
+        )
+
     def update_periods(self, new_periods: NDArray[np.floating[Any]]) -> None:
         """Update period durations across the network.
 
@@ -198,6 +269,10 @@ class Network:
         For PolicyPricingElementConfig, resolves connection/tag references to
         LP power flow variables from already-added Connection elements.
 
+        Connection tags that either endpoint can never carry (see
+        :meth:`NetworkElement.carries_tag`) are dropped before the connection
+        is created, so no flow variables or blocking rows exist for them.
+
         Args:
             element_config: Typed model element configuration dictionary
 
@@ -206,18 +281,30 @@ class Network:
 
         """
         name = element_config["name"]
+        self.element_configs[name] = element_config
+        self._calibrated_weight = None
+
+        with self._adding_columns(name):
+            return self._create(element_config)
 
+    def _create(self, element_config: ModelElementConfig) -> Element[Any]:
+        """Create the element for *element_config* and register it with its endpoints."""
+        name = element_config["name"]
         if element_config["element_type"] == "policy_pricing":
             return self._add_policy_pricing(element_config)
 
         element_type = element_config["element_type"]
         kwargs = {key: value for key, value in element_config.items() if key not in ("element_type", "name")}
-
-        # Create new element using registry
-        element_spec = ELEMENTS[element_type]
-        element_instance: Element[Any] = element_spec.factory(
-            name=name, periods=self.periods, solver=self._solver, **kwargs
+        if element_config["element_type"] == "connection" and (tags := element_config.get("tags")):
+            kwargs["tags"] = self._live_connection_tags(name, element_config["source"], element_config["target"], tags)
+
+        # Create new element using registry, batteries in the network's formulation
+        factory: type = (
+            BATTERY_FORMULATIONS[self.battery_formulation]
+            if element_config["element_type"] == "battery"
+            else ELEMENTS[element_type].factory
         )
+        element_instance: Element[Any] = factory(name=name, periods=self.periods, solver=self._solver, **kwargs)
         self.elements[name] = element_instance
 
         # Register connections immediately when adding Connection elements
@@ -234,12 +321,110 @@ class Network:
                 msg = f"Target element '{element_instance.target}' is not a network participant"
                 raise ValueError(msg)  # noqa: TRY004 (ValueError is appropriate here, not TypeError)
 
+            for endpoint in (source_element, target_element):
+                if get_decorator_state(endpoint, ELEMENT_POWER_BALANCE) is not None:
+                    self._reset_power_balance(endpoint)
             source_element.register_connection(element_instance, "source")
             target_element.register_connection(element_instance, "target")
             element_instance.set_endpoints(source_element, target_element)
 
         return element_instance
 
+    def remove(self, name: str) -> Element[Any]:
+        """Remove an element from the network, keeping the rest of the LP and its basis.
+
+        HiGHS cannot delete columns without renumbering every later variable,
+        so the element's columns are fixed at zero.  Its rows are freed and
+        later deleted by row compaction.  The power balance of each endpoint
+        of a removed connection is rebuilt on the next optimization.
+
+        Connections must be removed before their endpoints, and policy
+        pricing before the connections it prices.
+
+        Args:
+            name: Name of the element to remove
+
+        Returns:
+            The removed element
+
+        Raises:
+            ValueError: If another element still references the element
+
+        """
+        element = self.elements[name]
+        if isinstance(element, NetworkElement) and element._connections:  # noqa: SLF001 (the network owns connection registration)
+            msg = f"Element '{name}' still has connections"
+            raise ValueError(msg)
+        for other in self.elements.values():
+            if isinstance(other, PolicyPricing) and any(term["connection"] == name for term in other.terms):
+                msg = f"Connection '{name}' is still priced by '{other.name}'"
+                raise ValueError(msg)
+
+        del self.elements[name]
+        self.element_configs.pop(name, None)
+        self._pruned_tags.pop(name, None)
+        self._calibrated_weight = None
+
+        hosts: list[ReactiveHost] = [element]
+        if isinstance(element, Connection):
+            hosts.extend(element.segments.values())
+        for host in hosts:
+            self._retire_rows(retire_constraints(host))
+
+        if isinstance(element, Connection):
+            for endpoint in (self.elements.get(element.source), self.elements.get(element.target)):
+                if isinstance(endpoint, NetworkElement):
+                    endpoint.unregister_connection(element)
+                    self._reset_power_balance(endpoint)
+
+        self._fix_columns([column for columns in self._columns.pop(name, []) for column in columns])
+        return element
+
+    def _reset_power_balance(self, element: NetworkElement[Any]) -> None:
+        """Rebuild the power balance of *element* on the next optimization, after its connections change."""
+        self._retire_rows(retire_constraints(element, (ELEMENT_POWER_BALANCE,)))
+        self._fix_columns(element.release_tag_decomposition())
+
+    def _retire_rows(self, rows: list[highs_cons]) -> None:
+        """Hold freed rows of removed constraints for row compaction to delete."""
+        if rows:
+            self._retired.append({"constraint": rows, "relaxed": True})
+
+    def _fix_columns(self, columns: list[int]) -> None:
+        """Fix columns that no longer belong to any constraint at zero."""
+        if columns:
+            indices = np.asarray(columns, dtype=np.int32)
+            zeros = np.zeros(len(indices))
+            self._solver.changeColsBounds(len(indices), indices, zeros, zeros)
+
+    @contextmanager
+    def _adding_columns(self, name: str) -> Generator[None]:
+        """Record the columns added to the solver within the block as belonging to element *name*."""
+        first = self._solver.numVariables
+        try:
+            yield
+        finally:
+            if (last := self._solver.numVariables) > first:
+                self._columns.setdefault(name, []).append(range(first, last))
+
+    def _live_connection_tags(self, name: str, source: str, target: str, tags: set[int]) -> set[int]:
+        """Return the connection tags both endpoints can carry, recording the rest as pruned.
+
+        Every tag is kept when none would survive, leaving the endpoints'
+        blocking rows to force the flow to zero.
+        """
+        endpoints = [
+            element
+            for element in (self.elements.get(source), self.elements.get(target))
+            if isinstance(element, NetworkElement)
+        ]
+        live = {tag for tag in tags if all(element.carries_tag(tag) for element in endpoints)}
+        if not live:
+            return set(tags)
+        if pruned := set(tags) - live:
+            self._pruned_tags[name] = pruned
+        return live
+
     def _add_policy_pricing(self, config: PolicyPricingElementConfig) -> PolicyPricing:
         """Create a PolicyPricing element by resolving connection/tag references."""
         name = config["name"]
@@ -251,6 +436,9 @@ class Network:
             if not isinstance(conn_element, Connection):
                 msg = f"PolicyPricing '{name}' references unknown connection '{conn_name}'"
                 raise TypeError(msg)
+            if tag in self._pruned_tags.get(conn_name, ()):
+                # The flow is structurally zero, so the term contributes nothing
+                continue
             if tag not in conn_element.power_in:
                 msg = f"PolicyPricing '{name}' references tag {tag} not on connection '{conn_name}'"
                 raise ValueError(msg)
@@ -268,6 +456,15 @@ class Network:
         self.elements[name] = element
         return element
 
+    def outputs(self) -> dict[str, Mapping[ModelOutputName, OutputData]]:
+        """Return the outputs of every element, including contracted ones, keyed by element name."""
+        outputs: dict[str, Mapping[ModelOutputName, OutputData]] = {
+            name: element.outputs() for name, element in self.elements.items()
+        }
+        for contraction in reversed(self.contractions):
+            outputs.update(contraction.outputs(self.elements, outputs))
+        return outputs
+
     def cost(self) -> tuple[highs_linear_expression | None, highs_linear_expression | None] | None:
         """Aggregate (primary, secondary) costs from all elements.
 
@@ -278,8 +475,9 @@ class Network:
         primaries: list[highs_linear_expression] = []
         secondaries: list[highs_linear_expression] = []
 
-        for element in self.elements.values():
-            element_cost = element.cost()
+        for name, element in self.elements.items():
+            with self._adding_columns(name):
+                element_cost = element.cost()
             if element_cost is None:
                 continue
             if isinstance(element_cost, tuple):
@@ -308,15 +506,19 @@ class Network:
             (e for e in self.elements.values() if isinstance(e, Connection)),
             key=lambda c: c.sort_key,
         )
+        normalized = self.options.secondary_objective == "normalized"
         for i, conn in enumerate(connections):
             conn.priority = i
+            conn.priority_count = len(connections) if normalized else None
 
         for element_name, element in self.elements.items():
             try:
-                element.constraints()
+                with self._adding_columns(element_name):
+                    element.constraints()
             except Exception as e:
                 msg = f"Failed to apply constraints for element '{element_name}'"
                 raise ValueError(msg) from e
+        self._compact_rows()
 
         objectives = self.cost()
         if objectives is None:
@@ -334,6 +536,14 @@ class Network:
         n_vars = h.numVariables
         all_col_indices = np.arange(n_vars, dtype=np.int32)
         cost_vectors = _build_cost_vectors((primary, secondary), n_vars)
+        self.objective_spread = ObjectiveSpread(
+            primary=_coefficient_spread(cost_vectors[0]), secondary=_coefficient_spread(cost_vectors[1])
+        )
+        _LOGGER.debug(
+            "Objective coefficient spread: primary %.3g, secondary %.3g",
+            self.objective_spread.primary,
+            self.objective_spread.secondary,
+        )
 
         if isinstance(self.options, BlendedOptions):
             return self._solve_blended(h, all_col_indices, cost_vectors, self.options.blend_weight)
@@ -343,6 +553,57 @@ class Network:
 
         return self._solve_lex(h, all_col_indices, cost_vectors, primary, secondary)
 
+    def _reactive_hosts(self) -> Iterator[ReactiveHost]:
+        """Yield every element and connection segment that owns reactive constraints."""
+        for element in self.elements.values():
+            yield element
+            if isinstance(element, Connection):
+                yield from element.segments.values()
+
+    def _compact_rows(self) -> None:
+        """Delete the rows of constraints that no longer apply once they pass the compaction threshold.
+
+        Deleting rows renumbers every later row, so the rows held by the
+        remaining constraints are renumbered to match.  Only constraints whose
+        rows are all basic are deleted, which keeps the last solve's basis
+        valid for the warm start.  Freed rows are basic after any solve, so a
+        constraint freed since then is deleted on a later call.
+        """
+        h = self._solver
+        rows = [(state, cons) for host in self._reactive_hosts() for state, cons in constraint_rows(host)]
+        rows.extend((state, state["constraint"]) for state in self._retired)
+        relaxed = [(state, cons) for state, cons in rows if state.get("relaxed")]
+        self._dead_rows = sum(len(cons) for _state, cons in relaxed)
+        threshold = self.options.compaction_threshold
+        if threshold is None or self._dead_rows == 0 or self._dead_rows < threshold * h.getNumRow():
+            return
+
+        basis = h.getBasis()
+        if basis.valid:
+            row_status = basis.row_status
+            relaxed = [
+                (state, cons)
+                for state, cons in relaxed
+                if all(row_status[c.index] == HighsBasisStatus.kBasic for c in cons)
+            ]
+        if not relaxed:
+            return
+
+        removed = np.sort(np.fromiter((c.index for _state, cons in relaxed for c in cons), dtype=np.int32))
+        h.deleteRows(len(removed), removed)
+        for state, _cons in relaxed:
+            del state["constraint"], state["relaxed"]
+        self._retired = [state for state in self._retired if "constraint" in state]
+        kept = [c for state, cons in rows if "constraint" in state for c in cons]
+        if self._lex_constraint is not None:
+            kept.append(self._lex_constraint)
+        for cons in kept:
+            cons.index -= int(np.searchsorted(removed, cons.index))
+
+        self._dead_rows -= len(removed)
+        self._compactions += 1
+        _LOGGER.debug("Compacted %d free rows, %d rows remain", len(removed), h.getNumRow())
+
     def _solve_lex(
         self,
         h: Highs,
@@ -555,7 +816,9 @@ class Network:
         """
         result: dict[str, dict[str, highs_cons | list[highs_cons]]] = {}
         for element_name, element in self.elements.items():
-            if element_constraints := element.constraints():
+            with self._adding_columns(element_name):
+                element_constraints = element.constraints()
+            if element_constraints:
                 result[element_name] = element_constraints
         return result
 
@@ -605,6 +868,14 @@ def _build_cost_vectors(
     return vectors
 
 
+def _coefficient_spread(costs: NDArray[np.float64]) -> float:
+    """Return the ratio of the largest to the smallest nonzero cost magnitude, 1.0 without any."""
+    magnitudes = np.abs(costs[costs != 0.0])
+    if magnitudes.size == 0:
+        return 1.0
+    return float(magnitudes.max() / magnitudes.min())
+
+
 def _set_cost_vector(
     solver: Highs,
     col_indices: NDArray[np.int32],
@@ -10,11 +10,21 @@ The pattern is inspired by reactive frameworks like MobX:
 - Parameter changes invalidate only dependent constraints
 """
 
-from .decorators import OutputMethod, ReactiveConstraint, ReactiveCost, ReactiveMethod, constraint, cost, output
+from .decorators import (
+    ColumnBounds,
+    OutputMethod,
+    ReactiveConstraint,
+    ReactiveCost,
+    ReactiveMethod,
+    constraint,
+    cost,
+    output,
+)
 from .protocols import ReactiveHost
 from .tracked_param import TrackedParam
 
 __all__ = [
+    "ColumnBounds",
     "OutputMethod",
     "ReactiveConstraint",
     "ReactiveCost",
@@ -1,17 +1,25 @@
 """Decorator classes for reactive caching of constraints and costs."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass
 from functools import partial
-from typing import TypeVar, overload
+from typing import Any, TypeVar, overload
+from weakref import WeakKeyDictionary
 
 from highspy import Highs, HighsRanging, HighsSolution
 from highspy.highs import highs_cons, highs_linear_expression
 import numpy as np
+from numpy.typing import NDArray
 
 from custom_components.haeo.core.model.output_data import ModelOutputValue, OutputData
 
 from .protocols import ReactiveHost
-from .tracked_param import ensure_decorator_state, tracking_context
+from .tracked_param import (
+    _propagate_method_invalidation,  # pyright: ignore[reportPrivateUsage]
+    ensure_decorator_state,
+    get_decorator_state,
+    tracking_context,
+)
 
 
 def _get_ranging(solver: Highs) -> tuple[HighsRanging, HighsSolution]:
@@ -42,6 +50,123 @@ def clear_ranging_cache(solver: Highs) -> None:
 R = TypeVar("R")
 
 
+@dataclass(frozen=True, slots=True)
+class ColumnBounds:
+    """Single-variable constraint rows expressed as bounds on their columns.
+
+    Row ``i`` reads ``lower_i <= coeffs[i] * x[columns[i]] <= upper_i``,
+    which is the column bound ``lower / coeff <= x <= upper / coeff``.
+    """
+
+    columns: NDArray[np.int32]
+    coeffs: NDArray[np.float64]
+    lower: NDArray[np.float64]
+    upper: NDArray[np.float64]
+
+    @classmethod
+    def from_expressions(cls, exprs: list[highs_linear_expression]) -> "ColumnBounds | None":
+        """Return the bounds equivalent to *exprs*, or None unless each has its own single variable."""
+        columns: list[int] = []
+        coeffs: list[float] = []
+        lower: list[float] = []
+        upper: list[float] = []
+        for expr in exprs:
+            if len(expr.idxs) != 1 or expr.vals[0] == 0 or expr.bounds is None:
+                return None
+            columns.append(expr.idxs[0])
+            coeffs.append(expr.vals[0])
+            lower.append(expr.bounds[0])
+            upper.append(expr.bounds[1])
+        if not columns or len(set(columns)) != len(columns):
+            return None
+        return cls(
+            columns=np.asarray(columns, dtype=np.int32),
+            coeffs=np.asarray(coeffs, dtype=float),
+            lower=np.asarray(lower, dtype=float),
+            upper=np.asarray(upper, dtype=float),
+        )
+
+    def column_lower(self) -> NDArray[np.float64]:
+        """Return the lower column bound implied by each row."""
+        return np.where(self.coeffs > 0, self.lower, self.upper) / self.coeffs
+
+    def column_upper(self) -> NDArray[np.float64]:
+        """Return the upper column bound implied by each row."""
+        return np.where(self.coeffs > 0, self.upper, self.lower) / self.coeffs
+
+
+class _ColumnBoundsRegistry:
+    """Column bounds set by the column-bound constraints of one solver.
+
+    Each column keeps the bounds it had before any constraint bounded it, and
+    each side is that base intersected with the bound of every constraint
+    currently setting that side, so constraints sharing a column never adopt
+    or overwrite each other's bounds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._base: dict[int, tuple[float, float]] = {}
+        self._lower: dict[int, dict[Hashable, float]] = {}
+        self._upper: dict[int, dict[Hashable, float]] = {}
+        self._owned: dict[Hashable, list[int]] = {}
+
+    def apply(self, solver: Highs, owner: Hashable, bounds: ColumnBounds | None) -> None:
+        """Replace *owner*'s bounds with *bounds* (None removes them) and update the affected columns."""
+        touched: set[int] = set()
+        for column in self._owned.pop(owner, ()):
+            self._lower[column].pop(owner, None)
+            self._upper[column].pop(owner, None)
+            touched.add(column)
+
+        if bounds is not None:
+            columns = bounds.columns.tolist()
+            if unseen := [column for column in columns if column not in self._base]:
+                _status, _count, _costs, lower, upper, _nnz = solver.getCols(
+                    len(unseen), np.asarray(unseen, dtype=np.int32)
+                )
+                for column, low, up in zip(unseen, np.asarray(lower).tolist(), np.asarray(upper).tolist(), strict=True):
+                    self._base[column] = (low, up)
+                    self._lower[column] = {}
+                    self._upper[column] = {}
+            for column, low, up in zip(
+                columns, bounds.column_lower().tolist(), bounds.column_upper().tolist(), strict=True
+            ):
+                if np.isfinite(low):
+                    self._lower[column][owner] = low
+                if np.isfinite(up):
+                    self._upper[column][owner] = up
+            self._owned[owner] = columns
+            touched.update(columns)
+
+        if touched:
+            changed = np.fromiter(sorted(touched), dtype=np.int32, count=len(touched))
+            lower, upper = self.effective(changed)
+            solver.changeColsBounds(len(changed), changed, lower, upper)
+
+    def effective(self, columns: NDArray[np.int32]) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Return the column bounds currently in force for *columns*."""
+        lower = [max([self._base[column][0], *self._lower[column].values()]) for column in columns.tolist()]
+        upper = [min([self._base[column][1], *self._upper[column].values()]) for column in columns.tolist()]
+        return np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+
+
+# Column bounds registries keyed by solver; an entry lives as long as its network's solver
+_COLUMN_BOUNDS_REGISTRIES: WeakKeyDictionary[Highs, _ColumnBoundsRegistry] = WeakKeyDictionary()
+
+
+def _column_bounds_registry(solver: Highs) -> _ColumnBoundsRegistry:
+    """Return the column bounds registry of *solver*, creating it on first use.
+
+    A network owns exactly one solver, so this is the network's record of its
+    columns' original bounds.
+    """
+    registry = _COLUMN_BOUNDS_REGISTRIES.get(solver)
+    if registry is None:
+        registry = _COLUMN_BOUNDS_REGISTRIES[solver] = _ColumnBoundsRegistry()
+    return registry
+
+
 class ReactiveMethod[R]:
     """Base descriptor/decorator that caches method results with automatic dependency tracking.
 
@@ -123,18 +248,23 @@ class ReactiveConstraint[R](ReactiveMethod[R]):
 
     """
 
-    def __init__(self, fn: Callable[..., R], *, output: bool = False, unit: str = "$/kW") -> None:
+    def __init__(
+        self, fn: Callable[..., R], *, output: bool = False, unit: str = "$/kW", column_bounds: bool = False
+    ) -> None:
         """Initialize constraint decorator.
 
         Args:
             fn: The constraint function
             output: If True, expose as shadow price output (default False)
             unit: Unit for shadow price output (default "$/kW")
+            column_bounds: If True and every expression constrains its own single
+                variable, apply them as column bounds instead of rows
 
         """
         super().__init__(fn)
         self.output = output
         self.unit = unit
+        self.column_bounds = column_bounds
 
     def get_output(self, obj: "ReactiveHost") -> "OutputData | None":
         """Get output data for this constraint (shadow prices if output=True).
@@ -155,11 +285,16 @@ class ReactiveConstraint[R](ReactiveMethod[R]):
         # Get the state for this constraint
         state_attr = f"_reactive_state_{self._name}"
         state = getattr(obj, state_attr, None)
-        if state is None or "constraint" not in state:
+        if state is None:
             return None
 
-        # Extract shadow prices from the constraint using the solver
         solver: Highs = obj._solver  # noqa: SLF001 (tightly coupled reactive infrastructure requires solver access) # pyright: ignore[reportPrivateUsage]
+        if (bounds := state.get("column_bounds")) is not None:
+            return self._column_bounds_output(solver, bounds)
+        if "constraint" not in state:
+            return None
+
+        # Extract shadow prices from the constraint using the solver
         cons = state["constraint"]
         arr = np.asarray(cons, dtype=object)
         values = tuple(solver.constrDuals(arr).flat)
@@ -187,6 +322,54 @@ class ReactiveConstraint[R](ReactiveMethod[R]):
             range_dn=range_dn,
         )
 
+    def _column_bounds_output(self, solver: Highs, bounds: ColumnBounds) -> OutputData:
+        """Recover the row shadow prices and ranging of constraints applied as column bounds.
+
+        A column's reduced cost is the row dual scaled by the row coefficient,
+        but only while the bound in force is this constraint's rather than the
+        column's own or a tighter one from another constraint.
+        """
+        from custom_components.haeo.core.model.const import OutputType  # noqa: PLC0415
+
+        rng, sol = _get_ranging(solver)
+        columns = bounds.columns
+        col_dual = np.asarray(sol.col_dual, dtype=float)[columns]
+        effective_lower, effective_upper = _column_bounds_registry(solver).effective(columns)
+        column_lower, column_upper = bounds.column_lower(), bounds.column_upper()
+        binding = ((col_dual > 0) & np.isfinite(column_lower) & (column_lower >= effective_lower)) | (
+            (col_dual < 0) & np.isfinite(column_upper) & (column_upper <= effective_upper)
+        )
+        values = np.where(binding, col_dual / bounds.coeffs, 0.0)
+
+        range_up: tuple[float, ...] | None = None
+        range_dn: tuple[float, ...] | None = None
+        if rng.valid:
+            col_value = np.asarray(sol.col_value, dtype=float)[columns]
+            up = (np.asarray(rng.col_bound_up.value_, dtype=float)[columns] - col_value) * np.abs(bounds.coeffs)
+            dn = (col_value - np.asarray(rng.col_bound_dn.value_, dtype=float)[columns]) * np.abs(bounds.coeffs)
+            positive = bounds.coeffs > 0
+            range_up = tuple(np.where(positive, up, dn).tolist())
+            range_dn = tuple(np.where(positive, dn, up).tolist())
+
+        return OutputData(
+            type=OutputType.SHADOW_PRICE,
+            unit=self.unit,
+            values=tuple(values.tolist()),
+            range_up=range_up,
+            range_dn=range_dn,
+        )
+
+    def _apply_column_bounds(
+        self, obj: "ReactiveHost", solver: Highs, state: dict[str, Any], bounds: ColumnBounds | None
+    ) -> None:
+        """Set this constraint's column bounds to *bounds*, or withdraw them when None."""
+        _column_bounds_registry(solver).apply(solver, (id(obj), self._name), bounds)
+        state["column_mode"] = True
+        if bounds is None:
+            state.pop("column_bounds", None)
+        else:
+            state["column_bounds"] = bounds
+
     def _call(self, obj: "ReactiveHost") -> R:
         """Execute with caching, dependency tracking, and solver lifecycle management."""
         # Record access if being tracked by another method
@@ -214,12 +397,30 @@ class ReactiveConstraint[R](ReactiveMethod[R]):
         state["deps"] = tracking
         state["invalidated"] = False
 
-        # Handle None result (constraint not applicable)
+        # Get solver from element
+        solver: Highs = obj._solver  # noqa: SLF001 (tightly coupled reactive infrastructure requires solver access) # pyright: ignore[reportPrivateUsage]
+
+        # Column bound mode is fixed by the first expression and never falls back to rows
+        if "column_mode" in state:
+            bounds = ColumnBounds.from_expressions(expr) if isinstance(expr, list) else None
+            assert expr is None or bounds is not None, "Column bound constraint must stay single-variable"  # noqa: S101 (runtime invariant check for constraint type consistency)
+            self._apply_column_bounds(obj, solver, state, bounds)
+            return expr  # type: ignore[return-value]
+
+        # Handle None result (constraint not applicable), freeing any rows it added
         if expr is None:
+            if not is_first_call and not state.get("relaxed"):
+                self._relax_rows(solver, state)
             return expr  # type: ignore[return-value]
 
-        # Get solver from element
-        solver: Highs = obj._solver  # noqa: SLF001 (tightly coupled reactive infrastructure requires solver access) # pyright: ignore[reportPrivateUsage]
+        if (
+            is_first_call
+            and self.column_bounds
+            and isinstance(expr, list)
+            and (bounds := ColumnBounds.from_expressions(expr)) is not None  # type: ignore[arg-type]
+        ):
+            self._apply_column_bounds(obj, solver, state, bounds)
+            return expr  # type: ignore[return-value]
 
         # First call: create constraint(s) in solver
         if is_first_call:
@@ -229,9 +430,20 @@ class ReactiveConstraint[R](ReactiveMethod[R]):
             # Subsequent call with invalidation: update constraint(s)
             existing = state["constraint"]
             self._update_constraint(solver, existing, expr)  # type: ignore[arg-type]
+            state.pop("relaxed", None)
 
         return expr  # type: ignore[return-value]
 
+    def _relax_rows(self, solver: Highs, state: dict[str, Any]) -> None:
+        """Free the rows of a constraint that no longer applies.
+
+        The rows stay in the model for reuse until Network compaction
+        deletes them, since deleting a row renumbers every later row.
+        """
+        for cons in _rows(state["constraint"]):
+            solver.changeRowBounds(cons.index, float("-inf"), float("inf"))
+        state["relaxed"] = True
+
     def _update_constraint(
         self,
         solver: "Highs",
@@ -299,6 +511,63 @@ class ReactiveConstraint[R](ReactiveMethod[R]):
                 solver.changeCoeff(cons.index, var_idx, new_val)
 
 
+def _rows(cons: "highs_cons | list[highs_cons]") -> list[highs_cons]:
+    """Return a constraint's rows as a list."""
+    return list(cons) if isinstance(cons, list) else [cons]
+
+
+def constraint_rows(host: ReactiveHost) -> Iterator[tuple[dict[str, Any], list[highs_cons]]]:
+    """Yield the state and solver rows of each constraint of *host* that added rows.
+
+    Rows of a constraint whose method last returned None are freed and the
+    state is marked ``relaxed``.  Callers that delete rows must renumber the
+    remaining ``highs_cons`` in place and drop ``constraint`` from the state
+    of any constraint whose rows were deleted, so it adds fresh rows on its
+    next non-None result.
+    """
+    for name in dir(type(host)):
+        if not isinstance(getattr(type(host), name, None), ReactiveConstraint):
+            continue
+        state = get_decorator_state(host, name)
+        if state is not None and "constraint" in state:
+            yield state, _rows(state["constraint"])
+
+
+def retire_constraints(host: ReactiveHost, names: Iterable[str] | None = None) -> list[highs_cons]:
+    """Withdraw the constraints of *host* from the solver and forget their state.
+
+    Column bounds are withdrawn at once, while rows are freed and returned
+    for the caller to delete, since deleting a row renumbers every later row.
+    A retired constraint adds itself afresh on its next call, so *names*
+    (every constraint when None) may change their row count.
+    """
+    solver: Highs = host._solver  # noqa: SLF001 (tightly coupled reactive infrastructure requires solver access) # pyright: ignore[reportPrivateUsage]
+    wanted = None if names is None else set(names)
+    rows: list[highs_cons] = []
+    retired: set[str] = set()
+    for name in dir(type(host)):
+        if not isinstance(getattr(type(host), name, None), ReactiveConstraint) or (
+            wanted is not None and name not in wanted
+        ):
+            continue
+        state = get_decorator_state(host, name)
+        if state is None:
+            continue
+        if "column_mode" in state:
+            _column_bounds_registry(solver).apply(solver, (id(host), name), None)
+        if "constraint" in state:
+            freed = _rows(state["constraint"])
+            if not state.get("relaxed"):
+                for cons in freed:
+                    solver.changeRowBounds(cons.index, float("-inf"), float("inf"))
+            rows.extend(freed)
+        delattr(host, f"_reactive_state_{name}")
+        retired.add(name)
+    if retired:
+        _propagate_method_invalidation(host, retired)
+    return rows
+
+
 class ReactiveCost[R](ReactiveMethod[R]):
     """Decorator that caches cost expressions with automatic dependency tracking.
 
@@ -378,11 +647,13 @@ def constraint[R](fn: Callable[..., R], /) -> ReactiveConstraint[R]: ...
 
 
 @overload
-def constraint(*, output: bool = False, unit: str = "$/kW") -> Callable[[Callable[..., R]], ReactiveConstraint[R]]: ...
+def constraint(
+    *, output: bool = False, unit: str = "$/kW", column_bounds: bool = False
+) -> Callable[[Callable[..., R]], ReactiveConstraint[R]]: ...
 
 
 def constraint[R](
-    fn: Callable[..., R] | None = None, /, *, output: bool = False, unit: str = "$/kW"
+    fn: Callable[..., R] | None = None, /, *, output: bool = False, unit: str = "$/kW", column_bounds: bool = False
 ) -> ReactiveConstraint[R] | Callable[[Callable[..., R]], ReactiveConstraint[R]]:
     """Decorate constraint methods with automatic caching and dependency tracking.
 
@@ -394,6 +665,7 @@ def constraint[R](
         fn: The function to decorate (when used without arguments)
         output: If True, expose as shadow price output (default False)
         unit: Unit for shadow price output (default "$/kW")
+        column_bounds: If True, apply single-variable expressions as column bounds (default False)
 
     Returns:
         Decorated function or decorator factory
@@ -401,9 +673,9 @@ def constraint[R](
     """
     if fn is not None:
         # Called without arguments: @constraint
-        return ReactiveConstraint(fn, output=output, unit=unit)
+        return ReactiveConstraint(fn, output=output, unit=unit, column_bounds=column_bounds)
     # Called with arguments: @constraint(output=True, unit="$/kWh")
-    return lambda f: ReactiveConstraint(f, output=output, unit=unit)
+    return lambda f: ReactiveConstraint(f, output=output, unit=unit, column_bounds=column_bounds)
 
 
 cost = ReactiveCost
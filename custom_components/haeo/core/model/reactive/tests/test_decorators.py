@@ -5,10 +5,13 @@ from collections.abc import Sequence
 from highspy import Highs
 from highspy.highs import highs_linear_expression
 import numpy as np
+from numpy.typing import NDArray
+import pytest
 
 from custom_components.haeo.core.model.element import Element
 from custom_components.haeo.core.model.elements.battery import Battery
 from custom_components.haeo.core.model.reactive import ReactiveConstraint, ReactiveCost, TrackedParam, constraint, cost
+from custom_components.haeo.core.model.reactive.decorators import constraint_rows
 
 
 def create_test_element[T: Element[str]](cls: type[T]) -> T:
@@ -327,6 +330,169 @@ def test_constraints_skips_none_result() -> None:
     assert "constraint" not in state
 
 
+def _limited_element(*, column_bounds: bool) -> tuple[Highs, Element[str]]:
+    """Build and solve an element limiting ``2 * x`` per period, minimizing ``x[1] - x[0]``."""
+    solver = Highs()
+    solver.setOptionValue("output_flag", False)
+    x = solver.addVariables(2, lb=0.0, out_array=True)
+
+    class TestElement(Element[str]):
+        limit = TrackedParam[NDArray[np.float64] | None]()
+
+        @constraint(output=True, column_bounds=column_bounds)
+        def my_constraint(self) -> list[highs_linear_expression] | None:
+            if self.limit is None:
+                return None
+            return list(x * 2.0 <= self.limit)
+
+    elem = TestElement(
+        name="test", periods=np.array([1.0, 1.0]), solver=solver, output_names=frozenset({"my_constraint"})
+    )
+    elem.limit = np.array([4.0, 3.0])
+    elem.constraints()
+    solver.minimize(Highs.qsum(x * np.array([-1.0, 1.0])))
+    return solver, elem
+
+
+def test_column_bounds_constraint_matches_rows() -> None:
+    """Single-variable constraints become column bounds with the same optimum and shadow prices."""
+    row_solver, row_elem = _limited_element(column_bounds=False)
+    bound_solver, bound_elem = _limited_element(column_bounds=True)
+
+    assert row_solver.numConstrs == 2
+    assert bound_solver.numConstrs == 0
+    assert bound_solver.getObjectiveValue() == pytest.approx(row_solver.getObjectiveValue())
+    row_output = row_elem.outputs()
+    bound_output = bound_elem.outputs()
+    assert bound_output.keys() == row_output.keys() == {"my_constraint"}
+    np.testing.assert_allclose(bound_output["my_constraint"].values, row_output["my_constraint"].values)
+    assert bound_output["my_constraint"].values[0] == pytest.approx(-0.5)
+
+
+def test_column_bounds_constraint_updates_and_restores_bounds() -> None:
+    """Parameter changes move the column bounds, and a None result restores the column's own bounds."""
+    solver, elem = _limited_element(column_bounds=True)
+    assert solver.getObjectiveValue() == pytest.approx(-2.0)
+
+    elem.limit = np.array([6.0, 3.0])  # type: ignore[attr-defined]
+    elem.constraints()
+    solver.run()
+    assert solver.getObjectiveValue() == pytest.approx(-3.0)
+
+    elem.limit = None  # type: ignore[attr-defined]
+    elem.constraints()
+    _status, _count, _costs, lower, upper, _nnz = solver.getCols(2, np.array([0, 1], dtype=np.int32))
+    np.testing.assert_array_equal(lower, [0.0, 0.0])
+    np.testing.assert_array_equal(upper, [np.inf, np.inf])
+    assert elem.outputs() == {}
+
+
+def test_column_bounds_constraints_share_columns() -> None:
+    """Constraints bounding opposite sides of the same columns keep each other's bounds and prices."""
+    solver = Highs()
+    solver.setOptionValue("output_flag", False)
+    x = solver.addVariables(2, lb=-np.inf, out_array=True)
+
+    class TestElement(Element[str]):
+        floor = TrackedParam[NDArray[np.float64] | None]()
+        ceiling = TrackedParam[NDArray[np.float64]]()
+
+        @constraint(output=True, column_bounds=True)
+        def lower(self) -> list[highs_linear_expression] | None:
+            return None if self.floor is None else list(x >= self.floor)
+
+        @constraint(output=True, column_bounds=True)
+        def upper(self) -> list[highs_linear_expression]:
+            return list(x <= self.ceiling)
+
+    elem = TestElement(
+        name="test", periods=np.array([1.0, 1.0]), solver=solver, output_names=frozenset({"lower", "upper"})
+    )
+    elem.floor = np.array([1.0, 2.0])
+    elem.ceiling = np.array([5.0, 6.0])
+    elem.constraints()
+    solver.minimize(Highs.qsum(x * np.array([1.0, -1.0])))
+
+    assert solver.numConstrs == 0
+    assert solver.getObjectiveValue() == pytest.approx(-5.0)
+    outputs = elem.outputs()
+    np.testing.assert_allclose(outputs["lower"].values, [1.0, 0.0])
+    np.testing.assert_allclose(outputs["upper"].values, [0.0, -1.0])
+
+    elem.ceiling = np.array([4.0, 3.0])  # type: ignore[attr-defined]
+    elem.floor = None  # type: ignore[attr-defined]
+    elem.constraints()
+    _status, _count, _costs, lower, upper, _nnz = solver.getCols(2, np.array([0, 1], dtype=np.int32))
+    np.testing.assert_array_equal(lower, [-np.inf, -np.inf])
+    np.testing.assert_array_equal(upper, [4.0, 3.0])
+
+
+def test_column_bounds_constraints_share_a_side() -> None:
+    """Constraints bounding the same side of a column apply the tightest bound and loosen independently."""
+    solver = Highs()
+    solver.setOptionValue("output_flag", False)
+    x = solver.addVariables(1, lb=0.0, ub=10.0, out_array=True)
+
+    class TestElement(Element[str]):
+        first_limit = TrackedParam[float | None]()
+        second_limit = TrackedParam[float]()
+
+        @constraint(output=True, column_bounds=True)
+        def first(self) -> list[highs_linear_expression] | None:
+            return None if self.first_limit is None else [x[0] <= self.first_limit]
+
+        @constraint(output=True, column_bounds=True)
+        def second(self) -> list[highs_linear_expression]:
+            return [x[0] <= self.second_limit]
+
+    elem = TestElement(name="test", periods=np.array([1.0]), solver=solver, output_names=frozenset({"first", "second"}))
+
+    def solve() -> tuple[float, float, float]:
+        elem.constraints()
+        solver.minimize(-x[0])
+        outputs = elem.outputs()
+        first = outputs["first"].values[0] if "first" in outputs else 0.0
+        return solver.getObjectiveValue(), first, outputs["second"].values[0]
+
+    elem.first_limit = 3.0
+    elem.second_limit = 5.0
+    assert solve() == pytest.approx((-3.0, -1.0, 0.0))
+
+    elem.second_limit = 8.0  # type: ignore[attr-defined]
+    elem.first_limit = None  # type: ignore[attr-defined]
+    assert solve() == pytest.approx((-8.0, 0.0, -1.0))
+
+    elem.first_limit = 4.0  # type: ignore[attr-defined]
+    assert solve() == pytest.approx((-4.0, -1.0, 0.0))
+
+    elem.second_limit = 12.0  # type: ignore[attr-defined]
+    elem.first_limit = None  # type: ignore[attr-defined]
+    assert solve() == pytest.approx((-10.0, 0.0, 0.0))
+
+
+def test_row_constraint_none_result_frees_rows() -> None:
+    """A None result frees the constraint's rows, and a later result tightens them again."""
+    solver, elem = _limited_element(column_bounds=False)
+    assert solver.getObjectiveValue() == pytest.approx(-2.0)
+
+    elem.limit = None  # type: ignore[attr-defined]
+    elem.constraints()
+    state = getattr(elem, "_reactive_state_my_constraint", None)
+    assert state is not None
+    assert state["relaxed"]
+    assert [row for _state, row in constraint_rows(elem)] == [state["constraint"]]
+    _status, _count, lower, upper, _nnz = solver.getRows(2, np.array([0, 1], dtype=np.int32))
+    np.testing.assert_array_equal(lower, [-np.inf, -np.inf])
+    np.testing.assert_array_equal(upper, [np.inf, np.inf])
+
+    elem.limit = np.array([6.0, 3.0])  # type: ignore[attr-defined]
+    elem.constraints()
+    solver.run()
+    assert "relaxed" not in state
+    assert solver.numConstrs == 2
+    assert solver.getObjectiveValue() == pytest.approx(-3.0)
+
+
 # Integration tests
 
 
@@ -0,0 +1,204 @@
+"""Tests for lossless horizon aggregation."""
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from custom_components.haeo.core.model import ModelElementConfig, Network, OutputData, OutputType
+from custom_components.haeo.core.model.aggregation import PeriodAggregation, find_period_runs
+from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_BATTERY as ELEMENT_TYPE_BATTERY
+from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_CONNECTION as ELEMENT_TYPE_CONNECTION
+from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_NODE as ELEMENT_TYPE_NODE
+
+PERIODS = np.array([0.5, 0.5, 1.0, 1.0, 1.0, 1.0])
+PRICE = np.array([0.1, 0.1, 0.1, 0.3, 0.3, 0.2])
+
+
+def _configs(price: np.ndarray = PRICE) -> list[ModelElementConfig]:
+    """Build a grid, battery and fixed load whose only time variation is *price*."""
+    n = len(price)
+
+    def connection(name: str, source: str, target: str, **segments: Any) -> ModelElementConfig:
+        return {
+            "element_type": ELEMENT_TYPE_CONNECTION,
+            "name": name,
+            "source": source,
+            "target": target,
+            "tags": {1},
+            "segments": segments,
+        }  # type: ignore[return-value]
+
+    limit = {"segment_type": "power_limit", "max_power": np.full(n, 3.0)}
+    return [
+        {"element_type": ELEMENT_TYPE_NODE, "name": "grid", "is_source": True, "is_sink": True},
+        {
+            "element_type": ELEMENT_TYPE_BATTERY,
+            "name": "battery",
+            "capacity": np.full(n + 1, 10.0),
+            "initial_charge": 5.0,
+        },
+        {"element_type": ELEMENT_TYPE_NODE, "name": "bus", "is_source": False, "is_sink": False},
+        {"element_type": ELEMENT_TYPE_NODE, "name": "load", "is_source": False, "is_sink": True},
+        connection("import", "grid", "bus", price={"segment_type": "pricing", "price": price}),
+        connection("export", "bus", "grid", price={"segment_type": "pricing", "price": -0.5 * price}),
+        connection("discharge", "battery", "bus", limit=limit),
+        connection("charge", "bus", "battery", limit=limit),
+        connection("demand", "bus", "load", limit={**limit, "fixed": True}),
+    ]  # type: ignore[list-item]
+
+
+def _solve(periods: np.ndarray, configs: list[ModelElementConfig]) -> tuple[Network, float]:
+    network = Network(name="test", periods=periods)
+    for config in configs:
+        network.add(config)
+    return network, network.optimize()
+
+
+def test_find_period_runs_merges_identical_periods() -> None:
+    """Runs break wherever any per-period input changes, regardless of period duration."""
+    aggregation = find_period_runs(PERIODS, _configs())
+
+    assert aggregation.run_lengths == (3, 2, 1)
+    assert aggregation.n_periods == 6
+    assert aggregation.n_aggregated == 3
+    assert aggregation.reduction_ratio == pytest.approx(0.5)
+    np.testing.assert_allclose(aggregation.aggregate_periods(PERIODS), [2.0, 2.0, 1.0])
+
+
+def test_find_period_runs_keeps_boundaries_that_change() -> None:
+    """A boundary that differs from its neighbours is kept, along with both neighbours."""
+    configs = _configs(np.full(6, 0.1))
+    capacity = np.full(7, 10.0)
+    capacity[3] = 8.0
+    configs[1]["capacity"] = capacity  # type: ignore[typeddict-unknown-key]
+
+    assert find_period_runs(PERIODS, configs).run_lengths == (2, 1, 1, 2)
+
+
+def test_find_period_runs_treats_nan_as_equal() -> None:
+    """Unset (NaN) inputs do not split runs."""
+    configs = _configs(np.full(6, np.nan))
+
+    assert find_period_runs(PERIODS, configs).run_lengths == (6,)
+
+
+@pytest.mark.parametrize(
+    "segment",
+    [
+        {"segment_type": "soc_pricing", "discharge_energy_threshold": np.zeros(6), "discharge_energy_price": 0.1},
+        {"segment_type": "power_limit", "max_power": np.ones(3)},
+    ],
+    ids=["soc_pricing", "foreign_length"],
+)
+def test_find_period_runs_declines_inexact_configs(segment: dict[str, Any]) -> None:
+    """Stored-energy costs and arrays of unknown horizon length disable aggregation."""
+    configs = _configs(np.full(6, 0.1))
+    configs[6]["segments"] = {"extra": segment}  # type: ignore[typeddict-unknown-key]
+
+    assert find_period_runs(PERIODS, configs).is_identity
+
+
+def test_aggregate_config_samples_periods_and_boundaries() -> None:
+    """Per-period arrays keep each run's value and boundary arrays keep run boundaries."""
+    aggregation = PeriodAggregation(run_lengths=(3, 2, 1))
+    capacity = np.arange(7.0)
+    config = _configs()[1] | {"capacity": capacity}
+
+    aggregated = aggregation.aggregate_config(config)  # type: ignore[arg-type]
+
+    np.testing.assert_array_equal(aggregated["capacity"], [0.0, 3.0, 5.0, 6.0])  # type: ignore[typeddict-item]
+    np.testing.assert_array_equal(capacity, np.arange(7.0))
+    np.testing.assert_array_equal(
+        aggregation.aggregate_config(_configs()[4])["segments"]["price"]["price"],  # type: ignore[typeddict-item]
+        [0.1, 0.3, 0.2],
+    )
+
+
+def test_aggregate_config_weights_periods_by_duration() -> None:
+    """With periods given, per-period arrays take each run's duration-weighted mean of set values."""
+    aggregation = PeriodAggregation(run_lengths=(3, 3))
+    config = _configs(np.array([0.1, 0.2, 0.4, 0.3, np.nan, 0.6]))[4]
+
+    aggregated = aggregation.aggregate_config(config, PERIODS)  # type: ignore[arg-type]
+
+    np.testing.assert_allclose(
+        aggregated["segments"]["price"]["price"],  # type: ignore[typeddict-item]
+        [0.275, 0.45],
+    )
+
+
+@pytest.mark.parametrize(
+    ("keep", "breaks", "expected"),
+    [
+        (0, (), (3, 2, 1)),
+        (2, (), (1, 1, 2, 2)),
+        (0, (4,), (3, 1, 2)),
+    ],
+    ids=["blocks", "keep", "breaks"],
+)
+def test_coarsen_groups_periods_into_blocks(keep: int, breaks: tuple[int, ...], expected: tuple[int, ...]) -> None:
+    """Blocks close once they reach the block length, after kept periods and at breaks."""
+    aggregation = PeriodAggregation.coarsen(PERIODS, 2.0, keep=keep, breaks=breaks)
+
+    assert aggregation.run_lengths == expected
+    assert aggregation.n_periods == len(PERIODS)
+
+
+def test_aggregated_solve_matches_full_cost() -> None:
+    """The merged network reaches the full network's optimal cost."""
+    configs = _configs()
+    _, full_cost = _solve(PERIODS, configs)
+
+    aggregation = find_period_runs(PERIODS, configs)
+    aggregated, aggregated_cost = _solve(
+        aggregation.aggregate_periods(PERIODS), [aggregation.aggregate_config(config) for config in configs]
+    )
+
+    assert aggregated.n_periods == 3
+    assert aggregated_cost == pytest.approx(full_cost)
+
+    stored = aggregation.expand_output(aggregated.elements["battery"].outputs()["battery_energy_stored"], PERIODS)
+    assert len(stored.values) == len(PERIODS) + 1
+    assert stored.values[0] == pytest.approx(5.0)
+
+
+def test_expand_output_repeats_period_blocks() -> None:
+    """Each per-period block repeats its run values, ranging included."""
+    aggregation = PeriodAggregation(run_lengths=(2, 1))
+    output = OutputData(
+        type=OutputType.SHADOW_PRICE,
+        unit="$/kWh",
+        values=(1.0, 2.0, 3.0, 4.0),
+        range_up=(5.0, 6.0, 7.0, 8.0),
+    )
+
+    expanded = aggregation.expand_output(output, np.ones(3))
+
+    assert tuple(expanded.values) == (1.0, 1.0, 2.0, 3.0, 3.0, 4.0)
+    assert tuple(expanded.range_up or ()) == (5.0, 5.0, 6.0, 7.0, 7.0, 8.0)
+    assert expanded.range_dn is None
+    assert expanded.unit == "$/kWh"
+
+
+def test_expand_output_interpolates_boundaries_in_time() -> None:
+    """Boundary outputs move linearly across each run by elapsed time."""
+    aggregation = PeriodAggregation(run_lengths=(2, 1))
+    output = OutputData(type=OutputType.ENERGY, unit="kWh", values=(0.0, 3.0, 1.0), state_last=True)
+
+    expanded = aggregation.expand_output({"stored": output}, np.array([1.0, 2.0, 1.0]))
+
+    assert isinstance(expanded, dict)
+    stored = expanded["stored"]
+    assert isinstance(stored, OutputData)
+    assert stored.values == pytest.approx((0.0, 1.0, 3.0, 1.0))
+    assert stored.state_last
+
+
+def test_expand_output_leaves_scalars_and_identity_untouched() -> None:
+    """Outputs that are not horizon series, or an identity aggregation, pass through."""
+    scalar = OutputData(type=OutputType.COST, unit="$", values=(1.0,))
+    series = OutputData(type=OutputType.POWER, unit="kW", values=(1.0, 2.0))
+
+    assert PeriodAggregation(run_lengths=(2, 2, 1)).expand_output(scalar, np.ones(5)) is scalar
+    assert PeriodAggregation.identity(2).expand_output(series, np.ones(2)) is series
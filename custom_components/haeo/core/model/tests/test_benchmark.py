@@ -0,0 +1,92 @@
+"""Battery formulation benchmarks on a multi-battery network over growing horizons.
+
+Run with:
+    uv run pytest custom_components/haeo/core/model/tests/test_benchmark.py -m benchmark \
+        --benchmark-group-by=param:periods
+
+Each benchmark records the LP size and the simplex iterations of its last solve in ``extra_info``.
+"""
+
+from typing import Any
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.haeo.core.model import Network
+from custom_components.haeo.core.model.elements import (
+    MODEL_ELEMENT_TYPE_BATTERY,
+    MODEL_ELEMENT_TYPE_CONNECTION,
+    MODEL_ELEMENT_TYPE_NODE,
+    BatteryFormulation,
+)
+from custom_components.haeo.core.model.network import LexOptions
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.timeout(120)]
+
+# Battery sections sharing the bus, like an undercharge/normal/overcharge split
+_BATTERY_COUNT = 3
+
+
+def _battery_network(formulation: BatteryFormulation, n_periods: int) -> Network:
+    """Build batteries, a load and a grid with daily price cycles on a shared bus."""
+    hours = np.arange(n_periods) * 0.25
+    periods = np.full(n_periods, 0.25)
+    network = Network(name="benchmark", periods=periods, options=LexOptions(), battery_formulation=formulation)
+    network.add({"element_type": MODEL_ELEMENT_TYPE_NODE, "name": "grid", "is_source": True, "is_sink": True})
+    network.add({"element_type": MODEL_ELEMENT_TYPE_NODE, "name": "bus", "is_source": False, "is_sink": False})
+    network.add({"element_type": MODEL_ELEMENT_TYPE_NODE, "name": "load", "is_source": False, "is_sink": True})
+
+    def connect(name: str, source: str, target: str, **segments: Any) -> None:
+        network.add(
+            {
+                "element_type": MODEL_ELEMENT_TYPE_CONNECTION,
+                "name": name,
+                "source": source,
+                "target": target,
+                "tags": {1},
+                "segments": segments,
+            }
+        )
+
+    import_price = 0.25 + 0.15 * np.sin(2 * np.pi * hours / 24)
+    connect("import", "grid", "bus", price={"segment_type": "pricing", "price": import_price})
+    connect("export", "bus", "grid", price={"segment_type": "pricing", "price": -0.5 * import_price})
+    demand = 1.0 + 0.5 * np.cos(2 * np.pi * hours / 24)
+    connect("demand", "bus", "load", limit={"segment_type": "power_limit", "max_power": demand, "fixed": True})
+
+    for index in range(_BATTERY_COUNT):
+        name = f"battery_{index}"
+        network.add(
+            {
+                "element_type": MODEL_ELEMENT_TYPE_BATTERY,
+                "name": name,
+                "capacity": 5.0 + index,
+                "initial_charge": 2.0,
+                "minimum_charge": 0.5,
+                "salvage_value": 0.1,
+            }
+        )
+        limit = {"segment_type": "power_limit", "max_power": np.full(n_periods, 3.0)}
+        wear = {"segment_type": "pricing", "price": np.full(n_periods, 0.01 * (index + 1))}
+        connect(f"{name}_charge", "bus", name, limit=limit, wear=wear)
+        connect(f"{name}_discharge", name, "bus", limit=limit, wear=wear)
+    return network
+
+
+@pytest.mark.parametrize("formulation", ["cumulative", "bounded"])
+@pytest.mark.parametrize("periods", [96, 288, 576])
+def test_battery_formulation_solve(formulation: BatteryFormulation, periods: int, benchmark: BenchmarkFixture) -> None:
+    """Benchmark building and solving the network, recording its size and simplex iterations."""
+
+    def solve() -> tuple[Network, float]:
+        network = _battery_network(formulation, periods)
+        return network, network.optimize()
+
+    network, cost = benchmark(solve)
+
+    solver = network._solver
+    benchmark.extra_info["rows"] = solver.getNumRow()
+    benchmark.extra_info["columns"] = solver.getNumCol()
+    benchmark.extra_info["simplex_iterations"] = solver.getInfo().simplex_iteration_count
+    assert np.isfinite(cost)
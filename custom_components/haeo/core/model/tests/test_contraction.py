@@ -0,0 +1,148 @@
+"""Tests for passthrough junction contraction."""
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from custom_components.haeo.core.model import ModelElementConfig, Network, OutputData
+from custom_components.haeo.core.model.contraction import Contraction, contract_passthrough_nodes
+from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_CONNECTION as ELEMENT_TYPE_CONNECTION
+from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_NODE as ELEMENT_TYPE_NODE
+from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_POLICY_PRICING as ELEMENT_TYPE_POLICY_PRICING
+from custom_components.haeo.core.model.network import LexOptions
+
+PERIODS = np.ones(3)
+
+# Segments an adapter emits for a connection with nothing configured
+FREE_SEGMENTS: dict[str, Any] = {
+    "efficiency": {"segment_type": "efficiency", "efficiency": None},
+    "power_limit": {"segment_type": "power_limit", "max_power": None},
+    "pricing": {"segment_type": "pricing", "price": None},
+}
+
+
+def _node(name: str, *, is_source: bool = False, is_sink: bool = False) -> ModelElementConfig:
+    return {"element_type": ELEMENT_TYPE_NODE, "name": name, "is_source": is_source, "is_sink": is_sink}
+
+
+def _connection(name: str, source: str, target: str, **segments: Any) -> ModelElementConfig:
+    return {
+        "element_type": ELEMENT_TYPE_CONNECTION,
+        "name": name,
+        "source": source,
+        "target": target,
+        "tags": {1},
+        "segments": segments or dict(FREE_SEGMENTS),
+    }  # type: ignore[return-value]
+
+
+def _configs() -> list[ModelElementConfig]:
+    """Build a bus feeding a valued load and fed by limited solar, each through a junction.
+
+    Each junction joins a free connection on the bus side to a limited one on the far side.
+    """
+    limit = {"segment_type": "power_limit", "max_power": np.full(3, 5.0)}
+    return [
+        _node("grid", is_source=True, is_sink=True),
+        _node("bus"),
+        _node("load", is_sink=True),
+        _node("load_junction"),
+        _node("solar", is_source=True),
+        _node("solar_junction"),
+        _connection("import", "grid", "bus", price={"segment_type": "pricing", "price": np.array([0.1, 0.2, 0.3])}),
+        _connection("export", "bus", "grid", price={"segment_type": "pricing", "price": np.full(3, -0.05)}),
+        _connection("supply", "bus", "load_junction"),
+        _connection(
+            "drop",
+            "load_junction",
+            "load",
+            limit=limit,
+            value={"segment_type": "pricing", "price": np.full(3, -0.5)},
+        ),
+        _connection("generation", "solar", "solar_junction", limit={**limit, "max_power": np.array([0.0, 2.0, 8.0])}),
+        _connection("inverter", "solar_junction", "bus"),
+    ]
+
+
+def _solve(configs: list[ModelElementConfig], *, contract: bool) -> tuple[float, Network]:
+    network = Network(name="test", periods=PERIODS, options=LexOptions())
+    if contract:
+        configs, network.contractions = contract_passthrough_nodes(configs)
+    for config in configs:
+        network.add(config)
+    return network.optimize(), network
+
+
+def test_contract_passthrough_nodes_removes_free_junctions() -> None:
+    """Each junction goes with its free connection and the other connection is redirected."""
+    configs = _configs()
+
+    reduced, contractions = contract_passthrough_nodes(configs)
+
+    assert contractions == (
+        Contraction(node="load_junction", connection="supply", kept="drop", far="bus", kept_end="source"),
+        Contraction(node="solar_junction", connection="inverter", kept="generation", far="bus", kept_end="target"),
+    )
+    by_name = {config["name"]: config for config in reduced}
+    assert set(by_name) == {"grid", "bus", "load", "solar", "import", "export", "drop", "generation"}
+    assert by_name["drop"]["source"] == "bus"  # type: ignore[typeddict-item]
+    assert by_name["generation"]["target"] == "bus"  # type: ignore[typeddict-item]
+    assert configs[9]["source"] == "load_junction"  # type: ignore[typeddict-item]
+
+
+def test_contracted_network_restores_original_outputs() -> None:
+    """The contracted solve has the same cost and reports every original element's power and prices."""
+    full_cost, full = _solve(_configs(), contract=False)
+    cost, contracted = _solve(_configs(), contract=True)
+
+    assert cost == pytest.approx(full_cost)
+    full_outputs = full.outputs()
+    outputs = contracted.outputs()
+    assert set(outputs) == set(full_outputs)
+    for name in ("load_junction", "supply", "solar_junction", "inverter"):
+        assert set(outputs[name]) == set(full_outputs[name])
+        for output_name, output in outputs[name].items():
+            expected = full_outputs[name][output_name]
+            assert isinstance(output, OutputData)
+            assert isinstance(expected, OutputData)
+            assert output.type == expected.type
+            assert output.values == pytest.approx(expected.values)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(
+            lambda configs: configs[8]["segments"]["efficiency"].update(efficiency=np.full(3, 0.95)), id="lossy"
+        ),
+        pytest.param(lambda configs: configs[8]["segments"]["power_limit"].update(fixed=True), id="fixed"),
+        pytest.param(lambda configs: configs[3].update(is_sink=True), id="sink"),
+        pytest.param(lambda configs: configs[3].update(inbound_tags={1}), id="tag_restricted"),
+        pytest.param(lambda configs: configs[8].update(tags={1, 2}), id="mismatched_tags"),
+        pytest.param(lambda configs: configs[1].update(outbound_tags={2}, inbound_tags={2}), id="far_blocks_tag"),
+        pytest.param(
+            lambda configs: configs.append({**_connection("spill", "bus", "grid"), "tags": {2}}),
+            id="far_carries_other_tags",
+        ),
+        pytest.param(
+            lambda configs: configs.append(
+                {
+                    "element_type": ELEMENT_TYPE_POLICY_PRICING,
+                    "name": "policy",
+                    "price": 0.1,
+                    "terms": [{"connection": "supply", "tag": 1}],
+                }
+            ),
+            id="policy_priced",
+        ),
+    ],
+)
+def test_contract_passthrough_nodes_keeps_junctions_that_matter(change: Any) -> None:
+    """A junction whose removal could change the LP or its prices stays."""
+    configs = _configs()
+    change(configs)
+
+    _reduced, contractions = contract_passthrough_nodes(configs)
+
+    assert "load_junction" not in {contraction.node for contraction in contractions}
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-from custom_components.haeo.core.model.elements.battery import Battery
+from custom_components.haeo.core.model.elements.battery import Battery, BoundedBattery
 
 from .element_types import ElementTestCase
 
@@ -108,7 +108,40 @@ VALID_CASES: list[ElementTestCase] = [
             "battery_soc_min": {"type": "shadow_price", "unit": "$/kWh", "values": (0.0, 0.0, 0.0)},
         },
     },
+    {
+        "description": "Battery discharge stops at minimum charge",
+        "factory": Battery,
+        "data": {
+            "name": "battery_minimum_charge",
+            "periods": np.array([1.0] * 3),
+            "capacity": 10.0,
+            "initial_charge": 8.0,
+            "minimum_charge": 3.0,
+        },
+        "inputs": {
+            "input_cost": 0.2,
+            "output_cost": np.array([0.0, 0.0, -0.1]),  # Discharging pays only in the last period
+        },
+        "expected_outputs": {
+            "battery_energy_stored": {"type": "energy", "unit": "kWh", "values": (8.0, 8.0, 8.0, 3.0)},
+            "battery_power_charge": {"type": "power", "unit": "kW", "values": (0.0, 0.0, 0.0)},
+            "battery_power_discharge": {"type": "power", "unit": "kW", "values": (0.0, 0.0, 5.0)},
+            "element_power_balance": {"type": "shadow_price", "unit": "$/kWh", "values": (0.1, 0.1, 0.1)},
+            "battery_energy_in_flow": {"type": "shadow_price", "unit": "$/kWh", "values": (0.0, 0.0, 0.0)},
+            "battery_energy_out_flow": {"type": "shadow_price", "unit": "$/kWh", "values": (0.0, 0.0, 0.0)},
+            "battery_soc_max": {"type": "shadow_price", "unit": "$/kWh", "values": (0.0, 0.0, 0.0)},
+            "battery_soc_min": {"type": "shadow_price", "unit": "$/kWh", "values": (0.0, 0.0, 0.1)},
+        },
+    },
 ]
 
+
+def _bounded(case: ElementTestCase) -> ElementTestCase:
+    """Return *case* for the bounded formulation, which must report the same outputs."""
+    return {**case, "description": f"{case['description']} (bounded formulation)", "factory": BoundedBattery}
+
+
+VALID_CASES.extend([_bounded(case) for case in VALID_CASES])
+
 INVALID_CASES: list[ElementTestCase] = []
 INVALID_MODEL_PARAMS: list[ElementTestCase] = []
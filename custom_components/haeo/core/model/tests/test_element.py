@@ -182,6 +182,60 @@ def test_multi_tag_outbound_does_not_duplicate_production(solver: Highs) -> None
     assert solver.val(produced[0]) == pytest.approx(10.0, abs=0.01)
 
 
+def test_single_tag_outbound_skips_decomposition(solver: Highs) -> None:
+    """A single outbound tag takes production directly without per-tag variables or rows."""
+    n = 2
+    node = Node(
+        name="src",
+        periods=np.array([1.0] * n),
+        solver=solver,
+        is_source=True,
+        is_sink=False,
+        outbound_tags={1},
+    )
+    conn = _make_mock_connection(solver, n, {1}, "c1")
+    node.register_connection(conn, "source")
+    columns = solver.numVariables
+
+    node.constraints()
+
+    assert node._produced_by_tag is None
+    assert solver.numVariables == columns
+
+    solver.addConstr(-conn.power_into_source_for_tag(1)[0] == 4)
+    produced = node.element_power_produced()
+    assert produced is not None
+    solver.minimize(produced[0])
+    assert solver.val(produced[0]) == pytest.approx(4.0, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    ("outbound_tags", "inbound_tags", "tag", "expected"),
+    [
+        (None, {1}, 2, True),
+        ({1}, None, 2, True),
+        ({1}, {2}, 2, True),
+        ({1}, {2}, 3, False),
+    ],
+    ids=["open-outbound", "open-inbound", "restricted-member", "restricted-outsider"],
+)
+def test_carries_tag(
+    solver: Highs, outbound_tags: set[int] | None, inbound_tags: set[int] | None, tag: int, expected: bool
+) -> None:
+    """Only tags outside both restricted tag sets are never carried."""
+    node = Node(
+        name="hub",
+        periods=np.array([1.0]),
+        solver=solver,
+        is_source=True,
+        is_sink=True,
+        outbound_tags=outbound_tags,
+        inbound_tags=inbound_tags,
+    )
+
+    assert node.carries_tag(tag) is expected
+
+
 # ---------------------------------------------------------------------------
 # #63 - Empty inbound/outbound forces consumption/production to zero
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Unit tests for Network class."""
 
 import logging
+from typing import Any
 from unittest.mock import Mock
 
 from highspy import Highs, HighsModelStatus
@@ -13,6 +14,7 @@ from custom_components.haeo.core.model.element import Element
 from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_BATTERY as ELEMENT_TYPE_BATTERY
 from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_CONNECTION as ELEMENT_TYPE_CONNECTION
 from custom_components.haeo.core.model.elements import MODEL_ELEMENT_TYPE_NODE as ELEMENT_TYPE_NODE
+from custom_components.haeo.core.model.elements.battery import BatteryFormulation, BoundedBattery
 from custom_components.haeo.core.model.elements.connection import Connection
 from custom_components.haeo.core.model.elements.policy_pricing import ELEMENT_TYPE as ELEMENT_TYPE_POLICY_PRICING
 from custom_components.haeo.core.model.elements.policy_pricing import PolicyPricingElementConfig, PolicyPricingTerm
@@ -20,10 +22,12 @@ from custom_components.haeo.core.model.network import (
     BlendedOptions,
     CalibratedOptions,
     LexOptions,
+    RowCompaction,
     SimplexTuning,
     SolveOptions,
     _bisect_boundary,
 )
+from custom_components.haeo.core.model.output_data import OutputData
 
 # Test constants
 HOURS_PER_DAY = 24
@@ -348,9 +352,12 @@ def test_network_optimize_raises_on_infeasible_network(
     monkeypatch.setattr(network._solver, "run", mock_run)
     monkeypatch.setattr(network._solver, "getModelStatus", mock_get_model_status)
 
+    assert not network.infeasible
+
     # This should raise ValueError with the error message from optimize()
     with pytest.raises(ValueError, match="Optimization failed with status:"):
         network.optimize()
+    assert network.infeasible
 
 
 def test_add_soc_pricing_connection() -> None:
@@ -607,6 +614,80 @@ def test_lex_mode_with_secondary_objective() -> None:
     assert np.isfinite(result)
 
 
+def _build_parallel_network(options: SolveOptions) -> Network:
+    """Build a source feeding a sink through several priced connections over a day."""
+    network = Network(name="test", periods=np.full(24, 0.5), options=options)
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "source", "is_source": True, "is_sink": False})
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "sink", "is_source": False, "is_sink": True})
+    for index in range(8):
+        network.add(
+            {
+                "element_type": ELEMENT_TYPE_CONNECTION,
+                "name": f"conn_{index}",
+                "source": "source",
+                "target": "sink",
+                "tags": {1},
+                "segments": {
+                    "power_limit": {"segment_type": "power_limit", "max_power": np.full(24, 1.0)},
+                    "pricing": {"segment_type": "pricing", "price": np.full(24, -0.1 * (index % 3))},
+                },
+            }
+        )
+    return network
+
+
+def test_normalized_secondary_objective_bounds_coefficient_spread() -> None:
+    """The normalized time preference keeps the primary optimum with a spread independent of size."""
+    indexed = _build_parallel_network(LexOptions())
+    normalized = _build_parallel_network(LexOptions(secondary_objective="normalized"))
+
+    assert normalized.optimize() == pytest.approx(indexed.optimize())
+
+    assert indexed.objective_spread is not None
+    assert normalized.objective_spread is not None
+    assert normalized.objective_spread.primary == pytest.approx(indexed.objective_spread.primary)
+    assert indexed.objective_spread.secondary == pytest.approx(8 * 24)
+    assert normalized.objective_spread.secondary < 2.0
+
+
+def test_compaction_deletes_rows_of_constraints_that_no_longer_apply() -> None:
+    """Rows freed by a removed limit are deleted once basic, and the remaining rows keep solving correctly."""
+    network = Network(name="test", periods=np.full(24, 0.5), options=LexOptions(compaction_threshold=0.05))
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "source", "is_source": True, "is_sink": False})
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "sink", "is_source": False, "is_sink": True})
+    connection = network.add(
+        {
+            "element_type": ELEMENT_TYPE_CONNECTION,
+            "name": "conn",
+            "source": "source",
+            "target": "sink",
+            "tags": {1, 2},
+            "segments": {
+                "limit": {"segment_type": "power_limit", "max_power": np.full(24, 2.0)},
+                "cap": {"segment_type": "power_limit", "max_power": np.full(24, 10.0)},
+                "pricing": {"segment_type": "pricing", "price": np.full(24, -1.0)},
+            },
+        }
+    )
+    limit = connection.segments["limit"]
+    assert network.optimize() == pytest.approx(-24.0)
+    rows = network._solver.getNumRow()
+
+    # The freed rows were binding in the last basis, so they wait for a solve to make them basic
+    limit.max_power = None  # type: ignore[attr-defined]
+    assert network.optimize() == pytest.approx(-120.0)
+    assert network.row_compaction == RowCompaction(threshold=0.05, dead_rows=24, compactions=0)
+
+    assert network.optimize() == pytest.approx(-120.0)
+    assert network.row_compaction == RowCompaction(threshold=0.05, dead_rows=0, compactions=1)
+    assert network._solver.getNumRow() == rows - 24
+
+    limit.max_power = np.full(24, 3.0)  # type: ignore[attr-defined]
+    assert network.optimize() == pytest.approx(-36.0)
+    assert network._solver.getNumRow() == rows
+    np.testing.assert_allclose(network.outputs()["conn"]["connection_power"].values, 3.0, atol=1e-4)
+
+
 def test_lex_mode_warm_resolve_with_duplicate_coefficients() -> None:
     """Re-optimizing in lex mode must survive primary expressions with repeated var idxs.
 
@@ -805,3 +886,154 @@ def test_add_policy_pricing_unknown_tag() -> None:
                 terms=[PolicyPricingTerm(connection="conn", tag=99)],
             )
         )
+
+
+def test_connection_tags_pruned_to_carried_tags() -> None:
+    """Tags an endpoint can never carry get no flow variables and their policy terms are dropped."""
+    network = Network(name="test", periods=np.array([1.0]))
+    network.add(
+        {
+            "element_type": ELEMENT_TYPE_NODE,
+            "name": "grid",
+            "is_source": True,
+            "is_sink": True,
+            "outbound_tags": {1},
+            "inbound_tags": {1},
+        }
+    )
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "load", "is_source": False, "is_sink": True})
+    conn = network.add(
+        {
+            "element_type": ELEMENT_TYPE_CONNECTION,
+            "name": "conn",
+            "source": "grid",
+            "target": "load",
+            "tags": {1, 2},
+            "segments": {
+                "power_limit": {"segment_type": "power_limit", "max_power": np.array([10.0])},
+            },
+        }
+    )
+    assert conn.connection_tags() == {1}
+
+    pricing = network.add(
+        PolicyPricingElementConfig(
+            element_type=ELEMENT_TYPE_POLICY_PRICING,
+            name="pp",
+            price=0.05,
+            terms=[PolicyPricingTerm(connection="conn", tag=2)],
+        )
+    )
+    assert pricing.pricing_cost() is None
+
+
+def _build_battery_network(formulation: BatteryFormulation) -> Network:
+    """Build a grid-tied battery and fixed load on a bus, with SOC pricing and salvage value."""
+    periods = np.array([1.0, 0.5, 1.0, 2.0])
+    network = Network(name="test", periods=periods, options=LexOptions(), battery_formulation=formulation)
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "grid", "is_source": True, "is_sink": True})
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "bus", "is_source": False, "is_sink": False})
+    network.add({"element_type": ELEMENT_TYPE_NODE, "name": "load", "is_source": False, "is_sink": True})
+    network.add(
+        {
+            "element_type": ELEMENT_TYPE_BATTERY,
+            "name": "battery",
+            "capacity": np.array([10.0, 5.0, 8.0, 10.0, 10.0]),
+            "initial_charge": 4.0,
+            "minimum_charge": 1.0,
+            "salvage_value": 0.05,
+        }
+    )
+    links: dict[str, tuple[str, str, dict[str, Any]]] = {
+        "import": ("grid", "bus", {"segment_type": "pricing", "price": np.array([0.1, 0.4, 0.3, 0.05])}),
+        "export": ("bus", "grid", {"segment_type": "pricing", "price": np.array([-0.02, -0.03, -0.02, -0.01])}),
+        "demand": (
+            "bus",
+            "load",
+            {"segment_type": "power_limit", "max_power": np.array([2.0, 3.0, 1.0, 2.0]), "fixed": True},
+        ),
+        "charge": ("bus", "battery", {"segment_type": "power_limit", "max_power": np.array([5.0] * 4)}),
+        "discharge": ("battery", "bus", {"segment_type": "power_limit", "max_power": np.array([2.5] * 4)}),
+    }
+    for name, (source, target, segment) in links.items():
+        segments: dict[str, Any] = {"main": segment}
+        if name == "discharge":
+            segments["soc"] = {
+                "segment_type": "soc_pricing",
+                "discharge_energy_threshold": np.array([3.0] * 4),
+                "discharge_energy_price": np.array([0.15] * 4),
+            }
+        network.add(
+            {
+                "element_type": ELEMENT_TYPE_CONNECTION,
+                "name": name,
+                "source": source,
+                "target": target,
+                "tags": {1},
+                "segments": segments,
+            }
+        )
+    return network
+
+
+def test_bounded_battery_formulation_matches_cumulative() -> None:
+    """Both battery formulations give the same cost and outputs with fewer rows for the bounded one."""
+    cumulative = _build_battery_network("cumulative")
+    bounded = _build_battery_network("bounded")
+
+    assert bounded.optimize() == pytest.approx(cumulative.optimize())
+
+    assert isinstance(bounded.elements["battery"], BoundedBattery)
+    assert bounded._solver.getNumRow() < cumulative._solver.getNumRow()
+    expected_outputs = cumulative.outputs()
+    outputs = bounded.outputs()
+    for name in ("battery", "bus", "load"):
+        assert set(outputs[name]) == set(expected_outputs[name])
+        for output_name, output in outputs[name].items():
+            expected = expected_outputs[name][output_name]
+            assert isinstance(output, OutputData)
+            assert isinstance(expected, OutputData)
+            assert output.values == pytest.approx(expected.values, abs=1e-4), f"{name}.{output_name}"
+
+
+def test_remove_and_readd_elements_matches_fresh_build() -> None:
+    """Removing elements from a solved network and adding them back matches fresh builds of each topology."""
+    network = _build_battery_network("cumulative")
+    full_cost = network.optimize()
+    removed = ("discharge", "charge", "battery")
+    configs = {name: network.element_configs[name] for name in removed}
+    bus = network.elements["bus"]
+
+    for name in removed:
+        network.remove(name)
+
+    fresh = Network(name="fresh", periods=network.periods, options=LexOptions())
+    for config in network.element_configs.values():
+        fresh.add(config)
+    assert set(network.elements) == set(fresh.elements)
+    assert network.optimize() == pytest.approx(fresh.optimize())
+    assert network.elements["bus"] is bus
+
+    for name in reversed(removed):
+        network.add(configs[name])
+
+    assert network.optimize() == pytest.approx(full_cost)
+    expected_network = _build_battery_network("cumulative")
+    expected_network.optimize()
+    expected_outputs = expected_network.outputs()
+    outputs = network.outputs()
+    for name in ("battery", "bus"):
+        for output_name, output in outputs[name].items():
+            expected = expected_outputs[name][output_name]
+            assert isinstance(output, OutputData)
+            assert isinstance(expected, OutputData)
+            assert output.values == pytest.approx(expected.values, abs=1e-4), f"{name}.{output_name}"
+
+
+def test_remove_connected_element_raises() -> None:
+    """An element cannot be removed while connections still attach to it."""
+    network = _build_battery_network("cumulative")
+
+    with pytest.raises(ValueError, match="battery"):
+        network.remove("battery")
+    assert "battery" in network.elements
@@ -1,5 +1,7 @@
 """Element schema definitions for HAEO integration."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final
 
 from custom_components.haeo.core.schema.elements.battery import BatteryConfigData, BatteryConfigSchema
@@ -15,6 +17,12 @@ from custom_components.haeo.core.schema.elements.load import LoadConfigData, Loa
 from custom_components.haeo.core.schema.elements.node import NodeConfigData, NodeConfigSchema
 from custom_components.haeo.core.schema.elements.policy import PolicyConfigData, PolicyConfigSchema
 from custom_components.haeo.core.schema.elements.solar import SolarConfigData, SolarConfigSchema
+from custom_components.haeo.core.schema.field_hints import (
+    FieldHint,
+    ListFieldHints,
+    extract_field_hints,
+    extract_list_field_hints,
+)
 
 ElementConfigSchema = (
     InverterConfigSchema
@@ -52,9 +60,29 @@ ELEMENT_CONFIG_SCHEMAS: Final[dict[ElementType, type]] = {
     ElementType.SOLAR: SolarConfigSchema,
 }
 
+# Field hints per element type, extracted once at import. Extraction reflects
+# over the schema annotations, which is too slow to repeat on every load.
+ELEMENT_FIELD_HINTS: Final[Mapping[ElementType, Mapping[str, Mapping[str, FieldHint]]]] = MappingProxyType(
+    {
+        element_type: MappingProxyType(
+            {section: MappingProxyType(fields) for section, fields in extract_field_hints(schema_cls).items()}
+        )
+        for element_type, schema_cls in ELEMENT_CONFIG_SCHEMAS.items()
+    }
+)
+
+ELEMENT_LIST_FIELD_HINTS: Final[Mapping[ElementType, Mapping[str, ListFieldHints]]] = MappingProxyType(
+    {
+        element_type: MappingProxyType(extract_list_field_hints(schema_cls))
+        for element_type, schema_cls in ELEMENT_CONFIG_SCHEMAS.items()
+    }
+)
+
 
 __all__ = [
     "ELEMENT_CONFIG_SCHEMAS",
+    "ELEMENT_FIELD_HINTS",
+    "ELEMENT_LIST_FIELD_HINTS",
     "ElementConfigData",
     "ElementConfigSchema",
     "ElementType",
@@ -1,6 +1,7 @@
 """Core state interfaces used across the optimization pipeline."""
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from datetime import datetime
 from typing import Any, Protocol
 
 
@@ -22,6 +23,11 @@ class EntityState(Protocol):
         """Entity attributes."""
         ...
 
+    @property
+    def last_updated(self) -> datetime | None:
+        """Time of the last state or attribute change, or None when unknown."""
+        ...
+
     def as_dict(self) -> dict[str, Any]:
         """Return serialized state representation."""
         ...
@@ -35,4 +41,24 @@ class StateMachine(Protocol):
         ...
 
 
-__all__ = ["EntityState", "StateMachine"]
+class StateSnapshot:
+    """State machine frozen to the states of a fixed set of entities.
+
+    Lets data loading run off the event loop against states captured on it.
+    """
+
+    def __init__(self, states: Mapping[str, EntityState]) -> None:
+        """Initialize the snapshot from captured states."""
+        self._states = dict(states)
+
+    @classmethod
+    def capture(cls, sm: StateMachine, entity_ids: Iterable[str]) -> "StateSnapshot":
+        """Capture the current states of *entity_ids* from *sm*."""
+        return cls({entity_id: state for entity_id in entity_ids if (state := sm.get(entity_id)) is not None})
+
+    def get(self, entity_id: str) -> EntityState | None:
+        """Return the captured state for *entity_id* when available."""
+        return self._states.get(entity_id)
+
+
+__all__ = ["EntityState", "StateMachine", "StateSnapshot"]
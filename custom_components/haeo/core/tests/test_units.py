@@ -6,6 +6,7 @@ from custom_components.haeo.core.units import (
     DeviceClass,
     UnitOfMeasurement,
     _convert_value,
+    base_unit_conversion,
     base_unit_for_device_class,
     convert_to_base_unit,
 )
@@ -111,3 +112,25 @@ def test_convert_to_base_unit(
     assert result_value == pytest.approx(expected_value)
     assert result_unit == expected_unit
     assert result_device_class == expected_device_class
+
+
+@pytest.mark.parametrize(
+    ("unit", "device_class", "expected"),
+    [
+        ("W", "power", (0.001, UnitOfMeasurement.KILO_WATT, DeviceClass.POWER)),
+        ("MWh", None, (1000.0, UnitOfMeasurement.KILO_WATT_HOUR, None)),
+        ("kW", None, (1.0, UnitOfMeasurement.KILO_WATT, None)),
+        ("%", None, (1.0, UnitOfMeasurement.PERCENT, None)),
+        ("unknown_unit", None, (1.0, "unknown_unit", None)),
+    ],
+)
+def test_base_unit_conversion(
+    unit: str,
+    device_class: str | None,
+    expected: tuple[float, UnitOfMeasurement | str | None, DeviceClass | None],
+) -> None:
+    """Series conversion resolves the same factor and base unit as per-value conversion."""
+    assert base_unit_conversion(unit, device_class) == expected
+    converted, base_unit, parsed_device_class = convert_to_base_unit(3.0, unit, device_class)
+    assert converted == 3.0 * expected[0]
+    assert (base_unit, parsed_device_class) == expected[1:]
@@ -103,29 +103,54 @@ def base_unit_for_device_class(device_class: DeviceClass | None) -> UnitOfMeasur
     return BASE_UNITS.get(device_class) if device_class is not None else None
 
 
-def _convert_value(
-    value: float,
+def _conversion_factor(
     from_unit: UnitOfMeasurement | None,
     device_class: DeviceClass | None,
 ) -> float:
-    """Convert *value* expressed in *from_unit* to the canonical base unit."""
+    """Return the multiplier converting values in *from_unit* to the canonical base unit."""
     if from_unit is None:
-        return value
+        return 1.0
 
     effective_device_class = device_class or _infer_device_class_from_unit(from_unit)
     base_unit = base_unit_for_device_class(effective_device_class)
     if base_unit is None or base_unit == from_unit:
-        return value
+        return 1.0
 
     if effective_device_class == DeviceClass.POWER:
-        factor = _POWER_TO_KW.get(from_unit)
-        return value * factor if factor is not None else value
+        return _POWER_TO_KW.get(from_unit, 1.0)
 
     if effective_device_class in {DeviceClass.ENERGY, DeviceClass.ENERGY_STORAGE}:
-        factor = _ENERGY_TO_KWH.get(from_unit)
-        return value * factor if factor is not None else value
+        return _ENERGY_TO_KWH.get(from_unit, 1.0)
+
+    return 1.0
+
+
+def _convert_value(
+    value: float,
+    from_unit: UnitOfMeasurement | None,
+    device_class: DeviceClass | None,
+) -> float:
+    """Convert *value* expressed in *from_unit* to the canonical base unit."""
+    factor = _conversion_factor(from_unit, device_class)
+    return value * factor if factor != 1.0 else value
+
+
+def base_unit_conversion(
+    unit: str | UnitOfMeasurement | None,
+    device_class: str | DeviceClass | None,
+) -> tuple[float, UnitOfMeasurement | str | None, DeviceClass | None]:
+    """Resolve the base unit multiplier once, parsing string unit/device_class if needed.
+
+    Series callers multiply every value by the returned factor instead of converting point by point.
+    """
+    parsed_unit = UnitOfMeasurement.of(unit)
+    parsed_device_class = DeviceClass.of(device_class)
+    effective_device_class = parsed_device_class or _infer_device_class_from_unit(parsed_unit)
+
+    factor = _conversion_factor(parsed_unit, parsed_device_class)
+    base_unit = base_unit_for_device_class(effective_device_class) or parsed_unit or unit
 
-    return value
+    return factor, base_unit, parsed_device_class
 
 
 def convert_to_base_unit(
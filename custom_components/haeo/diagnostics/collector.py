@@ -16,6 +16,8 @@ from custom_components.haeo import HaeoConfigEntry, HaeoRuntimeData
 from custom_components.haeo.const import ELEMENT_TYPE_NETWORK
 from custom_components.haeo.core.const import CONF_ELEMENT_TYPE, CONF_NAME
 from custom_components.haeo.core.context import OptimizationContext
+from custom_components.haeo.core.model.aggregation import PeriodAggregation
+from custom_components.haeo.core.model.network import ObjectiveSpread, RowCompaction
 from custom_components.haeo.core.schema import SchemaValue, is_schema_value
 from custom_components.haeo.core.schema.elements import ElementConfigSchema
 from custom_components.haeo.diagnostics.recorder_history import get_significant_states_full
@@ -88,6 +90,12 @@ class DiagnosticsResult:
     missing_entity_ids: tuple[str, ...]
     """Entity IDs that were expected but not found in the recorder."""
 
+    aggregation: dict[str, Any] | None = None
+    """Period aggregation summary of the solve (None when disabled or historical)."""
+
+    solver: dict[str, Any] | None = None
+    """Solver conditioning summary of the solve (None for historical diagnostics)."""
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a JSON-compatible dict for HA diagnostics output."""
         data: dict[str, Any] = {
@@ -97,6 +105,10 @@ class DiagnosticsResult:
         }
         if self.outputs is not None:
             data["outputs"] = self.outputs
+        if self.aggregation is not None:
+            data["aggregation"] = self.aggregation
+        if self.solver is not None:
+            data["solver"] = self.solver
         return data
 
 
@@ -315,6 +327,36 @@ async def _build_environment(
     )
 
 
+def _aggregation_summary(aggregation: PeriodAggregation | None) -> dict[str, Any] | None:
+    """Summarize how many periods the solve merged."""
+    if aggregation is None:
+        return None
+    return {
+        "original_periods": aggregation.n_periods,
+        "aggregated_periods": aggregation.n_aggregated,
+        "reduction_ratio": round(aggregation.reduction_ratio, 4),
+    }
+
+
+def _solver_summary(
+    objective_spread: ObjectiveSpread | None, row_compaction: RowCompaction | None
+) -> dict[str, Any] | None:
+    """Summarize the conditioning and compaction of the solved LP."""
+    summary: dict[str, Any] = {}
+    if objective_spread is not None:
+        summary["objective_spread"] = {
+            "primary": round(objective_spread.primary, 4),
+            "secondary": round(objective_spread.secondary, 4),
+        }
+    if row_compaction is not None:
+        summary["row_compaction"] = {
+            "threshold": row_compaction.threshold,
+            "dead_rows": row_compaction.dead_rows,
+            "compactions": row_compaction.compactions,
+        }
+    return summary or None
+
+
 def _to_local_iso(dt: datetime) -> str:
     """Format a datetime as a local-timezone ISO 8601 string."""
     return dt_util.as_local(dt).isoformat()
@@ -358,6 +400,8 @@ async def collect_diagnostics(
         optimization_start_time = _to_local_iso(started_at)
         optimization_end_time = _to_local_iso(completed_at)
         outputs = None
+        aggregation = None
+        solver = None
     else:
         runtime_data = config_entry.runtime_data
         if (
@@ -379,6 +423,8 @@ async def collect_diagnostics(
         optimization_end_time = _to_local_iso(coordinator_data.completed_at)
         horizon_start = _to_local_iso(coordinator_data.context.horizon_start)
         outputs = get_output_sensors(hass, config_entry)
+        aggregation = _aggregation_summary(coordinator_data.aggregation)
+        solver = _solver_summary(coordinator_data.objective_spread, coordinator_data.row_compaction)
 
     environment = await _build_environment(
         hass,
@@ -396,6 +442,8 @@ async def collect_diagnostics(
         inputs=inputs,
         outputs=outputs,
         missing_entity_ids=tuple(missing),
+        aggregation=aggregation,
+        solver=solver,
     )
 
 
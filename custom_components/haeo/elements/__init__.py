@@ -23,7 +23,7 @@ Sub-element Naming Convention:
         - "home_battery:connection" (implicit connection to network)
 """
 
-from collections.abc import Mapping, MutableSequence, Sequence
+from collections.abc import Iterable, Mapping, MutableSequence, Sequence
 import logging
 import types
 from typing import (
@@ -102,6 +102,8 @@ from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES, is_elem
 from custom_components.haeo.core.const import CONF_ELEMENT_TYPE
 from custom_components.haeo.core.schema.elements import (
     ELEMENT_CONFIG_SCHEMAS,
+    ELEMENT_FIELD_HINTS,
+    ELEMENT_LIST_FIELD_HINTS,
     ElementConfigData,
     ElementConfigSchema,
     ElementType,
@@ -129,11 +131,7 @@ from custom_components.haeo.core.schema.elements.node import NodeConfigData
 from custom_components.haeo.core.schema.elements.policy import PolicyConfigData
 from custom_components.haeo.core.schema.elements.solar import OPTIONAL_INPUT_FIELDS as SOLAR_OPTIONAL_INPUT_FIELDS
 from custom_components.haeo.core.schema.elements.solar import SolarConfigData
-from custom_components.haeo.core.schema.field_hints import (
-    SurfacedPriceHint,
-    extract_field_hints,
-    extract_list_field_hints,
-)
+from custom_components.haeo.core.schema.field_hints import SurfacedPriceHint
 from custom_components.haeo.elements.field_hints import build_input_fields, build_list_input_fields
 
 from .field_schema import FieldSchemaInfo
@@ -408,11 +406,18 @@ def is_element_config_data(value: Any) -> TypeGuard[ElementConfigData]:
     return _conforms_to_typed_dict(value, data_cls, check_optional=True)
 
 
-def collect_element_subentries(entry: ConfigEntry) -> list[ValidatedElementSubentry]:
-    """Return validated element subentries excluding the network element."""
+def collect_element_subentries(
+    entry: ConfigEntry,
+    subentries: Iterable[ConfigSubentry] | None = None,
+) -> list[ValidatedElementSubentry]:
+    """Return validated element subentries excluding the network element.
+
+    ``subentries`` defaults to the entry's current subentries; pass an earlier
+    view of them to collect the elements a set of input stores was built from.
+    """
     result: list[ValidatedElementSubentry] = []
 
-    for subentry in entry.subentries.values():
+    for subentry in entry.subentries.values() if subentries is None else subentries:
         if subentry.subentry_type not in ELEMENT_TYPES:
             # Not an element type (e.g., network) - skip silently
             continue
@@ -479,8 +484,7 @@ def get_input_fields(element_type: str | ElementType | Mapping[str, Any] | None)
     if element_type is None:
         return {}
 
-    schema_cls = ELEMENT_CONFIG_SCHEMAS[element_type]  # type: ignore[index]
-    return build_input_fields(str(element_type), extract_field_hints(schema_cls))
+    return build_input_fields(str(element_type), ELEMENT_FIELD_HINTS[element_type])  # type: ignore[index]
 
 
 def get_list_input_fields(element_config: Mapping[str, Any]) -> InputFieldGroups:
@@ -495,11 +499,7 @@ def get_list_input_fields(element_config: Mapping[str, Any]) -> InputFieldGroups
     if not is_element_type(element_type):
         return {}
 
-    schema_cls = ELEMENT_CONFIG_SCHEMAS.get(element_type)
-    if schema_cls is None:
-        return {}
-
-    list_hints = extract_list_field_hints(schema_cls)
+    list_hints = ELEMENT_LIST_FIELD_HINTS.get(element_type)
     if not list_hints:
         return {}
 
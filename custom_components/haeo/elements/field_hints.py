@@ -88,7 +88,7 @@ OUTPUT_TYPE_DEFAULTS: dict[OutputType, OutputTypeMetadata] = {
 
 def build_input_fields(
     element_type: str,
-    field_hints: dict[str, dict[str, FieldHint]],
+    field_hints: Mapping[str, Mapping[str, FieldHint]],
 ) -> dict[str, dict[str, InputFieldInfo[Any]]]:
     """Transform schema field hints into full HA InputFieldInfo objects."""
     result: dict[str, dict[str, InputFieldInfo[Any]]] = {}
@@ -253,9 +253,18 @@ class HaeoInputNumber(NumberEntity):
                 self._store.refresh()
             self._sync_from_store()
             self.async_write_ha_state()
-        else:
+        elif not self._hub_reloads_store():
             self.hass.async_create_task(self._async_load_sync_and_update())
 
+    def _hub_reloads_store(self) -> bool:
+        """Return True when the hub's batch reloader refreshes this store on horizon changes.
+
+        The entity then syncs through its store listener instead of loading itself.
+        """
+        runtime_data = self._config_entry.runtime_data
+        reloader = runtime_data.input_reloader if runtime_data is not None else None
+        return reloader is not None and self._store in reloader.stores
+
     @callback
     def _handle_store_change(self) -> None:
         """Handle a value change made through another entity sharing this store."""
@@ -280,8 +289,11 @@ class HaeoInputNumber(NumberEntity):
         Returns True if loading succeeded and state was synced.
         """
         sm = HomeAssistantStateMachine(self.hass)
+        load = await self._store.async_resolve(sm)
+        # Suppress only while applying: a newer load applied during the await
+        # must still reach this entity through its store listener.
         with self._suppress_self_notifications():
-            loaded = await self._store.async_load(sm)
+            loaded = self._store.apply_load(load)
         if not loaded:
             return False
         self._sync_from_store()
@@ -17,7 +17,12 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.haeo.const import DOMAIN
-from custom_components.haeo.core.const import CONF_HORIZON_PRESET, CONF_NAME
+from custom_components.haeo.core.const import (
+    CONF_HORIZON_PRESET,
+    CONF_MAX_SOLVE_BLOCK_DURATION,
+    CONF_NAME,
+    CONF_TARGET_SOLVE_TIME,
+)
 from custom_components.haeo.entities.haeo_horizon import HaeoHorizonEntity
 from custom_components.haeo.flows import (
     HORIZON_PRESET_5_DAYS,
@@ -25,7 +30,7 @@ from custom_components.haeo.flows import (
     HUB_SECTION_COMMON,
     HUB_SECTION_TIERS,
 )
-from custom_components.haeo.horizon import HorizonManager
+from custom_components.haeo.horizon import SOLVE_TIME_WINDOW, HorizonManager
 
 ADELAIDE = ZoneInfo("Australia/Adelaide")
 T4_PERIOD_SECONDS = 3600
@@ -548,3 +553,71 @@ async def test_horizon_manager_resume_restarts_timer(
 
     # Clean up
     manager.stop()
+
+
+def test_horizon_manager_ignores_solve_times_without_target(
+    hass: HomeAssistant,
+    horizon_manager: HorizonManager,
+) -> None:
+    """Without a target solve time the solve resolution never changes."""
+    for _ in range(SOLVE_TIME_WINDOW * 2):
+        horizon_manager.record_solve_time(60.0)
+
+    assert horizon_manager.solve_block_seconds is None
+
+
+def test_horizon_manager_adapts_solve_blocks_to_target(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Slow solves double the solve block up to the configured bound, fast solves halve it again.
+
+    The first solve at each solve block builds its LP and is not counted.
+    """
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data={
+            **config_entry.data,
+            HUB_SECTION_ADVANCED: {CONF_TARGET_SOLVE_TIME: 1.0, CONF_MAX_SOLVE_BLOCK_DURATION: 60},
+        },
+    )
+    manager = HorizonManager(hass, config_entry)
+
+    blocks = []
+    for _ in range(3):
+        for _ in range(SOLVE_TIME_WINDOW + 1):
+            manager.record_solve_time(2.0)
+        blocks.append(manager.solve_block_seconds)
+    assert blocks == [1800, 3600, 3600]
+
+    # Solves within the target but without headroom keep the current blocks
+    for _ in range(SOLVE_TIME_WINDOW + 1):
+        manager.record_solve_time(0.8)
+    assert manager.solve_block_seconds == 3600
+
+    blocks = []
+    for _ in range(2):
+        for _ in range(SOLVE_TIME_WINDOW + 1):
+            manager.record_solve_time(0.1)
+        blocks.append(manager.solve_block_seconds)
+    assert blocks == [1800, None]
+
+
+def test_horizon_manager_leaves_out_the_build_at_each_solve_block(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """The slow first solve at each solve block, which builds its LP, does not move the solve block."""
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data={
+            **config_entry.data,
+            HUB_SECTION_ADVANCED: {CONF_TARGET_SOLVE_TIME: 1.0, CONF_MAX_SOLVE_BLOCK_DURATION: 60},
+        },
+    )
+    manager = HorizonManager(hass, config_entry)
+
+    manager.record_solve_time(30.0)
+    for _ in range(SOLVE_TIME_WINDOW):
+        manager.record_solve_time(0.8)
+    assert manager.solve_block_seconds is None
@@ -22,9 +22,14 @@ import voluptuous as vol
 from custom_components.haeo.const import CONF_RECORD_FORECASTS
 from custom_components.haeo.core.const import (
     CONF_ADVANCED_MODE,
+    CONF_AGGREGATE_PERIODS,
+    CONF_BOUNDED_BATTERIES,
     CONF_DEBOUNCE_SECONDS,
     CONF_HORIZON_PRESET,
+    CONF_MAX_SOLVE_BLOCK_DURATION,
     CONF_NAME,
+    CONF_NORMALIZED_TIME_PREFERENCE,
+    CONF_TARGET_SOLVE_TIME,
     CONF_TIER_1_COUNT,
     CONF_TIER_1_DURATION,
     CONF_TIER_2_COUNT,
@@ -33,7 +38,10 @@ from custom_components.haeo.core.const import (
     CONF_TIER_3_DURATION,
     CONF_TIER_4_COUNT,
     CONF_TIER_4_DURATION,
+    CONF_TWO_STAGE_SOLVE,
     DEFAULT_DEBOUNCE_SECONDS,
+    DEFAULT_MAX_SOLVE_BLOCK_DURATION,
+    DEFAULT_TARGET_SOLVE_TIME,
     DEFAULT_TIER_1_COUNT,
     DEFAULT_TIER_1_DURATION,
     DEFAULT_TIER_2_COUNT,
@@ -291,7 +299,17 @@ def get_hub_options_schema(config_entry: ConfigEntry) -> vol.Schema:
         ),
         SectionDefinition(
             key=HUB_SECTION_ADVANCED,
-            fields=(CONF_DEBOUNCE_SECONDS, CONF_ADVANCED_MODE, CONF_RECORD_FORECASTS),
+            fields=(
+                CONF_DEBOUNCE_SECONDS,
+                CONF_ADVANCED_MODE,
+                CONF_AGGREGATE_PERIODS,
+                CONF_TWO_STAGE_SOLVE,
+                CONF_TARGET_SOLVE_TIME,
+                CONF_MAX_SOLVE_BLOCK_DURATION,
+                CONF_BOUNDED_BATTERIES,
+                CONF_NORMALIZED_TIME_PREFERENCE,
+                CONF_RECORD_FORECASTS,
+            ),
             collapsed=True,
         ),
     )
@@ -328,6 +346,58 @@ def get_hub_options_schema(config_entry: ConfigEntry) -> vol.Schema:
                 ),
                 bool,
             ),
+            CONF_AGGREGATE_PERIODS: (
+                vol.Required(
+                    CONF_AGGREGATE_PERIODS,
+                    default=advanced_data.get(CONF_AGGREGATE_PERIODS, False),
+                ),
+                bool,
+            ),
+            CONF_TWO_STAGE_SOLVE: (
+                vol.Required(
+                    CONF_TWO_STAGE_SOLVE,
+                    default=advanced_data.get(CONF_TWO_STAGE_SOLVE, False),
+                ),
+                bool,
+            ),
+            CONF_TARGET_SOLVE_TIME: (
+                vol.Required(
+                    CONF_TARGET_SOLVE_TIME,
+                    default=advanced_data.get(CONF_TARGET_SOLVE_TIME, DEFAULT_TARGET_SOLVE_TIME),
+                ),
+                vol.All(
+                    NumberSelector(
+                        NumberSelectorConfig(min=0, max=300, step=0.5, mode=NumberSelectorMode.BOX),
+                    ),
+                    vol.Coerce(float),
+                ),
+            ),
+            CONF_MAX_SOLVE_BLOCK_DURATION: (
+                vol.Required(
+                    CONF_MAX_SOLVE_BLOCK_DURATION,
+                    default=advanced_data.get(CONF_MAX_SOLVE_BLOCK_DURATION, DEFAULT_MAX_SOLVE_BLOCK_DURATION),
+                ),
+                vol.All(
+                    NumberSelector(
+                        NumberSelectorConfig(min=60, max=1440, step=30, mode=NumberSelectorMode.BOX),
+                    ),
+                    vol.Coerce(int),
+                ),
+            ),
+            CONF_BOUNDED_BATTERIES: (
+                vol.Required(
+                    CONF_BOUNDED_BATTERIES,
+                    default=advanced_data.get(CONF_BOUNDED_BATTERIES, False),
+                ),
+                bool,
+            ),
+            CONF_NORMALIZED_TIME_PREFERENCE: (
+                vol.Required(
+                    CONF_NORMALIZED_TIME_PREFERENCE,
+                    default=advanced_data.get(CONF_NORMALIZED_TIME_PREFERENCE, False),
+                ),
+                bool,
+            ),
             CONF_RECORD_FORECASTS: (
                 vol.Required(
                     CONF_RECORD_FORECASTS,
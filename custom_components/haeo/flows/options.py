@@ -7,7 +7,19 @@ from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
 
 from custom_components.haeo.const import CONF_RECORD_FORECASTS
-from custom_components.haeo.core.const import CONF_ADVANCED_MODE, CONF_DEBOUNCE_SECONDS, CONF_HORIZON_PRESET
+from custom_components.haeo.core.const import (
+    CONF_ADVANCED_MODE,
+    CONF_AGGREGATE_PERIODS,
+    CONF_BOUNDED_BATTERIES,
+    CONF_DEBOUNCE_SECONDS,
+    CONF_HORIZON_PRESET,
+    CONF_MAX_SOLVE_BLOCK_DURATION,
+    CONF_NORMALIZED_TIME_PREFERENCE,
+    CONF_TARGET_SOLVE_TIME,
+    CONF_TWO_STAGE_SOLVE,
+    DEFAULT_MAX_SOLVE_BLOCK_DURATION,
+    DEFAULT_TARGET_SOLVE_TIME,
+)
 
 from . import (
     HORIZON_PRESET_CUSTOM,
@@ -77,6 +89,18 @@ class HubOptionsFlow(config_entries.OptionsFlow):
                 **self.config_entry.data.get(HUB_SECTION_ADVANCED, {}),
                 CONF_DEBOUNCE_SECONDS: self._user_input[HUB_SECTION_ADVANCED][CONF_DEBOUNCE_SECONDS],
                 CONF_ADVANCED_MODE: self._user_input[HUB_SECTION_ADVANCED][CONF_ADVANCED_MODE],
+                CONF_AGGREGATE_PERIODS: self._user_input[HUB_SECTION_ADVANCED].get(CONF_AGGREGATE_PERIODS, False),
+                CONF_TWO_STAGE_SOLVE: self._user_input[HUB_SECTION_ADVANCED].get(CONF_TWO_STAGE_SOLVE, False),
+                CONF_TARGET_SOLVE_TIME: self._user_input[HUB_SECTION_ADVANCED].get(
+                    CONF_TARGET_SOLVE_TIME, DEFAULT_TARGET_SOLVE_TIME
+                ),
+                CONF_MAX_SOLVE_BLOCK_DURATION: self._user_input[HUB_SECTION_ADVANCED].get(
+                    CONF_MAX_SOLVE_BLOCK_DURATION, DEFAULT_MAX_SOLVE_BLOCK_DURATION
+                ),
+                CONF_BOUNDED_BATTERIES: self._user_input[HUB_SECTION_ADVANCED].get(CONF_BOUNDED_BATTERIES, False),
+                CONF_NORMALIZED_TIME_PREFERENCE: self._user_input[HUB_SECTION_ADVANCED].get(
+                    CONF_NORMALIZED_TIME_PREFERENCE, False
+                ),
             },
             CONF_RECORD_FORECASTS: self._user_input[HUB_SECTION_ADVANCED].get(CONF_RECORD_FORECASTS, False),
         }
@@ -9,22 +9,42 @@ The HorizonManager:
 - Uses dynamic time alignment when a preset is selected
 - Schedules updates at period boundaries
 - Provides callbacks for dependent components to subscribe to horizon changes
+- Adapts the solve resolution to a target solve time, when one is configured
 """
 
+from collections import deque
 from collections.abc import Callable
 from datetime import datetime
+import logging
+from statistics import fmean
+from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util import dt as dt_util
 
+from custom_components.haeo.core.const import (
+    CONF_MAX_SOLVE_BLOCK_DURATION,
+    CONF_TARGET_SOLVE_TIME,
+    DEFAULT_MAX_SOLVE_BLOCK_DURATION,
+    DEFAULT_TARGET_SOLVE_TIME,
+    HUB_SECTION_ADVANCED,
+)
 from custom_components.haeo.core.data.forecast_times import (
     floor_timestamp,
     generate_forecast_timestamps,
     tiers_to_periods_seconds,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
+# Number of recent solve times averaged before the solve resolution changes
+SOLVE_TIME_WINDOW: Final = 5
+
+# Resolution is restored once solves average below this fraction of the target
+SOLVE_TIME_HEADROOM: Final = 0.5
+
 
 class HorizonManager:
     """Manager for the forecast time horizon.
@@ -59,6 +79,15 @@ class HorizonManager:
         # Current forecast timestamps (cached)
         self._forecast_timestamps: tuple[float, ...] = ()
 
+        # Solve time budget: each coarsening level doubles the solve block length
+        advanced = config_entry.data.get(HUB_SECTION_ADVANCED, {})
+        self._target_solve_time = float(advanced.get(CONF_TARGET_SOLVE_TIME, DEFAULT_TARGET_SOLVE_TIME))
+        self._max_solve_block = 60 * int(advanced.get(CONF_MAX_SOLVE_BLOCK_DURATION, DEFAULT_MAX_SOLVE_BLOCK_DURATION))
+        self._solve_times: deque[float] = deque(maxlen=SOLVE_TIME_WINDOW)
+        self._coarsening = 0
+        # The first solve at each resolution also builds its LP, so it is not recorded
+        self._building = True
+
         # Initialize timestamps
         self._update_timestamps()
 
@@ -167,6 +196,53 @@ class HorizonManager:
 
         return unsubscribe
 
+    def record_solve_time(self, seconds: float) -> None:
+        """Record a solve time and adapt the solve resolution to the target.
+
+        Once ``SOLVE_TIME_WINDOW`` solves have been recorded, resolution is
+        coarsened one level when they average above the target, and refined
+        one level when they average below ``SOLVE_TIME_HEADROOM`` of it. The
+        window restarts after every change so it only measures one level, and
+        the first solve at each level is left out because it builds the LP
+        that later solves at that level reuse.
+        """
+        if self._target_solve_time <= 0:
+            return
+        if self._building:
+            self._building = False
+            return
+        self._solve_times.append(seconds)
+        if len(self._solve_times) < SOLVE_TIME_WINDOW:
+            return
+
+        average = fmean(self._solve_times)
+        if average > self._target_solve_time and self._solve_block(self._coarsening + 1) <= self._max_solve_block:
+            self._coarsening += 1
+        elif average < self._target_solve_time * SOLVE_TIME_HEADROOM and self._coarsening > 0:
+            self._coarsening -= 1
+        else:
+            return
+
+        self._solve_times.clear()
+        self._building = True
+        _LOGGER.info(
+            "Average solve time %.2fs against a %.2fs target, solving with %s",
+            average,
+            self._target_solve_time,
+            f"{self.solve_block_seconds // 60}-minute blocks" if self.solve_block_seconds else "full resolution",
+        )
+
+    def _solve_block(self, level: int) -> int:
+        """Return the solve block length in seconds at a coarsening level."""
+        return max(self._periods_seconds, default=0) * 2**level
+
+    @property
+    def solve_block_seconds(self) -> int | None:
+        """Get the block length beyond the near term that solves should use, or None for full resolution."""
+        if self._coarsening == 0:
+            return None
+        return self._solve_block(self._coarsening)
+
     def get_forecast_timestamps(self) -> tuple[float, ...]:
         """Get the current forecast timestamps as epoch values.
 
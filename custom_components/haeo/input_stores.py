@@ -6,20 +6,38 @@ a :class:`SubentryStorage` so edits persist back to the originating subentry.
 
 Stores are built once during setup and registered on the runtime data. Home
 Assistant entities then wrap these stores for display, and the coordinator
-reads their resolved values to feed the optimization.
+reads their resolved values to feed the optimization. On horizon changes the
+:class:`InputStoreReloader` reloads every driven forecast store in one batch.
+
+:func:`input_structure` snapshots everything about the entry except numeric
+constant input values, so a subentry change that only edits those constants
+can be absorbed by the live stores (:func:`sync_input_stores`) rather than
+reloading the hub. Other subentry changes rebuild only the stores of the
+subentries they touch (see :mod:`custom_components.haeo.subentry_changes`).
 """
 
 from __future__ import annotations
 
+from collections.abc import Collection, Mapping
+from contextlib import nullcontext
+import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from custom_components.haeo.core.const import CONF_ELEMENT_TYPE
-from custom_components.haeo.core.data.input_store import InputStore, create_input_store
-from custom_components.haeo.core.schema import is_none_value
+from custom_components.haeo.core.data.input_store import (
+    InputMode,
+    InputStore,
+    StoreLoad,
+    StoreValue,
+    create_input_store,
+)
+from custom_components.haeo.core.data.loader.sensor_loader import SensorPayloadCache
+from custom_components.haeo.core.schema import is_constant_value, is_none_value
 from custom_components.haeo.core.schema.elements.policy import CONF_PRICE, CONF_RULES
 from custom_components.haeo.core.schema.field_hints import FieldHint
+from custom_components.haeo.core.state import StateSnapshot
 from custom_components.haeo.elements import (
     InputFieldPath,
     get_input_fields,
@@ -34,6 +52,7 @@ from custom_components.haeo.flows.surfaced_policy import (
     find_surfaced_rule,
     resolve_surfaced_endpoints,
 )
+from custom_components.haeo.ha_state_machine import HomeAssistantStateMachine
 from custom_components.haeo.util import async_update_subentry_value
 
 if TYPE_CHECKING:
@@ -41,9 +60,14 @@ if TYPE_CHECKING:
     from custom_components.haeo.elements.input_fields import InputFieldInfo
     from custom_components.haeo.horizon import HorizonManager
 
+_LOGGER = logging.getLogger(__name__)
+
 type InputStoreKey = tuple[str, InputFieldPath]
 type InputStoreMap = dict[InputStoreKey, InputStore]
 
+# Stand-in for numeric constant input values in input_structure() snapshots
+_MASKED_CONSTANT = "masked_constant"
+
 
 class SubentryStorage:
     """Persistence binding backing an input store to a config subentry field.
@@ -127,20 +151,29 @@ def build_input_stores(
     hass: HomeAssistant,
     config_entry: HaeoConfigEntry,
     horizon_manager: HorizonManager,
+    payload_cache: SensorPayloadCache | None = None,
+    subentry_ids: Collection[str] | None = None,
 ) -> InputStoreMap:
     """Build the full set of input stores from a config entry's subentries.
 
     Iterates every configured input field across element subentries and creates
     a store bound to the originating subentry. Disabled (none) and absent fields
-    are skipped, mirroring entity creation.
+    are skipped, mirroring entity creation. Every store shares ``payload_cache``
+    (a fresh one when omitted) so a source sensor referenced by several fields
+    is extracted once per state change. ``subentry_ids`` limits the build to
+    those subentries, for rebuilding only what a structural change touched.
     """
     stores: InputStoreMap = {}
+    if payload_cache is None:
+        payload_cache = SensorPayloadCache()
 
     negated_price_fields = _negated_policy_price_fields(config_entry)
     policy_subentry = find_policy_subentry(config_entry)
     policy_subentry_id = policy_subentry.subentry_id if policy_subentry is not None else None
 
     for subentry in config_entry.subentries.values():
+        if subentry_ids is not None and subentry.subentry_id not in subentry_ids:
+            continue
         if not is_element_config_schema(subentry.data):
             continue
 
@@ -161,10 +194,178 @@ def build_input_stores(
                 hint=_hint_from_field_info(field_info),
                 get_forecast_timestamps=horizon_manager.get_forecast_timestamps,
                 negate=is_policy and field_path in negated_price_fields,
+                payload_cache=payload_cache,
             )
             stores[(subentry.title, field_path)] = store
 
     return stores
 
 
-__all__ = ["InputStoreKey", "InputStoreMap", "SubentryStorage", "build_input_stores"]
+def _thaw(value: Any) -> Any:
+    """Return a plain, mutable deep copy of nested subentry data."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _is_numeric_constant(value: Any) -> bool:
+    """Return True for numeric (non-bool) constants, wrapped or bare."""
+    if is_constant_value(value):
+        value = value["value"]
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _mask_numeric_constant(data: Any, field_path: InputFieldPath) -> None:
+    """Replace the numeric constant at *field_path* in thawed *data*, if any."""
+    container = data
+    for key in field_path[:-1]:
+        if isinstance(container, list):
+            index = int(key)
+            container = container[index] if index < len(container) else None
+        elif isinstance(container, dict):
+            container = container.get(key)
+        if not isinstance(container, (dict, list)):
+            return
+    leaf = field_path[-1]
+    if isinstance(container, dict) and _is_numeric_constant(container.get(leaf)):
+        container[leaf] = _MASKED_CONSTANT
+
+
+def input_structure(config_entry: HaeoConfigEntry) -> dict[str, Any]:
+    """Snapshot the entry with every numeric constant input value masked.
+
+    Two snapshots compare equal exactly when the entry only differs in the
+    numeric constants of existing input fields. Those are the values editable
+    input stores hold, so such a change needs no rebuild. Boolean constants
+    stay in the snapshot because some of them (e.g. node roles) shape the
+    network structure.
+    """
+    subentries: dict[str, Any] = {}
+    for subentry_id, subentry in config_entry.subentries.items():
+        data = _thaw(subentry.data)
+        if is_element_config_schema(subentry.data):
+            all_fields = {**get_input_fields(subentry.data), **get_list_input_fields(subentry.data)}
+            for field_path, _field_info in iter_input_field_paths(all_fields):
+                _mask_numeric_constant(data, field_path)
+        subentries[subentry_id] = (subentry.subentry_type, subentry.title, data)
+    return {"data": _thaw(config_entry.data), "options": _thaw(config_entry.options), "subentries": subentries}
+
+
+def sync_input_stores(stores: InputStoreMap) -> int:
+    """Adopt numeric constants edited directly in the subentries.
+
+    Each changed store re-resolves and notifies its listeners, which updates
+    its entities and queues its element for the next optimization. Returns the
+    number of stores that changed.
+    """
+    return sum(store.sync_from_storage() for store in stores.values())
+
+
+def _resolve_batch(
+    stores: list[InputStore],
+    generations: list[int],
+    current: list[StoreValue],
+    snapshot: StateSnapshot,
+    forecast_timestamps: tuple[float, ...],
+) -> list[StoreLoad]:
+    """Resolve every store against one state snapshot and horizon (runs in the executor)."""
+    return [
+        store.resolve_load(snapshot, value, forecast_timestamps, generation=generation)
+        for store, generation, value in zip(stores, generations, current, strict=True)
+    ]
+
+
+class InputStoreReloader:
+    """Reload all driven forecast stores of a hub in one batch on horizon changes.
+
+    Source states are captured on the event loop, resolution runs as a single
+    executor job sharing the hub's payload cache, and the results are applied
+    back on the loop inside the coordinator's batched_element_updates() so the
+    coordinator is signaled once per horizon change rather than once per store.
+    Ticks arriving while a batch is running are coalesced into one follow-up batch.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: HaeoConfigEntry,
+        horizon_manager: HorizonManager,
+        stores: InputStoreMap,
+    ) -> None:
+        """Initialize the reloader for the hub's driven forecast stores."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._horizon_manager = horizon_manager
+        self._stores: list[InputStore] = []
+        self._store_set: frozenset[InputStore] = frozenset()
+        self._running = False
+        self._rerun = False
+        self.set_stores(stores)
+
+    @property
+    def stores(self) -> frozenset[InputStore]:
+        """Return the stores reloaded on each horizon change."""
+        return self._store_set
+
+    def set_stores(self, stores: InputStoreMap) -> None:
+        """Replace the reloaded stores after a structural subentry change.
+
+        A batch already in flight keeps the list it started with.
+        """
+        self._stores = [store for store in stores.values() if store.mode == InputMode.DRIVEN and store.time_series]
+        self._store_set = frozenset(self._stores)
+
+    @callback
+    def handle_horizon_change(self) -> None:
+        """Schedule a batch reload, coalescing with one already in flight."""
+        if not self._stores:
+            return
+        if self._running:
+            self._rerun = True
+            return
+        self._running = True
+        self._hass.async_create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        """Run batches until no horizon change arrived during the last one."""
+        try:
+            while True:
+                self._rerun = False
+                await self.async_reload()
+                if not self._rerun:
+                    break
+        finally:
+            self._running = False
+
+    async def async_reload(self) -> None:
+        """Reload every driven forecast store against the current horizon."""
+        stores = self._stores
+        forecast_timestamps = self._horizon_manager.get_forecast_timestamps()
+        generations = [store.start_load() for store in stores]
+        current = [store.current_value() for store in stores]
+        snapshot = StateSnapshot.capture(
+            HomeAssistantStateMachine(self._hass),
+            {entity_id for store in stores for entity_id in store.source_entity_ids},
+        )
+        loads = await self._hass.async_add_executor_job(
+            _resolve_batch, stores, generations, current, snapshot, forecast_timestamps
+        )
+
+        runtime_data = self._config_entry.runtime_data
+        coordinator = runtime_data.coordinator if runtime_data is not None else None
+        with coordinator.batched_element_updates() if coordinator is not None else nullcontext():
+            applied = sum(store.apply_load(load) for store, load in zip(stores, loads, strict=True))
+        _LOGGER.debug("Reloaded %d of %d driven forecast stores", applied, len(stores))
+
+
+__all__ = [
+    "InputStoreKey",
+    "InputStoreMap",
+    "InputStoreReloader",
+    "SubentryStorage",
+    "build_input_stores",
+    "input_structure",
+    "sync_input_stores",
+]
@@ -1,5 +1,6 @@
 """Number platform for HAEO input entities."""
 
+from collections.abc import Iterable
 import logging
 
 from homeassistant.config_entries import ConfigSubentry
@@ -91,15 +92,15 @@ def _build_surfaced_mirror_entities(
     return entities
 
 
-async def async_setup_entry(
+def build_input_numbers(
     hass: HomeAssistant,
     config_entry: HaeoConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up HAEO number entities from a config entry.
+    subentries: Iterable[ConfigSubentry],
+) -> list[HaeoInputNumber]:
+    """Build the number entities of *subentries* from the prebuilt input stores.
 
-    Creates number entities for each numeric input field in element subentries.
-    These entities serve as configurable inputs for the optimization model.
+    Used at platform setup for every subentry, and again when a subentry is
+    added or changed on a running hub so only its entities are created.
     """
     # Runtime data must be set by __init__.py before platforms are set up
     if config_entry.runtime_data is None:
@@ -111,7 +112,7 @@ async def async_setup_entry(
 
     entities: list[HaeoInputNumber] = []
 
-    for subentry in config_entry.subentries.values():
+    for subentry in subentries:
         if not is_element_config_schema(subentry.data):
             continue
         element_config = subentry.data
@@ -171,6 +172,21 @@ async def async_setup_entry(
             )
         )
 
+    return entities
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: HaeoConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up HAEO number entities from a config entry.
+
+    Creates number entities for each numeric input field in element subentries.
+    These entities serve as configurable inputs for the optimization model.
+    """
+    entities = build_input_numbers(hass, config_entry, config_entry.subentries.values())
+
     if entities:
         _LOGGER.debug("Creating %d number entities for HAEO inputs", len(entities))
         async_add_entities(entities)
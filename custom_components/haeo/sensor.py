@@ -1,14 +1,16 @@
 """Sensor platform for Home Assistant Energy Optimizer integration."""
 
+from collections.abc import Iterable
 import logging
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from custom_components.haeo import HaeoRuntimeData
 from custom_components.haeo.const import ELEMENT_TYPE_NETWORK
+from custom_components.haeo.coordinator import HaeoDataUpdateCoordinator
 from custom_components.haeo.entities import HaeoSensor
 from custom_components.haeo.entities.device import (
     build_device_identifier,
@@ -23,6 +25,50 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
 
 
+def build_output_sensors(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinator: HaeoDataUpdateCoordinator,
+    subentries: Iterable[ConfigSubentry],
+) -> list[HaeoSensor]:
+    """Build a sensor for each output the coordinator data holds for *subentries*."""
+    entities: list[HaeoSensor] = []
+    if not coordinator.data:
+        return entities
+
+    for subentry in subentries:
+        # Get all devices under this subentry (may be multiple, e.g., battery regions)
+        subentry_devices = coordinator.data.outputs.get(subentry.title, {})
+
+        # Pass subentry data as translation placeholders (convert all values to strings)
+        translation_placeholders = {k: str(v) for k, v in subentry.data.items()}
+
+        for device_name, device_outputs in subentry_devices.items():
+            # Get or create the device using centralized device creation
+            device_entry = get_or_create_element_device(hass, config_entry, subentry, device_name)
+
+            # Build unique ID using consistent identifier pattern
+            device_identifier = build_device_identifier(config_entry, subentry, device_name)
+
+            for output_name, output_data in device_outputs.items():
+                entities.append(
+                    HaeoSensor(
+                        coordinator,
+                        device_entry=device_entry,
+                        subentry_key=subentry.title,
+                        device_key=device_name,
+                        element_title=subentry.title,
+                        element_type=subentry.subentry_type,
+                        output_name=output_name,
+                        output_data=output_data,
+                        unique_id=f"{device_identifier[1]}_{output_name}",
+                        translation_placeholders=translation_placeholders,
+                    )
+                )
+
+    return entities
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -63,36 +109,7 @@ async def async_setup_entry(
     entities: list[SensorEntity] = [horizon_entity]
 
     # Create sensors for each output in the coordinator data grouped by element
-    if coordinator.data:
-        for subentry in config_entry.subentries.values():
-            # Get all devices under this subentry (may be multiple, e.g., battery regions)
-            subentry_devices = coordinator.data.outputs.get(subentry.title, {})
-
-            # Pass subentry data as translation placeholders (convert all values to strings)
-            translation_placeholders = {k: str(v) for k, v in subentry.data.items()}
-
-            for device_name, device_outputs in subentry_devices.items():
-                # Get or create the device using centralized device creation
-                device_entry = get_or_create_element_device(hass, config_entry, subentry, device_name)
-
-                # Build unique ID using consistent identifier pattern
-                device_identifier = build_device_identifier(config_entry, subentry, device_name)
-
-                for output_name, output_data in device_outputs.items():
-                    entities.append(
-                        HaeoSensor(
-                            coordinator,
-                            device_entry=device_entry,
-                            subentry_key=subentry.title,
-                            device_key=device_name,
-                            element_title=subentry.title,
-                            element_type=subentry.subentry_type,
-                            output_name=output_name,
-                            output_data=output_data,
-                            unique_id=f"{device_identifier[1]}_{output_name}",
-                            translation_placeholders=translation_placeholders,
-                        )
-                    )
+    entities.extend(build_output_sensors(hass, config_entry, coordinator, config_entry.subentries.values()))
 
     if entities:
         async_add_entities(entities)
@@ -0,0 +1,209 @@
+"""Apply structural subentry changes to a running hub without reloading it.
+
+Adding, removing or restructuring an element subentry used to reload the whole
+hub, rebuilding every input store, entity and the optimization network from
+scratch. Here only the subentries a change touches are rebuilt: their input
+stores and entities are replaced, and the coordinator adds or removes their
+model elements on the live network, so the rest of the LP and its basis stay
+warm for the next solve.
+
+Changes this cannot absorb (hub data or options, the network subentry, or a
+hub that is not fully running) report back so the caller falls back to a
+reload, which is always correct.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Collection, Mapping, Sequence
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from custom_components.haeo import INPUT_ENTITY_READY_TIMEOUT, HaeoConfigEntry
+from custom_components.haeo.const import DOMAIN, ELEMENT_TYPE_NETWORK
+from custom_components.haeo.elements import get_surfaced_price_hints
+from custom_components.haeo.flows.surfaced_policy import find_policy_subentry
+from custom_components.haeo.input_stores import build_input_stores, input_structure, sync_input_stores
+from custom_components.haeo.number import build_input_numbers
+from custom_components.haeo.sensor import build_output_sensors
+from custom_components.haeo.switch import build_input_switches
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _affected_subentries(
+    config_entry: HaeoConfigEntry,
+    previous: Mapping[str, Any],
+    current: Mapping[str, Any],
+) -> set[str]:
+    """Return the ids of the subentries whose stores and entities must be rebuilt.
+
+    ``previous`` and ``current`` map subentry ids to their input structure
+    snapshots. Besides the subentries that were added, removed or changed, a
+    change to the policy or to an element with surfaced prices rebuilds the
+    policy and every element mirroring its prices, since those share stores.
+    """
+    changed = {
+        subentry_id
+        for subentry_id in previous.keys() | current.keys()
+        if previous.get(subentry_id) != current.get(subentry_id)
+    }
+
+    policy_subentry = find_policy_subentry(config_entry)
+    if policy_subentry is None:
+        return changed
+
+    def has_surfaced_prices(subentry_id: str) -> bool:
+        snapshot = current.get(subentry_id) or previous[subentry_id]
+        return bool(get_surfaced_price_hints(snapshot[0]))
+
+    if policy_subentry.subentry_id in changed or any(has_surfaced_prices(subentry_id) for subentry_id in changed):
+        changed.add(policy_subentry.subentry_id)
+        changed.update(subentry_id for subentry_id in current if has_surfaced_prices(subentry_id))
+    return changed
+
+
+async def _async_remove_entities(
+    hass: HomeAssistant,
+    config_entry: HaeoConfigEntry,
+    subentry_ids: Collection[str],
+    deleted: Collection[str],
+) -> None:
+    """Remove the live entities of the hub's *subentry_ids* from their platforms.
+
+    Registry entries of changed subentries are kept, so their recreated
+    entities get back the same entity ids. Those of *deleted* subentries are
+    removed along with their entities.
+    """
+    entity_registry = er.async_get(hass)
+    prefixes = tuple(f"{config_entry.entry_id}_{subentry_id}_" for subentry_id in subentry_ids)
+    deleted_prefixes = tuple(f"{config_entry.entry_id}_{subentry_id}_" for subentry_id in deleted)
+    for platform in async_get_platforms(hass, DOMAIN):
+        if platform.config_entry is None or platform.config_entry.entry_id != config_entry.entry_id:
+            continue
+        stale = [
+            (entity_id, entity.unique_id)
+            for entity_id, entity in platform.entities.items()
+            if entity.unique_id is not None and entity.unique_id.startswith(prefixes)
+        ]
+        for entity_id, unique_id in stale:
+            if entity_id not in platform.entities:
+                continue
+            if unique_id.startswith(deleted_prefixes) and entity_registry.async_get(entity_id) is not None:
+                # The entity removes itself when its registry entry goes
+                entity_registry.async_remove(entity_id)
+            else:
+                await platform.async_remove_entity(entity_id)
+
+
+async def _async_add_entities(
+    hass: HomeAssistant,
+    config_entry: HaeoConfigEntry,
+    domain: Platform,
+    entities: Sequence[Entity],
+) -> None:
+    """Add *entities* to the hub's platform of *domain*."""
+    if not entities:
+        return
+    platform = next(
+        platform
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.domain == domain
+        and platform.config_entry is not None
+        and platform.config_entry.entry_id == config_entry.entry_id
+    )
+    await platform.async_add_entities(entities)
+
+
+async def async_apply_subentry_changes(hass: HomeAssistant, config_entry: HaeoConfigEntry) -> bool:
+    """Apply the entry's structural subentry changes to the running hub.
+
+    Returns False when the change cannot be applied in place and the hub has
+    to be reloaded instead.
+    """
+    runtime_data = config_entry.runtime_data
+    if runtime_data is None or config_entry.state is not ConfigEntryState.LOADED:
+        return False
+
+    async with runtime_data.structure_lock:
+        coordinator = runtime_data.coordinator
+        previous = runtime_data.input_structure
+        if coordinator is None or previous is None:
+            return False
+
+        # Diff under the lock, since an earlier change applied while this one waited
+        current = input_structure(config_entry)
+        if previous["data"] != current["data"] or previous["options"] != current["options"]:
+            return False
+        previous_subentries: dict[str, Any] = previous["subentries"]
+        current_subentries: dict[str, Any] = current["subentries"]
+        affected = _affected_subentries(config_entry, previous_subentries, current_subentries)
+        if not affected:
+            return True
+        subentry_types = {
+            (current_subentries.get(subentry_id) or previous_subentries[subentry_id])[0] for subentry_id in affected
+        }
+        if ELEMENT_TYPE_NETWORK in subentry_types:
+            return False
+
+        _LOGGER.info("HAEO configuration changed, applying %d subentry changes to the running hub", len(affected))
+
+        # Rebuild the stores of the affected subentries from the same view of
+        # the subentries the snapshot was taken from, before anything yields;
+        # the coordinator takes its participants from this view too
+        subentries = dict(config_entry.subentries)
+        rebuilt = [subentry for subentry_id, subentry in subentries.items() if subentry_id in affected]
+        stale_titles = {previous_subentries[subentry_id][1] for subentry_id in affected & previous_subentries.keys()}
+        kept = {key: store for key, store in runtime_data.input_stores.items() if key[0] not in stale_titles}
+        added = build_input_stores(
+            hass,
+            config_entry,
+            runtime_data.horizon_manager,
+            runtime_data.payload_cache,
+            subentry_ids=affected,
+        )
+        runtime_data.input_stores = {**kept, **added}
+        runtime_data.input_structure = current
+        if runtime_data.input_reloader is not None:
+            runtime_data.input_reloader.set_stores(runtime_data.input_stores)
+
+        # Unaffected subentries may have had numeric constants edited in the same change
+        sync_input_stores(kept)
+
+        deleted = previous_subentries.keys() - current_subentries.keys()
+        await _async_remove_entities(hass, config_entry, affected, deleted)
+        numbers = build_input_numbers(hass, config_entry, rebuilt)
+        await _async_add_entities(hass, config_entry, Platform.NUMBER, numbers)
+        switches = build_input_switches(hass, config_entry, rebuilt)
+        await _async_add_entities(hass, config_entry, Platform.SWITCH, switches)
+
+        try:
+            async with asyncio.timeout(INPUT_ENTITY_READY_TIMEOUT):
+                await asyncio.gather(*[store.wait_ready() for store in added.values()])
+        except TimeoutError:
+            _LOGGER.warning("Input stores of the changed subentries were not ready in time")
+            return False
+
+        data = coordinator.data
+        await coordinator.async_apply_structure_change(subentries.values())
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success or coordinator.data is data:
+            return False
+
+        await _async_add_entities(
+            hass,
+            config_entry,
+            Platform.SENSOR,
+            build_output_sensors(hass, config_entry, coordinator, rebuilt),
+        )
+        return True
+
+
+__all__ = ["async_apply_subentry_changes"]
@@ -1,8 +1,10 @@
 """Switch platform for HAEO input entities."""
 
+from collections.abc import Iterable
 import logging
 
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigSubentry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -25,18 +27,12 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
 
 
-async def async_setup_entry(
+def build_input_switches(
     hass: HomeAssistant,
     config_entry: HaeoConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up HAEO switch entities from a config entry.
-
-    Creates switch entities for each boolean input field in element subentries.
-    These entities serve as configurable inputs for the optimization model.
-
-    Also creates the auto-optimize switch for the network device.
-    """
+    subentries: Iterable[ConfigSubentry],
+) -> list[HaeoInputSwitch]:
+    """Build the input switch entities of *subentries* from the prebuilt input stores."""
     # Runtime data must be set by __init__.py before platforms are set up
     if config_entry.runtime_data is None:
         msg = "Runtime data not set - integration setup incomplete"
@@ -45,10 +41,9 @@ async def async_setup_entry(
     runtime_data = config_entry.runtime_data
     horizon_manager = runtime_data.horizon_manager
 
-    entities: list[SwitchEntity] = []
+    entities: list[HaeoInputSwitch] = []
 
-    # Create input switches for each element's boolean fields
-    for subentry in config_entry.subentries.values():
+    for subentry in subentries:
         if not is_element_config_schema(subentry.data):
             continue
         element_config = subentry.data
@@ -93,6 +88,31 @@ async def async_setup_entry(
             entities.append(entity)
             _LOGGER.debug("Created input switch: %s.%s", subentry.title, ".".join(field_path))
 
+    return entities
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: HaeoConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up HAEO switch entities from a config entry.
+
+    Creates switch entities for each boolean input field in element subentries.
+    These entities serve as configurable inputs for the optimization model.
+
+    Also creates the auto-optimize switch for the network device.
+    """
+    # Runtime data must be set by __init__.py before platforms are set up
+    if config_entry.runtime_data is None:
+        msg = "Runtime data not set - integration setup incomplete"
+        raise RuntimeError(msg)
+
+    runtime_data = config_entry.runtime_data
+
+    # Create input switches for each element's boolean fields
+    entities: list[SwitchEntity] = [*build_input_switches(hass, config_entry, config_entry.subentries.values())]
+
     # Create auto-optimize switch for the network device
     network_subentry = next(s for s in config_entry.subentries.values() if s.subentry_type == ELEMENT_TYPE_NETWORK)
 
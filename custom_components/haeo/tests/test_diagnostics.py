@@ -1,5 +1,6 @@
 """Tests for HAEO diagnostics utilities."""
 
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta, timezone
 import json
 from types import MappingProxyType
@@ -44,6 +45,8 @@ from custom_components.haeo.core.const import (
     DEFAULT_TIER_4_COUNT,
     DEFAULT_TIER_4_DURATION,
 )
+from custom_components.haeo.core.model.aggregation import PeriodAggregation
+from custom_components.haeo.core.model.network import ObjectiveSpread, RowCompaction
 from custom_components.haeo.core.schema import as_connection_target, as_constant_value, as_entity_value
 from custom_components.haeo.core.schema.elements import ElementConfigSchema, ElementType
 from custom_components.haeo.core.schema.elements.battery import (
@@ -274,6 +277,69 @@ async def test_diagnostics_basic_structure(hass: HomeAssistant) -> None:
     assert "optimization_start_time" in environment
     assert "optimization_end_time" in environment
     assert "horizon_start" in environment
+    assert "aggregation" not in diagnostics
+    assert "solver" not in diagnostics
+
+
+async def test_diagnostics_reports_period_aggregation(hass: HomeAssistant) -> None:
+    """Diagnostics include the period reduction of an aggregated solve."""
+    hub_config = _hub_entry_data("Test Hub")
+    entry = MockConfigEntry(domain=DOMAIN, data=hub_config, entry_id="test_entry")
+    entry.add_to_hass(hass)
+
+    coordinator_data = replace(
+        _make_coordinator_data(participants={}, hub_config=hub_config),
+        aggregation=PeriodAggregation(run_lengths=(3, 1, 4)),
+    )
+    coordinator = Mock(spec=HaeoDataUpdateCoordinator)
+    coordinator.data = coordinator_data
+    entry.runtime_data = HaeoRuntimeData(horizon_manager=Mock(), coordinator=coordinator)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["aggregation"] == {
+        "original_periods": 8,
+        "aggregated_periods": 3,
+        "reduction_ratio": 0.625,
+    }
+
+
+async def test_diagnostics_reports_objective_spread(hass: HomeAssistant) -> None:
+    """Diagnostics include the coefficient spread of the solved objectives."""
+    hub_config = _hub_entry_data("Test Hub")
+    entry = MockConfigEntry(domain=DOMAIN, data=hub_config, entry_id="test_entry")
+    entry.add_to_hass(hass)
+
+    coordinator_data = replace(
+        _make_coordinator_data(participants={}, hub_config=hub_config),
+        objective_spread=ObjectiveSpread(primary=12.5, secondary=1.0 / 3.0),
+    )
+    coordinator = Mock(spec=HaeoDataUpdateCoordinator)
+    coordinator.data = coordinator_data
+    entry.runtime_data = HaeoRuntimeData(horizon_manager=Mock(), coordinator=coordinator)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["solver"] == {"objective_spread": {"primary": 12.5, "secondary": 0.3333}}
+
+
+async def test_diagnostics_reports_row_compaction_threshold(hass: HomeAssistant) -> None:
+    """Diagnostics include the row compaction threshold and how often it was reached."""
+    hub_config = _hub_entry_data("Test Hub")
+    entry = MockConfigEntry(domain=DOMAIN, data=hub_config, entry_id="test_entry")
+    entry.add_to_hass(hass)
+
+    coordinator_data = replace(
+        _make_coordinator_data(participants={}, hub_config=hub_config),
+        row_compaction=RowCompaction(threshold=0.1, dead_rows=4, compactions=2),
+    )
+    coordinator = Mock(spec=HaeoDataUpdateCoordinator)
+    coordinator.data = coordinator_data
+    entry.runtime_data = HaeoRuntimeData(horizon_manager=Mock(), coordinator=coordinator)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["solver"] == {"row_compaction": {"threshold": 0.1, "dead_rows": 4, "compactions": 2}}
 
 
 async def test_diagnostics_errors_when_no_optimization_has_run(hass: HomeAssistant) -> None:
@@ -55,6 +55,8 @@ from custom_components.haeo.core.const import (
     DEFAULT_TIER_4_COUNT,
     DEFAULT_TIER_4_DURATION,
 )
+from custom_components.haeo.core.data.input_store import InputMode
+from custom_components.haeo.core.data.loader.sensor_loader import SensorPayloadCache
 from custom_components.haeo.core.schema import as_connection_target, as_constant_value, as_entity_value
 from custom_components.haeo.core.schema.elements import ElementType
 from custom_components.haeo.core.schema.elements.battery import (
@@ -377,7 +379,7 @@ async def test_async_update_listener(
     hass: HomeAssistant,
     mock_hub_entry: MockConfigEntry,
 ) -> None:
-    """Test async_update_listener schedules reload."""
+    """Test async_update_listener reloads when the change cannot be applied to the running hub."""
     # Set up runtime_data (required by async_update_listener)
     mock_coordinator = Mock()
     mock_hub_entry.runtime_data = _create_mock_runtime_data(mock_coordinator)
@@ -391,8 +393,9 @@ async def test_async_update_listener(
 
     hass.config_entries.async_schedule_reload = mock_schedule_reload
 
-    # Call update listener
+    # Call update listener, which applies the change in a task
     await async_update_listener(hass, mock_hub_entry)
+    await hass.async_block_till_done()
 
     # Verify reload was scheduled
     assert schedule_reload_called
@@ -555,6 +558,9 @@ async def test_async_setup_entry_raises_config_entry_not_ready_on_timeout(
 
     # Create a mock input store that never becomes ready
     class NeverReadyStore:
+        mode = InputMode.EDITABLE
+        time_series = False
+
         async def wait_ready(self) -> None:
             # Wait forever - will timeout
             await asyncio.sleep(100)
@@ -571,6 +577,8 @@ async def test_async_setup_entry_raises_config_entry_not_ready_on_timeout(
         def __init__(self) -> None:
             self.horizon_manager = mock_horizon
             self.input_stores: dict[object, object] = {}
+            self.payload_cache = SensorPayloadCache()
+            self.input_reloader = None
             self.coordinator = None
             self.value_update_in_progress = False
 
@@ -648,6 +656,9 @@ async def test_setup_reentry_after_timeout_failure(
 
     # Create a mock input store that fails first time, succeeds second time
     class ConditionalReadyStore:
+        mode = InputMode.EDITABLE
+        time_series = False
+
         def __init__(self) -> None:
             self._ready = False
 
@@ -669,6 +680,8 @@ async def test_setup_reentry_after_timeout_failure(
         def __init__(self, horizon_manager: object) -> None:
             self.horizon_manager = horizon_manager
             self.input_stores: dict[object, object] = {}
+            self.payload_cache = SensorPayloadCache()
+            self.input_reloader = None
             self.coordinator = None
             self.value_update_in_progress = False
 
@@ -750,6 +763,8 @@ async def test_setup_cleanup_on_coordinator_error(
         def __init__(self, horizon_manager: object) -> None:
             self.horizon_manager = horizon_manager
             self.input_stores: dict[object, object] = {}  # No stores to wait for
+            self.payload_cache = SensorPayloadCache()
+            self.input_reloader = None
             self.coordinator = None
             self.value_update_in_progress = False
 
@@ -802,6 +817,8 @@ async def test_async_setup_entry_raises_config_entry_error_on_permanent_failure(
         def __init__(self, horizon_manager: object) -> None:
             self.horizon_manager = horizon_manager
             self.input_stores: dict[object, object] = {}  # No stores to wait for
+            self.payload_cache = SensorPayloadCache()
+            self.input_reloader = None
             self.coordinator = None
             self.value_update_in_progress = False
 
@@ -854,6 +871,8 @@ async def test_setup_preserves_config_entry_not_ready_exception(
         def __init__(self, horizon_manager: object) -> None:
             self.horizon_manager = horizon_manager
             self.input_stores: dict[object, object] = {}  # No stores to wait for
+            self.payload_cache = SensorPayloadCache()
+            self.input_reloader = None
             self.coordinator = None
             self.value_update_in_progress = False
 
@@ -917,6 +936,8 @@ async def test_setup_preserves_config_entry_error_exception(
         def __init__(self, horizon_manager: object) -> None:
             self.horizon_manager = horizon_manager
             self.input_stores: dict[object, object] = {}  # No stores to wait for
+            self.payload_cache = SensorPayloadCache()
+            self.input_reloader = None
             self.coordinator = None
             self.value_update_in_progress = False
 
@@ -1,14 +1,15 @@
 """Tests for the input store builder and subentry storage binding."""
 
 from types import MappingProxyType
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 from homeassistant.config_entries import ConfigSubentry
 from homeassistant.core import HomeAssistant
+import numpy as np
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.haeo import HaeoRuntimeData
+from custom_components.haeo import HaeoRuntimeData, async_update_listener
 from custom_components.haeo.const import DOMAIN
 from custom_components.haeo.core.const import CONF_ELEMENT_TYPE, CONF_NAME
 from custom_components.haeo.core.data.input_store import InputMode
@@ -25,7 +26,13 @@ from custom_components.haeo.core.schema.elements.grid import ELEMENT_TYPE as GRI
 from custom_components.haeo.core.schema.sections import CONF_CONNECTION
 from custom_components.haeo.flows import HUB_SECTION_ADVANCED, HUB_SECTION_COMMON, HUB_SECTION_TIERS
 from custom_components.haeo.horizon import HorizonManager
-from custom_components.haeo.input_stores import SubentryStorage, build_input_stores
+from custom_components.haeo.input_stores import (
+    InputStoreReloader,
+    SubentryStorage,
+    build_input_stores,
+    input_structure,
+    sync_input_stores,
+)
 
 
 @pytest.fixture
@@ -195,6 +202,116 @@ async def test_build_input_stores_negates_entity_surfaced_price(
     assert np.all(price_store.value < 0)
 
 
+def _replace_grid_field(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    subentry: ConfigSubentry,
+    field_path: tuple[str, str],
+    value: object,
+) -> None:
+    """Replace one nested grid field the way a reconfigure flow would."""
+    section, key = field_path
+    data = {**subentry.data, section: {**subentry.data[section], key: value}}
+    hass.config_entries.async_update_subentry(entry, subentry, data=data)
+
+
+def test_input_structure_ignores_numeric_constant_edits(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Numeric constant edits keep the structure; source or kind changes do not."""
+    subentry = _add_grid(hass, config_entry)
+    before = input_structure(config_entry)
+
+    _replace_grid_field(
+        hass, config_entry, subentry, (SECTION_PRICING, CONF_PRICE_SOURCE_TARGET), as_constant_value(0.4)
+    )
+    assert input_structure(config_entry) == before
+
+    _replace_grid_field(
+        hass, config_entry, subentry, (SECTION_PRICING, CONF_PRICE_TARGET_SOURCE), as_entity_value(["sensor.other"])
+    )
+    assert input_structure(config_entry) != before
+
+
+async def test_update_listener_syncs_constant_only_change_without_reload(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    horizon_manager: Mock,
+) -> None:
+    """A constant-only subentry edit updates the live stores instead of reloading."""
+    subentry = _add_grid(hass, config_entry)
+    runtime_data = config_entry.runtime_data
+    runtime_data.coordinator = Mock()
+    runtime_data.input_stores = build_input_stores(hass, config_entry, horizon_manager)
+    runtime_data.input_structure = input_structure(config_entry)
+    schedule_reload = Mock()
+    hass.config_entries.async_schedule_reload = schedule_reload
+
+    _replace_grid_field(
+        hass, config_entry, subentry, (SECTION_POWER_LIMITS, CONF_MAX_POWER_TARGET_SOURCE), as_constant_value(8.0)
+    )
+    await async_update_listener(hass, config_entry)
+
+    schedule_reload.assert_not_called()
+    runtime_data.coordinator.refresh_participant_configs.assert_called_once()
+    limit_store = runtime_data.input_stores[("Main Grid", (SECTION_POWER_LIMITS, CONF_MAX_POWER_TARGET_SOURCE))]
+    np.testing.assert_array_equal(limit_store.value, [8.0, 8.0])
+    assert sync_input_stores(runtime_data.input_stores) == 0
+
+
+async def test_input_store_reloader_applies_batch_inside_coordinator_batch(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    horizon_manager: Mock,
+) -> None:
+    """The reloader loads driven forecast stores and applies them in one coordinator batch."""
+    _add_grid(hass, config_entry)
+    hass.states.async_set("sensor.export_price", "0.12", {"unit_of_measurement": "$/kWh"})
+    stores = build_input_stores(hass, config_entry, horizon_manager)
+    driven = stores[("Main Grid", (SECTION_PRICING, CONF_PRICE_TARGET_SOURCE))]
+
+    coordinator = MagicMock()
+    config_entry.runtime_data.coordinator = coordinator
+    reloader = InputStoreReloader(hass, config_entry, horizon_manager, stores)
+    listener = Mock()
+    driven.add_listener(listener)
+
+    assert reloader.stores == {driven}
+
+    await reloader.async_reload()
+
+    assert driven.available
+    assert driven.forecast_timestamps == (0.0, 300.0, 600.0)
+    listener.assert_called_once()
+    coordinator.batched_element_updates.assert_called_once()
+
+
+async def test_input_store_reloader_coalesces_ticks_during_reload(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    horizon_manager: Mock,
+) -> None:
+    """Horizon ticks arriving while a batch runs collapse into one follow-up batch."""
+    _add_grid(hass, config_entry)
+    stores = build_input_stores(hass, config_entry, horizon_manager)
+    reloader = InputStoreReloader(hass, config_entry, horizon_manager, stores)
+    calls = 0
+
+    async def reload_with_ticks() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            reloader.handle_horizon_change()
+            reloader.handle_horizon_change()
+
+    with patch.object(reloader, "async_reload", side_effect=reload_with_ticks) as reload_mock:
+        reloader.handle_horizon_change()
+        await hass.async_block_till_done()
+
+    assert reload_mock.await_count == 2
+
+
 def test_subentry_storage_read_returns_none_for_missing_subentry(
     hass: HomeAssistant,
     config_entry: MockConfigEntry,
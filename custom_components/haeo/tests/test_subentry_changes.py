@@ -0,0 +1,193 @@
+"""Tests for applying structural subentry changes to a running hub."""
+
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntryState, ConfigSubentry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.haeo import MIGRATION_MINOR_VERSION, HaeoRuntimeData
+from custom_components.haeo.const import DOMAIN, INTEGRATION_TYPE_HUB
+from custom_components.haeo.core.const import (
+    CONF_NAME,
+    CONF_TIER_1_COUNT,
+    CONF_TIER_1_DURATION,
+    CONF_TIER_2_COUNT,
+    CONF_TIER_2_DURATION,
+    CONF_TIER_3_COUNT,
+    CONF_TIER_3_DURATION,
+    CONF_TIER_4_COUNT,
+    CONF_TIER_4_DURATION,
+)
+from custom_components.haeo.core.schema.constant_value import as_constant_value
+from custom_components.haeo.flows import HUB_SECTION_ADVANCED, HUB_SECTION_COMMON, HUB_SECTION_TIERS
+from custom_components.haeo.flows.surfaced_policy import _save_policy_rules  # pyright: ignore[reportPrivateUsage]
+
+
+def _load(name: str, power: float) -> dict[str, Any]:
+    return {
+        "name": name,
+        "element_type": "load",
+        "connection": {"type": "connection_target", "value": "Switchboard"},
+        "curtailment": {},
+        "forecast": {"forecast": as_constant_value(power)},
+        "pricing": {},
+    }
+
+
+PARTICIPANTS: dict[str, dict[str, Any]] = {
+    "Switchboard": {"name": "Switchboard", "element_type": "node", "role": {"is_sink": False, "is_source": False}},
+    "Grid": {
+        "name": "Grid",
+        "element_type": "grid",
+        "connection": {"type": "connection_target", "value": "Switchboard"},
+        "power_limits": {
+            "max_power_source_target": as_constant_value(10.0),
+            "max_power_target_source": as_constant_value(10.0),
+        },
+        "pricing": {"price_source_target": as_constant_value(0.3), "price_target_source": as_constant_value(0.05)},
+    },
+    "Base Load": _load("Base Load", 1.0),
+}
+
+
+async def _setup_hub(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up a hub of constant-valued participants."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "integration_type": INTEGRATION_TYPE_HUB,
+            HUB_SECTION_COMMON: {CONF_NAME: "Test Hub"},
+            HUB_SECTION_TIERS: {
+                CONF_TIER_1_COUNT: 4,
+                CONF_TIER_1_DURATION: 15,
+                CONF_TIER_2_COUNT: 0,
+                CONF_TIER_2_DURATION: 5,
+                CONF_TIER_3_COUNT: 0,
+                CONF_TIER_3_DURATION: 30,
+                CONF_TIER_4_COUNT: 0,
+                CONF_TIER_4_DURATION: 60,
+            },
+            HUB_SECTION_ADVANCED: {},
+        },
+        minor_version=MIGRATION_MINOR_VERSION,
+    )
+    entry.add_to_hass(hass)
+    for name, config in PARTICIPANTS.items():
+        subentry = ConfigSubentry(
+            data=MappingProxyType(config),
+            subentry_type=config["element_type"],
+            title=name,
+            unique_id=None,
+        )
+        hass.config_entries.async_add_subentry(entry, subentry)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert entry.state is ConfigEntryState.LOADED
+    return entry
+
+
+def _subentry_entity_ids(hass: HomeAssistant, entry: MockConfigEntry, subentry_id: str) -> set[str]:
+    """Return the entity ids of the registered entities that have a state for *subentry_id*."""
+    prefix = f"{entry.entry_id}_{subentry_id}_"
+    return {
+        registry_entry.entity_id
+        for registry_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if registry_entry.unique_id.startswith(prefix) and hass.states.get(registry_entry.entity_id) is not None
+    }
+
+
+async def test_subentry_changes_apply_to_the_running_hub(hass: HomeAssistant) -> None:
+    """Adding and removing an element keeps the hub running and only touches that element's entities."""
+    entry = await _setup_hub(hass)
+    runtime_data = entry.runtime_data
+    assert isinstance(runtime_data, HaeoRuntimeData)
+    coordinator = runtime_data.coordinator
+    assert coordinator is not None
+    network = coordinator.network
+    base_load_id = next(sid for sid, subentry in entry.subentries.items() if subentry.title == "Base Load")
+    base_load_entities = _subentry_entity_ids(hass, entry, base_load_id)
+    base_load_element = network.elements["Base Load"]
+    cost = coordinator.data.outputs
+
+    subentry = ConfigSubentry(
+        data=MappingProxyType(_load("Heater", 2.0)),
+        subentry_type="load",
+        title="Heater",
+        unique_id=None,
+    )
+    hass.config_entries.async_add_subentry(entry, subentry)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.runtime_data is runtime_data
+    assert runtime_data.coordinator is coordinator
+    assert coordinator.network is network
+    assert network.elements["Base Load"] is base_load_element
+    assert "Heater" in network.elements
+    assert "Heater" in coordinator.data.outputs
+    assert coordinator.data.outputs is not cost
+    heater_entities = _subentry_entity_ids(hass, entry, subentry.subentry_id)
+    assert heater_entities
+    assert _subentry_entity_ids(hass, entry, base_load_id) == base_load_entities
+
+    hass.config_entries.async_remove_subentry(entry, subentry.subentry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.runtime_data is runtime_data
+    assert coordinator.network is network
+    assert "Heater" not in network.elements
+    assert "Heater" not in coordinator.data.outputs
+    assert not any(hass.states.get(entity_id) for entity_id in heater_entities)
+    assert _subentry_entity_ids(hass, entry, base_load_id) == base_load_entities
+
+
+async def test_policy_and_element_added_together_match_a_reload(hass: HomeAssistant) -> None:
+    """An element committed with a policy rule pricing it in one step solves as the reloaded hub does."""
+    entry = await _setup_hub(hass)
+    runtime_data = entry.runtime_data
+    assert isinstance(runtime_data, HaeoRuntimeData)
+
+    _save_policy_rules(
+        hass,
+        entry,
+        [
+            {
+                "name": "Grid to Heater",
+                "enabled": True,
+                "price": as_constant_value(0.2),
+                "source": ["Grid"],
+                "target": ["Heater"],
+            }
+        ],
+    )
+    hass.config_entries.async_add_subentry(
+        entry,
+        ConfigSubentry(
+            data=MappingProxyType(_load("Heater", 2.0)),
+            subentry_type="load",
+            title="Heater",
+            unique_id=None,
+        ),
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.runtime_data is runtime_data
+    coordinator = runtime_data.coordinator
+    assert coordinator is not None
+    applied_cost = coordinator.network.optimize()
+    applied_elements = set(coordinator.network.elements)
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    reloaded = entry.runtime_data
+    assert isinstance(reloaded, HaeoRuntimeData)
+    assert reloaded is not runtime_data
+    assert reloaded.coordinator is not None
+    assert reloaded.coordinator.network.optimize() == pytest.approx(applied_cost)
+    assert set(reloaded.coordinator.network.elements) == applied_elements
+    assert set(reloaded.input_stores) == set(runtime_data.input_stores)
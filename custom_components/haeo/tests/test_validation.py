@@ -1,8 +1,11 @@
 """Tests for network connectivity validation."""
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
+from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES, expand_model_elements
 from custom_components.haeo.core.const import CONF_ELEMENT_TYPE, CONF_NAME
 from custom_components.haeo.core.schema import as_connection_target
 from custom_components.haeo.core.schema.elements import ElementConfigData, ElementType
@@ -89,6 +92,22 @@ def test_validate_network_topology_with_implicit_connection() -> None:
     assert result.components == (("grid", "main"),)
 
 
+def test_validate_network_topology_reuses_model_elements() -> None:
+    """A supplied model element expansion is used instead of running the adapters."""
+    main_node: NodeConfigData = {
+        CONF_ELEMENT_TYPE: ElementType.NODE,
+        CONF_NAME: "main",
+        SECTION_ROLE: {CONF_IS_SOURCE: False, CONF_IS_SINK: False},
+    }
+    participants: dict[str, ElementConfigData] = {"main_node": main_node}
+    model_elements = expand_model_elements(participants)
+
+    with patch.object(ELEMENT_TYPES[ElementType.NODE], "model_elements", side_effect=AssertionError):
+        result = validate_network_topology(participants, model_elements)
+
+    assert result.components == (("main",),)
+
+
 def test_validate_network_topology_detects_disconnected() -> None:
     """Disconnected components are properly identified."""
     node_a: NodeConfigData = {
@@ -2,29 +2,22 @@
 
 from collections.abc import Mapping, Sequence
 
-from .core.const import CONF_ELEMENT_TYPE
-from .core.model.elements import MODEL_ELEMENT_TYPE_CONNECTION
-from .elements import ELEMENT_TYPES, ElementConfigData
+from .core.adapters.registry import expand_model_elements
+from .core.model.elements import MODEL_ELEMENT_TYPE_CONNECTION, ModelElementConfig
+from .elements import ElementConfigData
 from .util.graph import ConnectivityResult as NetworkConnectivityResult
 from .util.graph import find_connected_components
 
 
-def _build_adjacency(participants: Mapping[str, ElementConfigData]) -> dict[str, set[str]]:
-    """Build adjacency map from loaded element configs.
+def _build_adjacency(model_elements_by_participant: Mapping[str, Sequence[ModelElementConfig]]) -> dict[str, set[str]]:
+    """Build adjacency map from each participant's model elements.
 
-    Uses the adapter layer to convert loaded configs into model elements,
-    which includes both explicit connection elements and implicit connections.
+    The model elements come from the adapter layer, so they include both
+    explicit connection elements and implicit connections.
     """
     adjacency: dict[str, set[str]] = {}
 
-    # Collect all model elements from all configs
-    for loaded_config in participants.values():
-        element_type = loaded_config[CONF_ELEMENT_TYPE]
-        adapter = ELEMENT_TYPES[element_type]
-
-        # Get model elements including implicit connections
-        model_elements = adapter.model_elements(loaded_config)
-
+    for model_elements in model_elements_by_participant.values():
         # Add non-connection elements as nodes (skip internal connection elements)
         for elem in model_elements:
             elem_type = elem["element_type"]
@@ -43,7 +36,10 @@ def _build_adjacency(participants: Mapping[str, ElementConfigData]) -> dict[str,
     return adjacency
 
 
-def validate_network_topology(participants: Mapping[str, ElementConfigData]) -> NetworkConnectivityResult:
+def validate_network_topology(
+    participants: Mapping[str, ElementConfigData],
+    model_elements: Mapping[str, Sequence[ModelElementConfig]] | None = None,
+) -> NetworkConnectivityResult:
     """Validate connectivity for the provided participant configurations.
 
     Uses the adapter layer to transform loaded configs into model elements,
@@ -51,6 +47,8 @@ def validate_network_topology(participants: Mapping[str, ElementConfigData]) ->
 
     Args:
         participants: Map of element names to their loaded configurations.
+        model_elements: Existing ``expand_model_elements`` result for the
+            participants, reused instead of running the adapters again.
 
     Returns:
         NetworkConnectivityResult indicating connectivity status.
@@ -59,7 +57,9 @@ def validate_network_topology(participants: Mapping[str, ElementConfigData]) ->
     if not participants:
         return NetworkConnectivityResult(is_connected=True, components=())
 
-    adjacency = _build_adjacency(participants)
+    if model_elements is None:
+        model_elements = expand_model_elements(participants)
+    adjacency = _build_adjacency(model_elements)
     return find_connected_components(adjacency)
 
 
@@ -45,8 +45,7 @@ class highs_var:
     def __eq__(self, other: object) -> highs_linear_expression: ...  # type: ignore[override]
 
 class highs_cons:
-    @property
-    def index(self) -> int: ...
+    index: int
 
 class highs_linear_expression:
     @property
@@ -98,6 +97,21 @@ class HighsModelStatus(IntEnum):
     kUnknown = 15
     kSolutionLimit = 16
 
+class HighsBasisStatus(IntEnum):
+    kLower = 0
+    kBasic = 1
+    kUpper = 2
+    kZero = 3
+    kNonbasic = 4
+
+class HighsBasis:
+    @property
+    def valid(self) -> bool: ...
+    @property
+    def col_status(self) -> list[HighsBasisStatus]: ...
+    @property
+    def row_status(self) -> list[HighsBasisStatus]: ...
+
 class HighsCallback:
     def __iadd__(self, callback: Callable[[int, str], None]) -> HighsCallback: ...
 
@@ -239,9 +253,27 @@ class Highs:
         costs: NDArray[np.float64],
     ) -> None: ...
     def changeColBounds(self, col: int, lower: float, upper: float) -> None: ...
+    def changeColsBounds(
+        self,
+        num_cols: int,
+        cols: NDArray[np.int32],
+        lower: NDArray[np.float64],
+        upper: NDArray[np.float64],
+    ) -> None: ...
+    def getCols(
+        self,
+        num_cols: int,
+        cols: NDArray[np.int32],
+    ) -> tuple[HighsStatus, int, NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], int]: ...
+    def getRows(
+        self,
+        num_rows: int,
+        rows: NDArray[np.int32],
+    ) -> tuple[HighsStatus, int, NDArray[np.float64], NDArray[np.float64], int]: ...
     def changeCoeff(self, row: int, col: int, value: float) -> None: ...
     def getInfoValue(self, info: str) -> tuple[HighsStatus, int | float]: ...
-    def deleteRows(self, num_rows: int, row_indices: list[int]) -> None: ...
+    def deleteRows(self, num_rows: int, row_indices: list[int] | NDArray[np.int32]) -> None: ...
+    def getBasis(self) -> HighsBasis: ...
     def getExpr(self, cons: highs_cons) -> highs_linear_expression: ...
     def getRanging(self) -> tuple[HighsStatus, HighsRanging]: ...
     def clearLinearObjectives(self) -> None: ...
@@ -21,7 +21,14 @@ import numpy as np
 import pytest
 from pytest_benchmark.fixture import BenchmarkFixture
 
-from custom_components.haeo.coordinator.network import ElementUpdater, _build_element_updater, _build_policy_updater
+from custom_components.haeo.coordinator.network import (
+    ElementUpdater,
+    ReducedNetwork,
+    _build_element_updater,
+    _build_policy_updater,
+    solve_coarse_plan,
+    solve_near_term,
+)
 from custom_components.haeo.core.adapters.elements.policy import extract_policy_rules
 from custom_components.haeo.core.adapters.policy_compilation import compile_policies
 from custom_components.haeo.core.adapters.registry import ELEMENT_TYPES, collect_model_elements
@@ -43,6 +50,7 @@ class _EntityState:
     entity_id: str
     state: str
     attributes: Mapping[str, Any]
+    last_updated: datetime | None = None
 
     def as_dict(self) -> dict[str, Any]:
         return {
@@ -186,9 +194,17 @@ _scenarios = _discover_scenarios()
 _MODES: list[SolveOptions] = [
     CalibratedOptions(),
     LexOptions(),
+    CalibratedOptions(secondary_objective="normalized"),
+    LexOptions(secondary_objective="normalized"),
 ]
 
 
+def _mode_id(options: SolveOptions) -> str:
+    if options.secondary_objective == "indexed":
+        return options.mode
+    return f"{options.mode}_{options.secondary_objective}"
+
+
 _benchmark_params = [
     pytest.mark.benchmark,
     pytest.mark.timeout(120),
@@ -198,7 +214,7 @@ _benchmark_params = [
         ids=[s.name for s in _scenarios],
         indirect=["scenario_path"],
     ),
-    pytest.mark.parametrize("options", _MODES, ids=[m.mode for m in _MODES]),
+    pytest.mark.parametrize("options", _MODES, ids=[_mode_id(m) for m in _MODES]),
 ]
 
 
@@ -282,3 +298,59 @@ def test_warm_reentrant(scenario_path: Path, options: SolveOptions, benchmark: B
 
     result = benchmark(network.optimize)
     assert np.isfinite(result)
+
+
+@_apply_marks
+@pytest.mark.parametrize("two_stage", [False, True], ids=["single_stage", "two_stage"])
+def test_first_plan(scenario_path: Path, options: SolveOptions, two_stage: bool, benchmark: BenchmarkFixture) -> None:
+    """Build network from scratch and produce the first plan with its outputs.
+
+    A two-stage solve publishes its coarse plan first.
+    """
+    config, inputs, freeze_timestamp = _load_scenario(scenario_path)
+    frozen_dt = datetime.fromisoformat(freeze_timestamp)
+    sm = _ScenarioStateMachine(inputs)
+
+    def run() -> float:
+        net, _ = _build_network(config, sm, frozen_dt, options=options)
+        plan = solve_coarse_plan(ReducedNetwork(net)) if two_stage else None
+        if plan is not None:
+            return plan.solution[0]
+        cost = net.optimize()
+        net.outputs()
+        return cost
+
+    result = benchmark(run)
+    assert np.isfinite(result)
+
+
+@_apply_marks
+@pytest.mark.parametrize("two_stage", [False, True], ids=["single_stage", "two_stage"])
+def test_update_cycle(scenario_path: Path, options: SolveOptions, two_stage: bool, benchmark: BenchmarkFixture) -> None:
+    """Update all element parameters and re-solve with outputs, as one coordinator cycle does.
+
+    A two-stage cycle solves both stages on reduced networks kept across cycles.
+    """
+    config, inputs, freeze_timestamp = _load_scenario(scenario_path)
+    frozen_dt = datetime.fromisoformat(freeze_timestamp)
+    sm = _ScenarioStateMachine(inputs)
+
+    loaded_configs = _load_configs(config, sm, frozen_dt)
+    network, updaters = _build_network(config, sm, frozen_dt, options=options)
+    coarse, near_term = ReducedNetwork(network), ReducedNetwork(network)
+
+    def run() -> float:
+        for elem_name, elem_config in loaded_configs.items():
+            updater = updaters.get(elem_name)
+            if updater is not None:
+                updater(elem_config)
+        plan = solve_coarse_plan(coarse) if two_stage else None
+        if plan is not None:
+            return solve_near_term(near_term, plan)[0]
+        cost = network.optimize()
+        network.outputs()
+        return cost
+
+    run()  # prime
+    result = benchmark(run)
+    assert np.isfinite(result)
@@ -48,6 +48,7 @@ class DiagEntityState:
     entity_id: str
     state: str
     attributes: dict[str, Any]
+    last_updated: datetime | None = None
 
     def as_dict(self) -> dict[str, Any]:
         """Return serialized state representation."""